@@ -0,0 +1,41 @@
+"""add_data_version_to_organizations
+
+Per-org counter bumped whenever solver input data (people, teams, events,
+holidays, resources, availability, constraints) changes. The solve-context
+cache keys its snapshots on it.
+
+Revision ID: c7d9e1f3a5b8
+Revises: b4e6f8a2c5d3
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d9e1f3a5b8'
+down_revision: Union[str, Sequence[str], None] = 'b4e6f8a2c5d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('organizations', schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                'data_version',
+                sa.Integer(),
+                nullable=False,
+                server_default='0',
+            )
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('organizations', schema=None) as batch_op:
+        batch_op.drop_column('data_version')
@@ -0,0 +1,34 @@
+"""add_assignment_solution_person_index
+
+Person- and team-scoped solution exports look up one solution's
+assignments by person.
+
+Revision ID: d2f4a6c8e0b1
+Revises: c7d9e1f3a5b8
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f4a6c8e0b1'
+down_revision: Union[str, Sequence[str], None] = 'c7d9e1f3a5b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('assignments', schema=None) as batch_op:
+        batch_op.create_index(
+            'idx_assignments_solution_person', ['solution_id', 'person_id']
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('assignments', schema=None) as batch_op:
+        batch_op.drop_index('idx_assignments_solution_person')
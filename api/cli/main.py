@@ -5,14 +5,15 @@ Usage:
     signupflow init <workspace>          Create sample workspace with YAML files
     signupflow solve <workspace>         Run solver on a workspace directory
     signupflow solve <workspace> -o out  Save solution to output directory
+    signupflow solve <workspace> --ndjson  Save the full bundle as solution.ndjson
 """
 
-import json
 import sys
 from pathlib import Path
 
 import click
 
+from api.core.json_writer import write_json_stream, write_solution_ndjson
 from api.core.loader import (
     load_availability_files,
     load_constraint_files,
@@ -21,10 +22,10 @@ from api.core.loader import (
     load_org,
     load_people,
     load_teams,
-    save_json,
 )
 from api.core.solver.adapter import SolveContext
-from api.core.solver.heuristics import GreedyHeuristicSolver
+from api.core.solver.factory import SOLVER_ENGINES, create_solver
+from api.core.solver.profiling import PROFILERS, capture_profile
 
 
 @click.group()
@@ -78,10 +79,58 @@ def init(workspace: str):
     help="End date (default: latest event)",
 )
 @click.option(
-    "--mode", type=click.Choice(["strict", "relaxed"]), default="relaxed", help="Solving mode"
+    "--mode",
+    type=click.Choice(["strict", "relaxed", "vectorized"]),
+    default="relaxed",
+    help="Solving mode (vectorized scores candidates with NumPy)",
+)
+@click.option(
+    "--solver",
+    "engine",
+    type=click.Choice(list(SOLVER_ENGINES)),
+    default="greedy",
+    help="Solver engine (cp_sat needs OR-Tools; falls back to greedy)",
+)
+@click.option("--timeout", "timeout_s", type=int, default=None, help="Time budget in seconds")
+@click.option(
+    "--improve",
+    "improve_s",
+    type=click.FloatRange(0, 60),
+    default=0.0,
+    help="Seconds of local-search improvement after the greedy pass",
+)
+@click.option(
+    "--by-month",
+    is_flag=True,
+    help="With --solver parallel, also split subproblems by calendar month",
 )
 @click.option("--json-output", is_flag=True, help="Output solution as JSON to stdout")
-def solve(workspace: str, output: str, from_date, to_date, mode: str, json_output: bool):
+@click.option(
+    "--ndjson",
+    is_flag=True,
+    help="Save the full solution bundle as NDJSON (one assignment per line)",
+)
+@click.option(
+    "--profile",
+    "profiler",
+    type=click.Choice(list(PROFILERS)),
+    default=None,
+    help="Profile the solve and save the report as profile.txt (included in --json-output)",
+)
+def solve(
+    workspace: str,
+    output: str,
+    from_date,
+    to_date,
+    mode: str,
+    engine: str,
+    timeout_s: int | None,
+    improve_s: float,
+    by_month: bool,
+    json_output: bool,
+    ndjson: bool,
+    profiler: str | None,
+):
     """Run the scheduler on a workspace directory."""
     ws = Path(workspace)
 
@@ -139,6 +188,7 @@ def solve(workspace: str, output: str, from_date, to_date, mode: str, json_outpu
         click.echo(f"Events:    {len(events)}")
         click.echo(f"Range:     {solve_from} → {solve_to}")
         click.echo(f"Mode:      {mode}")
+        click.echo(f"Solver:    {engine}")
         click.echo()
 
     # Build solve context
@@ -158,29 +208,37 @@ def solve(workspace: str, output: str, from_date, to_date, mode: str, json_outpu
     )
 
     # Solve
-    solver = GreedyHeuristicSolver()
-    solver.build_model(context)
-    solution = solver.solve()
-
-    # Format output
-    result = {
+    with capture_profile(profiler) as captured:
+        solver = create_solver(engine, improve_s=improve_s, by_month=by_month)
+        solver.build_model(context)
+        solution = solver.solve(timeout_s=timeout_s)
+    profile = solution.meta.profile
+
+    # Format output: summary fields up front, assignments streamed one per line
+    summary = {
         "solve_ms": solution.metrics.solve_ms,
         "health_score": solution.metrics.health_score,
         "hard_violations": solution.metrics.hard_violations,
         "soft_score": solution.metrics.soft_score,
         "assignment_count": len(solution.assignments),
         "fairness_stdev": solution.metrics.fairness.stdev,
-        "assignments": [
-            {"event_id": a.event_id, "assignees": a.assignees} for a in solution.assignments
-        ],
+        "phases_ms": profile.phases_ms if profile else {},
+        "counters": profile.counters if profile else {},
         "violations": [
             {"key": v.constraint_key, "message": v.message, "entities": v.entities}
             for v in solution.violations.hard + solution.violations.soft
         ],
     }
 
+    def summary_assignments():
+        return ({"event_id": a.event_id, "assignees": a.assignees} for a in solution.assignments)
+
+    if captured.text is not None:
+        summary["profile"] = captured.text
+
     if json_output:
-        click.echo(json.dumps(result, indent=2, default=str))
+        stdout = click.get_text_stream("stdout")
+        write_json_stream(stdout, summary, "assignments", summary_assignments())
         return
 
     # Human-readable output
@@ -192,6 +250,9 @@ def solve(workspace: str, output: str, from_date, to_date, mode: str, json_outpu
         f"{len(solution.violations.soft)} soft"
     )
     click.echo(f"Fairness:     stdev={solution.metrics.fairness.stdev:.2f}")
+    if profile and profile.phases_ms:
+        phases = ", ".join(f"{name}={ms:.0f}ms" for name, ms in profile.phases_ms.items())
+        click.echo(f"Phases:       {phases}")
     click.echo()
 
     # Print assignments grouped by event
@@ -209,9 +270,17 @@ def solve(workspace: str, output: str, from_date, to_date, mode: str, json_outpu
     # Save output
     out_dir = Path(output) if output else ws / "output"
     out_dir.mkdir(parents=True, exist_ok=True)
-    save_json(out_dir / "solution.json", result)
-    if not json_output:
-        click.echo(f"\nSolution saved to {out_dir}/solution.json")
+    if ndjson:
+        out_path = out_dir / "solution.ndjson"
+        write_solution_ndjson(solution, out_path)
+    else:
+        out_path = out_dir / "solution.json"
+        with open(out_path, "w", encoding="utf-8") as f:
+            write_json_stream(f, summary, "assignments", summary_assignments())
+    click.echo(f"\nSolution saved to {out_path}")
+    if captured.text is not None:
+        (out_dir / "profile.txt").write_text(captured.text, encoding="utf-8")
+        click.echo(f"Profile ({captured.tool}) saved to {out_dir}/profile.txt")
 
 
 def _write_sample_org(ws: Path):
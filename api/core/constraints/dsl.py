@@ -4,10 +4,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from api.core.models import Event, Person, Team
 
+if TYPE_CHECKING:
+    from api.core.constraints.timeline import PersonTimeline
+
 
 @dataclass
 class EvalContext:
@@ -24,6 +27,9 @@ class EvalContext:
     params: dict[str, Any] | None = None
     assignments: dict[str, list[str]] | None = None  # event_id -> person_ids
     person_assignments: dict[str, list[Event]] | None = None  # person_id -> events
+    # person_id -> sorted timeline; when set, period/gap/recency predicates
+    # query it instead of scanning ``person_assignments``.
+    person_timelines: dict[str, PersonTimeline] | None = None
 
 
 @dataclass
@@ -1,57 +1,198 @@
-"""Constraint evaluation engine."""
+"""Constraint evaluation engine.
 
-from datetime import date
+Bindings are compiled once into a ``CompiledConstraint`` plan: predicate
+names are resolved to functions, day-of-week names to weekday ints, the
+action's checks to a fixed list of closures, and cap windows / ``when``
+results are memoized per date. The solver compiles each binding once per
+solve; ``evaluate_constraint`` compiles on the fly for one-off checks.
+"""
+
+from collections.abc import Callable
+from datetime import date, timedelta
 
 from api.core.constraints.dsl import ConstraintResult, EvalContext
 from api.core.constraints.predicates import (
-    is_day_of_week,
-    is_friday_or_monday,
+    count_assignments_in_period,
     is_long_weekend,
+    last_assignment_days_ago,
+    min_gap_hours_satisfied,
 )
 from api.core.models import ConstraintBinding, PredicateNode
 
+Predicate = Callable[[EvalContext], bool]
+Check = Callable[[EvalContext], ConstraintResult | None]
 
-def evaluate_predicate(node: PredicateNode, ctx: EvalContext) -> bool:
-    """Recursively evaluate predicate tree."""
+# ``date.weekday()`` order; matched case-insensitively like ``is_day_of_week``.
+_WEEKDAY_NAMES = ("MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY")
+_FRIDAY_OR_MONDAY = frozenset({0, 4})
+
+
+def _never(ctx: EvalContext) -> bool:
+    return False
+
+
+def _friday_or_monday(ctx: EvalContext) -> bool:
+    return ctx.date is not None and ctx.date.weekday() in _FRIDAY_OR_MONDAY
+
+
+def compile_predicate(node: PredicateNode) -> Predicate:
+    """Resolve a predicate tree into a single callable."""
     if node.any_:
-        return any(evaluate_predicate(child, ctx) for child in node.any_)
+        any_children = [compile_predicate(child) for child in node.any_]
+        return lambda ctx: any(child(ctx) for child in any_children)
     if node.all_:
-        return all(evaluate_predicate(child, ctx) for child in node.all_)
+        all_children = [compile_predicate(child) for child in node.all_]
+        return lambda ctx: all(child(ctx) for child in all_children)
 
     # Leaf predicate
     if node.predicate == "is_long_weekend":
-        return is_long_weekend(ctx)
-    elif node.predicate == "is_day_of_week":
-        day = node.params.get("day", "")
-        return is_day_of_week(ctx, day)
-    elif node.predicate == "is_friday_or_monday":
-        return is_friday_or_monday(ctx)
+        return is_long_weekend
+    if node.predicate == "is_day_of_week":
+        day = node.params.get("day", "").upper()
+        if day not in _WEEKDAY_NAMES:
+            return _never
+        weekday = _WEEKDAY_NAMES.index(day)
+        return lambda ctx: (
+            ctx.event is not None and ctx.date is not None and ctx.date.weekday() == weekday
+        )
+    if node.predicate == "is_friday_or_monday":
+        return _friday_or_monday
 
-    return False
+    return _never
 
 
-def evaluate_constraint(binding: ConstraintBinding, ctx: EvalContext) -> ConstraintResult:
-    """Evaluate a constraint binding against context."""
-    # Check when clause
-    if binding.when:
-        if not evaluate_predicate(binding.when, ctx):
+def evaluate_predicate(node: PredicateNode, ctx: EvalContext) -> bool:
+    """Evaluate a predicate tree once (compiles it on the fly)."""
+    return compile_predicate(node)(ctx)
+
+
+def cap_window(period: str, on: date) -> tuple[date, date] | None:
+    """Resolve the inclusive ``[win_start, win_end]`` for an ``enforce_cap`` period.
+
+    ``P1M`` is the calendar month containing ``on``. ``P{N}D`` is a rolling
+    N-day window centered on ``on`` — for N=7, half=3, win=[on-3, on+3].
+    Returns None for unrecognised periods (the cap is then not enforced).
+    """
+    if period == "P1M":
+        win_start = on.replace(day=1)
+        win_end = (win_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        return win_start, win_end
+    if period.startswith("P") and period.endswith("D"):
+        try:
+            window_days = int(period[1:-1])
+        except ValueError:
+            window_days = 0
+        if window_days > 0:
+            half = window_days // 2
+            return on - timedelta(days=half), on + timedelta(days=window_days - half - 1)
+    return None
+
+
+class CompiledConstraint:
+    """Evaluation plan for one ``ConstraintBinding``.
+
+    Calling the plan returns the same ``ConstraintResult`` as the original
+    tree walk. ``when`` results are memoized per ``(date, has_event)``: the
+    leaf predicates only read the date, the event's presence and the holiday
+    map, so a plan must not be shared across different holiday maps — the
+    solver compiles fresh plans in every ``build_model`` / ``use_model``.
+
+    ``calls`` and ``predicate_calls`` (checks run plus ``when`` clauses
+    evaluated) only ever grow; the solver reports their change over a solve.
+    """
+
+    __slots__ = (
+        "binding",
+        "key",
+        "scope",
+        "severity",
+        "applies_to",
+        "fail_penalty",
+        "_when",
+        "_when_memo",
+        "_checks",
+        "calls",
+        "predicate_calls",
+    )
+
+    def __init__(self, binding: ConstraintBinding) -> None:
+        self.binding = binding
+        self.key = binding.key
+        self.scope = binding.scope
+        self.severity = binding.severity
+        self.applies_to = frozenset(binding.applies_to)
+        self.fail_penalty = 1000.0 if binding.severity == "hard" else float(binding.weight or 10)
+        self._when = compile_predicate(binding.when) if binding.when else None
+        self._when_memo: dict[tuple[date | None, bool], bool] = {}
+        self._checks = self._compile_checks()
+        self.calls = 0
+        self.predicate_calls = 0
+
+    def __call__(self, ctx: EvalContext) -> ConstraintResult:
+        self.calls += 1
+        if self._when is not None and not self.when_matches(ctx):
             return ConstraintResult(satisfied=True, reason="when clause not matched")
+        for check in self._checks:
+            self.predicate_calls += 1
+            result = check(ctx)
+            if result is not None:
+                return result
+        return ConstraintResult(satisfied=True)
 
-    # Evaluate action
-    action = binding.then
+    def when_matches(self, ctx: EvalContext) -> bool:
+        """Whether the ``when`` clause holds for ``ctx`` (True when there is none)."""
+        if self._when is None:
+            return True
+        memo_key = (ctx.date, ctx.event is not None)
+        matched = self._when_memo.get(memo_key)
+        if matched is None:
+            self.predicate_calls += 1
+            matched = self._when_memo[memo_key] = bool(self._when(ctx))
+        return matched
+
+    def _compile_checks(self) -> list[Check]:
+        """One closure per configured action, in the tree walk's order."""
+        action = self.binding.then
+        checks: list[Check] = []
 
-    if action.forbid_if:
-        # Check forbid conditions
         if action.forbid_if == "is_friday_or_monday":
-            if is_friday_or_monday(ctx):
-                return ConstraintResult(
-                    satisfied=False,
-                    penalty=1000.0 if binding.severity == "hard" else float(binding.weight or 10),
-                    reason=f"Event on {ctx.date} forbidden: {action.forbid_if}",
+            checks.append(self._forbid_friday_or_monday)
+        if action.require_roles:
+            checks.append(self._require_roles)
+        if action.enforce_min_gap_hours is not None:
+            checks.append(self._min_gap(action.enforce_min_gap_hours))
+        if action.enforce_cap:
+            checks.append(self._cap(action.enforce_cap))
+        if action.penalize_if and self.severity == "soft":
+            penalty_type = action.penalize_if.get("type")
+            if penalty_type == "cooldown":
+                checks.append(
+                    self._recency(
+                        action.penalize_if.get("cooldown_days", 14),
+                        "Cooldown violation: {days_ago} < {limit} days",
+                    )
                 )
+            elif penalty_type == "recent_rotation":
+                checks.append(
+                    self._recency(
+                        action.penalize_if.get("lookback_days", 30),
+                        "Recent rotation: {days_ago} < {limit} days",
+                    )
+                )
+        return checks
+
+    def _forbid_friday_or_monday(self, ctx: EvalContext) -> ConstraintResult | None:
+        if not _friday_or_monday(ctx):
+            return None
+        return ConstraintResult(
+            satisfied=False,
+            penalty=self.fail_penalty,
+            reason=f"Event on {ctx.date} forbidden: is_friday_or_monday",
+        )
 
-    if action.require_roles and ctx.event:
-        # Check role coverage
+    def _require_roles(self, ctx: EvalContext) -> ConstraintResult | None:
+        if not ctx.event:
+            return None
         if not ctx.assignments:
             return ConstraintResult(satisfied=False, reason="No assignments available")
 
@@ -61,7 +202,7 @@ def evaluate_constraint(binding: ConstraintBinding, ctx: EvalContext) -> Constra
 
         people_map = {p.id: p for p in ctx.all_people}
 
-        for req_role in action.require_roles:
+        for req_role in self.binding.then.require_roles or []:
             count = sum(
                 1
                 for pid in event_assignees
@@ -70,84 +211,71 @@ def evaluate_constraint(binding: ConstraintBinding, ctx: EvalContext) -> Constra
             if count < req_role.count:
                 return ConstraintResult(
                     satisfied=False,
-                    penalty=1000.0 if binding.severity == "hard" else float(binding.weight or 10),
+                    penalty=self.fail_penalty,
                     reason=f"Role {req_role.role} needs {req_role.count}, has {count}",
                 )
+        return None
 
-    if action.enforce_min_gap_hours is not None and ctx.person:
-        from api.core.constraints.predicates import min_gap_hours_satisfied
-
-        if not min_gap_hours_satisfied(ctx, ctx.person.id, action.enforce_min_gap_hours):
+    def _min_gap(self, min_hours: int) -> Check:
+        def check(ctx: EvalContext) -> ConstraintResult | None:
+            if not ctx.person or min_gap_hours_satisfied(ctx, ctx.person.id, min_hours):
+                return None
             return ConstraintResult(
                 satisfied=False,
-                penalty=1000.0 if binding.severity == "hard" else float(binding.weight or 10),
-                reason=f"Min gap {action.enforce_min_gap_hours}h violated",
+                penalty=self.fail_penalty,
+                reason=f"Min gap {min_hours}h violated",
             )
 
-    if action.enforce_cap and ctx.person:
-        from datetime import timedelta
-
-        from api.core.constraints.predicates import count_assignments_in_period
-
-        period = action.enforce_cap.get("period", "P1M")
-        max_count = action.enforce_cap.get("max_count", 999)
-
-        # Resolve [win_start, win_end] for the configured period.
-        win_start: date | None = None
-        win_end: date | None = None
-        if ctx.date:
-            if period == "P1M":
-                win_start = ctx.date.replace(day=1)
-                win_end = (win_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
-            elif period.startswith("P") and period.endswith("D"):
-                # Rolling N-day window centered on the candidate event date.
-                # For N=7, half=3, win=[date-3, date+3] (7 days inclusive).
-                try:
-                    window_days = int(period[1:-1])
-                except ValueError:
-                    window_days = 0
-                if window_days > 0:
-                    half = window_days // 2
-                    win_start = ctx.date - timedelta(days=half)
-                    win_end = ctx.date + timedelta(days=window_days - half - 1)
-
-        if win_start is not None and win_end is not None:
-            count = count_assignments_in_period(ctx, ctx.person.id, win_start, win_end)
-            if count >= max_count:
-                return ConstraintResult(
-                    satisfied=False,
-                    penalty=1000.0 if binding.severity == "hard" else float(binding.weight or 10),
-                    reason=f"Cap {max_count} reached in period {period}",
-                )
+        return check
 
-    if action.penalize_if and binding.severity == "soft":
-        # Soft constraint penalties
-        penalty_type = action.penalize_if.get("type")
+    def _cap(self, enforce_cap: dict) -> Check:
+        period = enforce_cap.get("period", "P1M")
+        max_count = enforce_cap.get("max_count", 999)
+        windows: dict[date, tuple[date, date] | None] = {}
 
-        if penalty_type == "cooldown" and ctx.person and ctx.date:
-            from api.core.constraints.predicates import last_assignment_days_ago
+        def check(ctx: EvalContext) -> ConstraintResult | None:
+            if not ctx.person or not ctx.date:
+                return None
+            if ctx.date in windows:
+                window = windows[ctx.date]
+            else:
+                window = windows[ctx.date] = cap_window(period, ctx.date)
+            if window is None:
+                return None
+            count = count_assignments_in_period(ctx, ctx.person.id, *window)
+            if count < max_count:
+                return None
+            return ConstraintResult(
+                satisfied=False,
+                penalty=self.fail_penalty,
+                reason=f"Cap {max_count} reached in period {period}",
+            )
 
-            cooldown_days = action.penalize_if.get("cooldown_days", 14)
-            days_ago = last_assignment_days_ago(ctx, ctx.person.id, ctx.date)
-            if days_ago is not None and days_ago < cooldown_days:
-                penalty = float(binding.weight or 10) * (cooldown_days - days_ago) / cooldown_days
-                return ConstraintResult(
-                    satisfied=False,
-                    penalty=penalty,
-                    reason=f"Cooldown violation: {days_ago} < {cooldown_days} days",
-                )
+        return check
 
-        if penalty_type == "recent_rotation" and ctx.person and ctx.date:
-            from api.core.constraints.predicates import last_assignment_days_ago
+    def _recency(self, limit: int, reason: str) -> Check:
+        weight = float(self.binding.weight or 10)
 
-            lookback = action.penalize_if.get("lookback_days", 30)
+        def check(ctx: EvalContext) -> ConstraintResult | None:
+            if not ctx.person or not ctx.date:
+                return None
             days_ago = last_assignment_days_ago(ctx, ctx.person.id, ctx.date)
-            if days_ago is not None and days_ago < lookback:
-                penalty = float(binding.weight or 10) * (lookback - days_ago) / lookback
-                return ConstraintResult(
-                    satisfied=False,
-                    penalty=penalty,
-                    reason=f"Recent rotation: {days_ago} < {lookback} days",
-                )
+            if days_ago is None or days_ago >= limit:
+                return None
+            return ConstraintResult(
+                satisfied=False,
+                penalty=weight * (limit - days_ago) / limit,
+                reason=reason.format(days_ago=days_ago, limit=limit),
+            )
+
+        return check
+
 
-    return ConstraintResult(satisfied=True)
+def compile_constraint(binding: ConstraintBinding) -> CompiledConstraint:
+    """Compile ``binding`` into a reusable evaluation plan."""
+    return CompiledConstraint(binding)
+
+
+def evaluate_constraint(binding: ConstraintBinding, ctx: EvalContext) -> ConstraintResult:
+    """Evaluate a constraint binding against context (compiles it on the fly)."""
+    return compile_constraint(binding)(ctx)
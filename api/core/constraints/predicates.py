@@ -48,6 +48,10 @@ def has_role(ctx: EvalContext, role: str) -> bool:
 
 def count_assignments_in_period(ctx: EvalContext, person_id: str, start: date, end: date) -> int:
     """Count assignments for person in date range."""
+    if ctx.person_timelines is not None:
+        timeline = ctx.person_timelines.get(person_id)
+        return timeline.count_in_period(start, end) if timeline else 0
+
     if not ctx.person_assignments or person_id not in ctx.person_assignments:
         return 0
 
@@ -61,6 +65,12 @@ def count_assignments_in_period(ctx: EvalContext, person_id: str, start: date, e
 
 def min_gap_hours_satisfied(ctx: EvalContext, person_id: str, min_hours: int) -> bool:
     """Check if minimum gap between assignments is satisfied."""
+    if ctx.person_timelines is not None:
+        timeline = ctx.person_timelines.get(person_id)
+        if timeline is None or timeline.min_gap is None:
+            return True
+        return timeline.min_gap.total_seconds() / 3600 >= min_hours
+
     if not ctx.person_assignments or person_id not in ctx.person_assignments:
         return True
 
@@ -74,6 +84,12 @@ def min_gap_hours_satisfied(ctx: EvalContext, person_id: str, min_hours: int) ->
 
 def last_assignment_days_ago(ctx: EvalContext, person_id: str, current_date: date) -> int | None:
     """Get days since last assignment for person."""
+    if ctx.person_timelines is not None:
+        timeline = ctx.person_timelines.get(person_id)
+        if timeline is None or timeline.last_end is None:
+            return None
+        return (current_date - timeline.last_end.date()).days
+
     if not ctx.person_assignments or person_id not in ctx.person_assignments:
         return None
 
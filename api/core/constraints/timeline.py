@@ -0,0 +1,104 @@
+"""Sorted per-person assignment timeline for constraint predicates.
+
+The predicates in ``predicates.py`` used to scan (and for the min-gap check,
+re-sort) a person's full assignment list on every call, once per candidate
+per event. ``PersonTimeline`` keeps the assignments ordered by start as they
+are added so those queries become:
+
+- ``count_in_period``: two bisects over start-date ordinals — O(log n)
+- ``last_end``: the running maximum end — O(1)
+- ``min_gap``: the running minimum gap between consecutive assignments — O(1)
+
+Insertion is ``bisect.insort``-style (O(log n) search + list insert).
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+
+from api.core.models import Event
+
+
+class PersonTimeline:
+    """One person's assignments, kept sorted by start."""
+
+    __slots__ = ("_events", "_starts", "_start_ordinals", "_last_end", "_min_gap")
+
+    def __init__(self, events: list[Event] | None = None) -> None:
+        self._events: list[Event] = []
+        self._starts: list[datetime] = []
+        self._start_ordinals: list[int] = []
+        self._last_end: datetime | None = None
+        self._min_gap: timedelta | None = None
+        for event in events or []:
+            self.add(event)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @property
+    def events(self) -> list[Event]:
+        """Assignments in start order (ties keep insertion order)."""
+        return self._events
+
+    def add(self, event: Event) -> None:
+        """Insert ``event``, keeping start order and the running aggregates."""
+        # bisect_right keeps equal starts in insertion order, matching a
+        # stable ``sorted(..., key=start)`` over the append-order list.
+        pos = bisect_right(self._starts, event.start)
+        self._events.insert(pos, event)
+        self._starts.insert(pos, event.start)
+        self._start_ordinals.insert(pos, event.start.date().toordinal())
+
+        if self._last_end is None or event.end > self._last_end:
+            self._last_end = event.end
+
+        # Inserting between prev and next replaces gap(prev, next) with
+        # gap(prev, new) and gap(new, next). Because new.start <= next.start,
+        # gap(prev, new) <= gap(prev, next), so the minimum never increases and
+        # only the two new gaps need comparing.
+        if pos > 0:
+            self._note_gap(event.start - self._events[pos - 1].end)
+        if pos + 1 < len(self._events):
+            self._note_gap(self._events[pos + 1].start - event.end)
+
+    def remove(self, event_id: str) -> bool:
+        """Drop the assignment for ``event_id``; returns False if absent.
+
+        Removal can widen the minimum gap, so aggregates are rebuilt — O(n),
+        only used by incremental repair.
+        """
+        for pos, event in enumerate(self._events):
+            if event.id == event_id:
+                break
+        else:
+            return False
+        del self._events[pos]
+        del self._starts[pos]
+        del self._start_ordinals[pos]
+        self._last_end = max((e.end for e in self._events), default=None)
+        self._min_gap = None
+        for prev, nxt in zip(self._events, self._events[1:]):
+            self._note_gap(nxt.start - prev.end)
+        return True
+
+    def count_in_period(self, start: date, end: date) -> int:
+        """Number of assignments whose start date falls in ``[start, end]``."""
+        lo = bisect_left(self._start_ordinals, start.toordinal())
+        hi = bisect_right(self._start_ordinals, end.toordinal())
+        return max(hi - lo, 0)
+
+    @property
+    def last_end(self) -> datetime | None:
+        """Latest assignment end, or None when empty."""
+        return self._last_end
+
+    @property
+    def min_gap(self) -> timedelta | None:
+        """Smallest ``next.start - prev.end`` over consecutive assignments."""
+        return self._min_gap
+
+    def _note_gap(self, gap: timedelta) -> None:
+        if self._min_gap is None or gap < self._min_gap:
+            self._min_gap = gap
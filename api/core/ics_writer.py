@@ -1,27 +1,133 @@
-"""ICS calendar output writer."""
+"""ICS calendar output writer.
 
-from pathlib import Path
+Writes RFC 5545 text directly, one content line at a time, rather than
+building a calendar object tree and serializing it at the end:
+``calendar_header``, one ``vevent`` per event and ``CALENDAR_FOOTER``
+concatenate to a complete VCALENDAR, so callers can stream a calendar of
+any size. TEXT values are escaped (``escape_text``) and lines longer than
+75 octets are folded (``content_line``).
+"""
+
+from __future__ import annotations
 
-from ics import Calendar
-from ics import Event as ICSEvent
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
 
 from api.core.models import Event, Person, SolutionBundle
+from api.timeutils import utcnow
 
+CRLF = "\r\n"
+PRODID = "-//Rostio//Calendar Export//EN"
+# Content lines longer than this are folded (RFC 5545 section 3.1).
+MAX_LINE_OCTETS = 75
 
-def write_calendar_ics(
+CALENDAR_FOOTER = "END:VCALENDAR" + CRLF
+
+_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n", "\r": None})
+
+
+def escape_text(value: str) -> str:
+    """Escape a TEXT property value (backslash, semicolon, comma, newline)."""
+    return value.translate(_TEXT_ESCAPES)
+
+
+def content_line(name: str, value: str) -> str:
+    """``name:value`` with CRLF, folded so no physical line exceeds 75 octets."""
+    line = f"{name}:{value}"
+    if line.isascii():
+        if len(line) <= MAX_LINE_OCTETS:
+            return line + CRLF
+        parts = [line[:MAX_LINE_OCTETS]]
+        step = MAX_LINE_OCTETS - 1  # continuation lines start with a space
+        parts.extend(line[i : i + step] for i in range(MAX_LINE_OCTETS, len(line), step))
+    else:
+        parts = _fold_utf8(line)
+    return (CRLF + " ").join(parts) + CRLF
+
+
+def _fold_utf8(line: str) -> list[str]:
+    """Split ``line`` into folds of at most 75 UTF-8 octets, never inside a character."""
+    parts: list[str] = []
+    start = 0
+    octets = 0
+    limit = MAX_LINE_OCTETS
+    for i, char in enumerate(line):
+        width = len(char.encode())
+        if octets + width > limit:
+            parts.append(line[start:i])
+            start = i
+            octets = 0
+            limit = MAX_LINE_OCTETS - 1
+        octets += width
+    parts.append(line[start:])
+    return parts
+
+
+def format_datetime(value: datetime) -> str:
+    """UTC DATE-TIME form (``20260607T090000Z``); naive values are taken as UTC."""
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC)
+    return (
+        f"{value.year:04d}{value.month:02d}{value.day:02d}"
+        f"T{value.hour:02d}{value.minute:02d}{value.second:02d}Z"
+    )
+
+
+def calendar_header(name: str, timezone: str = "UTC") -> str:
+    """``BEGIN:VCALENDAR`` and the calendar properties."""
+    return "".join(
+        [
+            "BEGIN:VCALENDAR" + CRLF,
+            content_line("PRODID", PRODID),
+            "VERSION:2.0" + CRLF,
+            "CALSCALE:GREGORIAN" + CRLF,
+            "METHOD:PUBLISH" + CRLF,
+            content_line("X-WR-CALNAME", escape_text(name)),
+            content_line("X-WR-TIMEZONE", escape_text(timezone)),
+        ]
+    )
+
+
+def vevent(
+    uid: str,
+    dtstamp: datetime,
+    start: datetime,
+    end: datetime,
+    summary: str,
+    description: str | None = None,
+    status: str = "CONFIRMED",
+) -> str:
+    """One ``VEVENT`` component; ``summary`` and ``description`` are plain text."""
+    lines = [
+        "BEGIN:VEVENT" + CRLF,
+        content_line("UID", escape_text(uid)),
+        "DTSTAMP:" + format_datetime(dtstamp) + CRLF,
+        "DTSTART:" + format_datetime(start) + CRLF,
+        "DTEND:" + format_datetime(end) + CRLF,
+        content_line("SUMMARY", escape_text(summary)),
+    ]
+    if description:
+        lines.append(content_line("DESCRIPTION", escape_text(description)))
+    lines.append("STATUS:" + status + CRLF)
+    lines.append("END:VEVENT" + CRLF)
+    return "".join(lines)
+
+
+def iter_calendar_ics(
     solution: SolutionBundle,
     events: list[Event],
     people: list[Person],
-    output_path: Path,
     scope: str = "org",
     scope_id: str | None = None,
-) -> None:
-    """Write ICS calendar file for given scope."""
+    calendar_name: str = "Schedule",
+) -> Iterator[str]:
+    """The calendar for ``solution`` in ``scope``, one component at a time."""
     event_map = {e.id: e for e in events}
     people_map = {p.id: p for p in people}
+    dtstamp = utcnow()
 
-    calendar = Calendar()
-
+    yield calendar_header(calendar_name)
     for assignment in solution.assignments:
         event = event_map.get(assignment.event_id)
         if not event:
@@ -35,19 +141,28 @@ def write_calendar_ics(
             if scope_id not in assignment.team_ids:
                 continue
 
-        # Create ICS event
-        ics_event = ICSEvent()
-        ics_event.name = f"{event.type} - {event.id}"
-        ics_event.begin = event.start
-        ics_event.end = event.end
-
-        # Add attendees
         assignee_names = [people_map[pid].name for pid in assignment.assignees if pid in people_map]
-        if assignee_names:
-            ics_event.description = f"Assigned: {', '.join(assignee_names)}"
+        yield vevent(
+            uid=f"rostio-event-{event.id}@rostio.app",
+            dtstamp=dtstamp,
+            start=event.start,
+            end=event.end,
+            summary=f"{event.type} - {event.id}",
+            description=f"Assigned: {', '.join(assignee_names)}" if assignee_names else None,
+        )
+    yield CALENDAR_FOOTER
 
-        calendar.events.add(ics_event)
 
+def write_calendar_ics(
+    solution: SolutionBundle,
+    events: list[Event],
+    people: list[Person],
+    output_path: Path,
+    scope: str = "org",
+    scope_id: str | None = None,
+) -> None:
+    """Write ICS calendar file for given scope."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.writelines(calendar.serialize_iter())
+    # newline="" keeps the CRLF line endings RFC 5545 requires.
+    with open(output_path, "w", encoding="utf-8", newline="") as f:
+        f.writelines(iter_calendar_ics(solution, events, people, scope, scope_id))
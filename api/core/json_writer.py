@@ -1,14 +1,108 @@
-"""JSON output writer for solution bundles."""
+"""JSON output writers for solution bundles.
 
+Bundles are written incrementally: the small top-level sections go out
+first, then assignments one per line as the iterable yields them, so
+neither a whole-bundle dict nor the full document string is ever built.
+``write_solution_ndjson`` is the line-delimited variant; read it back one
+assignment at a time with ``iter_solution_assignments`` in
+``api/core/loader.py``.
+"""
+
+import json
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import Any, TextIO
 
 from api.core.loader import save_json
-from api.core.models import SolutionBundle
+from api.core.models import Assignment, SolutionBundle
+
+
+def iter_json_stream(fields: dict[str, Any], items_key: str, items: Iterable[Any]) -> Iterator[str]:
+    """Yield ``fields`` plus ``items_key: [...]`` as one JSON object, piece by piece.
+
+    Items are serialized one at a time, one per line, so the document can be
+    sent (or written) while ``items`` is still being produced.
+    """
+    yield "{\n"
+    for key, value in fields.items():
+        yield f"  {json.dumps(key)}: {json.dumps(value, default=str)},\n"
+    yield f"  {json.dumps(items_key)}: ["
+    first = True
+    for item in items:
+        yield ("\n    " if first else ",\n    ") + json.dumps(item, default=str)
+        first = False
+    yield "]\n}\n" if first else "\n  ]\n}\n"
+
+
+def write_json_stream(
+    f: TextIO, fields: dict[str, Any], items_key: str, items: Iterable[Any]
+) -> int:
+    """Write ``iter_json_stream(fields, items_key, items)`` to ``f``; returns the item count."""
+    count = 0
+
+    def counted() -> Iterator[Any]:
+        nonlocal count
+        for item in items:
+            count += 1
+            yield item
+
+    f.writelines(iter_json_stream(fields, items_key, counted()))
+    return count
+
+
+def solution_header(solution: SolutionBundle) -> dict[str, Any]:
+    """Every bundle section except the assignments."""
+    return {
+        "meta": solution.meta.model_dump(mode="json"),
+        "metrics": solution.metrics.model_dump(mode="json"),
+        "violations": solution.violations.model_dump(mode="json"),
+    }
+
+
+def _dump_assignments(assignments: Iterable[Assignment]) -> Iterable[dict[str, Any]]:
+    return (a.model_dump(mode="json") for a in assignments)
+
+
+def write_solution_json(
+    solution: SolutionBundle,
+    output_path: Path,
+    assignments: Iterable[Assignment] | None = None,
+) -> int:
+    """Write solution bundle to JSON, streaming the assignments.
+
+    ``assignments`` defaults to ``solution.assignments``; pass a generator to
+    write them as they are produced. Returns the number written.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        return write_json_stream(
+            f,
+            solution_header(solution),
+            "assignments",
+            _dump_assignments(solution.assignments if assignments is None else assignments),
+        )
+
 
+def write_solution_ndjson(
+    solution: SolutionBundle,
+    output_path: Path,
+    assignments: Iterable[Assignment] | None = None,
+) -> int:
+    """Write solution bundle as NDJSON: a header line, then one line per assignment.
 
-def write_solution_json(solution: SolutionBundle, output_path: Path) -> None:
-    """Write solution bundle to JSON."""
-    save_json(output_path, solution.model_dump(mode="json"))
+    The header holds ``meta``, ``metrics`` and ``violations``. ``assignments``
+    works as in ``write_solution_json``. Returns the number written.
+    """
+    if assignments is None:
+        assignments = solution.assignments
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(solution_header(solution)) + "\n")
+        for item in _dump_assignments(assignments):
+            f.write(json.dumps(item) + "\n")
+            count += 1
+    return count
 
 
 def write_metrics_json(solution: SolutionBundle, output_path: Path) -> None:
@@ -2,12 +2,14 @@
 
 import csv
 import json
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 import yaml
 
 from api.core.models import (
+    Assignment,
     Availability,
     ConstraintBinding,
     EventsFile,
@@ -118,11 +120,30 @@ def load_constraint_files(workspace: Path) -> list[ConstraintBinding]:
 
 
 def load_solution(path: Path) -> SolutionBundle:
-    """Load solution from JSON."""
+    """Load solution from JSON, or from NDJSON when ``path`` ends in ``.ndjson``."""
+    if path.suffix == ".ndjson":
+        return SolutionBundle(
+            **load_solution_header(path), assignments=list(iter_solution_assignments(path))
+        )
     data = load_json(path)
     return SolutionBundle(**data)
 
 
+def load_solution_header(path: Path) -> dict[str, Any]:
+    """Load the meta/metrics/violations header line of an NDJSON solution."""
+    with open(path, encoding="utf-8") as f:
+        return json.loads(f.readline())
+
+
+def iter_solution_assignments(path: Path) -> Iterator[Assignment]:
+    """Yield an NDJSON solution's assignments one line at a time."""
+    with open(path, encoding="utf-8") as f:
+        f.readline()  # header
+        for line in f:
+            if line.strip():
+                yield Assignment(**json.loads(line))
+
+
 def save_csv(path: Path, rows: list[dict[str, Any]], fieldnames: list[str]) -> None:
     """Save rows to CSV."""
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -216,6 +216,31 @@ class Metrics(BaseModel):
     health_score: float
 
 
+class VariantMetrics(BaseModel):
+    """Outcome of one portfolio variant."""
+
+    name: str
+    ordering: str
+    tie_break_seed: int | None = None
+    fairness_weight: int
+    completed: bool
+    solve_ms: float | None = None
+    hard_violations: int | None = None
+    soft_score: float | None = None
+    health_score: float | None = None
+    fairness_stdev: float | None = None
+
+
+class SolveProfile(BaseModel):
+    """Where a solve spent its time (see ``api/core/solver/profiling.py``)."""
+
+    phases_ms: dict[str, float] = Field(default_factory=dict)
+    counters: dict[str, int] = Field(default_factory=dict)
+    # Profiler that captured ``capture`` ("cprofile" | "pyinstrument"), when requested.
+    capture_tool: str | None = None
+    capture: str | None = None
+
+
 class SolutionMeta(BaseModel):
     """Metadata for a solution."""
 
@@ -225,6 +250,10 @@ class SolutionMeta(BaseModel):
     mode: str
     change_min: bool
     solver: SolverMeta
+    # Every variant a portfolio solve ran, winner included (portfolio engine only).
+    portfolio: list[VariantMetrics] | None = None
+    # Per-phase timing and counters (greedy engine), plus any profiler capture.
+    profile: SolveProfile | None = None
 
 
 class SolutionBundle(BaseModel):
@@ -1,7 +1,8 @@
 """Solver adapter interface."""
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, replace
 from datetime import date
 
 from api.core.models import (
@@ -37,9 +38,56 @@ class SolveContext:
     published_solution: SolutionBundle | None = None
 
 
+@dataclass
+class SolveProgress:
+    """Progress of a running solve, as reported to a progress callback."""
+
+    events_done: int
+    events_total: int
+    assignments: int
+    hard_violations: int
+
+
+ProgressCallback = Callable[[SolveProgress], None]
+
+
+class SolveCancelledError(Exception):
+    """Raised by a progress callback to stop a solve early."""
+
+
+def apply_patch(context: SolveContext, changes: Patch) -> SolveContext:
+    """Return a copy of ``context`` with ``changes`` applied.
+
+    Removed people/events are dropped, added ones appended (replacing any with
+    the same id), and each ``update_availability`` entry replaces the
+    availability rows of its person.
+    """
+    removed_people = set(changes.remove_people) | {p.id for p in changes.add_people}
+    removed_events = set(changes.remove_events) | {e.id for e in changes.add_events}
+    updated = {a.person_id for a in changes.update_availability}
+    return replace(
+        context,
+        people=[p for p in context.people if p.id not in removed_people] + changes.add_people,
+        events=[e for e in context.events if e.id not in removed_events] + changes.add_events,
+        availability=[a for a in context.availability if a.person_id not in updated]
+        + changes.update_availability,
+    )
+
+
 class SolverAdapter(ABC):
     """Abstract solver adapter."""
 
+    progress: ProgressCallback | None = None
+
+    def set_progress_callback(self, callback: ProgressCallback | None) -> None:
+        """Report progress to ``callback`` while solving.
+
+        Engines that assign event by event (greedy) call it after each event;
+        the others never do. A ``SolveCancelledError`` raised by the callback
+        propagates out of ``solve``.
+        """
+        self.progress = callback
+
     @abstractmethod
     def build_model(self, context: SolveContext) -> None:
         """Build internal model from context."""
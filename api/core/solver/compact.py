@@ -0,0 +1,54 @@
+"""Compact, array-backed event data for the greedy solver's inner loops.
+
+``Event`` stays the public model: predicates, timelines and the solution
+read it. What the solver itself needs per event — its date as a day number,
+its start order, its id and type — is pulled out once in ``build_model``
+into ``EventTable``, a struct of arrays over ``context.events`` addressed by
+dense ints:
+
+- ``days``: start date as an epoch day (``date.toordinal()``), ``array("l")``
+- ``order``: event positions sorted by start (stable), ``array("l")``
+- ``index``: event id → position
+
+A solve then filters its window with integer compares over ``order`` and
+gets each event's blocked-day bit offset as ``days[pos] - from_date
+ordinal``, instead of calling ``start.date()`` and re-sorting the models on
+every solve (portfolio variants and repairs reuse the table through
+``model_snapshot``).
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from datetime import date
+
+from api.core.models import Event
+
+
+class EventTable:
+    """Per-event solver fields for one ``context.events`` list. Read-only once built."""
+
+    __slots__ = ("events", "days", "order", "index")
+
+    def __init__(self, events: Sequence[Event]) -> None:
+        self.events = events
+        self.days = array("l", (e.start.date().toordinal() for e in events))
+        self.order = array("l", sorted(range(len(events)), key=lambda pos: events[pos].start))
+        self.index = {e.id: pos for pos, e in enumerate(events)}
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def window(self, from_date: date, to_date: date) -> list[Event]:
+        """Events starting on ``from_date`` .. ``to_date`` (inclusive), in start order."""
+        lo, hi = from_date.toordinal(), to_date.toordinal()
+        days, events = self.days, self.events
+        return [events[pos] for pos in self.order if lo <= days[pos] <= hi]
+
+    def day(self, event: Event) -> int:
+        """``event``'s start date as an epoch day."""
+        pos = self.index.get(event.id)
+        if pos is None or self.events[pos] is not event:
+            return event.start.date().toordinal()
+        return self.days[pos]
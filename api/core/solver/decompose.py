@@ -0,0 +1,282 @@
+"""Decomposed greedy solving on a process pool (``solver="parallel"``).
+
+A solve splits into subproblems that the greedy pass would never let
+interact:
+
+- **Components** — people, roles and team events form a graph (a person
+  links the roles they hold, an event links its required roles, a team-only
+  event links its members). Events in different connected components draw on
+  disjoint people, so solving each component alone gives exactly the
+  assignments the full solve would.
+- **Months** (``by_month=True``, opt-in) — each component is further split
+  by calendar month so a year-long single-component org still fans out.
+  Month partitions don't see each other's assignments, so this is an
+  approximation: after merging, a reconcile pass re-walks the whole roster
+  with the greedy repair (``incremental_update``), re-picking any assignment
+  that now breaks a person-scoped hard constraint across a month boundary,
+  then spends ``merge_s`` seconds of local search evening out the fairness
+  counts (each month starts everyone at zero, so the same people lead every
+  month's tie-breaks).
+
+Partitions are solved by ``GreedyHeuristicSolver`` (plus ``improve_s`` of
+local search each) in a ``ProcessPoolExecutor``; a single partition (or
+``max_workers=1``) is solved in-process.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, timedelta
+from itertools import repeat
+
+from api.core.models import (
+    Event,
+    Patch,
+    SolutionBundle,
+    SolutionMeta,
+    SolverMeta,
+    Violations,
+)
+from api.core.solver.adapter import SolveContext, SolverAdapter, apply_patch
+from api.core.solver.heuristics import GreedyHeuristicSolver, compute_metrics
+
+logger = logging.getLogger("rostio")
+
+DEFAULT_MERGE_S = 0.5
+
+
+@dataclass
+class WorkerSettings:
+    """Greedy solver knobs shipped to worker processes alongside their context."""
+
+    improve_s: float = 0.0
+    weights: dict[str, int] = field(default_factory=dict)
+    change_min_enabled: bool = False
+    change_min_weight: int = 100
+    prior_published_keys: set[tuple[str, str]] = field(default_factory=set)
+
+    def configure(self, solver: GreedyHeuristicSolver) -> None:
+        """Apply the objective and change-minimization settings to ``solver``."""
+        solver.set_objective(self.weights)
+        solver.enable_change_minimization(self.change_min_enabled, self.change_min_weight)
+        solver.set_prior_published_keys(self.prior_published_keys)
+
+
+def _solve_partition(context: SolveContext, settings: WorkerSettings) -> SolutionBundle:
+    """Worker entry point: greedy-solve one partition."""
+    solver = GreedyHeuristicSolver(improve_s=settings.improve_s)
+    settings.configure(solver)
+    solver.build_model(context)
+    return solver.solve()
+
+
+def partition_context(context: SolveContext, *, by_month: bool = False) -> list[SolveContext]:
+    """Split ``context`` into independent sub-contexts (see module docstring).
+
+    Each partition keeps the org, teams, constraints and holidays, and only
+    the events, people and availability of its component. Month partitions
+    narrow ``from_date`` / ``to_date`` to the month. Partitions are returned
+    in order of their first event.
+    """
+    parent: dict[tuple[str, str], tuple[str, str]] = {}
+
+    def find(node: tuple[str, str]) -> tuple[str, str]:
+        parent.setdefault(node, node)
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def union(a: tuple[str, str], b: tuple[str, str]) -> None:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[root_b] = root_a
+
+    events = sorted(
+        (e for e in context.events if context.from_date <= e.start.date() <= context.to_date),
+        key=lambda e: e.start,
+    )
+    team_members = {t.id: t.members for t in context.teams}
+    for person in context.people:
+        for role in person.roles:
+            union(("person", person.id), ("role", role))
+
+    event_nodes: list[tuple[str, str]] = []
+    for event in events:
+        if event.required_roles:
+            nodes = [("role", r.role) for r in event.required_roles]
+        else:
+            members = [m for t in event.team_ids for m in team_members.get(t, [])]
+            nodes = [("person", m) for m in members] or [("event", event.id)]
+        for node in nodes[1:]:
+            union(nodes[0], node)
+        event_nodes.append(nodes[0])
+
+    groups: dict[tuple, list[Event]] = defaultdict(list)
+    for event, node in zip(events, event_nodes, strict=True):
+        key = (find(node), (event.start.year, event.start.month) if by_month else None)
+        groups[key].append(event)
+
+    people_by_root: dict[tuple[str, str], list] = defaultdict(list)
+    for person in context.people:
+        people_by_root[find(("person", person.id))].append(person)
+    availability_by_person = defaultdict(list)
+    for avail in context.availability:
+        availability_by_person[avail.person_id].append(avail)
+
+    partitions = []
+    for (root, month), group in groups.items():
+        people = people_by_root.get(root, [])
+        from_date, to_date = context.from_date, context.to_date
+        if month is not None:
+            month_start = date(month[0], month[1], 1)
+            month_end = (month_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+            from_date, to_date = max(from_date, month_start), min(to_date, month_end)
+        partitions.append(
+            replace(
+                context,
+                people=people,
+                events=group,
+                availability=[a for p in people for a in availability_by_person.get(p.id, [])],
+                from_date=from_date,
+                to_date=to_date,
+                published_solution=None,
+            )
+        )
+    return partitions
+
+
+class DecomposingSolver(SolverAdapter):
+    """Greedy solver that fans independent partitions out to worker processes."""
+
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        by_month: bool = False,
+        improve_s: float = 0.0,
+        merge_s: float = DEFAULT_MERGE_S,
+    ) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.by_month = by_month
+        self.merge_s = merge_s
+        self.context: SolveContext | None = None
+        self._settings = WorkerSettings(improve_s=improve_s)
+        self._partitions: list[SolveContext] = []
+
+    def build_model(self, context: SolveContext) -> None:
+        """Partition ``context``; each worker builds its own greedy model."""
+        self.context = context
+        self._partitions = partition_context(context, by_month=self.by_month)
+
+    def solve(self, timeout_s: int | None = None) -> SolutionBundle:
+        """Solve every partition, merge, and reconcile month boundaries."""
+        if not self.context:
+            raise RuntimeError("Must call build_model first")
+
+        start_time = time.time()
+        partitions = self._partitions
+        workers = min(self.max_workers, len(partitions))
+        if workers <= 1:
+            results = [_solve_partition(p, self._settings) for p in partitions]
+        else:
+            chunksize = max(1, len(partitions) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(
+                    pool.map(
+                        _solve_partition, partitions, repeat(self._settings), chunksize=chunksize
+                    )
+                )
+        logger.info(
+            "Solved %d partitions on %d worker(s) in %.0fms",
+            len(partitions),
+            max(workers, 1),
+            (time.time() - start_time) * 1000,
+        )
+
+        merged = self._merge(results, start_time)
+        strategy = "components"
+        if self.by_month:
+            strategy += "+month"
+            if len(partitions) > 1:
+                merged = self._reconcile(merged, start_time)
+        if self._settings.improve_s > 0:
+            strategy += "+local_search"
+        merged.meta.solver = SolverMeta(name="greedy_parallel", version="1.0.0", strategy=strategy)
+        return merged
+
+    def _merge(self, results: list[SolutionBundle], start_time: float) -> SolutionBundle:
+        """Concatenate partition results in the full solve's event order."""
+        context = self.context
+        events_by_id = {e.id: e for e in context.events}
+        in_range = [
+            e for e in context.events if context.from_date <= e.start.date() <= context.to_date
+        ]
+        order = {e.id: i for i, e in enumerate(sorted(in_range, key=lambda e: e.start))}
+
+        assignments = sorted(
+            (a for r in results for a in r.assignments), key=lambda a: order[a.event_id]
+        )
+
+        def by_event(violation) -> int:
+            return order.get(violation.entities[0], -1) if violation.entities else -1
+
+        violations = Violations(
+            hard=sorted((v for r in results for v in r.violations.hard), key=by_event),
+            soft=sorted((v for r in results for v in r.violations.soft), key=by_event),
+        )
+        person_events: dict[str, list[Event]] = defaultdict(list)
+        for assignment in assignments:
+            for person_id in assignment.assignees:
+                person_events[person_id].append(events_by_id[assignment.event_id])
+
+        solve_ms = (time.time() - start_time) * 1000
+        return SolutionBundle(
+            meta=SolutionMeta(
+                generated_at=datetime.now(),
+                range_start=context.from_date,
+                range_end=context.to_date,
+                mode=context.mode,
+                change_min=context.change_min,
+                solver=SolverMeta(name="greedy_parallel", version="1.0.0", strategy="components"),
+            ),
+            assignments=assignments,
+            metrics=compute_metrics(solve_ms, person_events, violations),
+            violations=violations,
+        )
+
+    def _reconcile(self, merged: SolutionBundle, start_time: float) -> SolutionBundle:
+        """Repair month-boundary conflicts, then rebalance fairness for ``merge_s``."""
+        solver = GreedyHeuristicSolver(improve_s=self.merge_s)
+        self._settings.configure(solver)
+        solver.build_model(replace(self.context, published_solution=merged))
+        solver.incremental_update(Patch())
+        result = solver.solve()
+        if solver.repaired_events:
+            logger.info("Reconcile re-picked %d event(s)", len(solver.repaired_events))
+        result.metrics.solve_ms = (time.time() - start_time) * 1000
+        return result
+
+    def set_objective(self, weights: dict[str, int]) -> None:
+        """Set objective function weights."""
+        self._settings.weights = weights
+
+    def enable_change_minimization(self, enabled: bool, weight_move_published: int) -> None:
+        """Enable/disable change minimization."""
+        self._settings.change_min_enabled = enabled
+        self._settings.change_min_weight = weight_move_published
+
+    def set_prior_published_keys(self, keys: set[tuple[str, str]]) -> None:
+        """Provide ``(event_id, person_id)`` keys from the prior published solution."""
+        self._settings.prior_published_keys = keys
+
+    def incremental_update(self, changes: Patch) -> None:
+        """Apply incremental changes to model (re-partitions the patched context)."""
+        if not self.context:
+            raise RuntimeError("Must call build_model first")
+        self.build_model(apply_patch(self.context, changes))
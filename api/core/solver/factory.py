@@ -0,0 +1,49 @@
+"""Solver engine selection for ``POST /solver/solve`` and the CLI."""
+
+import logging
+
+from api.core.solver.adapter import SolverAdapter
+from api.core.solver.heuristics import GreedyHeuristicSolver
+
+logger = logging.getLogger("rostio")
+
+GREEDY_ENGINE = "greedy"
+CP_SAT_ENGINE = "cp_sat"
+PARALLEL_ENGINE = "parallel"
+PORTFOLIO_ENGINE = "portfolio"
+SOLVER_ENGINES = (GREEDY_ENGINE, CP_SAT_ENGINE, PARALLEL_ENGINE, PORTFOLIO_ENGINE)
+
+
+def create_solver(
+    engine: str = GREEDY_ENGINE, *, improve_s: float = 0.0, by_month: bool = False
+) -> SolverAdapter:
+    """Return a solver adapter for ``engine``.
+
+    ``improve_s`` adds that many seconds of local-search improvement after
+    the greedy pass (ignored by ``cp_sat``; per partition for ``parallel``).
+    ``cp_sat`` falls back to the greedy solver (with a warning) when OR-Tools
+    isn't installed. ``parallel`` solves independent subproblems on a process
+    pool; ``portfolio`` races greedy variants and keeps the best. Adapter
+    modules are imported lazily so app startup doesn't pay for loading
+    OR-Tools.
+
+    ``by_month`` also splits ``parallel`` partitions by calendar month (see
+    ``api/core/solver/decompose.py``); other engines ignore it.
+    """
+    if engine not in SOLVER_ENGINES:
+        raise ValueError(f"Unknown solver engine '{engine}'")
+    if engine == CP_SAT_ENGINE:
+        from api.core.solver.or_tools_adapter import ORTOOLS_AVAILABLE, ORToolsSolver
+
+        if ORTOOLS_AVAILABLE:
+            return ORToolsSolver()
+        logger.warning("OR-Tools not installed; solving with the greedy heuristic instead")
+    if engine == PARALLEL_ENGINE:
+        from api.core.solver.decompose import DecomposingSolver
+
+        return DecomposingSolver(improve_s=improve_s, by_month=by_month)
+    if engine == PORTFOLIO_ENGINE:
+        from api.core.solver.portfolio import PortfolioSolver
+
+        return PortfolioSolver(improve_s=improve_s)
+    return GreedyHeuristicSolver(improve_s=improve_s)
@@ -1,12 +1,17 @@
 """Simple greedy heuristic solver implementation."""
 
+import logging
+import math
+import random
 import time
 from collections import defaultdict
-from datetime import datetime
+from collections.abc import Sequence
+from datetime import date, datetime
 from typing import Any
 
 from api.core.constraints.dsl import EvalContext
-from api.core.constraints.eval import evaluate_constraint
+from api.core.constraints.eval import CompiledConstraint, compile_constraint
+from api.core.constraints.timeline import PersonTimeline
 from api.core.models import (
     Assignment,
     Event,
@@ -14,31 +19,242 @@ from api.core.models import (
     Metrics,
     Patch,
     Person,
+    RequiredRole,
     SolutionBundle,
     SolutionMeta,
+    SolveProfile,
     SolverMeta,
     StabilityMetrics,
     Violation,
     Violations,
 )
-from api.core.solver.adapter import SolveContext, SolverAdapter
+from api.core.solver.adapter import SolveContext, SolveProgress, SolverAdapter, apply_patch
+from api.core.solver.compact import EventTable
+from api.core.solver.local_search import LocalSearchImprover
+from api.core.solver.ordering import LOOKAHEAD_PENALTY, SlackOrder
+from api.core.solver.profiling import PhaseTimer
+from api.core.solver.vectorized import NUMPY_AVAILABLE, VECTORIZED_MODE, VectorizedScorer
+
+logger = logging.getLogger("rostio")
+
+START_ORDER = "start"
+MOST_CONSTRAINED_ORDER = "most_constrained"
+ORDERINGS = (START_ORDER, MOST_CONSTRAINED_ORDER)
+
+# What ``build_model`` precomputes that solves only read; see ``model_snapshot``
+# / ``use_model``. Constraint plans carry per-solver memos and counters, so
+# they are compiled per solver instead.
+_MODEL_FIELDS = (
+    "_person_index",
+    "_person_roles",
+    "_candidates_by_role",
+    "_blocked_days",
+    "_holiday_map",
+    "_event_table",
+)
 
 
 class GreedyHeuristicSolver(SolverAdapter):
-    """Feasible-first greedy solver."""
+    """Feasible-first greedy solver.
+
+    With ``improve_s > 0`` the greedy roster is post-optimized for that many
+    seconds by ``LocalSearchImprover`` (see ``local_search.py``).
+
+    After ``incremental_update`` the next ``solve`` repairs the baseline roster
+    instead of solving from scratch (see ``incremental_update``).
+
+    ``ordering`` picks the order events are assigned in (``ORDERINGS``; see
+    ``ordering.py`` for most-constrained-first; the result is reported in
+    start order either way) and ``tie_break_seed``, when
+    set, breaks equal candidate scores randomly instead of by roster order.
+    The per-assignment fairness penalty is ``weights["fairness"]`` (default
+    10, see ``set_objective``). These are the knobs portfolio variants turn.
 
-    def __init__(self) -> None:
+    Each solution carries per-phase timing and counters in
+    ``meta.profile`` (see ``profiling.py``).
+    """
+
+    def __init__(
+        self,
+        *,
+        improve_s: float = 0.0,
+        improve_seed: int = 0,
+        ordering: str = START_ORDER,
+        tie_break_seed: int | None = None,
+    ) -> None:
+        if ordering not in ORDERINGS:
+            raise ValueError(f"Unknown event ordering '{ordering}'")
         self.context: SolveContext | None = None
+        self.improve_s = improve_s
+        self.improve_seed = improve_seed
+        self.ordering = ordering
+        self.tie_break_seed = tie_break_seed
         self.weights: dict[str, int] = {}
         self.change_min_enabled: bool = False
         self.change_min_weight: int = 100
         # Loose match (event_id, person_id) — see specs/020-solver-quality-changemin.
         # Solver writes Assignment.role=NULL so a role-strict match would never hit.
         self._prior_published_keys: set[tuple[str, str]] = set()
+        # Model-build indexes (see ``build_model``). Candidates are dense
+        # ints into ``context.people`` so the per-event loop never rescans
+        # the full roster.
+        self._person_index: dict[str, int] = {}
+        self._person_roles: list[frozenset[str]] = []
+        self._candidates_by_role: dict[str, list[int]] = {}
+        self._blocked_days: list[int] = []
+        self._holiday_map: dict[date, bool] = {}
+        self._plans: list[CompiledConstraint] = []
+        self._constraint_index: dict[tuple[str, str, str], list[CompiledConstraint]] = {}
+        self._event_table: EventTable = EventTable([])
+        # Per solve: assignments so far per person int (fairness term).
+        self._assignment_counts: list[int] = []
+        self._timelines: dict[str, PersonTimeline] = {}
+        # event id -> role filled by each assignee, for role-based events (per solve).
+        self._slot_roles: dict[str, list[str]] = {}
+        # Set per solve when context.mode == "vectorized".
+        self._scorer: VectorizedScorer | None = None
+        # Set per solve from ``weights`` / ``tie_break_seed``.
+        self._fairness_weight: float = 10
+        self._tie_rng: random.Random | None = None
+        self._slack_order: SlackOrder | None = None
+        # Profiling (see ``profiling.py``): last build_model time, not yet
+        # reported by a solve, and the running solve's phases and counters.
+        self._build_ms: float = 0.0
+        self._timer = PhaseTimer()
+        self._candidates_scored = 0
+        # Repair state (see ``incremental_update``): baseline event id ->
+        # assignment, and events to re-assign from scratch. Reset by build_model.
+        self._repair_baseline: dict[str, Assignment] | None = None
+        self._repair_events: set[str] = set()
+        self._last_solution: SolutionBundle | None = None
+        # Events whose assignment the last repair recomputed.
+        self.repaired_events: list[str] = []
 
     def build_model(self, context: SolveContext) -> None:
-        """Build internal model from context."""
+        """Build internal model from context.
+
+        Precomputes everything that only depends on the input data, once:
+
+        - ``_person_index``: person id → dense int (position in ``context.people``)
+        - ``_candidates_by_role``: role → ascending person ints holding that role
+        - ``_blocked_days``: per-person bitset over the solve window; bit ``d``
+          is set when the person is unavailable on ``from_date + d`` (vacation
+          periods, inclusive on both ends, plus exception / rrule dates)
+        - ``_holiday_map``: date → is_long_weekend
+        - ``_plans``: one compiled evaluation plan per constraint binding
+        - ``_constraint_index``: (event type, scope, severity) → plans that
+          apply, in binding order, so each event fetches only its constraints;
+          ``applies_to: ["*"]`` files a plan under every event type present
+        - ``_event_table``: event epoch days, start order and id index
+          (``compact.py``), so solves never re-derive dates from the models
+        """
+        build_start = time.perf_counter()
+        self.context = context
+        self._repair_baseline = None
+        self._repair_events = set()
+
+        self._person_index = {}
+        self._person_roles = []
+        candidates_by_role: dict[str, list[int]] = defaultdict(list)
+        for idx, person in enumerate(context.people):
+            self._person_index[person.id] = idx
+            roles = frozenset(person.roles)
+            self._person_roles.append(roles)
+            for role in roles:
+                candidates_by_role[role].append(idx)
+        self._candidates_by_role = dict(candidates_by_role)
+
+        horizon = (context.to_date - context.from_date).days
+        self._blocked_days = [0] * len(context.people)
+        for avail in context.availability or []:
+            if avail.person_id is None:
+                continue
+            idx = self._person_index.get(avail.person_id)
+            if idx is None:
+                continue
+            bits = self._blocked_days[idx]
+            for vac in avail.vacations:
+                lo = max((vac.start - context.from_date).days, 0)
+                hi = min((vac.end - context.from_date).days, horizon)
+                if lo <= hi:
+                    bits |= ((1 << (hi - lo + 1)) - 1) << lo
+            for exc_date in avail.exceptions:
+                offset = (exc_date - context.from_date).days
+                if 0 <= offset <= horizon:
+                    bits |= 1 << offset
+            self._blocked_days[idx] = bits
+
+        self._holiday_map = {}
+        for h in context.holidays or []:
+            self._holiday_map[h.date] = h.is_long_weekend
+
+        self._compile_plans(context)
+
+        self._event_table = EventTable(context.events)
+        self._build_ms = (time.perf_counter() - build_start) * 1000
+
+    def _compile_plans(self, context: SolveContext) -> None:
+        """Fill ``_plans`` and ``_constraint_index`` from ``context.constraints``."""
+        self._plans = [compile_constraint(c) for c in context.constraints]
+        constraint_index: dict[tuple[str, str, str], list[CompiledConstraint]] = defaultdict(list)
+        event_types = {event.type for event in context.events}
+        for plan in self._plans:
+            # "*" applies a binding to every event type in the window.
+            for event_type in event_types if "*" in plan.applies_to else plan.applies_to:
+                constraint_index[(event_type, plan.scope, plan.severity)].append(plan)
+        self._constraint_index = dict(constraint_index)
+
+    def model_snapshot(self) -> dict[str, Any]:
+        """The indexes ``build_model`` precomputed, for ``use_model`` on the same data.
+
+        They are read-only once built, so several solvers can share one snapshot.
+        Constraint plans are left out: each solver compiles its own.
+        """
+        if not self.context:
+            raise RuntimeError("Must call build_model first")
+        return {name: getattr(self, name) for name in _MODEL_FIELDS}
+
+    def use_model(self, context: SolveContext, snapshot: dict[str, Any]) -> None:
+        """Like ``build_model``, but adopt the indexes of a solver built on the same data.
+
+        ``snapshot`` comes from ``model_snapshot``; ``context`` must hold the
+        same people, availability, holidays and constraints over the same
+        window (only ``mode``, ``change_min`` and ``published_solution`` may
+        differ).
+        """
         self.context = context
+        self._repair_baseline = None
+        self._repair_events = set()
+        self._build_ms = 0.0
+        for name in _MODEL_FIELDS:
+            setattr(self, name, snapshot[name])
+        # Plans hold per-date memos and call counters; sharing them would mix
+        # concurrent solves' profile counters.
+        self._compile_plans(context)
+
+    # Read-only views of the ``build_model`` indexes, for solvers that build
+    # their own model on top of them (``ORToolsSolver``).
+
+    def constraints_for(
+        self, event_type: str, scope: str, severity: str
+    ) -> Sequence[CompiledConstraint]:
+        """Compiled plans for ``(event_type, scope, severity)``, in binding order."""
+        return self._constraint_index.get((event_type, scope, severity), ())
+
+    @property
+    def candidates_by_role(self) -> dict[str, list[int]]:
+        """Role → ascending person ints holding that role."""
+        return self._candidates_by_role
+
+    @property
+    def blocked_days(self) -> list[int]:
+        """Per-person bitsets of unavailable days, bit ``d`` = ``from_date + d``."""
+        return self._blocked_days
+
+    @property
+    def holiday_map(self) -> dict[date, bool]:
+        """Holiday date → is_long_weekend."""
+        return self._holiday_map
 
     def solve(self, timeout_s: int | None = None) -> SolutionBundle:
         """Solve and return solution bundle."""
@@ -46,58 +262,150 @@ class GreedyHeuristicSolver(SolverAdapter):
             raise RuntimeError("Must call build_model first")
 
         start_time = time.time()
+        timer = self._timer = PhaseTimer()
+        timer.phases_ms["build"] = self._build_ms
+        self._build_ms = 0.0
+        self._candidates_scored = 0
+        plan_calls = sum(plan.calls for plan in self._plans)
+        predicate_calls = sum(plan.predicate_calls for plan in self._plans)
+        t = time.perf_counter()
 
         # Build assignments
         assignments: list[Assignment] = []
         assignment_map: dict[str, list[str]] = {}  # event_id -> person_ids
         person_events: dict[str, list[Event]] = defaultdict(list)
+        # Sorted per-person timelines queried by the period/gap/recency predicates.
+        self._timelines = defaultdict(PersonTimeline)
+        self._slot_roles = {}
+        # event id -> [start, end) of its coverage violations in violations.hard
+        coverage_spans: dict[str, tuple[int, int]] = {}
+        holiday_map = self._holiday_map
+
+        self._assignment_counts = [0] * len(self.context.people)
+
+        # Events in range, sorted by start time
+        sorted_events = self._event_table.window(self.context.from_date, self.context.to_date)
+        t = timer.add("filter", t)
+        solve_order = sorted_events
+        # event id -> [start, end) of its violations in violations.hard, only
+        # needed to put an out-of-start-order result back in start order.
+        event_spans: dict[str, tuple[int, int]] | None = None
+        slack_order: SlackOrder | None = None
+        self._slack_order = None
+        if self.ordering == MOST_CONSTRAINED_ORDER:
+            slack_order = SlackOrder(
+                sorted_events,
+                people=self.context.people,
+                person_index=self._person_index,
+                candidates_by_role=self._candidates_by_role,
+                blocked_days=self._blocked_days,
+                from_date=self.context.from_date,
+                constraint_index=self._constraint_index,
+                ctx=EvalContext(
+                    holidays=holiday_map,
+                    all_events=self.context.events,
+                    all_people=self.context.people,
+                    assignments=assignment_map,
+                    person_assignments=person_events,
+                    person_timelines=self._timelines,
+                ),
+            )
+            solve_order = self._slack_order = slack_order
+            event_spans = {}
+            timer.add("order", t)
+        self._fairness_weight = self.weights.get("fairness", 10)
+        self._tie_rng = (
+            random.Random(self.tie_break_seed) if self.tie_break_seed is not None else None
+        )
 
-        # Build holiday map
-        holiday_map: dict[Any, bool] = {}
-        if self.context.holidays:
-            for h in self.context.holidays:
-                holiday_map[h.date] = h.is_long_weekend
-
-        # Build per-person vacation map: person_id -> list[(start_date, end_date)]
-        # so we can filter out unavailable candidates per event.
-        self._vacation_by_person: dict[str, list[tuple[Any, Any]]] = defaultdict(list)
-        # Per-person exception dates (rrule expansions + one-off AvailabilityException rows).
-        self._exception_dates_by_person: dict[str, set[Any]] = defaultdict(set)
-        for avail in self.context.availability or []:
-            if avail.person_id is None:
-                continue
-            for vac in avail.vacations:
-                self._vacation_by_person[avail.person_id].append((vac.start, vac.end))
-            for exc_date in avail.exceptions:
-                self._exception_dates_by_person[avail.person_id].add(exc_date)
-
-        # Filter events in range
-        events_in_range = [
-            e
-            for e in self.context.events
-            if self.context.from_date <= e.start.date() <= self.context.to_date
-        ]
+        violations = Violations()
 
-        # Sort events by start time
-        sorted_events = sorted(events_in_range, key=lambda e: e.start)
+        self._scorer = None
+        if self.context.mode == VECTORIZED_MODE:
+            if NUMPY_AVAILABLE:
+                self._scorer = VectorizedScorer(
+                    people=self.context.people,
+                    person_index=self._person_index,
+                    candidates_by_role=self._candidates_by_role,
+                    blocked_days=self._blocked_days,
+                    from_date=self.context.from_date,
+                    to_date=self.context.to_date,
+                    change_min_enabled=self.change_min_enabled,
+                    change_min_weight=self.change_min_weight,
+                    prior_published_keys=self._prior_published_keys,
+                    fairness_weight=self._fairness_weight,
+                    tie_rng=self._tie_rng,
+                    slack_order=self._slack_order,
+                )
+            else:
+                logger.warning("numpy not installed; vectorized mode uses scalar scoring")
 
-        violations = Violations()
+        repair = self._repair_baseline
+        self.repaired_events = []
+        progress = self.progress
 
         # Assign each event
-        for event in sorted_events:
-            assigned = self._assign_event(
-                event, person_events, assignment_map, holiday_map, violations
-            )
+        for events_done, event in enumerate(solve_order, start=1):
+            first_violation = len(violations.hard)
+            if repair is not None and event.id in repair and event.id not in self._repair_events:
+                assigned = self._repair_event(
+                    event, repair[event.id], person_events, assignment_map, holiday_map, violations
+                )
+            else:
+                assigned = self._assign_event(
+                    event, person_events, assignment_map, holiday_map, violations
+                )
+                if repair is not None and assigned is not None:
+                    self.repaired_events.append(event.id)
+            if event.id in self._slot_roles:
+                coverage_spans[event.id] = (first_violation, len(violations.hard))
+            if event_spans is not None:
+                event_spans[event.id] = (first_violation, len(violations.hard))
             if assigned:
                 assignments.append(assigned)
                 for person_id in assigned.assignees:
                     person_events[person_id].append(event)
+                    self._timelines[person_id].add(event)
+                    idx = self._person_index.get(person_id)
+                    if idx is not None:  # team fallback may name non-roster members
+                        self._assignment_counts[idx] += 1
+                if self._scorer is not None:
+                    self._scorer.record(event, assigned.assignees)
+                if slack_order is not None:
+                    slack_order.consume(event, assigned.assignees)
+            if progress is not None:
+                progress(
+                    SolveProgress(
+                        events_done=events_done,
+                        events_total=len(sorted_events),
+                        assignments=len(assignments),
+                        hard_violations=len(violations.hard),
+                    )
+                )
+
+        strategy = "feasible_first"
+        if event_spans is not None:
+            coverage_spans = self._restore_start_order(
+                sorted_events, assignments, violations, event_spans
+            )
+            strategy += f"+{self.ordering}"
+        if repair is not None:
+            strategy = "repair"
+            self._repair_baseline = None
+            self._repair_events = set()
+        if self.improve_s > 0 and self._slot_roles:
+            t = time.perf_counter()
+            person_events = self._improve(assignments, violations, coverage_spans)
+            strategy += "+local_search"
+            timer.add("improve", t)
 
         # Compute metrics
+        t = time.perf_counter()
         solve_time = (time.time() - start_time) * 1000
         metrics = self._compute_metrics(
             solve_time, assignments, person_events, violations, len(self.context.people)
         )
+        timer.add("metrics", t)
 
         # Build solution
         meta = SolutionMeta(
@@ -106,12 +414,107 @@ class GreedyHeuristicSolver(SolverAdapter):
             range_end=self.context.to_date,
             mode=self.context.mode,
             change_min=self.context.change_min,
-            solver=SolverMeta(name="greedy_heuristic", version="1.0.0", strategy="feasible_first"),
+            solver=SolverMeta(name="greedy_heuristic", version="1.0.0", strategy=strategy),
+            profile=SolveProfile(
+                phases_ms=timer.phases_ms,
+                counters={
+                    "events": len(sorted_events),
+                    "candidates_scored": self._candidates_scored,
+                    "constraint_evals": sum(plan.calls for plan in self._plans) - plan_calls,
+                    "predicates_called": sum(plan.predicate_calls for plan in self._plans)
+                    - predicate_calls,
+                },
+            ),
         )
 
-        return SolutionBundle(
+        self._last_solution = SolutionBundle(
             meta=meta, assignments=assignments, metrics=metrics, violations=violations
         )
+        return self._last_solution
+
+    def _restore_start_order(
+        self,
+        events: list[Event],
+        assignments: list[Assignment],
+        violations: Violations,
+        event_spans: dict[str, tuple[int, int]],
+    ) -> dict[str, tuple[int, int]]:
+        """Put assignments and hard violations back in ``events`` (start) order.
+
+        ``event_spans`` maps each solved event to its slice of
+        ``violations.hard``. Returns the coverage spans re-based to the new
+        order.
+        """
+        by_event = {a.event_id: a for a in assignments}
+        old_hard = violations.hard
+        violations.hard = []
+        assignments.clear()
+        coverage_spans: dict[str, tuple[int, int]] = {}
+        for event in events:
+            first = len(violations.hard)
+            start, end = event_spans[event.id]
+            violations.hard.extend(old_hard[start:end])
+            if event.id in by_event:
+                assignments.append(by_event[event.id])
+            if event.id in self._slot_roles:
+                coverage_spans[event.id] = (first, len(violations.hard))
+        return coverage_spans
+
+    def _repair_event(
+        self,
+        event: Event,
+        baseline: Assignment,
+        person_events: dict[str, list[Event]],
+        assignment_map: dict[str, list[str]],
+        holiday_map: dict[Any, bool],
+        violations: Violations,
+    ) -> Assignment | None:
+        """Keep ``baseline`` for ``event``, refilling slots of assignees who can't stay.
+
+        An assignee stays while they are still in the roster, free on the
+        event date, (for role-based events) hold one of its roles and pass
+        the person-scoped hard constraints given the roster so far.
+        """
+        t = time.perf_counter()
+        day = self._event_table.day(event)
+        event_date = date.fromordinal(day)
+        day_offset = day - self.context.from_date.toordinal()
+        required = {r.role for r in event.required_roles}
+        person_hard = self._constraint_index.get((event.type, "person", "hard"), ())
+        ctx = EvalContext(
+            event=event,
+            date=event_date,
+            holidays=holiday_map,
+            all_events=self.context.events,
+            all_people=self.context.people,
+            assignments=assignment_map,
+            person_assignments=person_events,
+            person_timelines=self._timelines,
+        )
+        keep = []
+        for person_id in baseline.assignees:
+            idx = self._person_index.get(person_id)
+            if idx is None or (self._blocked_days[idx] >> day_offset) & 1:
+                continue
+            if required and not required & self._person_roles[idx]:
+                continue
+            ctx.person = self.context.people[idx]
+            if not all(plan(ctx).satisfied for plan in person_hard):
+                continue
+            keep.append(person_id)
+        self._timer.add("filter", t)
+
+        if len(keep) < len(baseline.assignees):
+            self.repaired_events.append(event.id)
+            return self._assign_event(
+                event, person_events, assignment_map, holiday_map, violations, keep=keep
+            )
+        if event.required_roles:
+            self._slot_roles[event.id] = [
+                event.required_roles[i].role for i in self._match_kept(event.required_roles, keep)
+            ]
+        violations.hard.extend(self._coverage_violations(event, keep))
+        return _assignment(event, keep)
 
     def _assign_event(
         self,
@@ -120,14 +523,25 @@ class GreedyHeuristicSolver(SolverAdapter):
         assignment_map: dict[str, list[str]],
         holiday_map: dict[Any, bool],
         violations: Violations,
+        keep: list[str] | None = None,
     ) -> Assignment | None:
-        """Assign people to an event."""
+        """Assign people to an event.
+
+        ``keep`` (repair only) pre-fills the event; each kept person covers
+        the first required role they hold, and only the remaining slots are
+        picked.
+        """
         if not self.context:
             return None
 
-        event_date = event.start.date()
-        hard_constraints = [c for c in self.context.constraints if c.severity == "hard"]
-        soft_constraints = [c for c in self.context.constraints if c.severity == "soft"]
+        timer = self._timer
+        t = time.perf_counter()
+        day = self._event_table.day(event)
+        event_date = date.fromordinal(day)
+        index = self._constraint_index
+        event_hard = index.get((event.type, "event", "hard"), ())
+        person_hard = index.get((event.type, "person", "hard"), ())
+        person_soft = index.get((event.type, "person", "soft"), ())
 
         # Check event-level hard constraints first
         ctx = EvalContext(
@@ -138,21 +552,23 @@ class GreedyHeuristicSolver(SolverAdapter):
             all_people=self.context.people,
             assignments=assignment_map,
             person_assignments=person_events,
+            person_timelines=self._timelines,
         )
 
-        for constraint in hard_constraints:
-            if constraint.scope == "event" and event.type in constraint.applies_to:
-                result = evaluate_constraint(constraint, ctx)
-                if not result.satisfied:
-                    violations.hard.append(
-                        Violation(
-                            constraint_key=constraint.key,
-                            severity="hard",
-                            message=result.reason,
-                            entities=[event.id],
-                        )
+        for constraint in event_hard:
+            result = constraint(ctx)
+            if not result.satisfied:
+                violations.hard.append(
+                    Violation(
+                        constraint_key=constraint.key,
+                        severity="hard",
+                        message=result.reason,
+                        entities=[event.id],
                     )
-                    return None  # Cannot schedule this event
+                )
+                timer.add("filter", t)
+                return None  # Cannot schedule this event
+        t = timer.add("filter", t)
 
         # Find required roles
         required_roles = event.required_roles
@@ -174,71 +590,163 @@ class GreedyHeuristicSolver(SolverAdapter):
 
         # Assign people to roles
         assignees: list[str] = []
-        people_map = {p.id: p for p in self.context.people}
-
-        for req_role in required_roles:
-            candidates = [p for p in self.context.people if req_role.role in p.roles]
+        slot_roles: list[str] = []
+        people = self.context.people
+        counts = self._assignment_counts
+        day_offset = day - self.context.from_date.toordinal()
+        needed = [req_role.count for req_role in required_roles]
+        if keep:
+            for person_id, i in zip(keep, self._match_kept(required_roles, keep), strict=True):
+                needed[i] -= 1
+                assignees.append(person_id)
+                slot_roles.append(required_roles[i].role)
+
+        role_order = list(zip(required_roles, needed, strict=True))
+        if self._slack_order is not None:
+            # Fill the role with the fewest spare holders first.
+            role_order = [role_order[i] for i in self._slack_order.role_order(event)]
+        for req_role, count in role_order:
+            if count <= 0:
+                continue
+            if self._scorer is not None:
+                self._candidates_scored += len(self._candidates_by_role.get(req_role.role, ()))
+                picked = self._scorer.select(
+                    event=event,
+                    role=req_role.role,
+                    count=count,
+                    exclude=assignees,
+                    ctx=ctx,
+                    hard_constraints=person_hard,
+                    soft_constraints=person_soft,
+                )
+                assignees.extend(people[idx].id for idx in picked)
+                slot_roles.extend(req_role.role for _ in picked)
+                t = timer.add("score", t)
+                continue
 
-            # Score candidates
-            scored: list[tuple[float, Person]] = []
-            for person in candidates:
+            # Filter candidates, then score the ones left
+            eligible: list[int] = []
+            for idx in self._candidates_by_role.get(req_role.role, ()):
+                person = people[idx]
                 if person.id in assignees:
                     continue  # Already assigned to this event
 
-                # Skip if person is on vacation/time-off covering the event date.
-                # Vacation periods are inclusive on both ends.
-                vacations = getattr(self, "_vacation_by_person", {}).get(person.id, [])
-                if any(v_start <= event_date <= v_end for v_start, v_end in vacations):
-                    continue
-                # Skip if event date matches a one-off AvailabilityException OR
-                # any rrule-expanded blocked date for the person.
-                exception_dates = getattr(self, "_exception_dates_by_person", {}).get(
-                    person.id, set()
-                )
-                if event_date in exception_dates:
+                # Skip if person is on vacation/time-off, a one-off
+                # AvailabilityException, or an rrule-expanded blocked date.
+                if (self._blocked_days[idx] >> day_offset) & 1:
                     continue
 
                 # Check person-level hard constraints
                 ctx.person = person
                 hard_ok = True
-                for constraint in hard_constraints:
-                    if constraint.scope == "person" and event.type in constraint.applies_to:
-                        result = evaluate_constraint(constraint, ctx)
-                        if not result.satisfied:
-                            hard_ok = False
-                            break
+                for constraint in person_hard:
+                    if not constraint(ctx).satisfied:
+                        hard_ok = False
+                        break
 
                 if not hard_ok:
                     continue
+                eligible.append(idx)
+            t = timer.add("filter", t)
+
+            scored: list[tuple[float, Person]] = []
+            protected: set[str] = set()
+            if self._slack_order is not None:
+                picked = {self._person_index[pid] for pid in assignees}
+            for idx in eligible:
+                person = people[idx]
+                ctx.person = person
 
                 # Score soft constraints
                 penalty = 0.0
-                for constraint in soft_constraints:
-                    if constraint.scope == "person" and event.type in constraint.applies_to:
-                        result = evaluate_constraint(constraint, ctx)
-                        penalty += result.penalty
+                for constraint in person_soft:
+                    penalty += constraint(ctx).penalty
 
                 # Add fairness: prefer people with fewer assignments
-                assignment_count = len(person_events.get(person.id, []))
-                penalty += assignment_count * 10
+                penalty += counts[idx] * self._fairness_weight
 
                 # Change-minimization bonus: subtract weight if this (event, person)
                 # was in the prior published solution. Lower penalty wins.
                 if self.change_min_enabled and (event.id, person.id) in self._prior_published_keys:
                     penalty -= self.change_min_weight
 
-                scored.append((penalty, person))
+                # Most-constrained ordering: keep scarce people for the
+                # pending events that can't spare them.
+                if self._slack_order is not None:
+                    short = self._slack_order.lookahead(idx, event, picked)
+                    if short:
+                        penalty += LOOKAHEAD_PENALTY * short
+                        protected.add(person.id)
 
-            # Pick best candidates
+                scored.append((penalty, person))
+            self._candidates_scored += len(eligible)
+            t = timer.add("score", t)
+
+            if protected and len(scored) < count:
+                # This role ends up short either way; one more body doesn't
+                # remove its violation but would cause another elsewhere.
+                scored = [s for s in scored if s[1].id not in protected]
+
+            # Pick best candidates (stable: equal scores keep roster order
+            # unless a tie-break seed shuffles them first)
+            if self._tie_rng is not None:
+                self._tie_rng.shuffle(scored)
             scored.sort(key=lambda x: x[0])
-            for i in range(min(req_role.count, len(scored))):
+            for i in range(min(count, len(scored))):
                 assignees.append(scored[i][1].id)
+                slot_roles.append(req_role.role)
+            t = timer.add("select", t)
+        self._slot_roles[event.id] = slot_roles
 
         # Check if we met role requirements
-        for req_role in required_roles:
-            count = sum(1 for pid in assignees if req_role.role in people_map[pid].roles)
+        violations.hard.extend(self._coverage_violations(event, assignees))
+
+        return _assignment(event, assignees)
+
+    def _match_kept(self, required_roles: list[RequiredRole], keep: list[str]) -> list[int]:
+        """Required-role index each kept person covers, maximizing covered slots.
+
+        Augmenting-path matching over the event's slots, so a person holding
+        two roles doesn't take the slot someone else can only fill. Slots of
+        scarcer roles (fewer holders in the roster) are tried first, leaving
+        the easy-to-fill slots open for re-picking. Anyone left unmatched
+        counts against the first required role they hold.
+        """
+        slot_role = sorted(
+            (i for i, r in enumerate(required_roles) for _ in range(r.count)),
+            key=lambda i: len(self._candidates_by_role.get(required_roles[i].role, ())),
+        )
+        holds = [
+            {i for i, r in enumerate(required_roles) if r.role in self._person_roles[idx]}
+            for idx in (self._person_index[pid] for pid in keep)
+        ]
+        owner = [-1] * len(slot_role)
+
+        def place(k: int, seen: set[int]) -> bool:
+            for slot, i in enumerate(slot_role):
+                if i in holds[k] and slot not in seen:
+                    seen.add(slot)
+                    if owner[slot] == -1 or place(owner[slot], seen):
+                        owner[slot] = k
+                        return True
+            return False
+
+        for k in range(len(keep)):
+            place(k, set())
+        matched = {k: slot_role[slot] for slot, k in enumerate(owner) if k != -1}
+        return [matched[k] if k in matched else min(holds[k]) for k in range(len(keep))]
+
+    def _coverage_violations(self, event: Event, assignees: list[str]) -> list[Violation]:
+        """``require_role_coverage`` violations for roles ``assignees`` leave short."""
+        violations = []
+        for req_role in event.required_roles:
+            count = sum(
+                1
+                for pid in assignees
+                if req_role.role in self._person_roles[self._person_index[pid]]
+            )
             if count < req_role.count:
-                violations.hard.append(
+                violations.append(
                     Violation(
                         constraint_key="require_role_coverage",
                         severity="hard",
@@ -246,13 +754,76 @@ class GreedyHeuristicSolver(SolverAdapter):
                         entities=[event.id],
                     )
                 )
+        return violations
 
-        return Assignment(
-            event_id=event.id,
-            assignees=assignees,
-            resource_id=event.resource_id,
-            team_ids=event.team_ids,
+    def _improve(
+        self,
+        assignments: list[Assignment],
+        violations: Violations,
+        coverage_spans: dict[str, tuple[int, int]],
+    ) -> dict[str, list[Event]]:
+        """Run the local-search phase and rewrite the role-based assignments in place.
+
+        Returns the rebuilt person → events map. Coverage violations of the
+        rewritten events are recomputed where they sat in ``violations.hard``.
+        """
+        context = self.context
+        events_by_id = {e.id: e for e in context.events}
+        staffed = [a for a in assignments if a.assignees]
+        events = [events_by_id[a.event_id] for a in staffed]
+        slots = [
+            (pos, role, self._person_index[pid])
+            for pos, assignment in enumerate(staffed)
+            if assignment.event_id in self._slot_roles
+            for role, pid in zip(
+                self._slot_roles[assignment.event_id], assignment.assignees, strict=True
+            )
+        ]
+        # Team-fallback assignees stay put but still load their people.
+        fixed = [
+            (pos, idx)
+            for pos, assignment in enumerate(staffed)
+            if assignment.event_id not in self._slot_roles
+            for pid in assignment.assignees
+            if (idx := self._person_index.get(pid)) is not None
+        ]
+
+        improver = LocalSearchImprover(
+            people=context.people,
+            candidates_by_role=self._candidates_by_role,
+            blocked_days=self._blocked_days,
+            constraint_index=self._constraint_index,
+            holiday_map=self._holiday_map,
+            all_events=context.events,
+            from_date=context.from_date,
+            fairness_weight=self.weights.get("fairness", 10),
+            change_min_enabled=self.change_min_enabled,
+            change_min_weight=self.change_min_weight,
+            prior_published_keys=self._prior_published_keys,
+            seed=self.improve_seed,
         )
+        improved, _ = improver.improve(events, slots, time_budget_s=self.improve_s, fixed=fixed)
+
+        new_assignees: dict[int, list[str]] = defaultdict(list)
+        for (pos, _, _), person in zip(slots, improved, strict=True):
+            new_assignees[pos].append(context.people[person].id)
+        old_hard = violations.hard
+        violations.hard = []
+        cursor = 0
+        for pos, assignees in new_assignees.items():
+            assignment, event = staffed[pos], events[pos]
+            assignment.assignees = assignees
+            start, end = coverage_spans[event.id]
+            violations.hard.extend(old_hard[cursor:start])
+            violations.hard.extend(self._coverage_violations(event, assignees))
+            cursor = end
+        violations.hard.extend(old_hard[cursor:])
+
+        person_events: dict[str, list[Event]] = defaultdict(list)
+        for assignment in assignments:
+            for person_id in assignment.assignees:
+                person_events[person_id].append(events_by_id[assignment.event_id])
+        return person_events
 
     def _compute_metrics(
         self,
@@ -263,42 +834,7 @@ class GreedyHeuristicSolver(SolverAdapter):
         total_people: int,
     ) -> Metrics:
         """Compute solution metrics."""
-        import math
-
-        # Count per person
-        per_person_counts = {pid: len(events) for pid, events in person_events.items()}
-
-        # Fairness: stdev of counts
-        counts = list(per_person_counts.values())
-        if counts:
-            mean = sum(counts) / len(counts)
-            variance = sum((c - mean) ** 2 for c in counts) / len(counts)
-            stdev = math.sqrt(variance)
-        else:
-            stdev = 0.0
-
-        fairness = FairnessMetrics(stdev=stdev, per_person_counts=per_person_counts)
-
-        # Soft score
-        soft_score = sum(v.penalty if hasattr(v, "penalty") else 0.0 for v in violations.soft)
-
-        # Health score: 100 if no hard violations, scaled down by soft
-        hard_violations = len(violations.hard)
-        if hard_violations > 0:
-            health_score = 0.0
-        else:
-            health_score = max(0.0, 100.0 - soft_score / 10)
-
-        stability = StabilityMetrics()
-
-        return Metrics(
-            solve_ms=solve_ms,
-            hard_violations=hard_violations,
-            soft_score=soft_score,
-            fairness=fairness,
-            stability=stability,
-            health_score=health_score,
-        )
+        return compute_metrics(solve_ms, person_events, violations)
 
     def set_objective(self, weights: dict[str, int]) -> None:
         """Set objective function weights."""
@@ -319,6 +855,81 @@ class GreedyHeuristicSolver(SolverAdapter):
         self._prior_published_keys = keys
 
     def incremental_update(self, changes: Patch) -> None:
-        """Apply incremental changes to model."""
-        # Not implemented for heuristic solver
-        pass
+        """Apply ``changes`` and make the next ``solve`` repair the baseline roster.
+
+        The baseline is ``context.published_solution``, else the last solution
+        this solver returned. The repair walks events in start order like a
+        full solve, but keeps each baseline assignment as-is unless an
+        assignee was removed, became unavailable on the event date, no longer
+        holds a required role or would now break a person-scoped hard
+        constraint; only those slots are re-picked. Events
+        the patch adds (or replaces, e.g. rescheduled) are assigned from
+        scratch, and removed events are dropped. Several updates before one
+        ``solve`` accumulate against the same baseline. Without a baseline
+        the next ``solve`` is a full solve on the patched context.
+        """
+        if not self.context:
+            raise RuntimeError("Must call build_model first")
+
+        baseline = self._repair_baseline
+        if baseline is None:
+            solution = self.context.published_solution or self._last_solution
+            if solution is not None:
+                baseline = {a.event_id: a for a in solution.assignments}
+        reassign = self._repair_events | {e.id for e in changes.add_events}
+
+        self.build_model(apply_patch(self.context, changes))
+        self._repair_baseline = baseline
+        self._repair_events = reassign if baseline is not None else set()
+
+
+def _assignment(event: Event, assignees: list[str]) -> Assignment:
+    """``event``'s assignment, built without re-validating solver-produced ids."""
+    return Assignment.model_construct(
+        event_id=event.id,
+        assignees=assignees,
+        resource_id=event.resource_id,
+        team_ids=list(event.team_ids),
+    )
+
+
+def compute_metrics(
+    solve_ms: float,
+    person_events: dict[str, list[Event]],
+    violations: Violations,
+) -> Metrics:
+    """Compute solution metrics (shared by every solver adapter)."""
+    # Count per person
+    per_person_counts = {pid: len(events) for pid, events in person_events.items()}
+
+    # Fairness: stdev of counts
+    counts = list(per_person_counts.values())
+    if counts:
+        mean = sum(counts) / len(counts)
+        variance = sum((c - mean) ** 2 for c in counts) / len(counts)
+        stdev = math.sqrt(variance)
+    else:
+        stdev = 0.0
+
+    fairness = FairnessMetrics(stdev=stdev, per_person_counts=per_person_counts)
+
+    # Soft score
+    soft_score = sum(v.penalty if hasattr(v, "penalty") else 0.0 for v in violations.soft)
+
+    # Health score: 100 if no hard violations, scaled down by soft
+    hard_violations = len(violations.hard)
+    if hard_violations > 0:
+        health_score = 0.0
+    else:
+        health_score = max(0.0, 100.0 - soft_score / 10)
+
+    stability = StabilityMetrics()
+
+    return Metrics(
+        solve_ms=solve_ms,
+        hard_violations=hard_violations,
+        soft_score=soft_score,
+        fairness=fairness,
+        stability=stability,
+        health_score=health_score,
+    )
@@ -0,0 +1,362 @@
+"""Local-search improvement phase for the greedy solver.
+
+The greedy pass commits to one event at a time and never revisits a pick, so
+late in the horizon it often has to load people who were already busy. This
+phase takes the greedy roster and runs simulated annealing over two
+neighborhoods:
+
+- **move** — hand one filled slot to another holder of the role
+- **swap** — exchange the people in two slots at different events
+
+State is kept in compact integer arrays: ``slot_event`` / ``slot_role`` /
+``slot_person`` per filled ``(event, role)`` slot, and per person the sorted
+event positions they work. The objective is a sum of per-person costs:
+
+    fairness_weight × k(k-1)/2          (the greedy ``10 × count`` summed)
+    + soft person-constraint penalties   (each assignment evaluated against
+                                          the person's earlier assignments,
+                                          as the greedy pass saw them)
+    - change_min_weight per kept published (event, person) pair
+
+Person-scoped hard constraints and blocked dates must keep holding. Because
+every term depends on one person's own roster, a move or swap is scored by
+re-evaluating only the two people it touches (delta evaluation): their
+fairness and change-min terms, plus a replay of their timelines through the
+person-scoped plans when any are bound — so a step costs O(roster length ×
+plans) for those two people, not a full-roster rescore.
+
+Team-fallback assignments (events with no required roles, staffed from the
+event's teams) have no slots and never move, but their assignees are part of
+each person's roster: they count toward the fairness load and sit in the
+timelines later events are checked against, as in the greedy pass and
+``compute_metrics``. Like the greedy pass, the fallback events themselves are
+not checked against constraints. Fallback members outside the solve's
+people have no roster and are left out; their load is fixed anyway.
+
+Slots the greedy pass could not fill stay empty, so role coverage never gets
+worse; events skipped by event-level hard constraints are not touched.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import random
+import time
+from array import array
+from bisect import bisect_left, insort
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date
+
+from api.core.constraints.dsl import EvalContext
+from api.core.constraints.eval import CompiledConstraint
+from api.core.constraints.timeline import PersonTimeline
+from api.core.models import Event, Person
+
+logger = logging.getLogger("rostio")
+
+# Iterations between clock reads; perf_counter is cheap but not free.
+_CLOCK_EVERY = 256
+
+# (objective delta, callback that commits the change)
+_Proposal = tuple[float, Callable[[], None]]
+
+
+@dataclass
+class LocalSearchStats:
+    """Outcome of one improvement run."""
+
+    iterations: int
+    accepted: int
+    initial_cost: float
+    best_cost: float
+    elapsed_s: float
+
+
+class LocalSearchImprover:
+    """Simulated annealing over a greedy roster's role slots."""
+
+    def __init__(
+        self,
+        *,
+        people: Sequence[Person],
+        candidates_by_role: dict[str, list[int]],
+        blocked_days: Sequence[int],
+        constraint_index: dict[tuple[str, str, str], list[CompiledConstraint]],
+        holiday_map: dict[date, bool],
+        all_events: list[Event],
+        from_date: date,
+        fairness_weight: float = 10.0,
+        change_min_enabled: bool = False,
+        change_min_weight: int = 100,
+        prior_published_keys: Iterable[tuple[str, str]] = (),
+        seed: int = 0,
+    ) -> None:
+        self._people = people
+        self._candidates_by_role = candidates_by_role
+        self._blocked_days = blocked_days
+        self._constraint_index = constraint_index
+        self._from_date = from_date
+        self._fairness_weight = fairness_weight
+        self._change_min_weight = change_min_weight if change_min_enabled else 0
+        self._prior_keys = set(prior_published_keys) if change_min_enabled else set()
+        self._rng = random.Random(seed)
+        # Reused for every constraint evaluation; mirrors the greedy pass's
+        # context (``assignments`` is the same empty map it passes).
+        self._ctx = EvalContext(
+            holidays=holiday_map, all_events=all_events, all_people=list(people), assignments={}
+        )
+
+    def improve(
+        self,
+        events: Sequence[Event],
+        slots: Sequence[tuple[int, str, int]],
+        *,
+        time_budget_s: float,
+        max_iterations: int | None = None,
+        fixed: Sequence[tuple[int, int]] = (),
+    ) -> tuple[list[int], LocalSearchStats]:
+        """Improve ``slots`` and return the best person per slot found.
+
+        ``events`` are the roster's events in greedy (start) order and
+        ``slots`` the filled ``(event position, role, person index)`` slots;
+        ``fixed`` holds the ``(event position, person index)`` team-fallback
+        assignments that stay put. Stops after ``time_budget_s`` seconds or
+        ``max_iterations`` steps, whichever comes first; the returned list is
+        parallel to ``slots``.
+        """
+        started = time.perf_counter()
+        self._load(events, slots, fixed)
+        cost = sum(self._cost)
+        initial_cost = best_cost = cost
+        iterations = accepted = 0
+
+        # Swaps keep every load unchanged, so without constraints or
+        # change-min they can't change the objective.
+        use_swaps = self._has_person_plans or bool(self._change_min_weight)
+        n_slots = len(self._slot_person)
+        if math.isinf(cost):
+            # Shouldn't happen for a greedy roster; leave it alone rather than
+            # let inf - inf deltas poison the search.
+            logger.warning("Local search skipped: starting roster breaks a hard constraint")
+            n_slots = 0
+        # Copy of the best state, taken only when a worsening move leaves it.
+        best: array | None = None
+        at_best = True
+        temperature0 = max(self._fairness_weight, 1.0)
+        temperature = temperature0
+        rng = self._rng
+
+        while n_slots and (max_iterations is None or iterations < max_iterations):
+            if iterations % _CLOCK_EVERY == 0:
+                elapsed = time.perf_counter() - started
+                if elapsed >= time_budget_s:
+                    break
+                progress = elapsed / time_budget_s
+                if max_iterations:
+                    progress = max(progress, iterations / max_iterations)
+                # Geometric cooling from T0 down to T0/1000 over the budget.
+                temperature = temperature0 * 0.001**progress
+            iterations += 1
+
+            if use_swaps and rng.random() < 0.5:
+                proposal = self._propose_swap(rng.randrange(n_slots), rng.randrange(n_slots))
+            else:
+                proposal = self._propose_move(rng.randrange(n_slots))
+            if proposal is None:
+                continue
+            delta, apply = proposal
+            if delta > 0 and rng.random() >= math.exp(-delta / temperature):
+                continue
+
+            if delta > 0 and at_best:
+                best = array("i", self._slot_person)
+                at_best = False
+            apply()
+            accepted += 1
+            cost += delta
+            if cost < best_cost - 1e-9:
+                best_cost = cost
+                best = None
+                at_best = True
+
+        if not at_best and best is not None:
+            # Ended away from the best state seen; roll back to it.
+            self._slot_person = best
+        stats = LocalSearchStats(
+            iterations=iterations,
+            accepted=accepted,
+            initial_cost=initial_cost,
+            best_cost=best_cost,
+            elapsed_s=time.perf_counter() - started,
+        )
+        logger.debug(
+            "Local search: %d iterations, %d accepted, cost %.1f -> %.1f in %.2fs",
+            stats.iterations,
+            stats.accepted,
+            stats.initial_cost,
+            stats.best_cost,
+            stats.elapsed_s,
+        )
+        return list(self._slot_person), stats
+
+    def roster_cost(
+        self,
+        events: Sequence[Event],
+        slots: Sequence[tuple[int, str, int]],
+        fixed: Sequence[tuple[int, int]] = (),
+    ) -> float:
+        """Objective value of a roster, or ``inf`` if it breaks a hard constraint."""
+        self._load(events, slots, fixed)
+        return sum(self._cost)
+
+    def _load(
+        self,
+        events: Sequence[Event],
+        slots: Sequence[tuple[int, str, int]],
+        fixed: Sequence[tuple[int, int]],
+    ) -> None:
+        """Build the slot arrays, per-person rosters and per-person costs."""
+        self._events = events
+        self._fixed_events = {event_pos for event_pos, _ in fixed}
+        self._event_days = array("i", ((e.start.date() - self._from_date).days for e in events))
+        role_ids: dict[str, int] = {}
+        self._role_candidates: list[list[int]] = []
+        self._slot_event = array("i")
+        self._slot_role = array("i")
+        self._slot_person = array("i")
+        for event_pos, role, person in slots:
+            role_id = role_ids.get(role)
+            if role_id is None:
+                role_id = role_ids[role] = len(self._role_candidates)
+                self._role_candidates.append(self._candidates_by_role.get(role, []))
+            self._slot_event.append(event_pos)
+            self._slot_role.append(role_id)
+            self._slot_person.append(person)
+
+        # Per event type: (person hard plans, person soft plans).
+        self._type_plans: dict[str, tuple[list[CompiledConstraint], list[CompiledConstraint]]] = {
+            event_type: (
+                self._constraint_index.get((event_type, "person", "hard"), []),
+                self._constraint_index.get((event_type, "person", "soft"), []),
+            )
+            for event_type in {e.type for e in events}
+        }
+        self._has_person_plans = any(h or s for h, s in self._type_plans.values())
+
+        self._rosters: list[list[int]] = [[] for _ in self._people]
+        for event_pos, person in zip(self._slot_event, self._slot_person, strict=True):
+            insort(self._rosters[person], event_pos)
+        for event_pos, person in fixed:
+            insort(self._rosters[person], event_pos)
+        self._cost = array("d", [0.0] * len(self._people))
+        for person, roster in enumerate(self._rosters):
+            cost = self._person_cost(person, roster)
+            self._cost[person] = math.inf if cost is None else cost
+
+    def _person_cost(self, person: int, roster: list[int]) -> float | None:
+        """Cost of ``person`` working ``roster`` (sorted event positions); None if infeasible."""
+        k = len(roster)
+        cost = self._fairness_weight * k * (k - 1) / 2
+        if self._change_min_weight:
+            person_id = self._people[person].id
+            kept = sum(1 for e in roster if (self._events[e].id, person_id) in self._prior_keys)
+            cost -= self._change_min_weight * kept
+        if not self._has_person_plans or not roster:
+            return cost
+
+        ctx = self._ctx
+        timeline = PersonTimeline()
+        ctx.person = self._people[person]
+        ctx.person_timelines = {ctx.person.id: timeline}
+        for event_pos in roster:
+            event = self._events[event_pos]
+            if event_pos in self._fixed_events:
+                timeline.add(event)
+                continue
+            hard, soft = self._type_plans[event.type]
+            ctx.event = event
+            ctx.date = event.start.date()
+            for plan in hard:
+                if not plan(ctx).satisfied:
+                    return None
+            for plan in soft:
+                cost += plan(ctx).penalty
+            timeline.add(event)
+        return cost
+
+    def _can_work(self, person: int, event_pos: int) -> bool:
+        """``person`` is free on the event's date and not already on the event."""
+        if (self._blocked_days[person] >> self._event_days[event_pos]) & 1:
+            return False
+        roster = self._rosters[person]
+        i = bisect_left(roster, event_pos)
+        return i == len(roster) or roster[i] != event_pos
+
+    def _propose_move(self, slot: int) -> _Proposal | None:
+        """Score handing ``slot`` to a random other holder of its role."""
+        candidates = self._role_candidates[self._slot_role[slot]]
+        if len(candidates) < 2:
+            return None
+        new = candidates[self._rng.randrange(len(candidates))]
+        old = self._slot_person[slot]
+        event_pos = self._slot_event[slot]
+        if new == old or not self._can_work(new, event_pos):
+            return None
+
+        old_roster = [e for e in self._rosters[old] if e != event_pos]
+        new_roster = self._rosters[new][:]
+        insort(new_roster, event_pos)
+        old_cost = self._person_cost(old, old_roster)
+        new_cost = self._person_cost(new, new_roster)
+        if old_cost is None or new_cost is None:
+            return None
+        delta = old_cost + new_cost - self._cost[old] - self._cost[new]
+
+        def apply() -> None:
+            self._slot_person[slot] = new
+            self._rosters[old] = old_roster
+            self._rosters[new] = new_roster
+            self._cost[old] = old_cost
+            self._cost[new] = new_cost
+
+        return delta, apply
+
+    def _propose_swap(self, slot_a: int, slot_b: int) -> _Proposal | None:
+        """Score exchanging the people in two slots at different events."""
+        a, b = self._slot_person[slot_a], self._slot_person[slot_b]
+        event_a, event_b = self._slot_event[slot_a], self._slot_event[slot_b]
+        if a == b or event_a == event_b:
+            return None
+        role_a, role_b = self._slot_role[slot_a], self._slot_role[slot_b]
+        if role_a != role_b and not (self._holds(b, role_a) and self._holds(a, role_b)):
+            return None
+        if not self._can_work(a, event_b) or not self._can_work(b, event_a):
+            return None
+
+        roster_a = [e for e in self._rosters[a] if e != event_a]
+        insort(roster_a, event_b)
+        roster_b = [e for e in self._rosters[b] if e != event_b]
+        insort(roster_b, event_a)
+        cost_a = self._person_cost(a, roster_a)
+        cost_b = self._person_cost(b, roster_b)
+        if cost_a is None or cost_b is None:
+            return None
+        delta = cost_a + cost_b - self._cost[a] - self._cost[b]
+
+        def apply() -> None:
+            self._slot_person[slot_a] = b
+            self._slot_person[slot_b] = a
+            self._rosters[a] = roster_a
+            self._rosters[b] = roster_b
+            self._cost[a] = cost_a
+            self._cost[b] = cost_b
+
+        return delta, apply
+
+    def _holds(self, person: int, role_id: int) -> bool:
+        """``person`` holds the role (candidate lists are ascending)."""
+        candidates = self._role_candidates[role_id]
+        i = bisect_left(candidates, person)
+        return i < len(candidates) and candidates[i] == person
@@ -1,46 +1,503 @@
-"""OR-Tools solver adapter (stub for future implementation)."""
+"""OR-Tools CP-SAT solver adapter.
 
-from api.core.models import Patch, SolutionBundle
-from api.core.solver.adapter import SolveContext, SolverAdapter
+Global optimizer for the roster. Where the greedy solver commits to one
+event at a time, CP-SAT searches every assignment jointly:
+
+- ``x[e, r, p]`` — boolean, person ``p`` fills role ``r`` at event ``e``.
+  Variables only exist for role holders who aren't blocked (vacation,
+  exception or rrule date) on the event date, so availability is hard by
+  construction. A person fills at most one role per event.
+- Role coverage is hard: ``sum_p x[e, r, p] <= count`` and every missing
+  slot costs ``weights["coverage"]``, which dominates all soft terms. Slots
+  that stay empty (not enough eligible people) are reported as
+  ``require_role_coverage`` violations, like the greedy solver.
+- Person-scoped hard bindings: ``forbid_if`` removes the event's variables,
+  ``enforce_cap`` limits assignments in the cap window, and
+  ``enforce_min_gap_hours`` forbids pairs of assignments closer than the gap.
+  Soft versions of the same actions add their penalty instead.
+- The objective adds fairness (``weights["fairness"] / 2 × load²`` per
+  person, so the marginal cost of one more assignment matches the greedy
+  ``10 × count``), cooldown / recent-rotation penalties for every pair of
+  assignments inside the window, and subtracts ``change_min_weight`` for
+  each ``(event, person)`` kept from the published solution.
+
+The greedy solution seeds the search as a hint and is returned unchanged if
+CP-SAT finds nothing better within ``timeout_s``.
+
+``meta.profile`` (see ``profiling.py``) times the ``hint`` (greedy pass),
+``build``, ``search`` and ``metrics`` phases and counts ``events``,
+``variables`` and CP-SAT's ``branches`` / ``conflicts``.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any
+
+from api.core.constraints.dsl import EvalContext
+from api.core.constraints.eval import CompiledConstraint, cap_window
+from api.core.models import (
+    Assignment,
+    Event,
+    Patch,
+    SolutionBundle,
+    SolutionMeta,
+    SolveProfile,
+    SolverMeta,
+    Violation,
+    Violations,
+)
+from api.core.solver.adapter import SolveContext, SolverAdapter, apply_patch
+from api.core.solver.heuristics import GreedyHeuristicSolver, compute_metrics
+from api.core.solver.profiling import PhaseTimer
+
+try:
+    import ortools
+    from ortools.sat.python import cp_model
+
+    ORTOOLS_AVAILABLE = True
+except ImportError:  # pragma: no cover — ortools is optional
+    cp_model = None
+    ORTOOLS_AVAILABLE = False
+
+logger = logging.getLogger("rostio")
+
+# Objective units per greedy penalty point; CP-SAT needs integer coefficients.
+SCALE = 100
+
+DEFAULT_WEIGHTS = {
+    "coverage": 100_000,  # per unfilled role slot
+    "fairness": 10,  # marginal cost per existing assignment, as in the greedy solver
+    "constraints": 1,  # multiplier on soft binding penalties
+}
 
 
 class ORToolsSolver(SolverAdapter):
     """OR-Tools CP-SAT solver adapter."""
 
+    def __init__(
+        self,
+        *,
+        num_workers: int = 8,
+        default_timeout_s: int = 30,
+        random_seed: int = 0,
+        hint_with_greedy: bool = True,
+    ) -> None:
+        if not ORTOOLS_AVAILABLE:
+            raise RuntimeError("OR-Tools is not installed: poetry install --extras ortools")
+        self.num_workers = num_workers
+        self.default_timeout_s = default_timeout_s
+        self.random_seed = random_seed
+        self.hint_with_greedy = hint_with_greedy
+        self.context: SolveContext | None = None
+        self.weights: dict[str, int] = dict(DEFAULT_WEIGHTS)
+        self.change_min_enabled: bool = False
+        self.change_min_weight: int = 100
+        self._prior_published_keys: set[tuple[str, str]] = set()
+        # The greedy solver's build_model indexes (role candidates, blocked-day
+        # bitsets, constraint plans) are reused to build the CP model.
+        self._greedy = GreedyHeuristicSolver()
+        self._model: Any = None
+        self._x: dict[tuple[int, int, int], Any] = {}
+        self._z: dict[tuple[int, int], Any] = {}
+        self._events: list[Event] = []
+        self._skipped: list[Violation] = []
+        self._max_duration = timedelta(0)
+
+    # ── SolverAdapter ────────────────────────────────────────────────
+
     def build_model(self, context: SolveContext) -> None:
-        """Build internal model from context."""
-        # TODO: Implement OR-Tools model construction
-        # - Create CP-SAT model
-        # - Define decision variables for assignments
-        # - Add hard constraints as model constraints
-        # - Build objective function from soft constraints and fairness
-        raise NotImplementedError("OR-Tools adapter not yet implemented")
+        """Build the CP-SAT model from context."""
+        self.context = context
+        self._greedy.build_model(context)
+        self._model = None
 
     def solve(self, timeout_s: int | None = None) -> SolutionBundle:
         """Solve and return solution bundle."""
-        # TODO: Implement OR-Tools solving
-        # - Set solver parameters (timeout, threads, etc.)
-        # - Run solver
-        # - Extract solution from model
-        # - Build SolutionBundle with assignments and metrics
-        raise NotImplementedError("OR-Tools adapter not yet implemented")
+        if not self.context:
+            raise RuntimeError("Must call build_model first")
+
+        start_time = time.time()
+        timer = PhaseTimer()
+        t = time.perf_counter()
+        self._greedy.enable_change_minimization(self.change_min_enabled, self.change_min_weight)
+        self._greedy.set_prior_published_keys(self._prior_published_keys)
+        greedy = self._greedy.solve() if self.hint_with_greedy else None
+        t = timer.add("hint", t)
+
+        self._build()
+        if greedy is not None:
+            self._add_hint(greedy)
+        t = timer.add("build", t)
+
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = float(timeout_s or self.default_timeout_s)
+        solver.parameters.num_workers = self.num_workers
+        solver.parameters.random_seed = self.random_seed
+        status = solver.Solve(self._model)
+        t = timer.add("search", t)
+
+        if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            logger.warning(
+                "CP-SAT returned %s; using the greedy solution", solver.StatusName(status)
+            )
+            if greedy is None:
+                greedy = self._greedy.solve()
+            return greedy
+
+        assignments, person_events, violations = self._extract(solver)
+        solve_time = (time.time() - start_time) * 1000
+        metrics = compute_metrics(solve_time, person_events, violations)
+        timer.add("metrics", t)
+        meta = SolutionMeta(
+            generated_at=datetime.now(),
+            range_start=self.context.from_date,
+            range_end=self.context.to_date,
+            mode=self.context.mode,
+            change_min=self.context.change_min,
+            solver=SolverMeta(
+                name="or_tools_cp_sat",
+                version=ortools.__version__,
+                strategy="optimal" if status == cp_model.OPTIMAL else "feasible",
+            ),
+            profile=SolveProfile(
+                phases_ms=timer.phases_ms,
+                counters={
+                    "events": len(self._events),
+                    "variables": len(self._x),
+                    "branches": solver.NumBranches(),
+                    "conflicts": solver.NumConflicts(),
+                },
+            ),
+        )
+        return SolutionBundle(
+            meta=meta, assignments=assignments, metrics=metrics, violations=violations
+        )
 
     def set_objective(self, weights: dict[str, int]) -> None:
-        """Set objective function weights."""
-        # TODO: Update objective function with custom weights
-        raise NotImplementedError("OR-Tools adapter not yet implemented")
+        """Override objective weights (``coverage``, ``fairness``, ``constraints``)."""
+        self.weights = {**DEFAULT_WEIGHTS, **weights}
 
     def enable_change_minimization(self, enabled: bool, weight_move_published: int) -> None:
         """Enable/disable change minimization."""
-        # TODO: Add penalties for changing published assignments
-        # - Load published solution
-        # - Add soft constraints penalizing deviations
-        raise NotImplementedError("OR-Tools adapter not yet implemented")
+        self.change_min_enabled = enabled
+        self.change_min_weight = weight_move_published
+
+    def set_prior_published_keys(self, keys: set[tuple[str, str]]) -> None:
+        """Provide ``(event_id, person_id)`` keys from the prior published solution."""
+        self._prior_published_keys = keys
 
     def incremental_update(self, changes: Patch) -> None:
-        """Apply incremental changes to model."""
-        # TODO: Implement incremental model updates
-        # - Add/remove decision variables
-        # - Update constraints
-        # - Avoid full model rebuild
-        raise NotImplementedError("OR-Tools adapter not yet implemented")
+        """Apply ``changes`` to the context; the model is rebuilt on the next solve."""
+        if not self.context:
+            raise RuntimeError("Must call build_model first")
+        self.build_model(apply_patch(self.context, changes))
+
+    # ── model ────────────────────────────────────────────────────────
+
+    def _build(self) -> None:
+        """Create variables, hard constraints and the objective."""
+        assert self.context is not None
+        context = self.context
+        greedy = self._greedy
+        model = cp_model.CpModel()
+        self._model = model
+        self._x = {}
+        self._z = {}
+        self._skipped = []
+
+        self._events = sorted(
+            (e for e in context.events if context.from_date <= e.start.date() <= context.to_date),
+            key=lambda e: e.start,
+        )
+        objective: list[Any] = []
+        self._max_duration = max((e.end - e.start for e in self._events), default=timedelta(0))
+
+        # Per-person eligible events, in start order: (start ordinal, event int).
+        person_slots: dict[int, list[tuple[int, int]]] = defaultdict(list)
+
+        for ei, event in enumerate(self._events):
+            event_date = event.start.date()
+            ctx = EvalContext(event=event, date=event_date, holidays=greedy.holiday_map)
+
+            # Event-level hard constraints drop the whole event, as in the greedy solver.
+            for plan in greedy.constraints_for(event.type, "event", "hard"):
+                result = plan(ctx)
+                if not result.satisfied:
+                    self._skipped.append(
+                        Violation(
+                            constraint_key=plan.key,
+                            severity="hard",
+                            message=result.reason,
+                            entities=[event.id],
+                        )
+                    )
+                    break
+            else:
+                if event.required_roles:
+                    self._add_event_vars(ei, event, ctx, person_slots, objective)
+
+        # z[e, p] is 1 iff p fills exactly one role at e.
+        roles_by_slot: dict[tuple[int, int], list[Any]] = defaultdict(list)
+        for (ei, _ri, pi), var in self._x.items():
+            roles_by_slot[(ei, pi)].append(var)
+        for key, z in self._z.items():
+            model.Add(sum(roles_by_slot[key]) == z)
+
+        for pi, slots in person_slots.items():
+            slots.sort(key=lambda s: (s[0], self._events[s[1]].start))
+            self._add_person_terms(pi, slots, objective)
+
+        # Change minimization: reward keeping published (event, person) pairs.
+        if self.change_min_enabled and self._prior_published_keys:
+            people = context.people
+            bonus = self.change_min_weight * SCALE
+            for (ei, pi), z in self._z.items():
+                if (self._events[ei].id, people[pi].id) in self._prior_published_keys:
+                    objective.append(-bonus * z)
+
+        model.Minimize(sum(objective))
+
+    def _add_event_vars(
+        self,
+        ei: int,
+        event: Event,
+        ctx: EvalContext,
+        person_slots: dict[int, list[tuple[int, int]]],
+        objective: list[Any],
+    ) -> None:
+        """Role variables, one-role-per-person and coverage terms for one event."""
+        assert self.context is not None
+        model = self._model
+        greedy = self._greedy
+        event_date = event.start.date()
+        day_offset = (event_date - self.context.from_date).days
+
+        # forbid_if only reads the date, so it applies to every candidate at once.
+        if any(
+            self._forbids(plan, ctx)
+            for plan in greedy.constraints_for(event.type, "person", "hard")
+        ):
+            candidates: dict[str, tuple[int, ...]] = {}
+        else:
+            candidates = greedy.candidates_by_role
+        soft_forbid = sum(
+            plan.fail_penalty
+            for plan in greedy.constraints_for(event.type, "person", "soft")
+            if self._forbids(plan, ctx)
+        )
+
+        event_z: list[Any] = []
+        for ri, req in enumerate(event.required_roles):
+            filled = []
+            for pi in candidates.get(req.role, ()):
+                if (greedy.blocked_days[pi] >> day_offset) & 1:
+                    continue
+                var = model.NewBoolVar(f"x_{ei}_{ri}_{pi}")
+                self._x[(ei, ri, pi)] = var
+                filled.append(var)
+                if (ei, pi) not in self._z:
+                    z = self._z[(ei, pi)] = model.NewBoolVar(f"z_{ei}_{pi}")
+                    event_z.append(z)
+                    person_slots[pi].append((event_date.toordinal(), ei))
+            if filled:
+                model.Add(sum(filled) <= req.count)
+            objective.append(self.weights["coverage"] * SCALE * (req.count - sum(filled)))
+
+        if soft_forbid:
+            cost = round(soft_forbid * self.weights["constraints"] * SCALE)
+            objective.extend(cost * z for z in event_z)
+
+    def _add_person_terms(
+        self, pi: int, slots: list[tuple[int, int]], objective: list[Any]
+    ) -> None:
+        """Fairness, caps, gaps and recency terms for one person's eligible events."""
+        model = self._model
+        greedy = self._greedy
+        events = self._events
+        z_of = [self._z[(ei, pi)] for _, ei in slots]
+        ordinals = [o for o, _ in slots]
+        constraint_weight = self.weights["constraints"]
+        gap_pairs: set[tuple[int, int, bool]] = set()
+
+        load = model.NewIntVar(0, len(slots), f"load_{pi}")
+        model.Add(load == sum(z_of))
+        load_sq = model.NewIntVar(0, len(slots) ** 2, f"load_sq_{pi}")
+        model.AddMultiplicationEquality(load_sq, [load, load])
+        objective.append(self.weights["fairness"] * SCALE // 2 * load_sq)
+
+        for pos, (_, ei) in enumerate(slots):
+            event = events[ei]
+            event_date = event.start.date()
+            ctx = EvalContext(event=event, date=event_date, holidays=greedy.holiday_map)
+            for severity in ("hard", "soft"):
+                for plan in greedy.constraints_for(event.type, "person", severity):
+                    if not plan.when_matches(ctx):
+                        continue
+                    action = plan.binding.then
+                    hard = severity == "hard"
+                    cost = round(plan.fail_penalty * constraint_weight * SCALE)
+
+                    if action.enforce_cap:
+                        window = cap_window(action.enforce_cap.get("period", "P1M"), event_date)
+                        if window is not None:
+                            lo = bisect_left(ordinals, window[0].toordinal())
+                            hi = bisect_right(ordinals, window[1].toordinal())
+                            others = [z_of[i] for i in range(lo, hi) if i != pos]
+                            max_count = action.enforce_cap.get("max_count", 999)
+                            if len(others) >= max_count:
+                                cap = model.Add(sum(others) <= max_count - 1)
+                                if hard:
+                                    cap.OnlyEnforceIf(z_of[pos])
+                                else:
+                                    over = model.NewBoolVar(f"cap_{plan.key}_{ei}_{pi}")
+                                    cap.OnlyEnforceIf([z_of[pos], over.Not()])
+                                    objective.append(cost * over)
+
+                    if action.enforce_min_gap_hours is not None:
+                        min_gap = timedelta(hours=action.enforce_min_gap_hours)
+                        for other_pos in self._gap_conflicts(slots, pos, min_gap):
+                            first, second = sorted((pos, other_pos))
+                            if (first, second, hard) not in gap_pairs:
+                                gap_pairs.add((first, second, hard))
+                                self._pair_term(z_of[first], z_of[second], hard, cost, objective)
+
+                    if action.penalize_if and not hard:
+                        penalty_type = action.penalize_if.get("type")
+                        if penalty_type == "cooldown":
+                            limit = action.penalize_if.get("cooldown_days", 14)
+                        elif penalty_type == "recent_rotation":
+                            limit = action.penalize_if.get("lookback_days", 30)
+                        else:
+                            continue
+                        weight = float(plan.binding.weight or 10) * constraint_weight
+                        # Earlier slots are in start order; stop once even the
+                        # longest event can't end inside the window.
+                        span = limit + self._max_duration.days + 1
+                        for prv in range(pos - 1, -1, -1):
+                            other = events[slots[prv][1]]
+                            if (event_date - other.start.date()).days >= span:
+                                break
+                            days_ago = (event_date - other.end.date()).days
+                            if days_ago < limit:
+                                pair_cost = round(weight * (limit - days_ago) / limit * SCALE)
+                                self._pair_term(z_of[prv], z_of[pos], False, pair_cost, objective)
+
+    def _gap_conflicts(
+        self, slots: list[tuple[int, int]], pos: int, min_gap: timedelta
+    ) -> list[int]:
+        """Slots closer than ``min_gap`` to ``slots[pos]`` (later start minus earlier end)."""
+        events = self._events
+        event = events[slots[pos][1]]
+        conflicts = []
+        for nxt in range(pos + 1, len(slots)):
+            if events[slots[nxt][1]].start - event.end >= min_gap:
+                break  # starts only grow from here
+            conflicts.append(nxt)
+        # An earlier slot can only end within min_gap of this start if it
+        # started less than min_gap plus the longest event duration before it.
+        horizon = min_gap + self._max_duration
+        for prv in range(pos - 1, -1, -1):
+            other = events[slots[prv][1]]
+            if event.start - other.start >= horizon:
+                break
+            if event.start - other.end < min_gap:
+                conflicts.append(prv)
+        return conflicts
+
+    def _pair_term(self, a: Any, b: Any, hard: bool, cost: int, objective: list[Any]) -> None:
+        """Forbid (hard) or charge ``cost`` (soft) for assigning both ``a`` and ``b``."""
+        if hard:
+            self._model.AddBoolOr([a.Not(), b.Not()])
+            return
+        if cost <= 0:
+            return
+        both = self._model.NewBoolVar("")
+        self._model.Add(both >= a + b - 1)
+        objective.append(cost * both)
+
+    @staticmethod
+    def _forbids(plan: CompiledConstraint, ctx: EvalContext) -> bool:
+        """Whether a person-scoped ``forbid_if`` binding rules out the event's date."""
+        if plan.binding.then.forbid_if != "is_friday_or_monday":
+            return False
+        return plan.when_matches(ctx) and ctx.date is not None and ctx.date.weekday() in (0, 4)
+
+    def _add_hint(self, greedy: SolutionBundle) -> None:
+        """Seed the search with the greedy assignment."""
+        assert self.context is not None
+        people = self.context.people
+        picked = {a.event_id: set(a.assignees) for a in greedy.assignments}
+        remaining = {
+            (ei, ri): req.count
+            for ei, event in enumerate(self._events)
+            for ri, req in enumerate(event.required_roles)
+        }
+        for (ei, pi), z in self._z.items():
+            self._model.AddHint(z, people[pi].id in picked.get(self._events[ei].id, ()))
+        # Greedy assignees carry no role, so give each one the first open role they hold.
+        hinted: set[tuple[int, int]] = set()
+        for (ei, ri, pi), var in self._x.items():
+            hit = (
+                (ei, pi) not in hinted
+                and remaining[(ei, ri)] > 0
+                and people[pi].id in picked.get(self._events[ei].id, ())
+            )
+            if hit:
+                remaining[(ei, ri)] -= 1
+                hinted.add((ei, pi))
+            self._model.AddHint(var, hit)
+
+    def _extract(self, solver: Any) -> tuple[list[Assignment], dict[str, list[Event]], Violations]:
+        """Read assignments, per-person events and coverage violations off the solver."""
+        assert self.context is not None
+        people = self.context.people
+        teams = {t.id: t for t in self.context.teams}
+        violations = Violations(hard=list(self._skipped))
+        skipped = {v.entities[0] for v in self._skipped}
+        by_event_role: dict[tuple[int, int], list[int]] = defaultdict(list)
+        for (ei, ri, pi), var in self._x.items():
+            if solver.Value(var):
+                by_event_role[(ei, ri)].append(pi)
+
+        assignments: list[Assignment] = []
+        person_events: dict[str, list[Event]] = defaultdict(list)
+        for ei, event in enumerate(self._events):
+            if event.id in skipped:
+                continue
+            if not event.required_roles:
+                assignees: list[str] = []
+                if event.team_ids and teams:
+                    for team_id in event.team_ids:
+                        if team_id in teams:
+                            assignees.extend(teams[team_id].members[:2])
+                    assignees = assignees[:2]
+            else:
+                assignees = []
+                for ri, req in enumerate(event.required_roles):
+                    picked = sorted(by_event_role.get((ei, ri), ()))
+                    assignees.extend(people[pi].id for pi in picked)
+                    if len(picked) < req.count:
+                        violations.hard.append(
+                            Violation(
+                                constraint_key="require_role_coverage",
+                                severity="hard",
+                                message=f"Role {req.role} needs {req.count}, got {len(picked)}",
+                                entities=[event.id],
+                            )
+                        )
+            assignments.append(
+                Assignment(
+                    event_id=event.id,
+                    assignees=assignees,
+                    resource_id=event.resource_id,
+                    team_ids=event.team_ids,
+                )
+            )
+            for person_id in assignees:
+                person_events[person_id].append(event)
+        return assignments, person_events, violations
@@ -0,0 +1,210 @@
+"""Scarcity-aware event ordering for the greedy solver (``ordering="most_constrained"``).
+
+Assigning strictly by start time lets early events use up a scarce role's
+holders (the one sound tech also ushers) and leaves later events short.
+``SlackOrder`` instead hands out the most constrained event next. An event's
+slack is, over its required roles, the smallest number of role holders still
+free for it minus the count needed:
+
+    slack(event) = min over roles (free holders of role − required count)
+
+"Free" starts from a precomputed availability matrix — per event, the
+holders of each required role not blocked on its date — and shrinks as the
+solve goes on: after each assignment, every other pending event the
+assignees were free for re-checks them against its person-scoped hard
+constraints (caps, min gaps) and drops those who no longer pass, lowering
+that event's slack. Those are the only checks that can change, so with no
+person-scoped hard constraints the order is fixed up front.
+
+Pending events sit in a heap keyed by ``(slack, start position)``; a lowered
+slack pushes a fresh entry and stale ones are skipped when popped. Events
+without required roles have infinite slack and go last, in start order.
+
+Ordering alone doesn't stop an event from filling a common role with a
+scarce person (the sound tech as an usher). ``lookahead`` scores that while
+candidates are picked: it counts the pending events with no spare holders
+that the candidate is free for and would be knocked out of (by a hard
+constraint) if they took this event. The greedy pass adds
+``LOOKAHEAD_PENALTY`` per such event to the candidate's score, so scarce
+people are only used for common roles when nobody else can be — and not at
+all for a role that ends up short anyway. Within an event, the role with the
+fewest spare holders is filled first (``role_order``).
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import date
+
+from api.core.constraints.dsl import EvalContext
+from api.core.constraints.eval import CompiledConstraint
+from api.core.constraints.timeline import PersonTimeline
+from api.core.models import Event, Person
+
+# Added to a candidate's score per pending event they would leave short;
+# outweighs the fairness and soft-constraint terms.
+LOOKAHEAD_PENALTY = 1000
+# Pending events with more spare holders than this aren't looked at.
+LOOKAHEAD_SPARE = 3
+
+
+class SlackOrder:
+    """Yields events most-constrained first, tracking slack as people are consumed."""
+
+    def __init__(
+        self,
+        events: Sequence[Event],
+        *,
+        people: Sequence[Person],
+        person_index: dict[str, int],
+        candidates_by_role: dict[str, list[int]],
+        blocked_days: Sequence[int],
+        from_date: date,
+        constraint_index: dict[tuple[str, str, str], list[CompiledConstraint]],
+        ctx: EvalContext,
+    ) -> None:
+        """``events`` must be in start order; ``ctx`` is the solve's evaluation context.
+
+        ``ctx`` has to share the solve's live ``person_timelines`` so the hard
+        checks in ``consume`` see every assignment made so far.
+        """
+        self._events = events
+        self._people = people
+        self._person_index = person_index
+        self._constraint_index = constraint_index
+        self._ctx = ctx
+        self._done = [False] * len(events)
+        self._positions = {event.id: pos for pos, event in enumerate(events)}
+
+        # The availability matrix: per event, per required role, the set of
+        # holders free for it; and per person, the events they appear in.
+        self._free: list[list[set[int]]] = []
+        self._needed: list[list[int]] = []
+        self._person_events: list[list[int]] = [[] for _ in people]
+        for pos, event in enumerate(events):
+            offset = (event.start.date() - from_date).days
+            role_free = []
+            members: set[int] = set()
+            for req in event.required_roles:
+                free = {
+                    idx
+                    for idx in candidates_by_role.get(req.role, ())
+                    if not (blocked_days[idx] >> offset) & 1
+                }
+                role_free.append(free)
+                members |= free
+            self._free.append(role_free)
+            self._needed.append([req.count for req in event.required_roles])
+            for idx in members:
+                self._person_events[idx].append(pos)
+
+        self.slack = [self._slack(pos) for pos in range(len(events))]
+        self._heap = [(slack, pos) for pos, slack in enumerate(self.slack)]
+        heapq.heapify(self._heap)
+
+    def __iter__(self) -> Iterator[Event]:
+        while self._heap:
+            slack, pos = heapq.heappop(self._heap)
+            if self._done[pos] or slack != self.slack[pos]:
+                continue  # already handed out, or superseded by a lower slack
+            self._done[pos] = True
+            yield self._events[pos]
+
+    def consume(self, event: Event, person_ids: Iterable[str]) -> None:
+        """Record that ``person_ids`` now work ``event``; re-check their other pending events.
+
+        Call after the assignment is on the timelines in ``ctx``.
+        """
+        ctx = self._ctx
+        for person_id in person_ids:
+            idx = self._person_index.get(person_id)
+            if idx is None:
+                continue
+            ctx.person = self._people[idx]
+            for pos in self._person_events[idx]:
+                if self._done[pos]:
+                    continue
+                other = self._events[pos]
+                hard = self._constraint_index.get((other.type, "person", "hard"), ())
+                if not hard:
+                    continue
+                ctx.event = other
+                ctx.date = other.start.date()
+                if all(plan(ctx).satisfied for plan in hard):
+                    continue
+                for free in self._free[pos]:
+                    free.discard(idx)
+                slack = self._slack(pos)
+                if slack < self.slack[pos]:
+                    self.slack[pos] = slack
+                    heapq.heappush(self._heap, (slack, pos))
+            # Drop people once they can't serve there, so later checks skip them.
+            self._person_events[idx] = [
+                pos
+                for pos in self._person_events[idx]
+                if not self._done[pos] and any(idx in free for free in self._free[pos])
+            ]
+
+    def role_order(self, event: Event) -> list[int]:
+        """Indices of ``event.required_roles`` by ascending spare holders."""
+        pos = self._positions[event.id]
+        spare = [len(f) - n for f, n in zip(self._free[pos], self._needed[pos], strict=True)]
+        return sorted(range(len(spare)), key=spare.__getitem__)
+
+    def lookahead(self, person: int, event: Event, picked: set[int]) -> float:
+        """Weighted count of pending events ``person`` would be knocked out of by ``event``.
+
+        Only events where the person is free in a role with at most
+        ``LOOKAHEAD_SPARE`` spare holders (``picked`` — the event's assignees
+        so far — counted as gone) are re-checked, with ``event`` tentatively
+        on the person's timeline. Each one they'd drop out of weighs
+        ``2 ** -spare``: 1 for an event with no spare, 1/2 with one, ...
+        """
+        tight: list[tuple[int, int]] = []
+        # A role's spare is at least the event's slack minus len(picked).
+        loose = LOOKAHEAD_SPARE + len(picked)
+        current = self._positions.get(event.id)
+        for pos in self._person_events[person]:
+            if self._done[pos] or pos == current or self.slack[pos] > loose:
+                continue
+            spare = min(
+                (
+                    len(free) - len(picked & free) - needed
+                    for free, needed in zip(self._free[pos], self._needed[pos], strict=True)
+                    if person in free
+                ),
+                default=LOOKAHEAD_SPARE + 1,
+            )
+            if spare <= LOOKAHEAD_SPARE:
+                tight.append((pos, max(spare, 0)))
+        if not tight:
+            return 0.0
+
+        ctx = self._ctx
+        ctx.person = self._people[person]
+        person_id = ctx.person.id
+        timelines = ctx.person_timelines
+        timeline = timelines.get(person_id)
+        if timeline is None:
+            timeline = timelines[person_id] = PersonTimeline()
+        timeline.add(event)
+        try:
+            weight = 0.0
+            for pos, spare in tight:
+                other = self._events[pos]
+                hard = self._constraint_index.get((other.type, "person", "hard"), ())
+                ctx.event = other
+                ctx.date = other.start.date()
+                if not all(plan(ctx).satisfied for plan in hard):
+                    weight += 2.0**-spare
+            return weight
+        finally:
+            timeline.remove(event.id)
+
+    def _slack(self, pos: int) -> float:
+        free = self._free[pos]
+        if not free:
+            return math.inf
+        return min(len(f) - n for f, n in zip(free, self._needed[pos], strict=True))
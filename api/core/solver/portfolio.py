@@ -0,0 +1,237 @@
+"""Portfolio solving (``solver="portfolio"``).
+
+Greedy results depend on the order events are assigned in and on how equal
+candidate scores are broken. The portfolio runs several
+``GreedyHeuristicSolver`` variants — start vs most-constrained-first
+ordering, seeded random tie-breaks, different fairness weights — at once in
+worker processes and keeps the best roster that finished within the
+wall-clock budget:
+
+    fewest hard violations → highest health score → lowest soft score
+    → lowest fairness stdev → variant order
+
+Every variant's metrics (or ``completed=False`` if it missed the budget or
+raised) are recorded in ``SolutionMeta.portfolio``. Variants still running
+at the deadline are killed with the worker pool; if none has finished by
+then the first to finish is used. A variant that raises is logged and left
+out; the solve only fails if every variant does.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import queue
+import time
+from dataclasses import dataclass
+
+from api.core.models import Patch, SolutionBundle, SolverMeta, VariantMetrics
+from api.core.solver.adapter import SolveContext, SolverAdapter, apply_patch
+from api.core.solver.decompose import WorkerSettings
+from api.core.solver.heuristics import (
+    MOST_CONSTRAINED_ORDER,
+    START_ORDER,
+    GreedyHeuristicSolver,
+)
+
+logger = logging.getLogger("rostio")
+
+DEFAULT_BUDGET_S = 10
+DEFAULT_VARIANTS = 4
+
+
+@dataclass(frozen=True)
+class PortfolioVariant:
+    """One greedy configuration in the portfolio."""
+
+    name: str
+    ordering: str = START_ORDER
+    tie_break_seed: int | None = None
+    fairness_weight: int = 10
+
+
+def default_variants(n: int = DEFAULT_VARIANTS) -> list[PortfolioVariant]:
+    """The plain greedy solve, most-constrained-first, then seeded / reweighted mixes."""
+    variants = [
+        PortfolioVariant("start"),
+        PortfolioVariant("most_constrained", ordering=MOST_CONSTRAINED_ORDER),
+    ]
+    orderings = (START_ORDER, MOST_CONSTRAINED_ORDER)
+    weights = (10, 25, 5)
+    i = 0
+    while len(variants) < n:
+        ordering = orderings[i % 2]
+        weight = weights[(i // 2) % len(weights)]
+        variants.append(
+            PortfolioVariant(
+                f"{ordering}-seed{i + 1}-fw{weight}",
+                ordering=ordering,
+                tie_break_seed=i + 1,
+                fairness_weight=weight,
+            )
+        )
+        i += 1
+    return variants[:n]
+
+
+def _solve_variant(
+    context: SolveContext, variant: PortfolioVariant, settings: WorkerSettings
+) -> SolutionBundle:
+    """Worker entry point: greedy-solve ``context`` as ``variant``."""
+    solver = GreedyHeuristicSolver(
+        improve_s=settings.improve_s,
+        improve_seed=variant.tie_break_seed or 0,
+        ordering=variant.ordering,
+        tie_break_seed=variant.tie_break_seed,
+    )
+    settings.configure(solver)
+    solver.set_objective({**settings.weights, "fairness": variant.fairness_weight})
+    solver.build_model(context)
+    return solver.solve()
+
+
+def _rank(solution: SolutionBundle) -> tuple[int, float, float, float]:
+    metrics = solution.metrics
+    return (
+        metrics.hard_violations,
+        -metrics.health_score,
+        metrics.soft_score,
+        metrics.fairness.stdev,
+    )
+
+
+class PortfolioSolver(SolverAdapter):
+    """Runs greedy variants in parallel and keeps the best roster."""
+
+    def __init__(
+        self,
+        *,
+        variants: list[PortfolioVariant] | None = None,
+        max_workers: int | None = None,
+        improve_s: float = 0.0,
+    ) -> None:
+        self.variants = variants or default_variants()
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.context: SolveContext | None = None
+        self._settings = WorkerSettings(improve_s=improve_s)
+
+    def build_model(self, context: SolveContext) -> None:
+        """Store the context; each worker builds its own greedy model."""
+        self.context = context
+
+    def solve(self, timeout_s: int | None = None) -> SolutionBundle:
+        """Run every variant within ``timeout_s`` (default 10s) and return the best."""
+        if not self.context:
+            raise RuntimeError("Must call build_model first")
+
+        start_time = time.time()
+        budget_s = timeout_s or DEFAULT_BUDGET_S
+        results: dict[int, SolutionBundle] = {}
+        errors: dict[int, Exception] = {}
+        workers = min(self.max_workers, len(self.variants))
+        if workers <= 1:
+            # In-process: run variants in turn until the budget runs out.
+            for i, variant in enumerate(self.variants):
+                if results and time.time() - start_time >= budget_s:
+                    break
+                try:
+                    results[i] = _solve_variant(self.context, variant, self._settings)
+                except Exception as exc:
+                    self._log_failure(variant, exc)
+                    errors[i] = exc
+        else:
+            finished: queue.SimpleQueue[int] = queue.SimpleQueue()
+            # Leaving the block terminates the pool, so variants still running
+            # at the deadline are killed instead of keeping their workers busy.
+            with multiprocessing.Pool(processes=workers) as pool:
+                pending = {
+                    i: pool.apply_async(
+                        _solve_variant,
+                        (self.context, variant, self._settings),
+                        callback=lambda _, i=i: finished.put(i),
+                        error_callback=lambda _, i=i: finished.put(i),
+                    )
+                    for i, variant in enumerate(self.variants)
+                }
+                while len(results) + len(errors) < len(pending):
+                    remaining = start_time + budget_s - time.time()
+                    if remaining <= 0 and results:
+                        break
+                    try:
+                        # Past the deadline with nothing finished: wait for the first.
+                        i = finished.get(timeout=remaining if remaining > 0 else None)
+                    except queue.Empty:
+                        continue
+                    try:
+                        results[i] = pending[i].get()
+                    except Exception as exc:
+                        self._log_failure(self.variants[i], exc)
+                        errors[i] = exc
+
+        if not results:
+            # Every variant raised: surface the first failure.
+            raise errors[min(errors)]
+
+        best = min(results, key=lambda i: (*_rank(results[i]), i))
+        solution = results[best]
+        solution.meta.portfolio = [
+            self._variant_metrics(variant, results.get(i))
+            for i, variant in enumerate(self.variants)
+        ]
+        winner = self.variants[best]
+        solution.meta.solver = SolverMeta(
+            name="greedy_portfolio",
+            version="1.0.0",
+            strategy=f"portfolio:{winner.name}",
+        )
+        solution.metrics.solve_ms = (time.time() - start_time) * 1000
+        logger.info(
+            "Portfolio: %d/%d variants finished, best %s (%d hard violations)",
+            len(results),
+            len(self.variants),
+            winner.name,
+            solution.metrics.hard_violations,
+        )
+        return solution
+
+    @staticmethod
+    def _log_failure(variant: PortfolioVariant, exc: Exception) -> None:
+        logger.warning("Portfolio variant %s failed: %s", variant.name, exc, exc_info=exc)
+
+    @staticmethod
+    def _variant_metrics(
+        variant: PortfolioVariant, result: SolutionBundle | None
+    ) -> VariantMetrics:
+        metrics = result.metrics if result is not None else None
+        return VariantMetrics(
+            name=variant.name,
+            ordering=variant.ordering,
+            tie_break_seed=variant.tie_break_seed,
+            fairness_weight=variant.fairness_weight,
+            completed=result is not None,
+            solve_ms=metrics.solve_ms if metrics else None,
+            hard_violations=metrics.hard_violations if metrics else None,
+            soft_score=metrics.soft_score if metrics else None,
+            health_score=metrics.health_score if metrics else None,
+            fairness_stdev=metrics.fairness.stdev if metrics else None,
+        )
+
+    def set_objective(self, weights: dict[str, int]) -> None:
+        """Set objective weights (each variant overrides ``fairness``)."""
+        self._settings.weights = weights
+
+    def enable_change_minimization(self, enabled: bool, weight_move_published: int) -> None:
+        """Enable/disable change minimization."""
+        self._settings.change_min_enabled = enabled
+        self._settings.change_min_weight = weight_move_published
+
+    def set_prior_published_keys(self, keys: set[tuple[str, str]]) -> None:
+        """Provide ``(event_id, person_id)`` keys from the prior published solution."""
+        self._settings.prior_published_keys = keys
+
+    def incremental_update(self, changes: Patch) -> None:
+        """Apply incremental changes to model."""
+        if not self.context:
+            raise RuntimeError("Must call build_model first")
+        self.build_model(apply_patch(self.context, changes))
@@ -0,0 +1,129 @@
+"""Per-phase timing, counters and optional profiler capture for solves.
+
+The greedy solver reports where a solve spent its time in
+``SolutionMeta.profile`` (``SolveProfile``):
+
+- ``phases_ms``: ``build`` (``build_model``; 0 when cached indexes were
+  reused), ``filter`` (windowing, event-level and person-level hard
+  constraints, availability), ``order`` (most-constrained setup, when
+  used), ``score`` (soft constraints, fairness, lookahead), ``select``
+  (ranking and picking), ``improve`` (local search, when enabled) and
+  ``metrics``
+- ``counters``: ``events``, ``candidates_scored``, ``constraint_evals``
+  (compiled plan calls) and ``predicates_called`` (checks and ``when``
+  clauses the plans ran)
+
+Phases are timed per event role rather than per candidate, so the timers
+cost a few clock reads per event. The plan counters are per solve: each
+solver compiles its own plans in ``build_model`` / ``use_model`` (cached
+snapshots don't carry them) and reports their change over the solve.
+
+``capture_profile`` additionally runs a cProfile or pyinstrument capture
+around a block and keeps its text report; pyinstrument is optional and
+falls back to cProfile when not installed.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import pstats
+from collections.abc import Iterator
+from contextlib import contextmanager
+from time import perf_counter
+
+try:
+    from pyinstrument import Profiler as _Pyinstrument
+
+    PYINSTRUMENT_AVAILABLE = True
+except ImportError:  # pragma: no cover — pyinstrument is optional
+    PYINSTRUMENT_AVAILABLE = False
+
+logger = logging.getLogger("rostio")
+
+CPROFILE = "cprofile"
+PYINSTRUMENT = "pyinstrument"
+PROFILERS = (CPROFILE, PYINSTRUMENT)
+
+# Functions listed in a cProfile report, by cumulative time.
+CPROFILE_TOP = 40
+
+
+class PhaseTimer:
+    """Wall time accumulated per phase name, in milliseconds."""
+
+    __slots__ = ("phases_ms",)
+
+    def __init__(self) -> None:
+        self.phases_ms: dict[str, float] = {}
+
+    def add(self, phase: str, since: float) -> float:
+        """Charge the time from ``since`` to now to ``phase``; returns now.
+
+        Chain calls to split a stretch of work: ``t = timer.add("filter", t)``.
+        """
+        now = perf_counter()
+        self.phases_ms[phase] = self.phases_ms.get(phase, 0.0) + (now - since) * 1000
+        return now
+
+
+class ProfileCapture:
+    """Result of ``capture_profile``: the tool used and its text report."""
+
+    __slots__ = ("tool", "text")
+
+    def __init__(self, tool: str | None) -> None:
+        self.tool = tool
+        self.text: str | None = None
+
+
+@contextmanager
+def capture_profile(tool: str | None) -> Iterator[ProfileCapture]:
+    """Profile the block with ``tool`` (``PROFILERS``); None captures nothing.
+
+    The report is on the yielded ``ProfileCapture`` once the block exits. If
+    another profiler is already active in the process the block runs
+    unprofiled (with a warning) rather than failing.
+    """
+    if tool is not None and tool not in PROFILERS:
+        raise ValueError(f"Unknown profiler '{tool}'")
+    if tool == PYINSTRUMENT and not PYINSTRUMENT_AVAILABLE:
+        logger.warning("pyinstrument not installed; profiling with cProfile instead")
+        tool = CPROFILE
+    capture = ProfileCapture(tool)
+    if tool is None:
+        yield capture
+        return
+
+    if tool == PYINSTRUMENT:
+        profiler = _Pyinstrument()
+        try:
+            profiler.start()
+        except RuntimeError as exc:
+            logger.warning("Solve not profiled: %s", exc)
+            capture.tool = None
+            yield capture
+            return
+        try:
+            yield capture
+        finally:
+            profiler.stop()
+            capture.text = profiler.output_text(unicode=False, color=False)
+        return
+
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError as exc:  # another profiler holds the interpreter hook
+        logger.warning("Solve not profiled: %s", exc)
+        capture.tool = None
+        yield capture
+        return
+    try:
+        yield capture
+    finally:
+        profile.disable()
+        out = io.StringIO()
+        pstats.Stats(profile, stream=out).sort_stats("cumulative").print_stats(CPROFILE_TOP)
+        capture.text = out.getvalue()
@@ -0,0 +1,301 @@
+"""NumPy scoring backend for the greedy solver (``SolveRequest.mode="vectorized"``).
+
+The scalar path in ``GreedyHeuristicSolver._assign_event`` scores candidates
+one at a time through compiled constraint plans. This backend keeps the
+per-person state those evaluations read — assignment counts, last assignment
+end day and per-day assignment counts for cap windows — in NumPy arrays, and
+computes the penalty vector for every candidate of a role in one pass.
+The fairness weight, tie-break seed and most-constrained lookahead come from
+the solver, so picks match the scalar path under any weights and ordering.
+
+Supported constraint actions are ``forbid_if``, ``enforce_cap`` and the
+``cooldown`` / ``recent_rotation`` ``penalize_if`` types. Bindings using any
+other action (``require_roles``, ``enforce_min_gap_hours``) are evaluated per
+candidate through the plan itself so results stay identical to the
+scalar path, including ordering among equal penalties. Bindings arrive as
+the solver's ``CompiledConstraint`` plans, so ``when`` clauses and the
+fallback share the plans' per-date memos.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Iterable, Sequence
+from datetime import date
+from typing import Any
+
+from api.core.constraints.dsl import EvalContext
+from api.core.constraints.eval import CompiledConstraint, cap_window
+from api.core.constraints.predicates import is_friday_or_monday
+from api.core.models import Event, Person
+from api.core.solver.ordering import LOOKAHEAD_PENALTY, SlackOrder
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover — numpy is optional
+    NUMPY_AVAILABLE = False
+
+VECTORIZED_MODE = "vectorized"
+
+# Sentinel for "never assigned" in the last-end-day array.
+_NO_ASSIGNMENT = -(2**62)
+
+
+class VectorizedScorer:
+    """Array-backed candidate scoring for one solve."""
+
+    def __init__(
+        self,
+        *,
+        people: Sequence[Person],
+        person_index: dict[str, int],
+        candidates_by_role: dict[str, list[int]],
+        blocked_days: Sequence[int],
+        from_date: date,
+        to_date: date,
+        change_min_enabled: bool,
+        change_min_weight: int,
+        prior_published_keys: Iterable[tuple[str, str]],
+        fairness_weight: float = 10,
+        tie_rng: random.Random | None = None,
+        slack_order: SlackOrder | None = None,
+    ) -> None:
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("Vectorized scoring requires numpy: poetry install --extras numpy")
+
+        self.people = people
+        self.person_index = person_index
+        self.from_date = from_date
+        self.horizon = (to_date - from_date).days
+        n_people = len(people)
+        n_days = self.horizon + 1
+
+        self.candidates_by_role = {
+            role: np.asarray(idxs, dtype=np.int64) for role, idxs in candidates_by_role.items()
+        }
+
+        # Per-person state read by the penalty vectors.
+        self.assignment_counts = np.zeros(n_people, dtype=np.int64)
+        self.last_end_ordinal = np.full(n_people, _NO_ASSIGNMENT, dtype=np.int64)
+        self.day_counts = np.zeros((n_people, n_days), dtype=np.int32)
+
+        # Blocked-day bitsets unpacked into a dense (people × days) mask.
+        n_bytes = (n_days + 7) // 8
+        self.blocked = np.zeros((n_people, n_days), dtype=bool)
+        for idx, bits in enumerate(blocked_days):
+            if bits:
+                raw = np.frombuffer(bits.to_bytes(n_bytes, "little"), dtype=np.uint8)
+                self.blocked[idx] = np.unpackbits(raw, bitorder="little")[:n_days].astype(bool)
+
+        self.change_min_enabled = change_min_enabled
+        self.change_min_weight = change_min_weight
+        self.prior_by_event: dict[str, set[int]] = {}
+        for event_id, person_id in prior_published_keys:
+            pidx = person_index.get(person_id)
+            if pidx is not None:
+                self.prior_by_event.setdefault(event_id, set()).add(pidx)
+
+        self.fairness_weight = fairness_weight
+        self.tie_rng = tie_rng
+        self.slack_order = slack_order
+
+        self._supported: dict[int, bool] = {}
+
+    # ── state ────────────────────────────────────────────────────────
+
+    def record(self, event: Event, person_ids: Iterable[str]) -> None:
+        """Update per-person arrays after ``person_ids`` were assigned to ``event``."""
+        start_offset = (event.start.date() - self.from_date).days
+        end_ordinal = event.end.date().toordinal()
+        for person_id in person_ids:
+            idx = self.person_index.get(person_id)
+            if idx is None:
+                continue
+            self.assignment_counts[idx] += 1
+            if 0 <= start_offset <= self.horizon:
+                self.day_counts[idx, start_offset] += 1
+            if end_ordinal > self.last_end_ordinal[idx]:
+                self.last_end_ordinal[idx] = end_ordinal
+
+    # ── scoring ──────────────────────────────────────────────────────
+
+    def select(
+        self,
+        *,
+        event: Event,
+        role: str,
+        count: int,
+        exclude: Iterable[str],
+        ctx: EvalContext,
+        hard_constraints: Sequence[CompiledConstraint],
+        soft_constraints: Sequence[CompiledConstraint],
+    ) -> list[int]:
+        """Return up to ``count`` best person ints for ``role``, best first.
+
+        ``hard_constraints`` / ``soft_constraints`` are the person-scoped
+        plans that apply to ``event.type`` (the solver's constraint index).
+        """
+        event_date = event.start.date()
+        day_offset = (event_date - self.from_date).days
+
+        cand = self.candidates_by_role.get(role)
+        if cand is None or len(cand) == 0 or count <= 0:
+            return []
+
+        keep = ~self.blocked[cand, day_offset]
+        excluded = [self.person_index[pid] for pid in exclude if pid in self.person_index]
+        if excluded:
+            keep &= ~np.isin(cand, excluded)
+        cand = cand[keep]
+
+        # Person-level hard constraints drop candidates.
+        for binding in hard_constraints:
+            if len(cand) == 0:
+                break
+            violated, _ = self._binding_vector(binding, ctx, event_date, cand)
+            cand = cand[~violated]
+        if len(cand) == 0:
+            return []
+
+        # Soft penalties, summed in binding order to match the scalar path.
+        penalty = np.zeros(len(cand), dtype=np.float64)
+        for binding in soft_constraints:
+            _, binding_penalty = self._binding_vector(binding, ctx, event_date, cand)
+            penalty += binding_penalty
+
+        # Fairness: prefer people with fewer assignments.
+        penalty += self.assignment_counts[cand] * self.fairness_weight
+
+        # Change-minimization bonus for (event, person) pairs already published.
+        if self.change_min_enabled:
+            prior = self.prior_by_event.get(event.id)
+            if prior:
+                penalty[np.isin(cand, list(prior))] -= self.change_min_weight
+
+        # Most-constrained ordering: keep scarce people for the pending
+        # events that can't spare them (per candidate, like the scalar path).
+        if self.slack_order is not None:
+            picked = set(excluded)
+            protected = np.zeros(len(cand), dtype=bool)
+            for pos, idx in enumerate(cand):
+                short = self.slack_order.lookahead(int(idx), event, picked)
+                if short:
+                    penalty[pos] += LOOKAHEAD_PENALTY * short
+                    protected[pos] = True
+            if protected.any() and len(cand) < count:
+                cand, penalty = cand[~protected], penalty[~protected]
+
+        if self.tie_rng is not None:
+            # Shuffle positions with the same draws the scalar path spends on
+            # its candidate list, then stable-sort that order by penalty.
+            order = list(range(len(cand)))
+            self.tie_rng.shuffle(order)
+            shuffled = np.asarray(order, dtype=np.int64)
+            best = shuffled[np.argsort(penalty[shuffled], kind="stable")[:count]]
+            return [int(i) for i in cand[best]]
+
+        return [int(i) for i in cand[_stable_smallest(penalty, count)]]
+
+    def _binding_vector(
+        self,
+        binding: CompiledConstraint,
+        ctx: EvalContext,
+        event_date: date,
+        cand: Any,
+    ) -> tuple[Any, Any]:
+        """Return ``(violated, penalty)`` arrays for ``binding`` over ``cand``."""
+        n = len(cand)
+        if not self._is_supported(binding):
+            return self._scalar_vector(binding, ctx, cand)
+
+        violated = np.zeros(n, dtype=bool)
+        penalty = np.zeros(n, dtype=np.float64)
+
+        # ``when`` predicates only read the event date / holidays, so one
+        # (memoized) evaluation covers every candidate.
+        if not binding.when_matches(ctx):
+            return violated, penalty
+
+        action = binding.binding.then
+        fail_penalty = binding.fail_penalty
+
+        if action.forbid_if == "is_friday_or_monday" and is_friday_or_monday(ctx):
+            return np.ones(n, dtype=bool), np.full(n, fail_penalty)
+
+        # Each candidate takes the penalty of the first action it violates.
+        if action.enforce_cap:
+            period = action.enforce_cap.get("period", "P1M")
+            max_count = action.enforce_cap.get("max_count", 999)
+            window = cap_window(period, event_date)
+            if window is not None:
+                lo = max((window[0] - self.from_date).days, 0)
+                hi = min((window[1] - self.from_date).days, self.horizon)
+                if lo <= hi:
+                    in_window = self.day_counts[cand, lo : hi + 1].sum(axis=1)
+                else:
+                    in_window = np.zeros(n, dtype=np.int64)
+                hit = in_window >= max_count
+                violated |= hit
+                penalty[hit] = fail_penalty
+
+        if action.penalize_if and binding.severity == "soft":
+            penalty_type = action.penalize_if.get("type")
+            if penalty_type == "cooldown":
+                limit = action.penalize_if.get("cooldown_days", 14)
+            elif penalty_type == "recent_rotation":
+                limit = action.penalize_if.get("lookback_days", 30)
+            else:
+                limit = None
+            if limit is not None:
+                last_end = self.last_end_ordinal[cand]
+                days_ago = event_date.toordinal() - last_end
+                hit = ~violated & (last_end != _NO_ASSIGNMENT) & (days_ago < limit)
+                weight = float(binding.binding.weight or 10)
+                penalty[hit] = weight * (limit - days_ago[hit]) / limit
+                violated |= hit
+
+        return violated, penalty
+
+    def _scalar_vector(
+        self, binding: CompiledConstraint, ctx: EvalContext, cand: Any
+    ) -> tuple[Any, Any]:
+        """Per-candidate fallback through the compiled plan."""
+        n = len(cand)
+        violated = np.zeros(n, dtype=bool)
+        penalty = np.zeros(n, dtype=np.float64)
+        for pos, idx in enumerate(cand):
+            ctx.person = self.people[int(idx)]
+            result = binding(ctx)
+            violated[pos] = not result.satisfied
+            penalty[pos] = result.penalty
+        return violated, penalty
+
+    def _is_supported(self, binding: CompiledConstraint) -> bool:
+        key = id(binding)
+        supported = self._supported.get(key)
+        if supported is None:
+            action = binding.binding.then
+            supported = not action.require_roles and action.enforce_min_gap_hours is None
+            self._supported[key] = supported
+        return supported
+
+
+def _stable_smallest(values: Any, k: int) -> Any:
+    """Positions of the ``k`` smallest ``values``, ordered by (value, position).
+
+    ``argpartition`` finds the k-th smallest value without a full sort; ties
+    at that boundary are then broken by position so the pick matches the
+    scalar path's stable ``list.sort``.
+    """
+    n = len(values)
+    if k < n:
+        kth = values[np.argpartition(values, k - 1)[k - 1]]
+        below = np.flatnonzero(values < kth)
+        at = np.flatnonzero(values == kth)[: k - len(below)]
+        picked = np.concatenate([below, at])
+        picked.sort()
+    else:
+        picked = np.arange(n)
+    return picked[np.argsort(values[picked], kind="stable")]
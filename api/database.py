@@ -46,6 +46,12 @@ from api.utils.tenancy_guard import install_tenancy_guard  # noqa: E402
 
 install_tenancy_guard(Session)
 
+# Bump Organization.data_version on solver-visible writes, which invalidates
+# cached solve contexts (see api/utils/org_data_version.py).
+from api.utils.org_data_version import install_org_version_tracking  # noqa: E402
+
+install_org_version_tracking(Session)
+
 
 def _resolve_sqlite_path(db_url: str) -> Path | None:
     """Translate SQLite URLs into filesystem paths."""
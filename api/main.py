@@ -38,6 +38,7 @@ from api.routers import (
     solver,
     teams,
 )
+from api.services import solve_jobs
 
 
 # Application lifespan context manager
@@ -72,6 +73,7 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    solve_jobs.shutdown()
     print("👋 SignUpFlow API shutting down")
 
 
@@ -54,6 +54,8 @@ class Organization(Base):
     config = Column(JSONType, nullable=True)
     created_at = Column(DateTime, default=utcnow)
     updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
+    # Bumped when solver input data changes (see api/utils/org_data_version.py)
+    data_version = Column(Integer, nullable=False, default=0, server_default="0")
 
     # Cancellation and data retention fields
     cancelled_at = Column(DateTime, nullable=True)  # When subscription was cancelled
@@ -687,6 +689,8 @@ class Assignment(Base):
         Index("idx_assignments_solution_id", "solution_id"),
         Index("idx_assignments_event_id", "event_id"),
         Index("idx_assignments_person_id", "person_id"),
+        # Person/team-scoped exports of one solution.
+        Index("idx_assignments_solution_person", "solution_id", "person_id"),
     )
 
 
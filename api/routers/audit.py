@@ -9,8 +9,9 @@ from api.database import get_db
 from api.dependencies import get_current_admin_user
 from api.models import AuditAction, AuditLog, Person
 from api.schemas.audit import AuditLogResponse
-from api.schemas.common import ListResponse, PaginationParams, get_pagination_params
+from api.schemas.common import ListResponse, PaginationParams, get_cursor_pagination_params
 from api.utils.audit_logger import log_audit_event
+from api.utils.pagination import count_total, keyset_page
 
 router = APIRouter(prefix="/audit-logs", tags=["audit"])
 
@@ -25,7 +26,7 @@ def list_audit_logs(
     end_date: datetime | None = Query(None, description="Inclusive upper bound on timestamp"),
     audit_status: str
     | None = Query(None, alias="status", description="success / failure / denied"),
-    pagination: PaginationParams = Depends(get_pagination_params),
+    pagination: PaginationParams = Depends(get_cursor_pagination_params),
     current_admin: Person = Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
@@ -49,13 +50,10 @@ def list_audit_logs(
     if audit_status is not None:
         query = query.filter(AuditLog.status == audit_status)
 
-    total = query.count()
-    rows = (
-        query.order_by(AuditLog.timestamp.desc())
-        .offset(pagination.offset)
-        .limit(pagination.limit)
-        .all()
+    rows, next_cursor = keyset_page(
+        query, pagination, AuditLog.timestamp, AuditLog.id, descending=True
     )
+    total = count_total(query, pagination.total)
 
     log_audit_event(
         db,
@@ -77,6 +75,7 @@ def list_audit_logs(
             },
             "limit": pagination.limit,
             "offset": pagination.offset,
+            "cursor": pagination.cursor,
             "result_count": len(rows),
         },
         ip_address=http_request.client.host if http_request.client else None,
@@ -88,4 +87,5 @@ def list_audit_logs(
         "total": total,
         "limit": pagination.limit,
         "offset": pagination.offset,
+        "next_cursor": next_cursor,
     }
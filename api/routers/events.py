@@ -17,7 +17,7 @@ from api.models import (
     Person,
     Team,
 )
-from api.schemas.common import PaginationParams, get_pagination_params
+from api.schemas.common import PaginationParams, get_cursor_pagination_params
 from api.schemas.event import EventCreate, EventList, EventResponse, EventUpdate
 from api.services import event_bus
 from api.timeutils import utcnow
@@ -30,6 +30,7 @@ from api.utils.event_helpers import (
     person_has_matching_role,
     validate_time_range,
 )
+from api.utils.pagination import count_total, keyset_page
 from api.utils.response_messages import error_response, success_response, validation_warning
 
 router = APIRouter(prefix="/events", tags=["events"])
@@ -135,7 +136,7 @@ def list_events(
         alias="status",
         description="Filter by computed status: 'upcoming', 'past', or 'ongoing'",
     ),
-    pagination: PaginationParams = Depends(get_pagination_params),
+    pagination: PaginationParams = Depends(get_cursor_pagination_params),
     db: Session = Depends(get_db),
 ):
     """List events with optional filters."""
@@ -168,14 +169,13 @@ def list_events(
                 detail=f"Invalid status '{status_filter}'. Must be 'upcoming', 'past', or 'ongoing'",
             )
 
-    query = query.order_by(Event.start_time)
-    events = query.offset(pagination.offset).limit(pagination.limit).all()
-    total = query.count()
+    events, next_cursor = keyset_page(query, pagination, Event.start_time, Event.id)
     return {
         "items": events,
-        "total": total,
+        "total": count_total(query, pagination.total),
         "limit": pagination.limit,
         "offset": pagination.offset,
+        "next_cursor": next_cursor,
     }
 
 
@@ -15,7 +15,7 @@ from api.dependencies import (
 )
 from api.logging_config import logger
 from api.models import AuditAction, Organization, Person
-from api.schemas.common import PaginationParams, get_pagination_params
+from api.schemas.common import PaginationParams, get_cursor_pagination_params
 from api.schemas.person import PersonCreate, PersonList, PersonResponse, PersonUpdate
 from api.utils.audit_logger import log_audit_event
 from api.utils.bulk_import import (
@@ -23,6 +23,7 @@ from api.utils.bulk_import import (
     BulkImportError,
     parse_bulk_people,
 )
+from api.utils.pagination import count_total, keyset_page
 
 router = APIRouter(prefix="/people", tags=["people"])
 
@@ -219,7 +220,7 @@ def list_people(
     | None = Query(
         None, alias="status", description="Filter by Person.status (active/inactive/invited)"
     ),
-    pagination: PaginationParams = Depends(get_pagination_params),
+    pagination: PaginationParams = Depends(get_cursor_pagination_params),
     current_user: Person = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -245,18 +246,18 @@ def list_people(
     # Note: For JSON field filtering in SQLite, we'd need to load and filter in memory
     # For production with PostgreSQL, we could use JSON operators
 
-    people = query.offset(pagination.offset).limit(pagination.limit).all()
+    people, next_cursor = keyset_page(query, pagination, Person.id, Person.id)
 
     # Apply role filter in memory if specified
     if role:
         people = [p for p in people if p.roles and role in p.roles]
 
-    total = query.count()
     return {
         "items": people,
-        "total": total,
+        "total": count_total(query, pagination.total),
         "limit": pagination.limit,
         "offset": pagination.offset,
+        "next_cursor": next_cursor,
     }
 
 
@@ -1,24 +1,17 @@
 """Solutions router - view and export generated solutions."""
 
 import json
+from collections.abc import Iterator
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from fastapi.responses import StreamingResponse
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from api.core.models import (
-    Assignment as AssignmentModel,
-)
-from api.core.models import (
-    Event as EventModel,
-)
-from api.core.models import (
-    Person as PersonModel,
-)
 from api.database import get_db
 from api.dependencies import get_current_admin_user, verify_org_member
 from api.models import Assignment, AuditAction, AuditLog, Event, Organization, Person, Solution
-from api.schemas.common import PaginationParams, get_pagination_params
+from api.schemas.common import PaginationParams, get_cursor_pagination_params
 from api.schemas.solver import (
     AssignmentChange,
     ExportFormat,
@@ -33,18 +26,40 @@ from api.schemas.solver import (
     StabilityMetrics,
     WorkloadStats,
 )
-from api.services import event_bus
+from api.services import event_bus, schedule_pdf, solution_export
 from api.timeutils import utcnow
 from api.utils.audit_logger import log_audit_event
-from api.utils.pdf_export import generate_schedule_pdf
+from api.utils.pagination import count_total, keyset_page
 
 router = APIRouter(prefix="/solutions", tags=["solutions"])
 
 
+def _solution_responses(db: Session, solutions: list[Solution]) -> list[SolutionResponse]:
+    """Responses for ``solutions`` with assignment counts from one grouped query."""
+    counts: dict[int, int] = {}
+    if solutions:
+        counts = dict(
+            db.query(Assignment.solution_id, func.count(Assignment.id))
+            .filter(Assignment.solution_id.in_([sol.id for sol in solutions]))
+            .group_by(Assignment.solution_id)
+            .all()
+        )
+    responses = []
+    for sol in solutions:
+        response = SolutionResponse.model_validate(sol)
+        response.assignment_count = counts.get(sol.id, 0)
+        responses.append(response)
+    return responses
+
+
+def _solution_response(db: Session, solution: Solution) -> SolutionResponse:
+    return _solution_responses(db, [solution])[0]
+
+
 @router.get("/", response_model=SolutionList)
 def list_solutions(
     org_id: str | None = Query(None, description="Filter by organization ID"),
-    pagination: PaginationParams = Depends(get_pagination_params),
+    pagination: PaginationParams = Depends(get_cursor_pagination_params),
     db: Session = Depends(get_db),
 ):
     """List solutions with optional filters."""
@@ -53,23 +68,15 @@ def list_solutions(
     if org_id:
         query = query.filter(Solution.org_id == org_id)
 
-    query = query.order_by(Solution.created_at.desc())
-    solutions = query.offset(pagination.offset).limit(pagination.limit).all()
-    total = query.count()
-
-    # Add assignment counts
-    solution_responses = []
-    for sol in solutions:
-        assignment_count = db.query(Assignment).filter(Assignment.solution_id == sol.id).count()
-        response = SolutionResponse.model_validate(sol)
-        response.assignment_count = assignment_count
-        solution_responses.append(response)
-
+    solutions, next_cursor = keyset_page(
+        query, pagination, Solution.created_at, Solution.id, descending=True
+    )
     return {
-        "items": solution_responses,
-        "total": total,
+        "items": _solution_responses(db, solutions),
+        "total": count_total(query, pagination.total),
         "limit": pagination.limit,
         "offset": pagination.offset,
+        "next_cursor": next_cursor,
     }
 
 
@@ -83,10 +90,7 @@ def get_solution(solution_id: int, db: Session = Depends(get_db)):
             detail=f"Solution {solution_id} not found",
         )
 
-    assignment_count = db.query(Assignment).filter(Assignment.solution_id == solution.id).count()
-    response = SolutionResponse.model_validate(solution)
-    response.assignment_count = assignment_count
-    return response
+    return _solution_response(db, solution)
 
 
 @router.get(
@@ -259,204 +263,53 @@ def export_solution(
     export_format: ExportFormat,
     db: Session = Depends(get_db),
 ):
-    """Export solution in various formats (CSV, ICS, JSON)."""
+    """Export solution in various formats (CSV, JSON, NDJSON, ICS, PDF)."""
+    # CSV, JSON, NDJSON and ICS stream straight from one joined query
+    # (api/services/solution_export.py); PDFs are rendered and cached by
+    # api/services/schedule_pdf.py.
     solution = db.query(Solution).filter(Solution.id == solution_id).first()
     if not solution:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Solution {solution_id} not found",
         )
-
-    # Load assignments
-    assignments_db = db.query(Assignment).filter(Assignment.solution_id == solution_id).all()
-    if not assignments_db:
+    if not solution_export.has_assignments(db, solution):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Solution has no assignments",
         )
 
-    # Group assignments by event
-    event_assignments = {}
-    for a in assignments_db:
-        if a.event_id not in event_assignments:
-            event_assignments[a.event_id] = []
-        event_assignments[a.event_id].append(a.person_id)
-
-    # Load events and people
-    event_ids = list(event_assignments.keys())
-    events_db = db.query(Event).filter(Event.id.in_(event_ids)).all()
-    people_db = db.query(Person).filter(Person.org_id == solution.org_id).all()
-
-    # Convert to core models
-    events = [
-        EventModel(
-            id=e.id,
-            type=e.type,
-            start=e.start_time,
-            end=e.end_time,
-            resource_id=e.resource_id,
-            team_ids=[],
-            required_roles=[],
-        )
-        for e in events_db
-    ]
-
-    people = [
-        PersonModel(id=p.id, name=p.name, roles=p.roles or [], skills=[], teams=[])
-        for p in people_db
-    ]
-
-    assignments = [
-        AssignmentModel(event_id=event_id, assignees=person_ids)
-        for event_id, person_ids in event_assignments.items()
-    ]
-
-    # Create a minimal solution object for export
-    from datetime import date
-
-    from api.core.models import (
-        FairnessMetrics,
-        Metrics,
-        SolutionBundle,
-        SolutionMeta,
-        SolverMeta,
-        StabilityMetrics,
-        Violations,
-    )
-
-    solution_obj = SolutionBundle(
-        meta=SolutionMeta(
-            generated_at=solution.created_at,
-            range_start=date.today(),
-            range_end=date.today(),
-            mode="greedy",
-            change_min=False,
-            solver=SolverMeta(name="greedy-solver", version="1.0", strategy="greedy"),
-        ),
-        assignments=assignments,
-        metrics=Metrics(
-            hard_violations=solution.hard_violations,
-            soft_score=solution.soft_score,
-            health_score=solution.health_score,
-            solve_ms=solution.solve_ms,
-            fairness=FairnessMetrics(
-                stdev=(
-                    solution.metrics.get("fairness", {}).get("stdev", 0.0)
-                    if solution.metrics
-                    else 0.0
-                ),
-                per_person_counts=(
-                    solution.metrics.get("fairness", {}).get("per_person_counts", {})
-                    if solution.metrics
-                    else {}
-                ),
-            ),
-            stability=StabilityMetrics(moves_from_published=0, affected_persons=0),
-        ),
-        violations=Violations(hard=[], soft=[]),
-    )
-
-    # Apply scope filtering if needed
+    person_id = team_id = None
     if export_format.scope.startswith("person:"):
         person_id = export_format.scope.split(":", 1)[1]
-        assignments = [a for a in assignments if person_id in a.assignees]
     elif export_format.scope.startswith("team:"):
-        # Would need team member lookup
-        pass
-
-    # Generate export
-    if export_format.format == "json":
-        # Return solution as JSON directly
-        import json
-
-        content = json.dumps(solution_obj.model_dump(), indent=2, default=str)
-        return Response(
-            content=content,
-            media_type="application/json",
-            headers={"Content-Disposition": f"attachment; filename=solution_{solution_id}.json"},
-        )
-
-    elif export_format.format == "csv":
-        # Generate CSV directly without using write_assignments_csv (has StringIO bug)
-        import csv
-        from io import StringIO
-
-        output = StringIO()
-        writer = csv.writer(output)
-
-        # Header
-        writer.writerow(["Event ID", "Event Type", "Date", "Time", "Assignees"])
-
-        # Data rows
-        for assignment in assignments:
-            event = next((e for e in events if e.id == assignment.event_id), None)
-            if event:
-                assignees = ", ".join([p.name for p in people if p.id in assignment.assignees])
-                writer.writerow(
-                    [event.id, event.type, event.start.date(), event.start.time(), assignees]
+        team_id = export_format.scope.split(":", 1)[1]
+
+    if export_format.format in ("csv", "json", "ndjson", "ics"):
+        events = solution_export.iter_export_events(db, solution, person_id, team_id)
+        if export_format.format == "csv":
+            chunks, media_type = solution_export.csv_chunks(events), "text/csv"
+        elif export_format.format == "json":
+            chunks, media_type = solution_export.json_chunks(solution, events), "application/json"
+        elif export_format.format == "ndjson":
+            chunks = solution_export.ndjson_chunks(solution, events)
+            media_type = "application/x-ndjson"
+        else:
+            chunks, media_type = solution_export.ics_chunks(solution, events), "text/calendar"
+        return StreamingResponse(
+            _closing(db, chunks),
+            media_type=media_type,
+            headers={
+                "Content-Disposition": (
+                    f"attachment; filename=solution_{solution_id}.{export_format.format}"
                 )
-
-        content = output.getvalue()
-        return Response(
-            content=content,
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename=solution_{solution_id}.csv"},
-        )
-
-    elif export_format.format == "ics":
-        # TODO: ICS export has StringIO bug - needs fixing
-        raise HTTPException(
-            status_code=status.HTTP_501_NOT_IMPLEMENTED, detail="ICS export not yet implemented"
+            },
         )
 
     elif export_format.format == "pdf":
-        # Get organization name
-        org = db.query(Organization).filter(Organization.id == solution.org_id).first()
-        org_name = org.name if org else solution.org_id
-
-        # Prepare data for PDF generation
-        pdf_events = []
-        for event in events:
-            pdf_events.append(
-                {
-                    "id": event.id,
-                    "type": event.type,
-                    "start_time": event.start,
-                    "end_time": event.end,
-                }
-            )
-
-        # Create people mapping (id -> {name, roles})
-        people_map = {p.id: {"name": p.name, "roles": p.roles or []} for p in people}
-
-        # Create assignments mapping (event_id -> [person_ids])
-        assignments_map = {a.event_id: a.assignees for a in assignments}
-
-        # Get event role requirements
-        events_db_map = {e.id: e for e in events_db}
-
-        # Get blocked dates for all people
-        from api.models import Availability, VacationPeriod
-
-        blocked_dates_map = {}  # person_id -> list of {start, end}
-        for person in people:
-            vacations = (
-                db.query(VacationPeriod)
-                .join(Availability, VacationPeriod.availability_id == Availability.id)
-                .filter(Availability.person_id == person.id)
-                .all()
-            )
-            blocked_dates_map[person.id] = [
-                {"start": v.start_date, "end": v.end_date} for v in vacations
-            ]
-
-        # Generate PDF
-        pdf_buffer = generate_schedule_pdf(
-            org_name, pdf_events, people_map, assignments_map, events_db_map, blocked_dates_map
-        )
-
+        pdf = schedule_pdf.export_pdf(db, solution, export_format.scope, person_id, team_id)
         return Response(
-            content=pdf_buffer.getvalue(),
+            content=pdf,
             media_type="application/pdf",
             headers={"Content-Disposition": f"attachment; filename=schedule_{solution_id}.pdf"},
         )
@@ -464,10 +317,25 @@ def export_solution(
     else:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Unknown format: {export_format.format}. Must be json, csv, ics, or pdf",
+            detail=(
+                f"Unknown format: {export_format.format}. " "Must be json, ndjson, csv, ics, or pdf"
+            ),
         )
 
 
+def _closing(db: Session, chunks: Iterator[str]) -> Iterator[str]:
+    """Stream ``chunks``, then release the session's connection.
+
+    The response body is produced after the endpoint returns, once ``get_db``
+    has already closed the session; the export query checks a connection
+    out again, and this hands it back when the stream ends or is abandoned.
+    """
+    try:
+        yield from chunks
+    finally:
+        db.close()
+
+
 @router.post("/{solution_id}/publish", response_model=SolutionResponse)
 def publish_solution(
     solution_id: int,
@@ -517,10 +385,7 @@ def publish_solution(
         user_agent=http_request.headers.get("user-agent"),
     )
 
-    assignment_count = db.query(Assignment).filter(Assignment.solution_id == solution.id).count()
-    response = SolutionResponse.model_validate(solution)
-    response.assignment_count = assignment_count
-    return response
+    return _solution_response(db, solution)
 
 
 @router.post("/{solution_id}/unpublish", response_model=SolutionResponse)
@@ -556,10 +421,7 @@ def unpublish_solution(
         user_agent=http_request.headers.get("user-agent"),
     )
 
-    assignment_count = db.query(Assignment).filter(Assignment.solution_id == solution.id).count()
-    response = SolutionResponse.model_validate(solution)
-    response.assignment_count = assignment_count
-    return response
+    return _solution_response(db, solution)
 
 
 @router.get("/{solution_a_id}/compare/{solution_b_id}", response_model=SolutionDiffResponse)
@@ -678,10 +540,7 @@ def rollback_solution(
         user_agent=http_request.headers.get("user-agent"),
     )
 
-    assignment_count = db.query(Assignment).filter(Assignment.solution_id == solution.id).count()
-    response = SolutionResponse.model_validate(solution)
-    response.assignment_count = assignment_count
-    return response
+    return _solution_response(db, solution)
 
 
 @router.get("/{solution_id}/stats", response_model=SolutionStatsResponse)
@@ -1,27 +1,44 @@
 """Solver router - schedule generation endpoint."""
 
+import asyncio
 import logging
+from dataclasses import replace
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, selectinload, sessionmaker
 
 from api.database import get_db
 from api.dependencies import get_current_admin_user, verify_org_member
 
 logger = logging.getLogger("rostio")
+from api.core.models import (
+    Assignment as CoreAssignment,
+)
 from api.core.models import (
     Availability as AvailabilityModel,
 )
 from api.core.models import (
     Event as EventModel,
 )
+from api.core.models import (
+    FairnessMetrics as CoreFairnessMetrics,
+)
 from api.core.models import (
     Holiday as HolidayModel,
 )
 from api.core.models import (
+    Metrics,
     Org,
     OrgDefaults,
+    Patch,
+    SolutionBundle,
+    SolutionMeta,
+    SolveProfile,
+    SolverMeta,
+    Violations,
 )
 from api.core.models import (
     Person as PersonModel,
@@ -29,14 +46,19 @@ from api.core.models import (
 from api.core.models import (
     Resource as ResourceModel,
 )
+from api.core.models import (
+    StabilityMetrics as CoreStabilityMetrics,
+)
 from api.core.models import (
     Team as TeamModel,
 )
 from api.core.models import (
     VacationPeriod as VacationPeriodModel,
 )
-from api.core.solver.adapter import SolveContext
+from api.core.solver.adapter import ProgressCallback, SolveContext, SolverAdapter
+from api.core.solver.factory import GREEDY_ENGINE, create_solver
 from api.core.solver.heuristics import GreedyHeuristicSolver
+from api.core.solver.profiling import capture_profile
 from api.core.timeutils import parse_rrule
 from api.models import (
     Assignment as DBAssignment,
@@ -44,12 +66,6 @@ from api.models import (
 from api.models import (
     Availability as DBAvailability,
 )
-from api.models import (
-    AvailabilityException as DBAvailabilityException,
-)
-from api.models import (
-    Constraint as DBConstraint,
-)
 from api.models import (
     Event,
     Holiday,
@@ -61,17 +77,22 @@ from api.models import (
 from api.models import (
     Solution as DBSolution,
 )
-from api.models import (
-    VacationPeriod as DBVacationPeriod,
-)
 from api.schemas.solver import (
     FairnessMetrics,
+    RepairPatch,
+    RepairRequest,
+    RepairResponse,
     SolutionMetrics,
+    SolveJobResponse,
+    SolveProfileInfo,
     SolveRequest,
     SolveResponse,
     StabilityMetrics,
     ViolationInfo,
 )
+from api.services import solve_jobs
+from api.services.constraint_bindings import org_constraint_bindings
+from api.services.solve_context_cache import Snapshot, solve_context_cache
 from api.utils.solver_stability import (
     compute_stability_metrics,
     load_prior_published_loose_keys,
@@ -79,6 +100,9 @@ from api.utils.solver_stability import (
 
 router = APIRouter(prefix="/solver", tags=["solver"])
 
+# How often ``/solver/jobs/{id}/stream`` samples the job for changes.
+JOB_STREAM_INTERVAL_S = 0.5
+
 
 @router.post("/solve", response_model=SolveResponse)
 def solve_schedule(
@@ -106,25 +130,216 @@ def solve_schedule(
     # Verify admin belongs to the organization
     verify_org_member(current_admin, solve_request.org_id)
 
+    solution = _run_solve(db, org, solve_request)
+
+    db_solution, stability = _save_solution(db, org, solution)
+    metrics, violations = _response_fields(solution, stability)
+
+    return SolveResponse(
+        solution_id=db_solution.id,
+        solver=solution.meta.solver.name,
+        metrics=metrics,
+        assignment_count=len(solution.assignments),
+        violations=violations[:20],  # Limit to first 20
+        message=f"Solution generated with {len(solution.assignments)} assignments",
+    )
+
+
+@router.post("/jobs", response_model=SolveJobResponse, status_code=status.HTTP_202_ACCEPTED)
+def submit_solve_job(
+    solve_request: SolveRequest,
+    current_admin: Person = Depends(get_current_admin_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Queue a solve in the background and return its job (admin only).
+
+    Takes the same body as ``/solve``. The solve runs on an in-process worker
+    thread (see ``api/services/solve_jobs.py``); poll ``GET /solver/jobs/{id}``
+    or stream ``/solver/jobs/{id}/stream`` for progress and the final
+    ``solution_id``.
+    """
+    org = db.query(Organization).filter(Organization.id == solve_request.org_id).first()
+    if not org:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Organization '{solve_request.org_id}' not found",
+        )
+    verify_org_member(current_admin, solve_request.org_id)
+
+    # The worker needs its own session; bind it to this request's engine.
+    session_factory = sessionmaker(bind=db.get_bind())
+
+    def work(job: solve_jobs.SolveJob) -> int:
+        with session_factory() as job_db:
+            job_org = job_db.query(Organization).filter(Organization.id == job.org_id).one()
+            solution = _run_solve(job_db, job_org, solve_request, progress=job.report)
+            job.check_cancelled()
+            db_solution, _ = _save_solution(job_db, job_org, solution)
+            return db_solution.id
+
+    job = solve_jobs.submit(org.id, work)
+    return _job_response(job)
+
+
+@router.get("/jobs/{job_id}", response_model=SolveJobResponse)
+def get_solve_job(job_id: str, current_admin: Person = Depends(get_current_admin_user)):
+    """Status, progress and (once completed) ``solution_id`` of a solve job (admin only)."""
+    return _job_response(_admin_job(job_id, current_admin))
+
+
+@router.post("/jobs/{job_id}/cancel", response_model=SolveJobResponse)
+def cancel_solve_job(job_id: str, current_admin: Person = Depends(get_current_admin_user)):
+    """
+    Cancel a queued or running solve job (admin only).
+
+    A queued job is cancelled at once. A running one stops at its next
+    progress report and saves nothing; the response may still show
+    ``running`` until then. Finished jobs are returned unchanged.
+    """
+    job = _admin_job(job_id, current_admin)
+    return _job_response(solve_jobs.cancel(job.id) or job)
+
+
+@router.get(
+    "/jobs/{job_id}/stream",
+    responses={
+        200: {
+            "content": {"text/event-stream": {}},
+            "description": "SSE stream of solve-job progress",
+        },
+        404: {"description": "Job not found"},
+    },
+)
+async def stream_solve_job(
+    job_id: str,
+    request: Request,
+    current_admin: Person = Depends(get_current_admin_user),
+):
+    """Server-Sent Events stream of a solve job's progress (admin only).
+
+    Emits the job (same shape as ``GET /solver/jobs/{id}``) as a JSON
+    ``data:`` line whenever it changes, and closes after the final state.
+    The job lives in this process, so the stream samples it every
+    ``JOB_STREAM_INTERVAL_S`` rather than going through ``event_bus``.
+    """
+    job = _admin_job(job_id, current_admin)
+
+    async def _event_stream():
+        yield ": stream open\n\n"
+        last = None
+        while True:
+            payload = _job_response(job).model_dump_json()
+            if payload != last:
+                yield f"data: {payload}\n\n"
+                last = payload
+            if job.finished or await request.is_disconnected():
+                break
+            await asyncio.sleep(JOB_STREAM_INTERVAL_S)
+
+    return StreamingResponse(
+        _event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache, no-transform",
+            "X-Accel-Buffering": "no",  # tell nginx not to buffer
+        },
+    )
+
+
+@router.post("/repair", response_model=RepairResponse)
+def repair_schedule(
+    repair_request: RepairRequest,
+    current_admin: Person = Depends(get_current_admin_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Repair a solution after a change instead of re-solving (admin only).
+
+    Loads org data like ``/solve``, applies the patch and keeps every
+    assignment of the baseline solution (``solution_id``, default: the org's
+    published solution) except those the patch invalidates: removed people,
+    new time off and reassigned events. Only those slots are re-picked. The
+    result is saved as a new, unpublished solution.
+    """
+    org = db.query(Organization).filter(Organization.id == repair_request.org_id).first()
+    if not org:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Organization '{repair_request.org_id}' not found",
+        )
+    verify_org_member(current_admin, repair_request.org_id)
+
+    baseline_query = db.query(DBSolution).filter(DBSolution.org_id == org.id)
+    if repair_request.solution_id is not None:
+        baseline_query = baseline_query.filter(DBSolution.id == repair_request.solution_id)
+    else:
+        baseline_query = baseline_query.filter(DBSolution.is_published.is_(True))
+    baseline = baseline_query.first()
+    if baseline is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Baseline solution not found"
+            if repair_request.solution_id is not None
+            else "No published solution to repair",
+        )
+
+    snapshot = _solve_snapshot(db, org, repair_request.from_date, repair_request.to_date)
+    context = replace(snapshot.context, mode=repair_request.mode, change_min=False)
+    context.published_solution = _baseline_bundle(db, baseline, context)
+
+    solver = create_solver(GREEDY_ENGINE)
+    _build_model(solver, context, snapshot)
+    solver.incremental_update(_core_patch(repair_request.patch, context))
+    solution = solver.solve()
+
+    db_solution, stability = _save_solution(db, org, solution)
+    metrics, violations = _response_fields(solution, stability)
+
+    return RepairResponse(
+        solution_id=db_solution.id,
+        solver=solution.meta.solver.name,
+        metrics=metrics,
+        assignment_count=len(solution.assignments),
+        violations=violations[:20],  # Limit to first 20
+        repaired_events=solver.repaired_events,
+        message=f"Repaired {len(solver.repaired_events)} of "
+        f"{len(solution.assignments)} assignments",
+    )
+
+
+def _load_solve_context(
+    db: Session, org: Organization, from_date, to_date, mode: str, change_min: bool
+) -> SolveContext:
+    """Load the org's people, events, availability, etc. into a ``SolveContext``.
+
+    Raises 400 when there are no events in ``[from_date, to_date]``.
+
+    Child collections (team members, event teams, vacation periods and
+    availability exceptions) are eager-loaded with one ``IN`` query per
+    relationship, so the query count doesn't grow with the org's size.
+    """
     # Load all data
-    people_db = db.query(Person).filter(Person.org_id == solve_request.org_id).all()
-    teams_db = db.query(Team).filter(Team.org_id == solve_request.org_id).all()
+    people_db = db.query(Person).filter(Person.org_id == org.id).all()
+    teams_db = (
+        db.query(Team).options(selectinload(Team.members)).filter(Team.org_id == org.id).all()
+    )
     events_db = (
         db.query(Event)
+        .options(selectinload(Event.event_teams))
         .filter(
-            Event.org_id == solve_request.org_id,
-            Event.start_time >= datetime.combine(solve_request.from_date, datetime.min.time()),
-            Event.start_time <= datetime.combine(solve_request.to_date, datetime.max.time()),
+            Event.org_id == org.id,
+            Event.start_time >= datetime.combine(from_date, datetime.min.time()),
+            Event.start_time <= datetime.combine(to_date, datetime.max.time()),
         )
         .all()
     )
-    (db.query(DBConstraint).filter(DBConstraint.org_id == solve_request.org_id).all())
     holidays_db = (
         db.query(Holiday)
         .filter(
-            Holiday.org_id == solve_request.org_id,
-            Holiday.date >= solve_request.from_date,
-            Holiday.date <= solve_request.to_date,
+            Holiday.org_id == org.id,
+            Holiday.date >= from_date,
+            Holiday.date <= to_date,
         )
         .all()
     )
@@ -132,7 +347,7 @@ def solve_schedule(
     if not events_db:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"No events found in date range {solve_request.from_date} to {solve_request.to_date}",
+            detail=f"No events found in date range {from_date} to {to_date}",
         )
 
     # Convert database models to core models
@@ -182,11 +397,8 @@ def solve_schedule(
             )
         )
 
-    # For now, we'll pass an empty constraints list since the API stores constraints
-    # differently than the solver expects (ConstraintBinding vs simple params).
-    # In production, you would convert DB constraints to proper ConstraintBinding format
-    # with scope, applies_to, when, and then fields.
-    constraints = []
+    # Translated once per org data version.
+    constraints = org_constraint_bindings(db, org)
 
     holidays = [
         HolidayModel(date=h.date, label=h.label, is_long_weekend=h.is_long_weekend)
@@ -194,7 +406,7 @@ def solve_schedule(
     ]
 
     # Load resources for the org
-    resources_db = db.query(Resource).filter(Resource.org_id == solve_request.org_id).all()
+    resources_db = db.query(Resource).filter(Resource.org_id == org.id).all()
     resources = [
         ResourceModel(
             id=r.id,
@@ -209,28 +421,27 @@ def solve_schedule(
     #   - VacationPeriod children: ranges the solver blocks (Sprint 3-E)
     #   - AvailabilityException children: one-off blocked dates
     #   - rrule string: recurring blocked dates expanded over the solve window
-    person_ids = [p.id for p in people_db]
     availability: list[AvailabilityModel] = []
-    if person_ids:
-        avail_rows = db.query(DBAvailability).filter(DBAvailability.person_id.in_(person_ids)).all()
+    if people_db:
+        avail_rows = (
+            db.query(DBAvailability)
+            .join(Person, DBAvailability.person_id == Person.id)
+            .filter(Person.org_id == org.id)
+            .options(
+                selectinload(DBAvailability.vacations), selectinload(DBAvailability.exceptions)
+            )
+            .all()
+        )
         # Compute the solve window once for rrule expansion
-        from_dt = datetime.combine(solve_request.from_date, datetime.min.time())
-        to_dt = datetime.combine(solve_request.to_date, datetime.max.time())
+        from_dt = datetime.combine(from_date, datetime.min.time())
+        to_dt = datetime.combine(to_date, datetime.max.time())
 
         for a in avail_rows:
             vacations = [
-                VacationPeriodModel(start=v.start_date, end=v.end_date)
-                for v in db.query(DBVacationPeriod)
-                .filter(DBVacationPeriod.availability_id == a.id)
-                .all()
+                VacationPeriodModel(start=v.start_date, end=v.end_date) for v in a.vacations
             ]
             # One-off exception dates from AvailabilityException
-            exception_dates: list = [
-                row.exception_date
-                for row in db.query(DBAvailabilityException)
-                .filter(DBAvailabilityException.availability_id == a.id)
-                .all()
-            ]
+            exception_dates: list = [row.exception_date for row in a.exceptions]
             # Expand rrule to concrete blocked dates within [from_date, to_date].
             # Malformed rrule strings are logged and treated as no-op so a single
             # bad rule doesn't break the entire solve.
@@ -265,26 +476,116 @@ def solve_schedule(
         constraints=constraints,
         availability=availability,
         holidays=holidays,
-        from_date=solve_request.from_date,
-        to_date=solve_request.to_date,
-        mode=solve_request.mode,
-        change_min=solve_request.change_min,
+        from_date=from_date,
+        to_date=to_date,
+        mode=mode,
+        change_min=change_min,
     )
+    return context
 
-    # Solve
-    solver = GreedyHeuristicSolver()
-    solver.build_model(context)
 
-    # Wire change-minimization when requested. Bonus weight comes from
-    # OrgDefaults.change_min_weight (default 100). The solver applies it as a
-    # tiebreaker to candidates whose (event_id, person_id) was in the prior
-    # published solution.
-    if solve_request.change_min:
-        solver.enable_change_minimization(True, org_file.defaults.change_min_weight)
-        solver.set_prior_published_keys(load_prior_published_loose_keys(db, org_id=org.id))
+def _solve_snapshot(db: Session, org: Organization, from_date, to_date) -> Snapshot:
+    """The org's solve context for the window, cached until the org's data changes.
 
-    solution = solver.solve()
+    Keyed on ``Organization.data_version`` (see
+    ``api/services/solve_context_cache.py``). The snapshot is shared: callers
+    ``replace`` its context before setting ``mode`` / ``change_min``.
+    """
+    key = (org.id, org.created_at, org.data_version or 0, from_date, to_date)
+    snapshot = solve_context_cache.get(key)
+    if snapshot is None:
+        context = _load_solve_context(db, org, from_date, to_date, "strict", False)
+        snapshot = solve_context_cache.put(key, context)
+    return snapshot
+
+
+def _build_model(solver: SolverAdapter, context: SolveContext, snapshot: Snapshot) -> None:
+    """``solver.build_model(context)``, reusing the snapshot's greedy indexes when built."""
+    if not isinstance(solver, GreedyHeuristicSolver):
+        solver.build_model(context)
+    elif snapshot.model is not None:
+        solver.use_model(context, snapshot.model)
+    else:
+        solver.build_model(context)
+        snapshot.model = solver.model_snapshot()
+
+
+def _run_solve(
+    db: Session,
+    org: Organization,
+    solve_request: SolveRequest,
+    progress: ProgressCallback | None = None,
+) -> SolutionBundle:
+    """Load the org's data and run the requested engine; nothing is saved.
+
+    With ``solve_request.profile`` set, loading and solving run under that
+    profiler and its report lands in ``solution.meta.profile``.
+    """
+    with capture_profile(solve_request.profile) as captured:
+        snapshot = _solve_snapshot(db, org, solve_request.from_date, solve_request.to_date)
+        context = replace(
+            snapshot.context, mode=solve_request.mode, change_min=solve_request.change_min
+        )
+        org_file = context.org
 
+        # Solve
+        solver = create_solver(
+            solve_request.solver,
+            improve_s=solve_request.improve_s,
+            by_month=solve_request.by_month,
+        )
+        _build_model(solver, context, snapshot)
+        solver.set_progress_callback(progress)
+
+        # Wire change-minimization when requested. Bonus weight comes from
+        # OrgDefaults.change_min_weight (default 100). The solver applies it as a
+        # tiebreaker to candidates whose (event_id, person_id) was in the prior
+        # published solution.
+        if solve_request.change_min:
+            solver.enable_change_minimization(True, org_file.defaults.change_min_weight)
+            solver.set_prior_published_keys(load_prior_published_loose_keys(db, org_id=org.id))
+
+        solution = solver.solve(timeout_s=solve_request.timeout_s)
+
+    if captured.text is not None:
+        profile = solution.meta.profile or SolveProfile()
+        profile.capture_tool = captured.tool
+        profile.capture = captured.text
+        solution.meta.profile = profile
+    return solution
+
+
+def _admin_job(job_id: str, admin: Person) -> solve_jobs.SolveJob:
+    """The job, if it belongs to the admin's org; 404 otherwise (no cross-tenant probing)."""
+    job = solve_jobs.get(job_id)
+    if job is None or job.org_id != admin.org_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Solve job not found",
+        )
+    return job
+
+
+def _job_response(job: solve_jobs.SolveJob) -> SolveJobResponse:
+    return SolveJobResponse(
+        job_id=job.id,
+        org_id=job.org_id,
+        status=job.status,
+        events_done=job.events_done,
+        events_total=job.events_total,
+        assignment_count=job.assignments,
+        hard_violations=job.hard_violations,
+        solution_id=job.solution_id,
+        error=job.error,
+        created_at=job.created_at,
+        finished_at=job.finished_at,
+    )
+
+
+def _save_solution(
+    db: Session, org: Organization, solution: SolutionBundle
+) -> tuple[DBSolution, CoreStabilityMetrics]:
+    """Persist ``solution`` and its assignments as a new (unpublished) solution."""
     # Compute stability vs the org's currently-published solution.
     stability = compute_stability_metrics(db, org_id=org.id, new_assignments=solution.assignments)
 
@@ -306,26 +607,56 @@ def solve_schedule(
             },
         },
     )
+    if solution.meta.portfolio is not None:
+        db_solution.metrics["portfolio"] = [
+            variant.model_dump(mode="json") for variant in solution.meta.portfolio
+        ]
+    if solution.meta.profile is not None:
+        db_solution.metrics["profile"] = solution.meta.profile.model_dump(mode="json")
     db.add(db_solution)
     db.flush()
 
     # Save assignments and collect IDs for notifications
-    assignment_ids = []
-    for assignment in solution.assignments:
-        for person_id in assignment.assignees:
-            db_assignment = DBAssignment(
-                solution_id=db_solution.id,
-                event_id=assignment.event_id,
-                person_id=person_id,
-            )
-            db.add(db_assignment)
-            db.flush()  # Flush to get assignment ID
-            assignment_ids.append(db_assignment.id)
+    assignment_ids = _insert_assignments(db, db_solution.id, solution.assignments)
+    logger.debug("Saved solution %s with %d assignments", db_solution.id, len(assignment_ids))
 
     db.commit()
     db.refresh(db_solution)
 
-    # Build response
+    return db_solution, stability
+
+
+def _insert_assignments(
+    db: Session, solution_id: int, assignments: list[CoreAssignment]
+) -> list[int]:
+    """Insert one row per assignee in a single bulk statement; return the new IDs.
+
+    The IDs come back in input order (event, then assignee). SQLAlchemy
+    batches the parameter sets into multi-row ``INSERT ... RETURNING``
+    statements, so a large roster costs a few round trips instead of one
+    flush per row. ``RETURNING`` order isn't guaranteed across batches, so
+    rows are matched back by ``(event_id, person_id)``, which is unique
+    within a solution; asking SQLAlchemy to sort by parameter order instead
+    makes SQLite fall back to one statement per row.
+    """
+    rows = [
+        {"solution_id": solution_id, "event_id": assignment.event_id, "person_id": person_id}
+        for assignment in assignments
+        for person_id in assignment.assignees
+    ]
+    if not rows:
+        return []
+    stmt = insert(DBAssignment).returning(
+        DBAssignment.id, DBAssignment.event_id, DBAssignment.person_id
+    )
+    ids = {(event_id, person_id): id_ for id_, event_id, person_id in db.execute(stmt, rows)}
+    return [ids[row["event_id"], row["person_id"]] for row in rows]
+
+
+def _response_fields(
+    solution: SolutionBundle, stability: CoreStabilityMetrics
+) -> tuple[SolutionMetrics, list[ViolationInfo]]:
+    """API metrics and violations for ``solution``."""
     violations = [
         ViolationInfo(
             constraint_key=v.constraint_key,
@@ -349,12 +680,80 @@ def solve_schedule(
             moves_from_published=stability.moves_from_published,
             affected_persons=stability.affected_persons,
         ),
+        profile=SolveProfileInfo(**solution.meta.profile.model_dump())
+        if solution.meta.profile is not None
+        else None,
     )
 
-    return SolveResponse(
-        solution_id=db_solution.id,
-        metrics=metrics,
-        assignment_count=len(solution.assignments),
-        violations=violations[:20],  # Limit to first 20
-        message=f"Solution generated with {len(solution.assignments)} assignments",
+    return metrics, violations
+
+
+def _baseline_bundle(db: Session, baseline: DBSolution, context: SolveContext) -> SolutionBundle:
+    """Rebuild a stored solution's in-range assignments as a ``SolutionBundle``."""
+    events_in_range = {e.id for e in context.events}
+    assignees: dict[str, list[str]] = {}
+    rows = (
+        db.query(DBAssignment)
+        .filter(DBAssignment.solution_id == baseline.id)
+        .order_by(DBAssignment.id)
+        .all()
+    )
+    for row in rows:
+        if row.event_id in events_in_range:
+            assignees.setdefault(row.event_id, []).append(row.person_id)
+
+    fairness = (baseline.metrics or {}).get("fairness") or {}
+    return SolutionBundle(
+        meta=SolutionMeta(
+            generated_at=baseline.created_at,
+            range_start=context.from_date,
+            range_end=context.to_date,
+            mode=context.mode,
+            change_min=False,
+            solver=SolverMeta(name="stored", version="", strategy=""),
+        ),
+        assignments=[
+            CoreAssignment(event_id=event_id, assignees=people)
+            for event_id, people in assignees.items()
+        ],
+        metrics=Metrics(
+            solve_ms=baseline.solve_ms or 0.0,
+            hard_violations=baseline.hard_violations,
+            soft_score=baseline.soft_score,
+            fairness=CoreFairnessMetrics(
+                stdev=fairness.get("stdev", 0.0),
+                per_person_counts=fairness.get("per_person_counts", {}),
+            ),
+            stability=CoreStabilityMetrics(),
+            health_score=baseline.health_score,
+        ),
+        violations=Violations(),
+    )
+
+
+def _core_patch(patch: RepairPatch, context: SolveContext) -> Patch:
+    """Translate the API patch into a solver ``Patch`` against ``context``.
+
+    Time off is added to the person's existing availability rather than
+    replacing it.
+    """
+    events_by_id = {e.id: e for e in context.events}
+    availability = {a.person_id: a for a in context.availability}
+    updated: dict[str, AvailabilityModel] = {}
+    for time_off in patch.add_time_off:
+        current = updated.get(time_off.person_id) or availability.get(time_off.person_id)
+        if current is None:
+            current = AvailabilityModel(person_id=time_off.person_id)
+        updated[time_off.person_id] = current.model_copy(
+            update={
+                "vacations": current.vacations
+                + [VacationPeriodModel(start=time_off.start, end=time_off.end)]
+            }
+        )
+
+    return Patch(
+        remove_people=patch.remove_people,
+        remove_events=patch.remove_events,
+        add_events=[events_by_id[e] for e in patch.reassign_events if e in events_by_id],
+        update_availability=list(updated.values()),
     )
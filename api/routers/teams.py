@@ -17,6 +17,7 @@ from api.schemas.team import (
     TeamResponse,
     TeamUpdate,
 )
+from api.utils.org_data_version import bump_org_data_version
 
 router = APIRouter(prefix="/teams", tags=["teams"])
 
@@ -243,6 +244,7 @@ def remove_team_members(
         db.query(TeamMember).filter(
             TeamMember.team_id == team_id, TeamMember.person_id == person_id
         ).delete()
+    bump_org_data_version(db, team.org_id)
 
     db.commit()
     return None
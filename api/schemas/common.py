@@ -1,13 +1,17 @@
 """Shared list-response envelope and pagination params for all list endpoints."""
 
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from typing import Generic, Literal, TypeVar
 
 from fastapi import Query
 from pydantic import BaseModel
 
 T = TypeVar("T")
 
+# How a list endpoint computes `total`: an exact COUNT, a COUNT that stops
+# at TOTAL_ESTIMATE_CAP rows, or no count at all (`total` is null).
+TotalMode = Literal["exact", "estimate", "none"]
+
 
 class ListResponse(BaseModel, Generic[T]):
     """Uniform shape for paginated list responses.
@@ -17,15 +21,20 @@ class ListResponse(BaseModel, Generic[T]):
 
     Fields:
         items: the page slice
-        total: total rows matching the query, regardless of pagination
+        total: total rows matching the query, regardless of pagination; null
+            when the caller asked for `total=none`, and at most
+            TOTAL_ESTIMATE_CAP for `total=estimate`
         limit: the page size used to produce `items`
-        offset: the offset applied to produce `items`
+        offset: the offset applied to produce `items` (0 in cursor mode)
+        next_cursor: opaque cursor for the following page on endpoints that
+            support cursor pagination; null on the last page
     """
 
     items: list[T]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    next_cursor: str | None = None
 
 
 @dataclass
@@ -34,6 +43,8 @@ class PaginationParams:
 
     limit: int
     offset: int
+    cursor: str | None = None
+    total: TotalMode = "exact"
 
 
 def get_pagination_params(
@@ -41,3 +52,21 @@ def get_pagination_params(
     offset: int = Query(0, ge=0, description="Number of rows to skip"),
 ) -> PaginationParams:
     return PaginationParams(limit=limit, offset=offset)
+
+
+def get_cursor_pagination_params(
+    limit: int = Query(50, ge=1, le=200, description="Page size, max 200"),
+    offset: int = Query(0, ge=0, description="Number of rows to skip"),
+    cursor: str
+    | None = Query(
+        None, description="Opaque cursor from a previous page's next_cursor; replaces offset"
+    ),
+    total: TotalMode = Query(
+        "exact", description="How to compute total: 'exact', 'estimate' (capped) or 'none'"
+    ),
+) -> PaginationParams:
+    """Pagination for the large tables: offset or keyset (cursor) paging.
+
+    See `api/utils/pagination.py` for how the cursor and total are applied.
+    """
+    return PaginationParams(limit=limit, offset=offset, cursor=cursor, total=total)
@@ -3,7 +3,7 @@
 from datetime import date, datetime
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class SolveRequest(BaseModel):
@@ -12,8 +12,72 @@ class SolveRequest(BaseModel):
     org_id: str = Field(..., description="Organization ID")
     from_date: date = Field(..., description="Start date for schedule")
     to_date: date = Field(..., description="End date for schedule")
-    mode: str = Field("strict", description="Solve mode: strict or relaxed")
+    mode: str = Field(
+        "strict",
+        description="Solve mode: strict, relaxed, or vectorized (NumPy candidate scoring)",
+    )
     change_min: bool = Field(False, description="Enable change minimization")
+    solver: str = Field(
+        "greedy",
+        description="Solver engine: greedy, cp_sat (OR-Tools CP-SAT; falls back to greedy "
+        "when OR-Tools is not installed), parallel (greedy on independent subproblems "
+        "across worker processes), or portfolio (greedy variants raced in worker processes; "
+        "best roster wins)",
+    )
+    timeout_s: int | None = Field(
+        None,
+        description="Time budget in seconds for optimizing engines "
+        "(cp_sat default: 30, portfolio default: 10)",
+    )
+    improve_s: float = Field(
+        0.0,
+        description="Seconds of local-search improvement after the greedy pass "
+        "(greedy, parallel and portfolio engines; 0 disables)",
+    )
+    by_month: bool = Field(
+        False,
+        description="Also split parallel-engine subproblems by calendar month, so long "
+        "single-team horizons fan out; month boundaries are reconciled after merging "
+        "(parallel engine only)",
+    )
+    profile: str | None = Field(
+        None,
+        description="Capture a profile of the solve with cprofile or pyinstrument "
+        "(falls back to cprofile when pyinstrument is not installed); the report is "
+        "saved with the solution's metrics",
+    )
+
+    @field_validator("solver")
+    @classmethod
+    def validate_solver(cls, v: str) -> str:
+        """Validate solver engine name."""
+        if v not in ["greedy", "cp_sat", "parallel", "portfolio"]:
+            raise ValueError("Solver must be greedy, cp_sat, parallel or portfolio")
+        return v
+
+    @field_validator("timeout_s")
+    @classmethod
+    def validate_timeout_s(cls, v: int | None) -> int | None:
+        """Validate solver time budget."""
+        if v is not None and (v < 1 or v > 600):
+            raise ValueError("Timeout must be between 1 and 600 seconds")
+        return v
+
+    @field_validator("improve_s")
+    @classmethod
+    def validate_improve_s(cls, v: float) -> float:
+        """Validate local-search budget."""
+        if v < 0 or v > 60:
+            raise ValueError("Improvement budget must be between 0 and 60 seconds")
+        return v
+
+    @field_validator("profile")
+    @classmethod
+    def validate_profile(cls, v: str | None) -> str | None:
+        """Validate profiler name."""
+        if v is not None and v not in ["cprofile", "pyinstrument"]:
+            raise ValueError("Profile must be cprofile or pyinstrument")
+        return v
 
 
 class ViolationInfo(BaseModel):
@@ -39,6 +103,15 @@ class StabilityMetrics(BaseModel):
     affected_persons: int = 0
 
 
+class SolveProfileInfo(BaseModel):
+    """Per-phase timing (ms) and counters of a solve, plus any profiler report."""
+
+    phases_ms: dict[str, float] = Field(default_factory=dict)
+    counters: dict[str, int] = Field(default_factory=dict)
+    capture_tool: str | None = None
+    capture: str | None = None
+
+
 class SolutionMetrics(BaseModel):
     """Schema for solution metrics."""
 
@@ -48,6 +121,7 @@ class SolutionMetrics(BaseModel):
     solve_ms: float
     fairness: FairnessMetrics
     stability: StabilityMetrics = Field(default_factory=StabilityMetrics)
+    profile: SolveProfileInfo | None = None
 
 
 class AssignmentInfo(BaseModel):
@@ -63,12 +137,75 @@ class SolveResponse(BaseModel):
     """Schema for solve response."""
 
     solution_id: int = Field(..., description="Database ID of saved solution")
+    solver: str = Field("greedy_heuristic", description="Engine that produced the solution")
     metrics: SolutionMetrics
     assignment_count: int
     violations: list[ViolationInfo]
     message: str
 
 
+class SolveJobResponse(BaseModel):
+    """Schema for a background solve job."""
+
+    job_id: str
+    org_id: str
+    status: str = Field(..., description="queued, running, completed, failed or cancelled")
+    events_done: int = Field(0, description="Events assigned so far")
+    events_total: int = Field(0, description="Events in the solve range (0 until known)")
+    assignment_count: int = Field(0, description="Assignments made so far")
+    hard_violations: int = Field(0, description="Hard violations so far")
+    solution_id: int | None = Field(None, description="Saved solution, once completed")
+    error: str | None = Field(None, description="Failure reason, if failed")
+    created_at: datetime
+    finished_at: datetime | None = None
+
+
+class TimeOff(BaseModel):
+    """A new unavailable date range for one person."""
+
+    person_id: str
+    start: date
+    end: date
+
+
+class RepairPatch(BaseModel):
+    """Changes since the baseline solution."""
+
+    remove_people: list[str] = Field(
+        default_factory=list, description="People leaving the roster; their slots are refilled"
+    )
+    remove_events: list[str] = Field(default_factory=list, description="Cancelled event IDs")
+    reassign_events: list[str] = Field(
+        default_factory=list,
+        description="Event IDs to assign from scratch (e.g. rescheduled or changed roles)",
+    )
+    add_time_off: list[TimeOff] = Field(
+        default_factory=list,
+        description="New time off; affected assignments are refilled",
+    )
+
+
+class RepairRequest(BaseModel):
+    """Schema for repair request."""
+
+    org_id: str = Field(..., description="Organization ID")
+    from_date: date = Field(..., description="Start date for schedule")
+    to_date: date = Field(..., description="End date for schedule")
+    mode: str = Field("strict", description="Solve mode for refilled slots")
+    solution_id: int | None = Field(
+        None, description="Baseline solution to repair (default: the org's published solution)"
+    )
+    patch: RepairPatch = Field(default_factory=RepairPatch)
+
+
+class RepairResponse(SolveResponse):
+    """Schema for repair response."""
+
+    repaired_events: list[str] = Field(
+        default_factory=list, description="Events whose assignees were recomputed"
+    )
+
+
 class SolutionResponse(BaseModel):
     """Schema for solution response."""
 
@@ -95,7 +232,7 @@ SolutionList = ListResponse[SolutionResponse]
 class ExportFormat(BaseModel):
     """Schema for export format request."""
 
-    format: str = Field(..., description="Export format: json, csv, pdf, or ics")
+    format: str = Field(..., description="Export format: json, ndjson, csv, pdf, or ics")
     scope: str = Field("org", description="Export scope: org, person:{id}, or team:{id}")
 
 
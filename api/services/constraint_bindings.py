@@ -0,0 +1,180 @@
+"""Translate stored ``Constraint`` rows into solver ``ConstraintBinding``s.
+
+The ``constraints`` table keeps a flat ``key`` / ``type`` / ``weight`` /
+``predicate`` / ``params`` row; the solver wants a ``ConstraintBinding``
+(scope, applies_to, optional ``when``, one ``then`` action). A row maps by
+its ``predicate``:
+
+    enforce_min_gap_hours   params: hours          -> then.enforce_min_gap_hours
+    enforce_cap             params: max_count, period (default P1M) -> then.enforce_cap
+    cooldown                params: cooldown_days  -> then.penalize_if (soft only)
+    recent_rotation         params: lookback_days  -> then.penalize_if (soft only)
+    forbid_friday_or_monday                        -> then.forbid_if (event scope)
+    dsl                     params: a full binding body (scope, applies_to, when, then)
+
+Every predicate also reads optional ``scope``, ``applies_to`` (event types,
+default ``["*"]`` = every type) and ``when`` (a predicate tree) from
+``params``. Rows with any other predicate, or params that don't validate,
+are skipped with a warning: they were never enforced before either.
+``require_roles`` has no row form because the greedy solver checks it
+before anyone is assigned; a ``dsl`` row can still carry it.
+
+Translation runs once per org data version, not per solve.
+``org_constraint_bindings`` caches an org's bindings under
+``(org id, created_at, Organization.data_version)``; every constraint write
+bumps ``data_version`` in the same transaction
+(``api/utils/org_data_version.py``), so a changed row — from any API worker
+— is a cache miss. Cached bindings are shared and must not be mutated.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from api.core.models import ConstraintBinding
+from api.models import Constraint, Organization
+
+logger = logging.getLogger("rostio")
+
+ALL_EVENT_TYPES = "*"
+
+
+def _min_gap(params: dict[str, Any]) -> dict[str, Any]:
+    return {"enforce_min_gap_hours": params["hours"]}
+
+
+def _cap(params: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "enforce_cap": {
+            "period": str(params.get("period", "P1M")),
+            "max_count": int(params["max_count"]),
+        }
+    }
+
+
+def _cooldown(params: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "penalize_if": {"type": "cooldown", "cooldown_days": int(params.get("cooldown_days", 14))}
+    }
+
+
+def _recent_rotation(params: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "penalize_if": {
+            "type": "recent_rotation",
+            "lookback_days": int(params.get("lookback_days", 30)),
+        }
+    }
+
+
+def _forbid_friday_or_monday(params: dict[str, Any]) -> dict[str, Any]:
+    return {"forbid_if": "is_friday_or_monday"}
+
+
+# predicate -> (default scope, builder of the ``then`` action from params)
+_ACTIONS: dict[str, tuple[str, Callable[[dict[str, Any]], dict[str, Any]]]] = {
+    "enforce_min_gap_hours": ("person", _min_gap),
+    "enforce_cap": ("person", _cap),
+    "cooldown": ("person", _cooldown),
+    "recent_rotation": ("person", _recent_rotation),
+    "forbid_friday_or_monday": ("event", _forbid_friday_or_monday),
+}
+
+
+def binding_from_row(row: Constraint) -> ConstraintBinding | None:
+    """The solver binding for one ``Constraint`` row, or None if it can't be enforced."""
+    params = dict(row.params or {})
+    try:
+        if row.predicate == "dsl":
+            body = {"params": {}, **params}
+        elif row.predicate in _ACTIONS:
+            scope, build_then = _ACTIONS[row.predicate]
+            body = {
+                "scope": params.get("scope", scope),
+                "applies_to": params.get("applies_to", [ALL_EVENT_TYPES]),
+                "when": params.get("when"),
+                "then": build_then(params),
+                "params": params,
+            }
+        else:
+            logger.warning(
+                "Constraint %s (%s) has unsupported predicate %r; not enforced",
+                row.id,
+                row.key,
+                row.predicate,
+            )
+            return None
+        return ConstraintBinding.model_validate(
+            {
+                "scope": "person",
+                "applies_to": [ALL_EVENT_TYPES],
+                **body,
+                "key": row.key,
+                "severity": row.type,
+                "weight": row.weight,
+            }
+        )
+    except (KeyError, TypeError, ValueError) as exc:
+        logger.warning(
+            "Constraint %s (%s) has invalid params; not enforced: %s", row.id, row.key, exc
+        )
+        return None
+
+
+def bindings_from_rows(rows: list[Constraint]) -> list[ConstraintBinding]:
+    """Translate ``rows`` in order, dropping the ones that can't be enforced."""
+    return [b for b in map(binding_from_row, rows) if b is not None]
+
+
+# (org created_at, data_version): the org's data the bindings were read from.
+Version = tuple[datetime | None, int]
+
+
+class ConstraintBindingCache:
+    """Per-org translated bindings for the org's current data version. Thread-safe."""
+
+    def __init__(self) -> None:
+        self.translations = 0
+        self._entries: dict[str, tuple[Version, list[ConstraintBinding]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, db: Session, org: Organization) -> list[ConstraintBinding]:
+        """``org``'s bindings, translating its rows once per data version."""
+        version: Version = (org.created_at, org.data_version or 0)
+        with self._lock:
+            entry = self._entries.get(org.id)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        rows = (
+            db.query(Constraint).filter(Constraint.org_id == org.id).order_by(Constraint.id).all()
+        )
+        bindings = bindings_from_rows(rows)
+        with self._lock:
+            # One entry per org: older versions can never be hit again.
+            self._entries[org.id] = (version, bindings)
+            self.translations += 1
+        return bindings
+
+    def clear(self) -> None:
+        """Forget every org and reset the translation counter."""
+        with self._lock:
+            self._entries.clear()
+            self.translations = 0
+
+
+constraint_binding_cache = ConstraintBindingCache()
+
+
+def org_constraint_bindings(db: Session, org: Organization) -> list[ConstraintBinding]:
+    """The org's enforceable constraints as solver bindings (cached)."""
+    return constraint_binding_cache.get(db, org)
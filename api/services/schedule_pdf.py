@@ -0,0 +1,223 @@
+"""PDF schedule export of a saved solution, rendered on a capped pool and cached.
+
+``POST /solutions/{id}/export`` with ``format=pdf`` loads the schedule in a
+fixed number of queries — assignments, their events, the org's people and
+all of their vacations in one Availability ⋈ VacationPeriod query — and
+renders it with ``generate_schedule_pdf`` on a small worker pool
+(``PDF_EXPORT_WORKERS``). The pool caps how many renders run at once; the
+request thread still waits for its PDF, so a burst of exports queues on
+the pool instead of rendering side by side.
+
+Rendered PDFs are kept in ``PdfCache`` under
+
+    (solution_id, solution created_at, org data_version, org name, scope)
+
+A saved solution's assignments never change, and ``data_version`` is bumped
+by every write to the people, events and vacations the PDF shows
+(``api/utils/org_data_version.py``), so repeated downloads of the same
+schedule are served from memory until that data changes. The cache holds at
+most ``PDF_EXPORT_CACHE_SIZE`` PDFs and ``PDF_EXPORT_CACHE_MAX_BYTES`` bytes
+in total, evicting least recently used first (size 0 disables it).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from api.models import (
+    Assignment,
+    Availability,
+    Event,
+    Organization,
+    Person,
+    Solution,
+    Team,
+    TeamMember,
+    VacationPeriod,
+)
+from api.utils.pdf_export import generate_schedule_pdf
+
+DEFAULT_MAX_ENTRIES = 32
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+PdfCacheKey = tuple[int, datetime | None, int, str, str]
+
+
+class PdfCache:
+    """LRU of rendered PDFs by ``PdfCacheKey``, bounded by entries and bytes. Thread-safe."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[PdfCacheKey, bytes] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def bytes(self) -> int:
+        """Bytes held across all cached PDFs."""
+        return self._bytes
+
+    def get(self, key: PdfCacheKey) -> bytes | None:
+        """The PDF for ``key``, marking it most recently used."""
+        with self._lock:
+            pdf = self._entries.get(key)
+            if pdf is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return pdf
+
+    def put(self, key: PdfCacheKey, pdf: bytes) -> None:
+        """Cache ``pdf`` under ``key`` unless it is larger than the whole cache."""
+        if self.max_entries <= 0 or len(pdf) > self.max_bytes:
+            return
+        solution_id, created_at, version = key[:3]
+        with self._lock:
+            # Renders from older data of this solution can never be hit again.
+            for old in [
+                k for k in self._entries if k[:2] == (solution_id, created_at) and k[2] < version
+            ]:
+                self._drop(old)
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = pdf
+            self._bytes += len(pdf)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Drop every PDF and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = 0
+
+    def _drop(self, key: PdfCacheKey) -> None:
+        self._bytes -= len(self._entries.pop(key))
+
+
+pdf_cache = PdfCache(
+    max_entries=int(os.getenv("PDF_EXPORT_CACHE_SIZE", str(DEFAULT_MAX_ENTRIES))),
+    max_bytes=int(os.getenv("PDF_EXPORT_CACHE_MAX_BYTES", str(DEFAULT_MAX_BYTES))),
+)
+
+_lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(int(os.getenv("PDF_EXPORT_WORKERS", "2")), 1),
+                thread_name_prefix="pdf-export",
+            )
+        return _executor
+
+
+def export_pdf(
+    db: Session,
+    solution: Solution,
+    scope: str,
+    person_id: str | None = None,
+    team_id: str | None = None,
+) -> bytes:
+    """The schedule PDF for ``solution`` in ``scope``, from the cache when possible.
+
+    ``person_id`` / ``team_id`` (parsed from ``scope``) keep only the
+    assignments of events that person, or any member of that team, works.
+    On a cache miss the calling thread waits for the render pool.
+    """
+    org = db.query(Organization).filter(Organization.id == solution.org_id).first()
+    org_name = org.name if org else solution.org_id
+    key: PdfCacheKey = (
+        solution.id,
+        solution.created_at,
+        org.data_version if org else 0,
+        org_name,
+        scope,
+    )
+    pdf = pdf_cache.get(key)
+    if pdf is None:
+        inputs = load_schedule(db, solution, person_id, team_id)
+        pdf = _get_executor().submit(_render, org_name, inputs).result()
+        pdf_cache.put(key, pdf)
+    return pdf
+
+
+def _render(org_name: str, inputs: dict[str, Any]) -> bytes:
+    return generate_schedule_pdf(org_name, **inputs).getvalue()
+
+
+def load_schedule(
+    db: Session, solution: Solution, person_id: str | None = None, team_id: str | None = None
+) -> dict[str, Any]:
+    """Keyword arguments for ``generate_schedule_pdf``, in a fixed number of queries."""
+    event_assignments: dict[str, list[str]] = {}
+    for event_id, assignee_id in db.query(Assignment.event_id, Assignment.person_id).filter(
+        Assignment.solution_id == solution.id
+    ):
+        event_assignments.setdefault(event_id, []).append(assignee_id)
+
+    events_db = (
+        db.query(Event)
+        .filter(Event.org_id == solution.org_id, Event.id.in_(list(event_assignments)))
+        .all()
+    )
+    people_db = db.query(Person).filter(Person.org_id == solution.org_id).all()
+
+    scoped: set[str] | None = None
+    if person_id is not None:
+        scoped = {person_id}
+    elif team_id is not None:
+        scoped = {
+            member
+            for (member,) in db.query(TeamMember.person_id)
+            .join(Team, Team.id == TeamMember.team_id)
+            .filter(Team.id == team_id, Team.org_id == solution.org_id)
+        }
+    if scoped is not None:
+        event_assignments = {
+            event_id: assignees
+            for event_id, assignees in event_assignments.items()
+            if scoped.intersection(assignees)
+        }
+
+    # Blocked dates for the whole org in one query, grouped per person.
+    blocked_dates_map: dict[str, list[dict[str, Any]]] = {p.id: [] for p in people_db}
+    vacations = (
+        db.query(Availability.person_id, VacationPeriod.start_date, VacationPeriod.end_date)
+        .join(Availability, VacationPeriod.availability_id == Availability.id)
+        .join(Person, Person.id == Availability.person_id)
+        .filter(Person.org_id == solution.org_id)
+        .order_by(Availability.person_id, VacationPeriod.start_date)
+    )
+    for vacation_person, start, end in vacations:
+        blocked_dates_map[vacation_person].append({"start": start, "end": end})
+
+    return {
+        "events": [
+            {"id": e.id, "type": e.type, "start_time": e.start_time, "end_time": e.end_time}
+            for e in events_db
+        ],
+        "people": {p.id: {"name": p.name, "roles": p.roles or []} for p in people_db},
+        "assignments": event_assignments,
+        # Event role requirements live in extra_data["role_counts"].
+        "events_db_map": {e.id: e for e in events_db},
+        "blocked_dates_map": blocked_dates_map,
+    }
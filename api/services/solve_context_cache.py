@@ -0,0 +1,135 @@
+"""In-process cache of converted solver input, keyed by org data version.
+
+Admins often solve the same window several times in a row (different
+``mode`` / ``change_min`` / engine) on unchanged data. Each solve used to
+reload people, teams, events, holidays, resources and availability and
+rebuild the core models. ``SolveContextCache`` keeps the converted
+``SolveContext`` — plus the greedy solver's precomputed indexes, once a
+greedy solve has built them — under
+
+    (org_id, org created_at, org data_version, from_date, to_date)
+
+``Organization.data_version`` is bumped by every write to solver input
+(``api/utils/org_data_version.py``), so a changed org simply misses; its
+older snapshots are dropped when the new one is stored. ``created_at``
+keeps a deleted-and-recreated org with the same id from hitting old
+entries.
+
+Bounded two ways: at most ``max_entries`` snapshots, and at most
+``max_rows`` rows in total (people + events + availability + teams +
+resources + holidays + constraints, a proxy for memory). Least recently
+used snapshots are evicted first; a single snapshot over ``max_rows`` isn't
+cached at all.
+Tune via ``SOLVE_CONTEXT_CACHE_SIZE`` / ``SOLVE_CONTEXT_CACHE_MAX_ROWS``
+(size 0 disables the cache).
+
+Snapshots are shared between requests and must be treated as read-only;
+callers take a ``dataclasses.replace`` copy of the context before setting
+per-request fields.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+
+from api.core.solver.adapter import SolveContext
+
+DEFAULT_MAX_ENTRIES = 8
+DEFAULT_MAX_ROWS = 500_000
+
+CacheKey = tuple[str, datetime | None, int, date, date]
+
+
+@dataclass
+class Snapshot:
+    """A cached solve context and, once built, the greedy solver's indexes."""
+
+    context: SolveContext
+    rows: int
+    model: dict[str, Any] | None = None
+
+
+def context_rows(context: SolveContext) -> int:
+    """Rows held by ``context``, the unit of the cache's memory cap."""
+    return (
+        len(context.people)
+        + len(context.events)
+        + len(context.availability)
+        + len(context.teams)
+        + len(context.resources)
+        + len(context.holidays)
+        + len(context.constraints)
+    )
+
+
+class SolveContextCache:
+    """LRU of ``Snapshot`` by ``CacheKey``, bounded by entries and rows. Thread-safe."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_rows: int = DEFAULT_MAX_ROWS):
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[CacheKey, Snapshot] = OrderedDict()
+        self._rows = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def rows(self) -> int:
+        """Rows held across all cached snapshots."""
+        return self._rows
+
+    def get(self, key: CacheKey) -> Snapshot | None:
+        """The snapshot for ``key``, marking it most recently used."""
+        with self._lock:
+            snapshot = self._entries.get(key)
+            if snapshot is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return snapshot
+
+    def put(self, key: CacheKey, context: SolveContext) -> Snapshot:
+        """Cache ``context`` under ``key``; returns its snapshot even if it didn't fit."""
+        snapshot = Snapshot(context=context, rows=context_rows(context))
+        if self.max_entries <= 0 or snapshot.rows > self.max_rows:
+            return snapshot
+        org_id, created_at, version = key[:3]
+        with self._lock:
+            # Older versions of this org can never be hit again.
+            for old in [
+                k for k in self._entries if k[:2] == (org_id, created_at) and k[2] < version
+            ]:
+                self._drop(old)
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = snapshot
+            self._rows += snapshot.rows
+            while len(self._entries) > self.max_entries or self._rows > self.max_rows:
+                self._drop(next(iter(self._entries)))
+        return snapshot
+
+    def clear(self) -> None:
+        """Drop every snapshot and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self._rows = 0
+            self.hits = self.misses = 0
+
+    def _drop(self, key: CacheKey) -> None:
+        self._rows -= self._entries.pop(key).rows
+
+
+solve_context_cache = SolveContextCache(
+    max_entries=int(os.getenv("SOLVE_CONTEXT_CACHE_SIZE", str(DEFAULT_MAX_ENTRIES))),
+    max_rows=int(os.getenv("SOLVE_CONTEXT_CACHE_MAX_ROWS", str(DEFAULT_MAX_ROWS))),
+)
@@ -0,0 +1,177 @@
+"""In-process background solve jobs.
+
+``POST /solver/jobs`` hands the solve to a small thread pool instead of
+running it inside the request, so a long solve neither hits proxy timeouts
+nor holds a request worker. Each job is a ``SolveJob`` kept in a
+module-level registry: the worker updates its progress through the solver's
+progress callback (``SolveJob.report``), and ``GET /solver/jobs/{id}`` reads
+it back.
+
+Cancellation is cooperative: ``cancel`` sets a flag that the next progress
+report turns into ``SolveCancelledError``, and the runner checks it once more
+before saving, so a cancelled job never persists a solution. Engines that
+don't report progress (cp_sat, parallel, portfolio) run to the end of their
+time budget and are then discarded.
+
+Single-process scope, like ``event_bus``: with several uvicorn workers a job
+is only visible on the worker that accepted it. That suits single-node
+installs; a Celery task could take over the same ``work`` callable when a
+shared result store is needed. Finished jobs are kept (newest
+``MAX_FINISHED_JOBS``) so clients can still poll the outcome.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import uuid
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from api.core.solver.adapter import SolveCancelledError, SolveProgress
+from api.timeutils import utcnow
+
+logger = logging.getLogger("rostio")
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATUSES = (COMPLETED, FAILED, CANCELLED)
+
+# Finished jobs kept for polling; older ones are dropped first.
+MAX_FINISHED_JOBS = 100
+
+
+@dataclass
+class SolveJob:
+    """State of one background solve."""
+
+    id: str
+    org_id: str
+    status: str = QUEUED
+    events_done: int = 0
+    events_total: int = 0
+    assignments: int = 0
+    hard_violations: int = 0
+    solution_id: int | None = None
+    error: str | None = None
+    created_at: datetime = field(default_factory=utcnow)
+    finished_at: datetime | None = None
+    _cancel: threading.Event = field(default_factory=threading.Event, repr=False)
+    _future: Future | None = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job completed, failed or was cancelled."""
+        return self.status in FINISHED_STATUSES
+
+    @property
+    def cancel_requested(self) -> bool:
+        """Whether ``cancel`` was called for this job."""
+        return self._cancel.is_set()
+
+    def report(self, progress: SolveProgress) -> None:
+        """Progress callback for the solver; raises ``SolveCancelledError`` once cancelled."""
+        self.events_done = progress.events_done
+        self.events_total = progress.events_total
+        self.assignments = progress.assignments
+        self.hard_violations = progress.hard_violations
+        self.check_cancelled()
+
+    def check_cancelled(self) -> None:
+        """Raise ``SolveCancelledError`` if the job was cancelled."""
+        if self._cancel.is_set():
+            raise SolveCancelledError(self.id)
+
+    def _finish(self, status: str, error: str | None = None) -> None:
+        self.status = status
+        self.error = error
+        self.finished_at = utcnow()
+
+
+_jobs: dict[str, SolveJob] = {}
+_lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+
+
+def _max_workers() -> int:
+    return max(int(os.getenv("SOLVE_JOB_WORKERS", "1")), 1)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_max_workers(), thread_name_prefix="solve-job"
+            )
+        return _executor
+
+
+def submit(org_id: str, work: Callable[[SolveJob], int]) -> SolveJob:
+    """Queue ``work`` for ``org_id`` and return its job.
+
+    ``work`` runs on a worker thread, reports progress through
+    ``job.report`` and returns the saved solution's ID.
+    """
+    job = SolveJob(id=uuid.uuid4().hex, org_id=org_id)
+    with _lock:
+        _prune()
+        _jobs[job.id] = job
+    job._future = _get_executor().submit(_run, job, work)
+    return job
+
+
+def get(job_id: str) -> SolveJob | None:
+    """The job with ``job_id``, if this process knows it."""
+    with _lock:
+        return _jobs.get(job_id)
+
+
+def cancel(job_id: str) -> SolveJob | None:
+    """Request cancellation of ``job_id``; a queued job is cancelled at once."""
+    job = get(job_id)
+    if job is None or job.finished:
+        return job
+    job._cancel.set()
+    if job._future is not None and job._future.cancel():
+        job._finish(CANCELLED)
+    return job
+
+
+def shutdown() -> None:
+    """Stop the worker pool, cancelling queued jobs (running ones finish)."""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _run(job: SolveJob, work: Callable[[SolveJob], int]) -> None:
+    if job.cancel_requested:
+        job._finish(CANCELLED)
+        return
+    job.status = RUNNING
+    try:
+        solution_id = work(job)
+    except SolveCancelledError:
+        job._finish(CANCELLED)
+    except Exception as exc:
+        logger.exception("Solve job %s failed", job.id)
+        job._finish(FAILED, error=str(exc) or type(exc).__name__)
+    else:
+        job.solution_id = solution_id
+        job._finish(COMPLETED)
+
+
+def _prune() -> None:
+    """Drop the oldest finished jobs beyond ``MAX_FINISHED_JOBS``. Caller holds ``_lock``."""
+    finished = [job for job in _jobs.values() if job.finished]
+    for job in finished[: max(len(finished) - MAX_FINISHED_JOBS, 0)]:
+        del _jobs[job.id]
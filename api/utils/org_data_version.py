@@ -0,0 +1,136 @@
+"""Per-org data version for solver input caching.
+
+``Organization.data_version`` is bumped whenever rows the solver reads
+change: people, teams and memberships, events and their teams, holidays,
+resources, availability (with vacations and exceptions), constraints and
+the org's own region/config. The solve-context cache
+(``api/services/solve_context_cache.py``) keys snapshots on it, so any such
+write invalidates the org's cached snapshots on every API worker.
+
+The bump is a ``before_flush`` listener: it looks at the session's new,
+deleted and modified objects, resolves each one's org (through its parent
+rows for junction and child tables) and adds ``data_version + 1`` to the
+same flush, so it commits or rolls back with the change itself. Modified
+rows only count when a solver-visible column changed, so a login touching
+``Person`` doesn't invalidate anything.
+
+Bulk ``Query.update()`` / ``Query.delete()`` bypass the unit of work; call
+``bump_org_data_version`` next to those.
+"""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import InstanceState, Session, UOWTransaction
+
+from api.models import (
+    Availability,
+    AvailabilityException,
+    Constraint,
+    Event,
+    EventTeam,
+    Holiday,
+    Organization,
+    Person,
+    Resource,
+    Team,
+    TeamMember,
+    VacationPeriod,
+)
+
+# Model -> columns the solver reads; None means any change counts.
+_TRACKED: dict[type, frozenset[str] | None] = {
+    Organization: frozenset({"region", "config"}),
+    Person: frozenset({"org_id", "name", "roles"}),
+    Team: frozenset({"org_id", "name"}),
+    TeamMember: None,
+    Event: frozenset({"org_id", "type", "start_time", "end_time", "resource_id", "extra_data"}),
+    EventTeam: None,
+    Holiday: None,
+    Resource: frozenset({"org_id", "type", "capacity", "location"}),
+    Availability: frozenset({"person_id", "rrule"}),
+    VacationPeriod: None,
+    AvailabilityException: None,
+    Constraint: None,
+}
+
+
+def bump_org_data_version(session: Session, org_id: str) -> None:
+    """Increment ``org_id``'s data version as part of the session's next flush."""
+    org = session.get(Organization, org_id)
+    if org is not None:
+        # A SQL expression, so concurrent bumps from other workers don't collide.
+        setattr(org, "data_version", Organization.data_version + 1)
+
+
+def _changed(obj: object, columns: frozenset[str] | None) -> bool:
+    if columns is None:
+        return True
+    state = cast(InstanceState[Any], inspect(obj))
+    return any(state.attrs[name].history.has_changes() for name in columns)
+
+
+def _str_attr(obj: object, name: str) -> str | None:
+    """``obj.<name>`` as a plain ``str`` (model attributes are typed as ``Column``)."""
+    value = getattr(obj, name, None)
+    return value if isinstance(value, str) else None
+
+
+def _org_of(session: Session, obj: object) -> str | None:
+    """The org ``obj`` belongs to, looking through parent rows where needed."""
+    if isinstance(obj, Organization):
+        return _str_attr(obj, "id")
+    if isinstance(obj, Person | Team | Event | Holiday | Resource | Constraint):
+        return _str_attr(obj, "org_id")
+    if isinstance(obj, TeamMember):
+        team = obj.team or session.get(Team, obj.team_id)
+        return _str_attr(team, "org_id")
+    if isinstance(obj, EventTeam):
+        parent = obj.event or session.get(Event, obj.event_id)
+        return _str_attr(parent, "org_id")
+    if isinstance(obj, Availability):
+        person = obj.person or session.get(Person, obj.person_id)
+        return _str_attr(person, "org_id")
+    if isinstance(obj, VacationPeriod | AvailabilityException):
+        availability = obj.availability or session.get(Availability, obj.availability_id)
+        return _org_of(session, availability) if availability is not None else None
+    return None
+
+
+def _before_flush(session: Session, flush_context: UOWTransaction, instances: Any) -> None:
+    touched: list[object] = [
+        obj for obj in session.new if type(obj) in _TRACKED and not isinstance(obj, Organization)
+    ]
+    touched += [obj for obj in session.deleted if type(obj) in _TRACKED]
+    touched += [
+        obj
+        for obj in session.dirty
+        if type(obj) in _TRACKED
+        and session.is_modified(obj, include_collections=False)
+        and _changed(obj, _TRACKED[type(obj)])
+    ]
+    if not touched:
+        return
+    with session.no_autoflush:
+        org_ids = {_org_of(session, obj) for obj in touched}
+        # A deleted org's version no longer matters.
+        deleted = {
+            _org_of(session, obj) for obj in session.deleted if isinstance(obj, Organization)
+        }
+        for org_id in org_ids - deleted:
+            if org_id is not None:
+                bump_org_data_version(session, org_id)
+
+
+_INSTALLED = False
+
+
+def install_org_version_tracking(target: type = Session) -> None:
+    """Install the version-bump listener on a Session class. Idempotent."""
+    global _INSTALLED
+    if _INSTALLED:
+        return
+    event.listen(target, "before_flush", _before_flush)
+    _INSTALLED = True
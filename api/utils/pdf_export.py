@@ -11,6 +11,67 @@ from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import inch
 from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
 
+# Styles are built once per process and shared by every render.
+_SAMPLE_STYLES = getSampleStyleSheet()
+
+TITLE_STYLE = ParagraphStyle(
+    "CustomTitle",
+    parent=_SAMPLE_STYLES["Heading1"],
+    fontSize=24,
+    textColor=colors.HexColor("#1e40af"),
+    spaceAfter=30,
+    alignment=TA_CENTER,
+)
+
+SUBTITLE_STYLE = ParagraphStyle(
+    "CustomSubtitle",
+    parent=_SAMPLE_STYLES["Normal"],
+    fontSize=12,
+    textColor=colors.HexColor("#64748b"),
+    spaceAfter=20,
+    alignment=TA_CENTER,
+)
+
+DATE_STYLE = ParagraphStyle(
+    "DateHeader",
+    parent=_SAMPLE_STYLES["Heading2"],
+    fontSize=16,
+    textColor=colors.HexColor("#0f172a"),
+    spaceAfter=10,
+    spaceBefore=20,
+)
+
+COL_WIDTHS = [1.2 * inch, 2.5 * inch, 3.5 * inch]
+
+TABLE_STYLE = TableStyle(
+    [
+        # Header style
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#3b82f6")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("ALIGN", (0, 0), (-1, 0), "CENTER"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, 0), 12),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+        # Body style
+        ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
+        ("TEXTCOLOR", (0, 1), (-1, -1), colors.black),
+        ("ALIGN", (0, 1), (0, -1), "CENTER"),  # Time column centered
+        ("ALIGN", (1, 1), (-1, -1), "LEFT"),  # Other columns left
+        ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+        ("FONTSIZE", (0, 1), (-1, -1), 10),
+        ("TOPPADDING", (0, 1), (-1, -1), 8),
+        ("BOTTOMPADDING", (0, 1), (-1, -1), 8),
+        # Grid
+        ("GRID", (0, 0), (-1, -1), 1, colors.grey),
+        (
+            "ROWBACKGROUNDS",
+            (0, 1),
+            (-1, -1),
+            [colors.white, colors.HexColor("#f1f5f9")],
+        ),
+    ]
+)
+
 
 def generate_schedule_pdf(
     org_name: str,
@@ -47,31 +108,21 @@ def generate_schedule_pdf(
     # Container for flowables
     elements = []
 
-    # Styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        "CustomTitle",
-        parent=styles["Heading1"],
-        fontSize=24,
-        textColor=colors.HexColor("#1e40af"),
-        spaceAfter=30,
-        alignment=TA_CENTER,
-    )
-
-    subtitle_style = ParagraphStyle(
-        "CustomSubtitle",
-        parent=styles["Normal"],
-        fontSize=12,
-        textColor=colors.HexColor("#64748b"),
-        spaceAfter=20,
-        alignment=TA_CENTER,
-    )
+    # Helper function to check if person is blocked on event date
+    def is_person_blocked(person_id: str, event_date: datetime) -> bool:
+        if not blocked_dates_map:
+            return False
+        blocked_periods = blocked_dates_map.get(person_id, [])
+        for period in blocked_periods:
+            if period["start"] <= event_date.date() <= period["end"]:
+                return True
+        return False
 
     # Title
-    elements.append(Paragraph(f"{org_name} - Schedule", title_style))
+    elements.append(Paragraph(f"{org_name} - Schedule", TITLE_STYLE))
     elements.append(
         Paragraph(
-            f"Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}", subtitle_style
+            f"Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}", SUBTITLE_STYLE
         )
     )
     elements.append(Spacer(1, 0.3 * inch))
@@ -90,15 +141,7 @@ def generate_schedule_pdf(
     # Create tables for each date
     for date_str, date_events in events_by_date.items():
         # Date header
-        date_style = ParagraphStyle(
-            "DateHeader",
-            parent=styles["Heading2"],
-            fontSize=16,
-            textColor=colors.HexColor("#0f172a"),
-            spaceAfter=10,
-            spaceBefore=20,
-        )
-        elements.append(Paragraph(date_str, date_style))
+        elements.append(Paragraph(date_str, DATE_STYLE))
         elements.append(Spacer(1, 0.1 * inch))
 
         # Create table data
@@ -127,16 +170,6 @@ def generate_schedule_pdf(
                     }
                     assigned_people: set[str] = set()
 
-                    # Helper function to check if person is blocked on event date
-                    def is_person_blocked(person_id: str, event_date: datetime) -> bool:
-                        if not blocked_dates_map:
-                            return False
-                        blocked_periods = blocked_dates_map.get(person_id, [])
-                        for period in blocked_periods:
-                            if period["start"] <= event_date.date() <= period["end"]:
-                                return True
-                        return False
-
                     # First pass: assign people who only have ONE matching role
                     for pid in assigned_ids:
                         person = people.get(pid)
@@ -180,17 +213,6 @@ def generate_schedule_pdf(
                     assignees_str = "\n".join(role_lines) if role_lines else "Not assigned"
                 else:
                     # No role requirements, just list names
-                    def is_person_blocked(
-                        person_id: str, event_date: datetime
-                    ) -> bool:  # noqa: F811
-                        if not blocked_dates_map:
-                            return False
-                        blocked_periods = blocked_dates_map.get(person_id, [])
-                        for period in blocked_periods:
-                            if period["start"] <= event_date.date() <= period["end"]:
-                                return True
-                        return False
-
                     assigned_names = []
                     for pid in assigned_ids:
                         if people.get(pid):
@@ -203,40 +225,8 @@ def generate_schedule_pdf(
             table_data.append([start_time, event_type, assignees_str])
 
         # Create table
-        col_widths = [1.2 * inch, 2.5 * inch, 3.5 * inch]
-        table = Table(table_data, colWidths=col_widths)
-
-        # Style the table
-        table.setStyle(
-            TableStyle(
-                [
-                    # Header style
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#3b82f6")),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, 0), 12),
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                    # Body style
-                    ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
-                    ("TEXTCOLOR", (0, 1), (-1, -1), colors.black),
-                    ("ALIGN", (0, 1), (0, -1), "CENTER"),  # Time column centered
-                    ("ALIGN", (1, 1), (-1, -1), "LEFT"),  # Other columns left
-                    ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-                    ("FONTSIZE", (0, 1), (-1, -1), 10),
-                    ("TOPPADDING", (0, 1), (-1, -1), 8),
-                    ("BOTTOMPADDING", (0, 1), (-1, -1), 8),
-                    # Grid
-                    ("GRID", (0, 0), (-1, -1), 1, colors.grey),
-                    (
-                        "ROWBACKGROUNDS",
-                        (0, 1),
-                        (-1, -1),
-                        [colors.white, colors.HexColor("#f1f5f9")],
-                    ),
-                ]
-            )
-        )
+        table = Table(table_data, colWidths=COL_WIDTHS)
+        table.setStyle(TABLE_STYLE)
 
         elements.append(table)
         elements.append(Spacer(1, 0.3 * inch))
@@ -15,7 +15,7 @@ from tests.api.conftest import auth_headers, seed_org, seed_user
 def _seed_audit_row(db, *, action: str, org_id: str, when: datetime, user_id: str = "test-user"):
     """Insert one AuditLog row directly. Bypasses the tenancy guard."""
     row = AuditLog(
-        id=f"audit_{action}_{when.timestamp()}_{org_id}",
+        id=f"audit_{action}_{when.timestamp()}_{org_id}_{user_id}",
         user_id=user_id,
         user_email="seed@example.com",
         organization_id=org_id,
@@ -150,6 +150,30 @@ class TestAuditLogPagination:
         rows = resp.json()["items"]
         assert len(rows) == 2
 
+    def test_cursor_pages_through_rows_with_equal_timestamps(self, client, db):
+        org_id, admin_hdrs = _admin_setup(client, "cursor")
+        when = datetime.now(UTC) - timedelta(minutes=1)
+        for i in range(5):
+            _seed_audit_row(
+                db,
+                action=AuditAction.LOGIN_SUCCESS,
+                org_id=org_id,
+                when=when - timedelta(seconds=i // 2),
+                user_id=f"u{i}",
+            )
+
+        params = {"action": AuditAction.LOGIN_SUCCESS, "limit": 2}
+        seen = []
+        cursor = None
+        for _ in range(3):
+            page_params = params if cursor is None else {**params, "cursor": cursor}
+            body = client.get("/api/v1/audit-logs", params=page_params, headers=admin_hdrs).json()
+            seen += [r["user_id"] for r in body["items"]]
+            cursor = body["next_cursor"]
+
+        assert cursor is None
+        assert sorted(seen) == [f"u{i}" for i in range(5)]
+
 
 @pytest.mark.no_mock_auth
 class TestAuditLogSelfAuditing:
@@ -0,0 +1,124 @@
+"""API tests: org constraints reach the solver through the binding cache.
+
+``/solver/solve`` used to load the org's ``Constraint`` rows and discard
+them. They are now translated into ``ConstraintBinding``s once per org data
+version: any constraint write bumps ``Organization.data_version``, so the
+next lookup translates again.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from api.models import Constraint, Organization
+from api.services.constraint_bindings import constraint_binding_cache, org_constraint_bindings
+from api.services.solve_context_cache import solve_context_cache
+from tests.api.conftest import auth_headers, seed_event, seed_org, seed_user
+
+ORG = "bind-org"
+ADMIN_EMAIL = "admin@bind.org"
+ADMIN_PW = "AdminPass123!"
+
+
+@pytest.fixture(autouse=True)
+def _empty_caches():
+    constraint_binding_cache.clear()
+    solve_context_cache.clear()
+    yield
+    constraint_binding_cache.clear()
+    solve_context_cache.clear()
+
+
+def test_bindings_are_translated_once_until_rows_change(db):
+    """Repeat lookups reuse the translation; a direct row write bumps the version."""
+    org = Organization(id=ORG, name="Bind Org")
+    db.add(org)
+    db.add(
+        Constraint(
+            org_id=ORG,
+            key="gap",
+            type="hard",
+            predicate="enforce_min_gap_hours",
+            params={"hours": 12},
+        )
+    )
+    db.commit()
+
+    first = org_constraint_bindings(db, org)
+    assert org_constraint_bindings(db, org) is first
+    assert constraint_binding_cache.translations == 1
+
+    db.add(Constraint(org_id=ORG, key="x", type="hard", predicate="no_overlap", params={}))
+    db.add(
+        Constraint(
+            org_id=ORG, key="cap", type="hard", predicate="enforce_cap", params={"max_count": 2}
+        )
+    )
+    db.commit()
+
+    assert [b.key for b in org_constraint_bindings(db, org)] == ["gap", "cap"]
+    assert constraint_binding_cache.translations == 2
+
+
+@pytest.mark.no_mock_auth
+class TestConstraintsReachSolver:
+    """Constraints created through the API change the next solve."""
+
+    def _setup(self, client) -> dict:
+        seed_org(client, ORG, name="Bind Org")
+        seed_user(client, ORG, ADMIN_EMAIL, "Admin", ADMIN_PW)
+        for i in range(3):
+            seed_user(
+                client, ORG, f"vol{i}@bind.org", f"Volunteer {i}", "VolPass123!", ["volunteer"]
+            )
+        hdrs = auth_headers(client, ADMIN_EMAIL, ADMIN_PW)
+        # Both events in the same calendar month, so the monthly cap applies.
+        today = date.today()
+        next_month = (today.replace(day=1) + timedelta(days=32)).replace(day=1)
+        for day in (1, 2):
+            seed_event(
+                client,
+                hdrs,
+                ORG,
+                f"evt-{day}",
+                days_from_now=(next_month - today).days + day,
+                role_counts={"volunteer": 2},
+            )
+        return hdrs
+
+    def _solve(self, client, hdrs) -> dict:
+        resp = client.post(
+            "/api/v1/solver/solve",
+            json={
+                "org_id": ORG,
+                "from_date": date.today().isoformat(),
+                "to_date": (date.today() + timedelta(days=40)).isoformat(),
+            },
+            headers=hdrs,
+        )
+        assert resp.status_code == 200, resp.text
+        return resp.json()
+
+    def test_cap_constraint_limits_assignments_until_deleted(self, client):
+        """A monthly cap of one leaves the second event short; deleting it restores it."""
+        hdrs = self._setup(client)
+        assert self._solve(client, hdrs)["violations"] == []
+
+        resp = client.post(
+            "/api/v1/constraints/",
+            json={
+                "org_id": ORG,
+                "key": "one_a_month",
+                "type": "hard",
+                "predicate": "enforce_cap",
+                "params": {"period": "P1M", "max_count": 1},
+            },
+            headers=hdrs,
+        )
+        assert resp.status_code == 201, resp.text
+        capped = self._solve(client, hdrs)
+        assert [v["constraint_key"] for v in capped["violations"]] == ["require_role_coverage"]
+
+        resp = client.delete(f"/api/v1/constraints/{resp.json()['id']}", headers=hdrs)
+        assert resp.status_code == 204
+        assert self._solve(client, hdrs)["violations"] == []
@@ -0,0 +1,152 @@
+"""Cursor (keyset) pagination and total modes on the large list endpoints.
+
+``GET /events/``, ``/people/``, ``/solutions/`` and ``/audit-logs`` return
+``next_cursor``; passing it back as ``?cursor=`` continues after the last
+row of the previous page. ``?total=estimate|none`` caps or skips the count.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from api.models import Event, Organization, Person, Solution
+from api.utils import pagination
+from api.utils.pagination import encode_cursor
+from tests.api.conftest import auth_headers, seed_user
+
+ORG = "cursor-org"
+START = datetime(2026, 6, 7, 9)
+
+
+def _seed_events(db, count: int) -> None:
+    """``count`` events, three per start time so ties are broken by id."""
+    db.add(Organization(id=ORG, name="Cursor Org"))
+    for i in range(count):
+        start = START + timedelta(days=i // 3)
+        db.add(
+            Event(
+                id=f"{ORG}-e{i:03d}",
+                org_id=ORG,
+                type="service",
+                start_time=start,
+                end_time=start + timedelta(hours=1),
+            )
+        )
+    db.commit()
+
+
+def _walk(client, url: str, params: dict, headers=None) -> list[list[str]]:
+    """Follow next_cursor from the first page to the last; returns the ids per page."""
+    pages = []
+    cursor = None
+    while True:
+        page_params = params if cursor is None else {**params, "cursor": cursor}
+        resp = client.get(url, params=page_params, headers=headers)
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        pages.append([item["id"] for item in body["items"]])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_event_cursor_walk_matches_offset_order(client, db):
+    _seed_events(db, 11)
+    params = {"org_id": ORG, "limit": 4}
+
+    pages = _walk(client, "/api/v1/events/", params)
+    by_offset = []
+    for offset in (0, 4, 8):
+        body = client.get("/api/v1/events/", params={**params, "offset": offset}).json()
+        by_offset.append([item["id"] for item in body["items"]])
+
+    assert [len(p) for p in pages] == [4, 4, 3]
+    assert pages == by_offset
+    assert sum(pages, []) == [f"{ORG}-e{i:03d}" for i in range(11)]
+
+
+def test_last_page_has_no_cursor(client, db):
+    _seed_events(db, 4)
+
+    body = client.get("/api/v1/events/", params={"org_id": ORG, "limit": 4}).json()
+
+    assert len(body["items"]) == 4
+    assert body["next_cursor"] is None
+
+
+def test_total_modes(client, db, monkeypatch):
+    _seed_events(db, 6)
+    monkeypatch.setattr(pagination, "TOTAL_ESTIMATE_CAP", 5)
+    params = {"org_id": ORG, "limit": 2}
+
+    def total(mode):
+        return client.get("/api/v1/events/", params={**params, "total": mode}).json()["total"]
+
+    assert total("exact") == 6
+    assert total("estimate") == 5
+    assert total("none") is None
+    resp = client.get("/api/v1/events/", params={**params, "total": "approx"})
+    assert resp.status_code == 422
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor("yesterday", "e1"), "W10"])
+def test_malformed_cursor_is_rejected(client, db, cursor):
+    _seed_events(db, 2)
+
+    resp = client.get("/api/v1/events/", params={"org_id": ORG, "cursor": cursor})
+
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Invalid cursor"
+
+
+def test_cursor_and_offset_together_are_rejected(client, db):
+    _seed_events(db, 3)
+    first = client.get("/api/v1/events/", params={"org_id": ORG, "limit": 1}).json()
+
+    resp = client.get(
+        "/api/v1/events/",
+        params={"org_id": ORG, "limit": 1, "offset": 1, "cursor": first["next_cursor"]},
+    )
+
+    assert resp.status_code == 400
+
+
+def test_solution_cursor_walk_is_newest_first(client, db):
+    db.add(Organization(id=ORG, name="Cursor Org"))
+    created = datetime(2026, 6, 1, 12)
+    for i in range(5):
+        db.add(
+            Solution(
+                org_id=ORG,
+                solve_ms=1.0,
+                hard_violations=0,
+                soft_score=0.0,
+                health_score=100.0,
+                metrics={},
+                # Two solutions per timestamp, so the id breaks the tie.
+                created_at=created + timedelta(minutes=i // 2),
+            )
+        )
+    db.commit()
+    ids = [s.id for s in db.query(Solution).filter(Solution.org_id == ORG).order_by(Solution.id)]
+
+    pages = _walk(client, "/api/v1/solutions/", {"org_id": ORG, "limit": 2})
+
+    assert sum(pages, []) == [ids[4], ids[3], ids[2], ids[1], ids[0]]
+
+
+@pytest.mark.no_mock_auth
+def test_people_cursor_walk(client, db):
+    db.add(Organization(id=ORG, name="Cursor Org"))
+    db.commit()
+    seed_user(client, ORG, email="admin@cursor.org", name="Admin", password="AdminPass1!")
+    hdrs = auth_headers(client, email="admin@cursor.org", password="AdminPass1!")
+    for i in range(6):
+        db.add(Person(id=f"{ORG}-p{i}", org_id=ORG, name=f"P{i}", roles=["usher"]))
+    db.commit()
+
+    pages = _walk(client, "/api/v1/people/", {"org_id": ORG, "limit": 3}, headers=hdrs)
+
+    people = sum(pages, [])
+    assert len(people) == 7  # the admin too
+    assert people == sorted(people)
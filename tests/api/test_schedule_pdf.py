@@ -0,0 +1,186 @@
+"""PDF schedule export: batched loading, worker rendering and the output cache.
+
+``load_schedule`` reads the whole org's blocked dates in one query instead
+of one per person; ``export_pdf`` renders on the worker pool and keeps the
+bytes in ``pdf_cache`` until the solution's org data changes.
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import event as sa_event
+
+from api.models import (
+    Assignment,
+    Availability,
+    Event,
+    Organization,
+    Person,
+    Solution,
+    Team,
+    TeamMember,
+    VacationPeriod,
+)
+from api.services import schedule_pdf
+from api.services.schedule_pdf import PdfCache, load_schedule, pdf_cache
+
+ORG = "pdf-org"
+START = datetime(2026, 6, 7, 9)
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    pdf_cache.clear()
+    yield
+    pdf_cache.clear()
+
+
+def _seed(db, people: int = 4) -> Solution:
+    """Two events; person ``n`` is on vacation the week of day ``n``."""
+    db.add(Organization(id=ORG, name="PDF Org"))
+    for n in range(people):
+        person = Person(id=f"{ORG}-p{n}", org_id=ORG, name=f"Person {n}", roles=["usher"])
+        availability = Availability(person=person)
+        availability.vacations = [
+            VacationPeriod(
+                start_date=date(2026, 6, 7) + timedelta(days=n),
+                end_date=date(2026, 6, 13) + timedelta(days=n),
+            )
+        ]
+        db.add_all([person, availability])
+    for i in range(2):
+        start = START + timedelta(days=i)
+        db.add(
+            Event(
+                id=f"{ORG}-e{i}",
+                org_id=ORG,
+                type="service",
+                start_time=start,
+                end_time=start + timedelta(hours=2),
+            )
+        )
+    solution = Solution(
+        org_id=ORG, solve_ms=1.0, hard_violations=0, soft_score=0.0, health_score=100.0, metrics={}
+    )
+    solution.assignments = [
+        Assignment(event_id=f"{ORG}-e0", person_id=f"{ORG}-p0"),
+        Assignment(event_id=f"{ORG}-e1", person_id=f"{ORG}-p1"),
+    ]
+    db.add(solution)
+    db.commit()
+    db.refresh(solution)
+    return solution
+
+
+def _count_queries(db, fn):
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    sa_event.listen(engine, "before_cursor_execute", record)
+    try:
+        result = fn()
+    finally:
+        sa_event.remove(engine, "before_cursor_execute", record)
+    return result, len(statements)
+
+
+def test_blocked_dates_load_in_one_query(db):
+    solution = _seed(db, people=12)
+
+    inputs, queries = _count_queries(db, lambda: load_schedule(db, solution))
+
+    # assignments, events, people, vacations
+    assert queries == 4
+    assert inputs["blocked_dates_map"][f"{ORG}-p3"] == [
+        {"start": date(2026, 6, 10), "end": date(2026, 6, 16)}
+    ]
+    assert inputs["assignments"] == {f"{ORG}-e0": [f"{ORG}-p0"], f"{ORG}-e1": [f"{ORG}-p1"]}
+
+
+def test_team_scope_keeps_its_members_assignments(db):
+    solution = _seed(db)
+    db.add(Team(id=f"{ORG}-t", org_id=ORG, name="Ushers"))
+    db.add(TeamMember(team_id=f"{ORG}-t", person_id=f"{ORG}-p1"))
+    db.commit()
+
+    inputs = load_schedule(db, solution, team_id=f"{ORG}-t")
+
+    assert inputs["assignments"] == {f"{ORG}-e1": [f"{ORG}-p1"]}
+
+
+def _export(client, solution_id: int, scope: str = "org"):
+    return client.post(
+        f"/api/v1/solutions/{solution_id}/export", json={"format": "pdf", "scope": scope}
+    )
+
+
+def test_repeat_downloads_are_served_from_cache(client, db, monkeypatch):
+    solution = _seed(db)
+    renders = []
+    render = schedule_pdf._render
+
+    def counting_render(org_name, inputs):
+        renders.append(org_name)
+        return render(org_name, inputs)
+
+    monkeypatch.setattr(schedule_pdf, "_render", counting_render)
+
+    first = _export(client, solution.id)
+    second = _export(client, solution.id)
+
+    assert first.status_code == 200, first.text
+    assert first.headers["content-type"] == "application/pdf"
+    assert first.content.startswith(b"%PDF")
+    assert second.content == first.content
+    assert len(renders) == 1
+    assert pdf_cache.hits == 1
+
+    # A different scope is a different PDF.
+    _export(client, solution.id, scope=f"person:{ORG}-p0")
+    assert len(renders) == 2
+
+    # Editing a person bumps the org's data version, so the next download re-renders.
+    person = db.query(Person).filter(Person.org_id == ORG, Person.id == f"{ORG}-p0").one()
+    person.name = "Renamed"
+    db.commit()
+    _export(client, solution.id)
+    assert len(renders) == 3
+
+
+def test_cache_evicts_least_recently_used_by_bytes():
+    cache = PdfCache(max_entries=10, max_bytes=10)
+    created = datetime(2026, 6, 1)
+    cache.put((1, created, 0, "Org", "org"), b"aaaa")
+    cache.put((2, created, 0, "Org", "org"), b"bbbb")
+    assert cache.get((1, created, 0, "Org", "org")) == b"aaaa"
+
+    cache.put((3, created, 0, "Org", "org"), b"cccc")
+
+    assert cache.get((2, created, 0, "Org", "org")) is None
+    assert len(cache) == 2
+    assert cache.bytes == 8
+    cache.put((4, created, 0, "Org", "org"), b"x" * 11)
+    assert len(cache) == 2
+
+
+def test_cache_drops_renders_of_older_data():
+    cache = PdfCache()
+    created = datetime(2026, 6, 1)
+    cache.put((1, created, 1, "Org", "org"), b"old")
+    cache.put((1, created, 1, "Org", "person:p1"), b"old")
+
+    cache.put((1, created, 2, "Org", "org"), b"new")
+
+    assert len(cache) == 1
+    assert cache.get((1, created, 2, "Org", "org")) == b"new"
+
+
+def test_cache_size_zero_disables_it():
+    cache = PdfCache(max_entries=0)
+
+    cache.put((1, None, 0, "Org", "org"), b"pdf")
+
+    assert len(cache) == 0
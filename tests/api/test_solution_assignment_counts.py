@@ -0,0 +1,137 @@
+"""API tests: solution assignment counts come from one grouped query.
+
+``list_solutions`` used to count assignments once per solution on the page;
+every solution response now takes its ``assignment_count`` from a single
+``GROUP BY solution_id`` aggregate, so a page's query count doesn't grow
+with its size.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from api.models import Assignment, Event, Organization, Person, Solution
+from tests.api.conftest import auth_headers, seed_user
+
+ORG = "counts-org"
+START = datetime(2026, 6, 7, 9)
+
+
+def _seed_solutions(db, org_id: str, count: int, first: int = 0) -> list[Solution]:
+    """``count`` solutions; solution ``i`` (numbered from ``first``) has ``i % 4`` assignments."""
+    solutions = []
+    for i in range(first, first + count):
+        sol = Solution(
+            org_id=org_id,
+            solve_ms=1.0,
+            hard_violations=0,
+            soft_score=0.0,
+            health_score=100.0,
+            metrics={},
+        )
+        sol.assignments = [
+            Assignment(event_id=f"{org_id}-e", person_id=f"{org_id}-p{n}", role="usher")
+            for n in range(i % 4)
+        ]
+        db.add(sol)
+        solutions.append(sol)
+    db.commit()
+    return solutions
+
+
+def _seed_org_rows(db, org_id: str, people: bool = True) -> None:
+    db.add(Organization(id=org_id, name="Counts Org"))
+    db.add(
+        Event(
+            id=f"{org_id}-e",
+            org_id=org_id,
+            type="service",
+            start_time=START,
+            end_time=START + timedelta(hours=2),
+        )
+    )
+    db.commit()
+    if people:
+        _seed_people(db, org_id)
+
+
+def _seed_people(db, org_id: str) -> None:
+    for n in range(3):
+        db.add(Person(id=f"{org_id}-p{n}", org_id=org_id, name=f"P{n}", roles=["usher"]))
+    db.commit()
+
+
+def _count_queries(db, fn):
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return result, len(statements)
+
+
+def _list_page(client):
+    return client.get("/api/v1/solutions/", params={"org_id": ORG, "limit": 200})
+
+
+def test_list_query_count_is_independent_of_page_size(client, db):
+    """A 10-solution page and a 200-solution page take the same number of queries."""
+    _seed_org_rows(db, ORG)
+    _seed_solutions(db, ORG, 10)
+    resp, small = _count_queries(db, lambda: _list_page(client))
+    assert resp.status_code == 200, resp.text
+    assert len(resp.json()["items"]) == 10
+
+    _seed_solutions(db, ORG, 190, first=10)
+    resp, large = _count_queries(db, lambda: _list_page(client))
+
+    assert resp.status_code == 200, resp.text
+    assert len(resp.json()["items"]) == 200
+    assert large == small
+
+
+def test_list_reports_each_solutions_count(client, db):
+    _seed_org_rows(db, ORG)
+    solutions = _seed_solutions(db, ORG, 8)
+
+    resp = _list_page(client)
+
+    assert resp.status_code == 200, resp.text
+    counts = {item["id"]: item["assignment_count"] for item in resp.json()["items"]}
+    assert counts == {sol.id: i % 4 for i, sol in enumerate(solutions)}
+
+
+def test_get_solution_reports_count(client, db):
+    _seed_org_rows(db, ORG)
+    _, sol = _seed_solutions(db, ORG, 2, first=2)
+
+    resp = client.get(f"/api/v1/solutions/{sol.id}")
+
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["assignment_count"] == 3
+
+
+@pytest.mark.no_mock_auth
+def test_publish_and_unpublish_report_count(client, db):
+    org_id = "counts-publish"
+    _seed_org_rows(db, org_id, people=False)
+    # The org's first signup becomes its admin, so it has to come before the people.
+    seed_user(client, org_id, email="admin@counts.org", name="Admin", password="AdminPass1!")
+    _seed_people(db, org_id)
+    hdrs = auth_headers(client, email="admin@counts.org", password="AdminPass1!")
+    (sol,) = _seed_solutions(db, org_id, 1, first=2)
+
+    published = client.post(f"/api/v1/solutions/{sol.id}/publish", headers=hdrs)
+    unpublished = client.post(f"/api/v1/solutions/{sol.id}/unpublish", headers=hdrs)
+
+    assert published.status_code == 200, published.text
+    assert published.json()["assignment_count"] == 2
+    assert unpublished.status_code == 200, unpublished.text
+    assert unpublished.json()["assignment_count"] == 2
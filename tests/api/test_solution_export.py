@@ -0,0 +1,200 @@
+"""Solution export: CSV, JSON, NDJSON and ICS stream from one joined query.
+
+``POST /solutions/{id}/export`` groups each event's assignees as the
+Assignment ⋈ Event ⟕ Person rows arrive and emits the export row by row;
+the query count doesn't depend on the number of events or people.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+
+from sqlalchemy import event as sa_event
+
+from api.models import Assignment, Event, Organization, Person, Solution, Team, TeamMember
+from api.services.solution_export import chunked, csv_chunks, iter_export_events
+
+ORG = "export-org"
+START = datetime(2026, 6, 7, 9)
+
+
+def _seed(db, events: int = 3, people: int = 4) -> Solution:
+    """Event ``i`` starts ``i`` days after START (seeded newest first) and
+    gets people ``i % people`` and ``(i + 1) % people``."""
+    db.add(Organization(id=ORG, name="Export Org"))
+    for n in range(people):
+        db.add(Person(id=f"{ORG}-p{n}", org_id=ORG, name=f"Person {n}", roles=["usher"]))
+    for i in reversed(range(events)):
+        start = START + timedelta(days=i)
+        db.add(
+            Event(
+                id=f"{ORG}-e{i}",
+                org_id=ORG,
+                type="service",
+                start_time=start,
+                end_time=start + timedelta(hours=2),
+            )
+        )
+    solution = Solution(
+        org_id=ORG,
+        solve_ms=5.0,
+        hard_violations=0,
+        soft_score=0.0,
+        health_score=100.0,
+        metrics={"fairness": {"stdev": 0.5, "per_person_counts": {}}},
+    )
+    solution.assignments = [
+        Assignment(event_id=f"{ORG}-e{i}", person_id=f"{ORG}-p{(i + k) % people}")
+        for i in range(events)
+        for k in range(2)
+    ]
+    db.add(solution)
+    db.commit()
+    db.refresh(solution)
+    return solution
+
+
+def _export(client, solution_id: int, fmt: str, scope: str = "org"):
+    return client.post(
+        f"/api/v1/solutions/{solution_id}/export", json={"format": fmt, "scope": scope}
+    )
+
+
+def test_csv_export_lists_events_in_start_order(client, db):
+    solution = _seed(db)
+
+    resp = _export(client, solution.id, "csv")
+
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"].startswith("text/csv")
+    rows = list(csv.reader(io.StringIO(resp.text)))
+    assert rows[0] == ["Event ID", "Event Type", "Date", "Time", "Assignees"]
+    assert rows[1:] == [
+        [f"{ORG}-e0", "service", "2026-06-07", "09:00:00", "Person 0, Person 1"],
+        [f"{ORG}-e1", "service", "2026-06-08", "09:00:00", "Person 1, Person 2"],
+        [f"{ORG}-e2", "service", "2026-06-09", "09:00:00", "Person 2, Person 3"],
+    ]
+
+
+def test_person_scope_keeps_that_persons_events(client, db):
+    solution = _seed(db)
+
+    resp = _export(client, solution.id, "csv", scope=f"person:{ORG}-p2")
+
+    rows = list(csv.reader(io.StringIO(resp.text)))[1:]
+    assert [r[0] for r in rows] == [f"{ORG}-e1", f"{ORG}-e2"]
+
+
+def test_team_scope_keeps_its_members_events(client, db):
+    solution = _seed(db)
+    db.add(Team(id=f"{ORG}-t", org_id=ORG, name="Ushers"))
+    db.add(TeamMember(team_id=f"{ORG}-t", person_id=f"{ORG}-p3"))
+    db.commit()
+
+    resp = _export(client, solution.id, "csv", scope=f"team:{ORG}-t")
+
+    rows = list(csv.reader(io.StringIO(resp.text)))[1:]
+    assert [r[0] for r in rows] == [f"{ORG}-e2"]
+
+
+def test_ics_export_streams_one_vevent_per_event(client, db):
+    solution = _seed(db)
+
+    resp = _export(client, solution.id, "ics", scope=f"person:{ORG}-p1")
+
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"].startswith("text/calendar")
+    body = resp.text
+    assert body.startswith("BEGIN:VCALENDAR\r\n")
+    assert body.endswith("END:VCALENDAR\r\n")
+    assert body.count("BEGIN:VEVENT") == 2
+    assert f"UID:rostio-solution-{solution.id}-{ORG}-e0@rostio.app\r\n" in body
+    assert "DTSTART:20260607T090000Z\r\n" in body
+    assert "DESCRIPTION:Assigned: Person 0\\, Person 1\r\n" in body
+
+
+def test_json_export_is_a_solution_bundle(client, db):
+    solution = _seed(db)
+
+    resp = _export(client, solution.id, "json")
+
+    assert resp.status_code == 200, resp.text
+    body = json.loads(resp.text)
+    assert set(body) == {"meta", "metrics", "violations", "assignments"}
+    assert body["metrics"]["fairness"]["stdev"] == 0.5
+    assert body["assignments"][0] == {
+        "event_id": f"{ORG}-e0",
+        "assignees": [f"{ORG}-p0", f"{ORG}-p1"],
+        "resource_id": None,
+        "team_ids": [],
+    }
+
+
+def test_ndjson_export_has_header_then_one_line_per_event(client, db):
+    solution = _seed(db)
+
+    resp = _export(client, solution.id, "ndjson")
+
+    assert resp.status_code == 200, resp.text
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert set(lines[0]) == {"meta", "metrics", "violations"}
+    assert [line["event_id"] for line in lines[1:]] == [f"{ORG}-e{i}" for i in range(3)]
+
+
+def test_export_without_assignments_is_rejected(client, db):
+    db.add(Organization(id=ORG, name="Export Org"))
+    solution = Solution(
+        org_id=ORG, solve_ms=0.0, hard_violations=0, soft_score=0.0, health_score=0.0, metrics={}
+    )
+    db.add(solution)
+    db.commit()
+
+    assert _export(client, solution.id, "csv").status_code == 400
+
+
+def test_unknown_format_is_rejected(client, db):
+    solution = _seed(db)
+
+    resp = _export(client, solution.id, "xml")
+
+    assert resp.status_code == 400
+    assert "ndjson" in resp.json()["detail"]
+
+
+def _count_queries(db, fn):
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    sa_event.listen(engine, "before_cursor_execute", record)
+    try:
+        result = fn()
+    finally:
+        sa_event.remove(engine, "before_cursor_execute", record)
+    return result, len(statements)
+
+
+def test_event_rows_take_one_query(db):
+    solution = _seed(db, events=40, people=25)
+
+    events, queries = _count_queries(db, lambda: list(iter_export_events(db, solution)))
+
+    assert len(events) == 40
+    assert queries == 1
+
+
+def test_chunks_are_batched():
+    assert list(chunked(["ab", "cd", "e"], size=3)) == ["abcd", "e"]
+    assert list(chunked([], size=3)) == []
+
+
+def test_csv_chunks_flush_by_size(db):
+    solution = _seed(db, events=30)
+
+    chunks = list(csv_chunks(iter_export_events(db, solution), size=200))
+
+    assert len(chunks) > 1
+    assert len(list(csv.reader(io.StringIO("".join(chunks))))) == 31
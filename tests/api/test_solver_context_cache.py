@@ -0,0 +1,145 @@
+"""API tests: org data versions and solve-context reuse.
+
+Writes to solver input bump ``Organization.data_version`` in the same
+flush; ``/solver/solve`` reuses the cached context while the version holds.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from api.models import (
+    Availability,
+    Organization,
+    Person,
+    Team,
+    TeamMember,
+    VacationPeriod,
+)
+from api.services.solve_context_cache import solve_context_cache
+from tests.api.conftest import auth_headers, seed_event, seed_org, seed_user
+
+ORG = "cache-org"
+ADMIN_EMAIL = "admin@cache.org"
+ADMIN_PW = "AdminPass123!"
+
+
+def _version(db) -> int:
+    db.expire_all()
+    return db.query(Organization).filter(Organization.id == ORG).one().data_version
+
+
+def _seed_db(db) -> None:
+    db.add(Organization(id=ORG, name="Cache Org"))
+    db.add(Person(id="p1", org_id=ORG, name="P1", roles=["usher"]))
+    db.add(Team(id="t1", org_id=ORG, name="T1"))
+    db.commit()
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    solve_context_cache.clear()
+    yield
+    solve_context_cache.clear()
+
+
+def test_solver_input_writes_bump_the_version(db):
+    """Role changes, memberships and vacations bump; other columns don't."""
+    _seed_db(db)
+    v0 = _version(db)
+
+    person = db.query(Person).filter(Person.id == "p1").one()
+    person.roles = ["usher", "sound"]
+    db.commit()
+    v1 = _version(db)
+
+    person = db.query(Person).filter(Person.id == "p1").one()
+    person.timezone = "Europe/Berlin"
+    db.commit()
+    assert _version(db) == v1  # not solver input
+
+    db.add(TeamMember(team_id="t1", person_id="p1"))
+    db.commit()
+    v2 = _version(db)
+
+    db.add(Availability(person_id="p1"))
+    db.commit()
+    availability = db.query(Availability).filter(Availability.person_id == "p1").one()
+    v3 = _version(db)
+    db.add(
+        VacationPeriod(
+            availability_id=availability.id, start_date=date(2026, 6, 1), end_date=date(2026, 6, 2)
+        )
+    )
+    db.commit()
+    v4 = _version(db)
+
+    assert v0 < v1 < v2 < v3 < v4
+
+
+def test_rolled_back_write_keeps_the_version(db):
+    """The bump is part of the flush, so a rollback undoes it too."""
+    _seed_db(db)
+    v0 = _version(db)
+
+    db.add(Person(id="p2", org_id=ORG, name="P2", roles=[]))
+    db.flush()
+    db.rollback()
+
+    assert _version(db) == v0
+
+
+@pytest.mark.no_mock_auth
+class TestSolveContextCache:
+    """Repeated solves on unchanged data skip the reload."""
+
+    def _setup(self, client) -> dict:
+        seed_org(client, ORG, name="Cache Org")
+        seed_user(client, ORG, ADMIN_EMAIL, "Admin", ADMIN_PW)
+        for i in range(3):
+            seed_user(client, ORG, f"vol{i}@cache.org", f"Volunteer {i}", "VolPass123!")
+        hdrs = auth_headers(client, ADMIN_EMAIL, ADMIN_PW)
+        seed_event(client, hdrs, ORG, "evt-1", days_from_now=14, role_counts={"volunteer": 2})
+        return hdrs
+
+    def _solve(self, client, hdrs, **extra):
+        resp = client.post(
+            "/api/v1/solver/solve",
+            json={
+                "org_id": ORG,
+                "from_date": (date.today() + timedelta(days=10)).isoformat(),
+                "to_date": (date.today() + timedelta(days=30)).isoformat(),
+                **extra,
+            },
+            headers=hdrs,
+        )
+        assert resp.status_code == 200, resp.text
+        return resp.json()
+
+    def test_second_solve_reuses_context_until_data_changes(self, client, db):
+        """Different modes hit the cache; a new event misses and is picked up."""
+        hdrs = self._setup(client)
+        selects: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("SELECT") and "FROM events" in statement:
+                selects.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            first = self._solve(client, hdrs)
+            loads = len(selects)
+            second = self._solve(client, hdrs, mode="relaxed", change_min=True)
+            assert len(selects) == loads  # no event reload
+            assert (solve_context_cache.hits, len(solve_context_cache)) == (1, 1)
+
+            seed_event(client, hdrs, ORG, "evt-2", days_from_now=21, role_counts={"volunteer": 1})
+            third = self._solve(client, hdrs)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert first["assignment_count"] == second["assignment_count"] == 1
+        assert third["assignment_count"] == 2
+        assert len(solve_context_cache) == 1  # the stale version was dropped
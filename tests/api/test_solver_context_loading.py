@@ -0,0 +1,120 @@
+"""API tests: solve-context loading issues a fixed number of queries.
+
+``_load_solve_context`` eager-loads team members, event teams, vacation
+periods and availability exceptions in bulk, so the query count must not
+grow with the number of people, availability rows or events.
+"""
+
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import event
+
+from api.models import (
+    Availability,
+    AvailabilityException,
+    Event,
+    EventTeam,
+    Organization,
+    Person,
+    Team,
+    TeamMember,
+    VacationPeriod,
+)
+from api.routers.solver import _load_solve_context
+from api.services.constraint_bindings import constraint_binding_cache
+
+ORG = "loading-org"
+FROM = date(2026, 6, 1)
+TO = date(2026, 6, 30)
+
+
+def _seed(db, people: int) -> Organization:
+    """``people`` volunteers, each with an availability row, a vacation and an exception."""
+    org = Organization(id=ORG, name="Loading Org")
+    db.add(org)
+    team = Team(id="team-1", org_id=ORG, name="Team 1")
+    db.add(team)
+    for i in range(people):
+        person_id = f"{ORG}-p{i}"
+        db.add(Person(id=person_id, org_id=ORG, name=f"P{i}", roles=["usher"]))
+        db.add(TeamMember(team_id="team-1", person_id=person_id))
+        day = FROM + timedelta(days=i % 28)
+        db.add(
+            Availability(
+                person_id=person_id,
+                vacations=[VacationPeriod(start_date=day, end_date=day + timedelta(days=1))],
+                exceptions=[AvailabilityException(exception_date=day + timedelta(days=2))],
+            )
+        )
+    for i in range(max(people // 5, 1)):
+        start = datetime.combine(FROM + timedelta(days=i % 28), datetime.min.time())
+        db.add(
+            Event(
+                id=f"{ORG}-e{i}",
+                org_id=ORG,
+                type="service",
+                start_time=start,
+                end_time=start + timedelta(hours=2),
+                extra_data={"role_counts": {"usher": 2}},
+                event_teams=[EventTeam(team_id="team-1")],
+            )
+        )
+    db.commit()
+    return org
+
+
+def _count_queries(db, fn):
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return result, len(statements)
+
+
+def _load(db, org):
+    db.expire_all()  # start from an empty identity map, like a fresh request
+    constraint_binding_cache.clear()  # and translate the org's constraints again
+    return _load_solve_context(db, org, FROM, TO, "strict", False)
+
+
+def test_query_count_is_independent_of_org_size(db):
+    """Ten and two hundred volunteers load with the same, small number of queries."""
+    org = _seed(db, people=10)
+    _, small = _count_queries(db, lambda: _load(db, org))
+
+    for i in range(10, 200):
+        person_id = f"{ORG}-p{i}"
+        db.add(Person(id=person_id, org_id=ORG, name=f"P{i}", roles=["usher"]))
+        db.add(
+            Availability(
+                person_id=person_id,
+                vacations=[VacationPeriod(start_date=FROM, end_date=FROM)],
+                exceptions=[AvailabilityException(exception_date=TO)],
+            )
+        )
+    db.commit()
+    context, large = _count_queries(db, lambda: _load(db, org))
+
+    assert len(context.availability) == 200
+    assert large == small
+    assert large <= 13
+
+
+def test_bulk_loaded_children_are_grouped_per_person(db):
+    """Vacations, exceptions, team members and event teams land on the right rows."""
+    org = _seed(db, people=3)
+    context = _load(db, org)
+
+    by_person = {a.person_id: a for a in context.availability}
+    p1 = by_person[f"{ORG}-p1"]
+    assert [(v.start, v.end) for v in p1.vacations] == [(date(2026, 6, 2), date(2026, 6, 3))]
+    assert p1.exceptions == [date(2026, 6, 4)]
+    assert context.teams[0].members == [f"{ORG}-p{i}" for i in range(3)]
+    assert all(e.team_ids == ["team-1"] for e in context.events)
@@ -0,0 +1,167 @@
+"""API tests: ``POST /solver/solve`` engine selection (``solver`` / ``timeout_s``)."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from api.core.solver import or_tools_adapter
+from api.models import Solution
+from tests.api.conftest import auth_headers, seed_event, seed_org, seed_user
+
+ORG = "engine-org"
+ADMIN_EMAIL = "admin@engine.org"
+ADMIN_PW = "AdminPass123!"
+
+
+def _setup(client) -> dict:
+    seed_org(client, ORG, name="Engine Org")
+    seed_user(client, ORG, ADMIN_EMAIL, "Admin", ADMIN_PW)
+    for i in range(3):
+        seed_user(client, ORG, f"vol{i}@engine.org", f"Volunteer {i}", "VolPass123!")
+    hdrs = auth_headers(client, ADMIN_EMAIL, ADMIN_PW)
+    seed_event(client, hdrs, ORG, "evt-1", days_from_now=14, role_counts={"volunteer": 2})
+    seed_event(client, hdrs, ORG, "evt-2", days_from_now=21, role_counts={"volunteer": 2})
+    return hdrs
+
+
+def _solve(client, hdrs, **extra):
+    return client.post(
+        "/api/v1/solver/solve",
+        json={
+            "org_id": ORG,
+            "from_date": (date.today() + timedelta(days=10)).isoformat(),
+            "to_date": (date.today() + timedelta(days=30)).isoformat(),
+            **extra,
+        },
+        headers=hdrs,
+    )
+
+
+@pytest.mark.no_mock_auth
+class TestSolverEngines:
+    """Engine selection on the solve endpoint."""
+
+    def test_default_engine_is_greedy(self, client):
+        """Omitting ``solver`` keeps the greedy heuristic."""
+        hdrs = _setup(client)
+        resp = _solve(client, hdrs)
+
+        assert resp.status_code == 200, resp.text
+        assert resp.json()["solver"] == "greedy_heuristic"
+
+    def test_cp_sat_engine_solves_and_saves(self, client):
+        """``solver=cp_sat`` runs OR-Tools and persists the assignments."""
+        pytest.importorskip("ortools")
+        hdrs = _setup(client)
+        resp = _solve(client, hdrs, solver="cp_sat", timeout_s=10)
+
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        assert body["solver"] == "or_tools_cp_sat"
+        assert body["metrics"]["hard_violations"] == 0
+        assert sum(body["metrics"]["fairness"]["per_person_counts"].values()) == 4
+
+    def test_cp_sat_falls_back_without_ortools(self, client, monkeypatch):
+        """Without OR-Tools the request still succeeds on the greedy solver."""
+        monkeypatch.setattr(or_tools_adapter, "ORTOOLS_AVAILABLE", False)
+        hdrs = _setup(client)
+        resp = _solve(client, hdrs, solver="cp_sat")
+
+        assert resp.status_code == 200, resp.text
+        assert resp.json()["solver"] == "greedy_heuristic"
+
+    def test_greedy_with_local_search(self, client):
+        """``improve_s`` post-optimizes the greedy roster and still saves it."""
+        hdrs = _setup(client)
+        resp = _solve(client, hdrs, improve_s=0.2)
+
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        assert body["solver"] == "greedy_heuristic"
+        assert body["metrics"]["hard_violations"] == 0
+
+    def test_parallel_engine(self, client):
+        """``solver=parallel`` solves independent subproblems and saves the merged roster."""
+        hdrs = _setup(client)
+        resp = _solve(client, hdrs, solver="parallel")
+
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        assert body["solver"] == "greedy_parallel"
+        assert body["metrics"]["hard_violations"] == 0
+        assert sum(body["metrics"]["fairness"]["per_person_counts"].values()) == 4
+
+    def test_parallel_engine_by_month(self, client, monkeypatch):
+        """``by_month`` reaches the parallel engine's partitioning."""
+        from api.core.solver import decompose
+
+        calls = []
+        partition = decompose.partition_context
+
+        def spy(context, *, by_month=False):
+            calls.append(by_month)
+            return partition(context, by_month=by_month)
+
+        monkeypatch.setattr(decompose, "partition_context", spy)
+        hdrs = _setup(client)
+        resp = _solve(client, hdrs, solver="parallel", by_month=True)
+
+        assert resp.status_code == 200, resp.text
+        assert calls == [True]
+        assert resp.json()["metrics"]["hard_violations"] == 0
+
+    def test_portfolio_engine_records_variants(self, client, db):
+        """``solver=portfolio`` saves the best roster and every variant's metrics."""
+        hdrs = _setup(client)
+        resp = _solve(client, hdrs, solver="portfolio", timeout_s=30)
+
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        assert body["solver"] == "greedy_portfolio"
+        assert body["metrics"]["hard_violations"] == 0
+        stored = db.query(Solution).filter(Solution.id == body["solution_id"]).one()
+        variants = stored.metrics["portfolio"]
+        assert [v["name"] for v in variants][:2] == ["start", "most_constrained"]
+        assert all(v["completed"] for v in variants)
+
+    def test_phase_timing_is_returned_and_saved(self, client, db):
+        """Every greedy solve reports per-phase timing and counters."""
+        hdrs = _setup(client)
+        resp = _solve(client, hdrs)
+
+        assert resp.status_code == 200, resp.text
+        profile = resp.json()["metrics"]["profile"]
+        assert {"build", "filter", "score", "select", "metrics"} <= set(profile["phases_ms"])
+        assert profile["counters"]["events"] == 2
+        assert profile["counters"]["candidates_scored"] > 0
+        assert profile["capture"] is None
+        stored = db.query(Solution).filter(Solution.id == resp.json()["solution_id"]).one()
+        assert stored.metrics["profile"]["counters"] == profile["counters"]
+
+    def test_cprofile_capture_is_saved(self, client, db):
+        """``profile=cprofile`` stores the profiler report with the solution."""
+        hdrs = _setup(client)
+        resp = _solve(client, hdrs, profile="cprofile")
+
+        assert resp.status_code == 200, resp.text
+        stored = db.query(Solution).filter(Solution.id == resp.json()["solution_id"]).one()
+        assert stored.metrics["profile"]["capture_tool"] == "cprofile"
+        assert "function calls" in stored.metrics["profile"]["capture"]
+
+    @pytest.mark.parametrize(
+        "extra",
+        [
+            {"solver": "simplex"},
+            {"timeout_s": 0},
+            {"timeout_s": 601},
+            {"improve_s": -1},
+            {"improve_s": 61},
+            {"profile": "perf"},
+        ],
+    )
+    def test_invalid_engine_options_rejected(self, client, extra):
+        """Unknown engines and out-of-range budgets fail validation."""
+        hdrs = _setup(client)
+        resp = _solve(client, hdrs, **extra)
+
+        assert resp.status_code == 422
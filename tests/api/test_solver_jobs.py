@@ -0,0 +1,138 @@
+"""API tests: background solve jobs (``/solver/jobs``)."""
+
+import json
+import time
+from datetime import date, timedelta
+
+import pytest
+
+from api.models import Solution
+from api.services import solve_jobs
+from tests.api.conftest import auth_headers, seed_event, seed_org, seed_user
+
+ORG = "jobs-org"
+ADMIN_EMAIL = "admin@jobs.org"
+ADMIN_PW = "AdminPass123!"
+
+
+def _setup(client) -> dict:
+    seed_org(client, ORG, name="Jobs Org")
+    seed_user(client, ORG, ADMIN_EMAIL, "Admin", ADMIN_PW)
+    for i in range(3):
+        seed_user(client, ORG, f"vol{i}@jobs.org", f"Volunteer {i}", "VolPass123!")
+    hdrs = auth_headers(client, ADMIN_EMAIL, ADMIN_PW)
+    seed_event(client, hdrs, ORG, "evt-1", days_from_now=14, role_counts={"volunteer": 2})
+    seed_event(client, hdrs, ORG, "evt-2", days_from_now=21, role_counts={"volunteer": 2})
+    return hdrs
+
+
+def _body(**extra) -> dict:
+    return {
+        "org_id": ORG,
+        "from_date": (date.today() + timedelta(days=10)).isoformat(),
+        "to_date": (date.today() + timedelta(days=30)).isoformat(),
+        **extra,
+    }
+
+
+def _wait(job_id: str) -> None:
+    solve_jobs.get(job_id)._future.result(timeout=30)
+
+
+@pytest.mark.no_mock_auth
+class TestSolverJobs:
+    """Queue, poll, stream and cancel background solves."""
+
+    def test_job_solves_and_saves(self, client, db):
+        """The job completes with full progress and points at a saved solution."""
+        hdrs = _setup(client)
+        resp = client.post("/api/v1/solver/jobs", json=_body(), headers=hdrs)
+
+        assert resp.status_code == 202, resp.text
+        job = resp.json()
+        assert job["status"] in ("queued", "running", "completed")
+        _wait(job["job_id"])
+
+        resp = client.get(f"/api/v1/solver/jobs/{job['job_id']}", headers=hdrs)
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        assert body["status"] == "completed"
+        assert (body["events_done"], body["events_total"]) == (2, 2)
+        assert body["assignment_count"] == 2
+        assert body["finished_at"] is not None
+        stored = db.query(Solution).filter(Solution.id == body["solution_id"]).one()
+        assert stored.org_id == ORG
+
+    def test_stream_ends_with_the_final_state(self, client):
+        """The SSE stream closes after emitting the finished job."""
+        hdrs = _setup(client)
+        job_id = client.post("/api/v1/solver/jobs", json=_body(), headers=hdrs).json()["job_id"]
+        _wait(job_id)
+
+        resp = client.get(f"/api/v1/solver/jobs/{job_id}/stream", headers=hdrs)
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        events = [
+            json.loads(line[len("data: ") :])
+            for line in resp.text.splitlines()
+            if line.startswith("data: ")
+        ]
+        assert events[-1]["status"] == "completed"
+        assert events[-1]["solution_id"] is not None
+
+    def test_cancel_finished_job_is_a_no_op(self, client):
+        """Cancelling after completion returns the completed job unchanged."""
+        hdrs = _setup(client)
+        job_id = client.post("/api/v1/solver/jobs", json=_body(), headers=hdrs).json()["job_id"]
+        _wait(job_id)
+
+        resp = client.post(f"/api/v1/solver/jobs/{job_id}/cancel", headers=hdrs)
+
+        assert resp.status_code == 200, resp.text
+        assert resp.json()["status"] == "completed"
+
+    def test_cancel_running_job_saves_nothing(self, client, db, monkeypatch):
+        """A job cancelled mid-solve ends cancelled without a solution."""
+        hdrs = _setup(client)
+        reported = []
+
+        def slow_report(self, progress):
+            reported.append(progress)
+            time.sleep(0.2)
+            solve_jobs.SolveJob.check_cancelled(self)
+
+        monkeypatch.setattr(solve_jobs.SolveJob, "report", slow_report)
+        job_id = client.post("/api/v1/solver/jobs", json=_body(), headers=hdrs).json()["job_id"]
+        resp = client.post(f"/api/v1/solver/jobs/{job_id}/cancel", headers=hdrs)
+        _wait(job_id)
+
+        assert resp.status_code == 200, resp.text
+        job = solve_jobs.get(job_id)
+        assert job.status == "cancelled"
+        assert job.solution_id is None
+        assert db.query(Solution).filter(Solution.org_id == ORG).count() == 0
+
+    def test_other_org_cannot_see_job(self, client):
+        """Jobs of another org 404 like unknown ids."""
+        hdrs = _setup(client)
+        job_id = client.post("/api/v1/solver/jobs", json=_body(), headers=hdrs).json()["job_id"]
+        _wait(job_id)
+        seed_org(client, "other-org", name="Other Org")
+        seed_user(client, "other-org", "admin@other.org", "Other", ADMIN_PW)
+        other = auth_headers(client, "admin@other.org", ADMIN_PW)
+
+        assert client.get(f"/api/v1/solver/jobs/{job_id}", headers=other).status_code == 404
+        assert client.get("/api/v1/solver/jobs/unknown", headers=hdrs).status_code == 404
+        cancel = client.post(f"/api/v1/solver/jobs/{job_id}/cancel", headers=other)
+        assert cancel.status_code == 404
+
+    def test_invalid_request_rejected_before_queueing(self, client):
+        """Validation and org checks run synchronously."""
+        hdrs = _setup(client)
+
+        assert (
+            client.post("/api/v1/solver/jobs", json=_body(solver="simplex"), headers=hdrs)
+        ).status_code == 422
+        missing = client.post("/api/v1/solver/jobs", json=_body(org_id="nope"), headers=hdrs)
+        assert missing.status_code == 404
@@ -0,0 +1,117 @@
+"""API tests: solver assignments are persisted with one bulk insert.
+
+``_insert_assignments`` writes every assignee of a solution through a single
+``INSERT ... RETURNING`` executemany and hands back the new IDs in input
+order, for notifications.
+
+The slow-marked benchmark persists 20k assignments through the bulk path and
+through the old per-row ``add`` + ``flush`` loop.
+"""
+
+import time
+
+import pytest
+from sqlalchemy import event
+
+from api.core.models import Assignment as CoreAssignment
+from api.models import Assignment, Organization, Solution
+from api.routers.solver import _insert_assignments
+
+ORG = "persist-org"
+
+
+def _solution(db) -> Solution:
+    db.add(Organization(id=ORG, name="Persist Org"))
+    solution = Solution(
+        org_id=ORG, solve_ms=1.0, hard_violations=0, soft_score=0.0, health_score=100.0
+    )
+    db.add(solution)
+    db.flush()
+    return solution
+
+
+def _assignments(events: int, per_event: int) -> list[CoreAssignment]:
+    return [
+        CoreAssignment(event_id=f"e{e}", assignees=[f"p{e}-{i}" for i in range(per_event)])
+        for e in range(events)
+    ]
+
+
+def test_ids_come_back_in_input_order(db):
+    """One ID per assignee, matching the stored rows in event/assignee order."""
+    solution = _solution(db)
+    ids = _insert_assignments(db, solution.id, _assignments(3, 2))
+    db.commit()
+
+    rows = {row.id: row for row in db.query(Assignment).all()}
+    assert len(ids) == 6
+    assert [(rows[i].event_id, rows[i].person_id) for i in ids] == [
+        ("e0", "p0-0"),
+        ("e0", "p0-1"),
+        ("e1", "p1-0"),
+        ("e1", "p1-1"),
+        ("e2", "p2-0"),
+        ("e2", "p2-1"),
+    ]
+    assert all(rows[i].solution_id == solution.id for i in ids)
+    assert all(rows[i].status == "confirmed" and rows[i].assigned_at for i in ids)
+
+
+def test_bulk_insert_is_one_statement(db):
+    """Persisting a roster costs one INSERT, not one per assignee."""
+    solution = _solution(db)
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        ids = _insert_assignments(db, solution.id, _assignments(50, 4))
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert len(ids) == 200
+    assert len(statements) == 1
+    assert statements[0].startswith("INSERT INTO assignments")
+
+
+def test_empty_solution_inserts_nothing(db):
+    """No assignees, no statement."""
+    solution = _solution(db)
+
+    assert _insert_assignments(db, solution.id, _assignments(2, 0)) == []
+    assert db.query(Assignment).count() == 0
+
+
+@pytest.mark.slow
+def test_persist_20k_assignments_benchmark(db, capsys):
+    """20k assignees: bulk insert vs per-row add + flush."""
+    solution = _solution(db)
+    assignments = _assignments(2000, 10)
+
+    t0 = time.perf_counter()
+    ids = _insert_assignments(db, solution.id, assignments)
+    db.commit()
+    bulk_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for assignment in assignments:
+        for person_id in assignment.assignees:
+            row = Assignment(
+                solution_id=solution.id, event_id=assignment.event_id, person_id=person_id
+            )
+            db.add(row)
+            db.flush()
+    db.commit()
+    per_row_s = time.perf_counter() - t0
+
+    with capsys.disabled():
+        print(
+            f"\n[persist] 20000 assignments: bulk={bulk_s * 1000:.0f}ms "
+            f"per_row_flush={per_row_s * 1000:.0f}ms ({per_row_s / bulk_s:.1f}x)"
+        )
+
+    assert len(ids) == 20000
+    assert bulk_s < per_row_s
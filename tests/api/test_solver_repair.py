@@ -0,0 +1,110 @@
+"""API tests: ``POST /solver/repair`` (incremental repair of a published solution)."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from api.models import Assignment
+from tests.api.conftest import auth_headers, seed_event, seed_org, seed_user
+
+ORG = "repair-org"
+ADMIN_EMAIL = "admin@repair.org"
+ADMIN_PW = "AdminPass123!"
+FROM = date.today() + timedelta(days=10)
+TO = date.today() + timedelta(days=30)
+
+
+def _setup(client) -> dict:
+    seed_org(client, ORG, name="Repair Org")
+    seed_user(client, ORG, ADMIN_EMAIL, "Admin", ADMIN_PW)
+    for i in range(4):
+        seed_user(client, ORG, f"vol{i}@repair.org", f"Volunteer {i}", "VolPass123!")
+    hdrs = auth_headers(client, ADMIN_EMAIL, ADMIN_PW)
+    seed_event(client, hdrs, ORG, "evt-1", days_from_now=14, role_counts={"volunteer": 2})
+    seed_event(client, hdrs, ORG, "evt-2", days_from_now=21, role_counts={"volunteer": 2})
+    return hdrs
+
+
+def _window() -> dict:
+    return {"org_id": ORG, "from_date": FROM.isoformat(), "to_date": TO.isoformat()}
+
+
+def _assignees(db, solution_id: int) -> dict[str, list[str]]:
+    rows = db.query(Assignment).filter(Assignment.solution_id == solution_id).all()
+    by_event: dict[str, list[str]] = {}
+    for row in rows:
+        by_event.setdefault(row.event_id, []).append(row.person_id)
+    return by_event
+
+
+def _publish_solve(client, hdrs) -> int:
+    resp = client.post("/api/v1/solver/solve", json=_window(), headers=hdrs)
+    assert resp.status_code == 200, resp.text
+    solution_id = resp.json()["solution_id"]
+    resp = client.post(f"/api/v1/solutions/{solution_id}/publish", headers=hdrs)
+    assert resp.status_code == 200, resp.text
+    return solution_id
+
+
+@pytest.mark.no_mock_auth
+class TestSolverRepair:
+    """Repair keeps the published roster and refills only invalidated slots."""
+
+    def test_time_off_repairs_one_event(self, client, db):
+        """New time off re-picks that person's slot; the other event is untouched."""
+        hdrs = _setup(client)
+        published_id = _publish_solve(client, hdrs)
+        published = _assignees(db, published_id)
+        leaving = published["evt-1"][0]
+        day = (date.today() + timedelta(days=14)).isoformat()
+
+        resp = client.post(
+            "/api/v1/solver/repair",
+            json={
+                **_window(),
+                "patch": {"add_time_off": [{"person_id": leaving, "start": day, "end": day}]},
+            },
+            headers=hdrs,
+        )
+
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        assert body["repaired_events"] == ["evt-1"]
+        assert body["solution_id"] != published_id
+        assert body["metrics"]["hard_violations"] == 0
+        repaired = _assignees(db, body["solution_id"])
+        assert leaving not in repaired["evt-1"]
+        assert len(repaired["evt-1"]) == 2
+        assert sorted(repaired["evt-2"]) == sorted(published["evt-2"])
+
+    def test_removed_person_and_explicit_baseline(self, client, db):
+        """``solution_id`` picks the baseline; removed people's slots are refilled."""
+        hdrs = _setup(client)
+        resp = client.post("/api/v1/solver/solve", json=_window(), headers=hdrs)
+        baseline_id = resp.json()["solution_id"]
+        leaving = _assignees(db, baseline_id)["evt-2"][0]
+
+        resp = client.post(
+            "/api/v1/solver/repair",
+            json={
+                **_window(),
+                "solution_id": baseline_id,
+                "patch": {"remove_people": [leaving]},
+            },
+            headers=hdrs,
+        )
+
+        assert resp.status_code == 200, resp.text
+        repaired = _assignees(db, resp.json()["solution_id"])
+        assert all(leaving not in people for people in repaired.values())
+
+    def test_requires_a_baseline(self, client):
+        """Without a published solution (or a valid ``solution_id``) repair is a 404."""
+        hdrs = _setup(client)
+
+        resp = client.post("/api/v1/solver/repair", json=_window(), headers=hdrs)
+        assert resp.status_code == 404
+        resp = client.post(
+            "/api/v1/solver/repair", json={**_window(), "solution_id": 99999}, headers=hdrs
+        )
+        assert resp.status_code == 404
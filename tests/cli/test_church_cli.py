@@ -145,6 +145,21 @@ class TestChurchCLI:
         solution = read_json(out / "solution.json")
         assert solution["assignment_count"] > 0
 
+    def test_solve_ndjson_bundle(self, tmp_path):
+        """--ndjson saves the full bundle: a header line, then one line per assignment."""
+        ws = tmp_path / "church"
+        self._build_church_workspace(ws)
+
+        run_cli("solve", str(ws), "--ndjson")
+
+        lines = (ws / "output" / "solution.ndjson").read_text().splitlines()
+        header = json.loads(lines[0])
+        assert set(header) == {"meta", "metrics", "violations"}
+        assert len(lines) == 5  # header + one assignment per event
+        assert {json.loads(line)["event_id"] for line in lines[1:]} == {
+            f"worship-wk{week}" for week in range(4)
+        }
+
     # ------------------------------------------------------------------
     # Test: fairness across weeks
     # ------------------------------------------------------------------
@@ -0,0 +1,191 @@
+"""Offline solver benchmarks over seeded synthetic orgs.
+
+Runs ``api/core/solver`` engines against ``synthetic_org.generate_org`` at
+each scale and records, per (scale, engine):
+
+- ``solve_ms``: best wall time of ``build_model`` + ``solve`` over
+  ``--repeat`` runs on a fresh solver
+- ``peak_mb``: peak traced allocation of one extra run (tracemalloc slows
+  the run down, so it is never the timed one)
+- ``hard_violations`` and ``fairness_stdev`` from the solution metrics
+- ``phases_ms`` from ``meta.profile`` when the engine reports it
+
+Usage::
+
+    python -m tests.performance.solver_bench --scales 100,1k --out solver-bench.json
+    python -m tests.performance.solver_bench --baseline main.json --fail-on-regression
+
+With ``--baseline`` the run is compared against an earlier report and every
+regression is printed (see ``compare``); CI uploads the report as an
+artifact so runs can be diffed across commits.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import tracemalloc
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from api.core.solver.factory import GREEDY_ENGINE, SOLVER_ENGINES, create_solver
+from tests.performance.synthetic_org import SCALES, generate_org
+
+# A case regresses when solve time or peak memory grows past this ratio of
+# the baseline (loose, as shared CI runners are noisy) ...
+TIME_TOLERANCE = 1.5
+# ... or fairness stdev grows by more than this, or hard violations grow at all.
+FAIRNESS_TOLERANCE = 0.1
+
+
+def run_case(
+    scale: str, engine: str = GREEDY_ENGINE, seed: int = 0, repeat: int = 3, memory: bool = True
+) -> dict[str, Any]:
+    """Benchmark one engine on one synthetic org; returns its result record."""
+    ctx = generate_org(scale, seed)
+    best_ms = float("inf")
+    for _ in range(repeat):
+        solver = create_solver(engine)
+        start = perf_counter()
+        solver.build_model(ctx)
+        solution = solver.solve()
+        best_ms = min(best_ms, (perf_counter() - start) * 1000)
+
+    peak_mb = None
+    if memory:
+        tracemalloc.start()
+        try:
+            solver = create_solver(engine)
+            solver.build_model(ctx)
+            solver.solve()
+            peak_mb = tracemalloc.get_traced_memory()[1] / 2**20
+        finally:
+            tracemalloc.stop()
+
+    profile = solution.meta.profile
+    return {
+        "scale": scale,
+        "engine": engine,
+        "seed": seed,
+        "people": len(ctx.people),
+        "events": len(ctx.events),
+        "assignments": len(solution.assignments),
+        "solve_ms": round(best_ms, 2),
+        "peak_mb": None if peak_mb is None else round(peak_mb, 2),
+        "hard_violations": solution.metrics.hard_violations,
+        "fairness_stdev": round(solution.metrics.fairness.stdev, 4),
+        "health_score": solution.metrics.health_score,
+        "phases_ms": profile.phases_ms if profile else None,
+    }
+
+
+def run(
+    scales: list[str],
+    engines: list[str],
+    seed: int = 0,
+    repeat: int = 3,
+    memory: bool = True,
+) -> dict[str, Any]:
+    """Benchmark every (scale, engine) pair; returns the full report."""
+    return {
+        "generated_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [
+            run_case(scale, engine, seed=seed, repeat=repeat, memory=memory)
+            for scale in scales
+            for engine in engines
+        ],
+    }
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], tolerance: float = TIME_TOLERANCE
+) -> list[str]:
+    """One message per regression of ``current`` against ``baseline``.
+
+    Cases missing from either report, or run with a different seed, are
+    not compared.
+    """
+    before = {(r["scale"], r["engine"], r["seed"]): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        old = before.get((result["scale"], result["engine"], result["seed"]))
+        if old is None:
+            continue
+        case = f"{result['scale']}/{result['engine']}"
+        for metric in ("solve_ms", "peak_mb"):
+            if old[metric] and result[metric] and result[metric] > old[metric] * tolerance:
+                regressions.append(f"{case}: {metric} {old[metric]} -> {result[metric]}")
+        if result["hard_violations"] > old["hard_violations"]:
+            regressions.append(
+                f"{case}: hard_violations {old['hard_violations']} -> {result['hard_violations']}"
+            )
+        if result["fairness_stdev"] > old["fairness_stdev"] + FAIRNESS_TOLERANCE:
+            regressions.append(
+                f"{case}: fairness_stdev {old['fairness_stdev']} -> {result['fairness_stdev']}"
+            )
+    return regressions
+
+
+def _format_row(result: dict[str, Any]) -> str:
+    peak = "-" if result["peak_mb"] is None else f"{result['peak_mb']:.1f}MB"
+    return (
+        f"{result['scale']:>4} {result['engine']:<9} people={result['people']:<6} "
+        f"events={result['events']:<5} solve={result['solve_ms']:.0f}ms peak={peak} "
+        f"hard={result['hard_violations']} fairness_stdev={result['fairness_stdev']:.3f}"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the solver on synthetic orgs.")
+    parser.add_argument(
+        "--scales", default="100,1k", help=f"Comma-separated scales ({', '.join(SCALES)})"
+    )
+    parser.add_argument("--engines", default=GREEDY_ENGINE, help="Comma-separated engines")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (best kept)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc run")
+    parser.add_argument("--out", type=Path, help="Write the JSON report here")
+    parser.add_argument("--baseline", type=Path, help="Earlier report to compare against")
+    parser.add_argument(
+        "--tolerance", type=float, default=TIME_TOLERANCE, help="Allowed time/memory ratio"
+    )
+    parser.add_argument(
+        "--fail-on-regression", action="store_true", help="Exit 1 when a case regresses"
+    )
+    args = parser.parse_args(argv)
+
+    scales = args.scales.split(",")
+    engines = args.engines.split(",")
+    for scale in scales:
+        if scale not in SCALES:
+            parser.error(f"unknown scale '{scale}'")
+    for engine in engines:
+        if engine not in SOLVER_ENGINES:
+            parser.error(f"unknown engine '{engine}'")
+
+    report = run(scales, engines, seed=args.seed, repeat=args.repeat, memory=not args.no_memory)
+    for result in report["results"]:
+        print(_format_row(result))
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    if args.baseline:
+        regressions = compare(
+            json.loads(args.baseline.read_text(encoding="utf-8")), report, args.tolerance
+        )
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions and args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
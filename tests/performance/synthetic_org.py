@@ -0,0 +1,199 @@
+"""Seeded synthetic orgs for offline solver benchmarks.
+
+``generate_org(scale, seed)`` builds a ``SolveContext`` shaped like a
+multi-campus church roster, without a database:
+
+- campuses of ``CAMPUS_SIZE`` people each; roles are campus-scoped
+  (``c3:usher``) so every role has a realistic holder count at any scale
+- each person holds 1-3 roles drawn from ``ROLE_WEIGHTS`` (ushers are
+  common, sound techs rare)
+- recurring weekly events per campus (``WEEKLY_EVENTS``) over
+  ``HORIZON_WEEKS`` weeks
+- availability: vacations, one-off exception dates and monthly rrule
+  blocks, the rrules expanded over the window the way the API loader does
+- a constraint set covering every action the greedy solver evaluates
+  (caps, min gap, cooldown, recent rotation, long-weekend forbid)
+
+The same ``(scale, seed)`` always yields the same org, so runs on
+different commits compare like for like.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import date, datetime, time, timedelta
+
+from api.core.models import (
+    Availability,
+    ConstraintAction,
+    ConstraintBinding,
+    Event,
+    Holiday,
+    Org,
+    OrgDefaults,
+    Person,
+    PredicateNode,
+    RequiredRole,
+    VacationPeriod,
+)
+from api.core.solver.adapter import SolveContext
+from api.core.timeutils import parse_rrule
+
+# Scale name -> number of people.
+SCALES = {"100": 100, "1k": 1_000, "10k": 10_000}
+
+CAMPUS_SIZE = 100
+HORIZON_WEEKS = 12
+# First Sunday of the benchmark window.
+START = date(2026, 1, 4)
+
+# Relative frequency of each role among people's roles.
+ROLE_WEIGHTS = {
+    "usher": 8,
+    "greeter": 6,
+    "musician": 4,
+    "teacher": 4,
+    "childcare": 3,
+    "sound_tech": 1,
+}
+
+# (event type, weekday offset from Sunday, hour, duration h, role counts)
+WEEKLY_EVENTS = (
+    ("service", 0, 9, 2, {"usher": 4, "greeter": 2, "musician": 3, "sound_tech": 1}),
+    ("service", 0, 11, 2, {"usher": 4, "greeter": 2, "musician": 3, "sound_tech": 1}),
+    ("sunday_school", 0, 10, 1, {"teacher": 3, "childcare": 2}),
+    ("rehearsal", 1, 19, 2, {"musician": 3, "sound_tech": 1}),
+)
+
+HOLIDAYS = (
+    Holiday(date=date(2026, 1, 19), label="MLK Day", is_long_weekend=True),
+    Holiday(date=date(2026, 2, 16), label="Presidents' Day", is_long_weekend=True),
+    Holiday(date=date(2026, 3, 1), label="Founders Sunday"),
+)
+
+
+def constraint_set() -> list[ConstraintBinding]:
+    """The bindings every synthetic org runs with."""
+    return [
+        ConstraintBinding(
+            key="monthly_cap",
+            scope="person",
+            applies_to=["service", "sunday_school", "rehearsal"],
+            then=ConstraintAction(enforce_cap={"period": "P1M", "max_count": 6}),
+            severity="hard",
+        ),
+        ConstraintBinding(
+            key="min_gap",
+            scope="person",
+            applies_to=["service", "rehearsal"],
+            then=ConstraintAction(enforce_min_gap_hours=1),
+            severity="hard",
+        ),
+        ConstraintBinding(
+            key="cooldown",
+            scope="person",
+            applies_to=["service"],
+            then=ConstraintAction(penalize_if={"type": "cooldown", "cooldown_days": 7}),
+            severity="soft",
+            weight=5,
+        ),
+        ConstraintBinding(
+            key="recent_rotation",
+            scope="person",
+            applies_to=["sunday_school"],
+            then=ConstraintAction(penalize_if={"type": "recent_rotation", "lookback_days": 14}),
+            severity="soft",
+            weight=3,
+        ),
+        ConstraintBinding(
+            key="no_rehearsal_long_weekend",
+            scope="event",
+            applies_to=["rehearsal"],
+            when=PredicateNode(predicate="is_long_weekend"),
+            then=ConstraintAction(forbid_if="is_friday_or_monday"),
+            severity="hard",
+        ),
+    ]
+
+
+def generate_org(scale: str | int, seed: int = 0) -> SolveContext:
+    """A reproducible synthetic org with ``scale`` people (a ``SCALES`` key or a count)."""
+    n_people = SCALES[scale] if isinstance(scale, str) else scale
+    rng = random.Random(seed)
+    from_date = START
+    to_date = START + timedelta(weeks=HORIZON_WEEKS) - timedelta(days=1)
+    role_names = list(ROLE_WEIGHTS)
+    role_weights = list(ROLE_WEIGHTS.values())
+
+    people: list[Person] = []
+    for i in range(n_people):
+        campus = i // CAMPUS_SIZE
+        roles: set[str] = set()
+        while len(roles) < rng.choice((1, 1, 2, 2, 3)):
+            roles.add(rng.choices(role_names, weights=role_weights)[0])
+        people.append(
+            Person(id=f"p{i}", name=f"Person {i}", roles=[f"c{campus}:{r}" for r in sorted(roles)])
+        )
+
+    availability: list[Availability] = []
+    window_start = datetime.combine(from_date, time.min)
+    window_end = datetime.combine(to_date, time.max)
+    for person in people:
+        vacations = []
+        if rng.random() < 0.2:
+            start = from_date + timedelta(days=rng.randint(0, HORIZON_WEEKS * 7 - 14))
+            vacations.append(
+                VacationPeriod(start=start, end=start + timedelta(days=rng.choice((6, 13))))
+            )
+        exceptions = []
+        if rng.random() < 0.3:
+            exceptions = sorted(
+                {
+                    from_date + timedelta(days=rng.randint(0, HORIZON_WEEKS * 7 - 1))
+                    for _ in range(rng.randint(1, 3))
+                }
+            )
+        rrule = None
+        if rng.random() < 0.1:
+            rrule = f"FREQ=MONTHLY;BYDAY={rng.choice(('1SU', '2SU', '3SU', '4SU'))}"
+            exceptions += [occ.date() for occ in parse_rrule(rrule, window_start, window_end)]
+        if vacations or exceptions:
+            availability.append(
+                Availability(
+                    person_id=person.id, rrule=rrule, exceptions=exceptions, vacations=vacations
+                )
+            )
+
+    events: list[Event] = []
+    for campus in range((n_people + CAMPUS_SIZE - 1) // CAMPUS_SIZE):
+        for week in range(HORIZON_WEEKS):
+            sunday = START + timedelta(weeks=week)
+            for slot, (event_type, offset, hour, hours, counts) in enumerate(WEEKLY_EVENTS):
+                start = datetime.combine(sunday + timedelta(days=offset), time(hour))
+                events.append(
+                    Event(
+                        id=f"c{campus}-w{week}-{slot}",
+                        type=event_type,
+                        start=start,
+                        end=start + timedelta(hours=hours),
+                        required_roles=[
+                            RequiredRole(role=f"c{campus}:{role}", count=count)
+                            for role, count in counts.items()
+                        ],
+                    )
+                )
+
+    return SolveContext(
+        org=Org(org_id=f"synthetic-{scale}-{seed}", region="US", defaults=OrgDefaults()),
+        people=people,
+        teams=[],
+        resources=[],
+        events=events,
+        constraints=constraint_set(),
+        availability=availability,
+        holidays=list(HOLIDAYS),
+        from_date=from_date,
+        to_date=to_date,
+        mode="strict",
+        change_min=False,
+    )
@@ -0,0 +1,111 @@
+"""Offline solver benchmarks on seeded synthetic orgs.
+
+The fast tests pin down the generator (same seed, same org) and the
+regression comparison. The slow-marked ones run the benchmark at the
+100 and 1k scales and print the tracked metrics; the full matrix, 10k
+included, runs through ``python -m tests.performance.solver_bench``.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from tests.performance import solver_bench
+from tests.performance.synthetic_org import CAMPUS_SIZE, HORIZON_WEEKS, WEEKLY_EVENTS, generate_org
+
+
+def test_generator_is_reproducible():
+    first = generate_org("100", seed=7)
+    second = generate_org("100", seed=7)
+
+    assert [p.model_dump() for p in first.people] == [p.model_dump() for p in second.people]
+    assert [a.model_dump() for a in first.availability] == [
+        a.model_dump() for a in second.availability
+    ]
+    assert [p.roles for p in generate_org("100", seed=8).people] != [p.roles for p in first.people]
+
+
+def test_generator_shape():
+    ctx = generate_org("1k", seed=0)
+
+    assert len(ctx.people) == 1_000
+    campuses = 1_000 // CAMPUS_SIZE
+    assert len(ctx.events) == campuses * HORIZON_WEEKS * len(WEEKLY_EVENTS)
+    assert all(1 <= len(p.roles) <= 3 for p in ctx.people)
+    # Roles are campus-scoped, so events only draw on their own campus.
+    assert {r.role.split(":")[0] for r in ctx.events[0].required_roles} == {"c0"}
+    # Ushers are common and sound techs rare.
+    roles = [r.split(":")[1] for p in ctx.people for r in p.roles]
+    assert roles.count("usher") > 3 * roles.count("sound_tech")
+    assert any(a.vacations for a in ctx.availability)
+    assert any(a.rrule and a.exceptions for a in ctx.availability)
+    assert {c.then.model_dump(exclude_none=True).popitem()[0] for c in ctx.constraints} >= {
+        "enforce_cap",
+        "enforce_min_gap_hours",
+        "penalize_if",
+        "forbid_if",
+    }
+
+
+def _report(**overrides):
+    result = {
+        "scale": "100",
+        "engine": "greedy",
+        "seed": 0,
+        "solve_ms": 100.0,
+        "peak_mb": 10.0,
+        "hard_violations": 2,
+        "fairness_stdev": 0.5,
+    }
+    return {"results": [{**result, **overrides}]}
+
+
+def test_compare_flags_regressions():
+    baseline = _report()
+
+    assert solver_bench.compare(baseline, _report(solve_ms=140.0)) == []
+    assert solver_bench.compare(baseline, _report(solve_ms=160.0)) == [
+        "100/greedy: solve_ms 100.0 -> 160.0"
+    ]
+    assert solver_bench.compare(baseline, _report(peak_mb=None)) == []
+    assert solver_bench.compare(baseline, _report(hard_violations=3)) == [
+        "100/greedy: hard_violations 2 -> 3"
+    ]
+    assert solver_bench.compare(baseline, _report(fairness_stdev=0.7)) == [
+        "100/greedy: fairness_stdev 0.5 -> 0.7"
+    ]
+    # Different seeds are different orgs; nothing to compare.
+    assert solver_bench.compare(baseline, _report(seed=1, solve_ms=999.0)) == []
+
+
+def test_main_writes_report(tmp_path):
+    out = tmp_path / "bench.json"
+
+    assert solver_bench.main(["--scales", "100", "--repeat", "1", "--out", str(out)]) == 0
+    report = json.loads(out.read_text())
+    (result,) = report["results"]
+    assert result["people"] == 100
+    assert 0 < result["assignments"] <= result["events"]
+    assert result["peak_mb"] > 0
+    assert set(result["phases_ms"]) >= {"build", "filter", "score", "select", "metrics"}
+
+    slower = _report(solve_ms=result["solve_ms"] / 10)
+    (tmp_path / "base.json").write_text(json.dumps(slower))
+    args = ["--scales", "100", "--repeat", "1", "--no-memory", "--baseline"]
+    assert solver_bench.main([*args, str(tmp_path / "base.json"), "--fail-on-regression"]) == 1
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("scale", ["100", "1k"])
+def test_solver_benchmark(scale, capsys):
+    """Bench the greedy solver: all but the long-weekend rehearsals get staffed."""
+    result = solver_bench.run_case(scale)
+
+    with capsys.disabled():
+        print(f"\n{solver_bench._format_row(result)}")
+    campuses = result["people"] // CAMPUS_SIZE
+    # Two Monday holidays fall in the window; those rehearsals are forbidden.
+    assert result["assignments"] >= result["events"] - 2 * campuses
+    assert result["fairness_stdev"] < 2
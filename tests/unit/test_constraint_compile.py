@@ -0,0 +1,161 @@
+"""Unit tests: constraint bindings compile into reusable evaluation plans.
+
+``compile_constraint`` resolves predicate names, day-of-week names and the
+action's checks once; the plan memoizes ``when`` results per event date and
+cap windows per date. Plans must return exactly what the tree walk did —
+same satisfied flag, penalty and reason.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from api.core.constraints.dsl import EvalContext
+from api.core.constraints.eval import compile_constraint, compile_predicate, evaluate_constraint
+from api.core.models import ConstraintAction, ConstraintBinding, Event, Person, PredicateNode
+
+MONDAY = date(2026, 6, 1)
+
+
+def _event(on: date) -> Event:
+    start = datetime.combine(on, datetime.min.time().replace(hour=10))
+    return Event(id=f"e-{on}", type="service", start=start, end=start + timedelta(hours=1))
+
+
+def _ctx(on: date, **kwargs) -> EvalContext:
+    return EvalContext(event=_event(on), date=on, **kwargs)
+
+
+@pytest.mark.parametrize("day", ["monday", "Monday", "MONDAY"])
+def test_day_of_week_is_case_insensitive(day):
+    """Day names resolve to a weekday int regardless of case."""
+    predicate = compile_predicate(PredicateNode(predicate="is_day_of_week", params={"day": day}))
+
+    assert predicate(_ctx(MONDAY)) is True
+    assert predicate(_ctx(MONDAY + timedelta(days=1))) is False
+
+
+def test_day_of_week_matches_strftime_for_every_weekday():
+    """``weekday()`` lookup agrees with the old ``strftime('%A')`` comparison."""
+    for offset in range(7):
+        on = MONDAY + timedelta(days=offset)
+        name = on.strftime("%A")
+        predicate = compile_predicate(
+            PredicateNode(predicate="is_day_of_week", params={"day": name})
+        )
+        assert predicate(_ctx(on)) is True
+        assert predicate(_ctx(on + timedelta(days=1))) is False
+
+
+def test_unknown_predicates_and_days_never_match():
+    """Unrecognised predicate names and day names compile to a constant False."""
+    assert compile_predicate(PredicateNode(predicate="nope"))(_ctx(MONDAY)) is False
+    node = PredicateNode(predicate="is_day_of_week", params={"day": "Funday"})
+    assert compile_predicate(node)(_ctx(MONDAY)) is False
+
+
+def test_any_all_trees_and_long_weekend():
+    """Nested any/all trees combine leaf results; long weekends read the holiday map."""
+    node = PredicateNode(
+        **{
+            "any": [
+                {"predicate": "is_long_weekend"},
+                {
+                    "all": [
+                        {"predicate": "is_friday_or_monday"},
+                        {"predicate": "is_day_of_week", "params": {"day": "friday"}},
+                    ]
+                },
+            ]
+        }
+    )
+    predicate = compile_predicate(node)
+    friday = MONDAY + timedelta(days=4)
+    saturday = MONDAY + timedelta(days=5)
+
+    assert predicate(_ctx(friday)) is True
+    assert predicate(_ctx(MONDAY)) is False
+    assert predicate(_ctx(saturday, holidays={saturday: True})) is True
+    assert predicate(_ctx(saturday, holidays={saturday: False})) is False
+
+
+def test_when_clause_is_memoized_per_date():
+    """A plan evaluates its ``when`` tree once per event date."""
+    binding = ConstraintBinding(
+        key="no_fri_mon",
+        scope="event",
+        applies_to=["service"],
+        severity="hard",
+        when=PredicateNode(predicate="is_long_weekend"),
+        then=ConstraintAction(forbid_if="is_friday_or_monday"),
+    )
+    plan = compile_constraint(binding)
+    calls = []
+    inner = plan._when
+    plan._when = lambda ctx: calls.append(ctx.date) or inner(ctx)
+
+    friday = MONDAY + timedelta(days=4)
+    holidays = {friday: True}
+    for _ in range(3):
+        result = plan(_ctx(friday, holidays=holidays))
+        assert result.satisfied is False
+        assert result.reason == f"Event on {friday} forbidden: is_friday_or_monday"
+    assert plan(_ctx(MONDAY, holidays=holidays)).reason == "when clause not matched"
+
+    assert calls == [friday, MONDAY]
+
+
+def test_plan_results_match_for_each_action():
+    """Penalties and reasons for cap, gap and recency checks keep their wording."""
+    person = Person(id="p1", name="P1", roles=["volunteer"])
+    history = [_event(MONDAY - timedelta(days=2)), _event(MONDAY - timedelta(days=1))]
+    ctx = _ctx(MONDAY, person=person, person_assignments={"p1": history})
+
+    cases = [
+        (
+            ConstraintAction(enforce_cap={"period": "P7D", "max_count": 2}),
+            "hard",
+            None,
+            (False, 1000.0, "Cap 2 reached in period P7D"),
+        ),
+        (
+            ConstraintAction(enforce_min_gap_hours=48),
+            "soft",
+            5,
+            (False, 5.0, "Min gap 48h violated"),
+        ),
+        (
+            ConstraintAction(penalize_if={"type": "cooldown", "cooldown_days": 4}),
+            "soft",
+            20,
+            (False, 15.0, "Cooldown violation: 1 < 4 days"),
+        ),
+        (
+            ConstraintAction(penalize_if={"type": "recent_rotation", "lookback_days": 2}),
+            "soft",
+            None,
+            (False, 5.0, "Recent rotation: 1 < 2 days"),
+        ),
+        (
+            ConstraintAction(penalize_if={"type": "cooldown", "cooldown_days": 1}),
+            "soft",
+            20,
+            (True, 0.0, ""),
+        ),
+    ]
+    for action, severity, weight, expected in cases:
+        binding = ConstraintBinding(
+            key="k",
+            scope="person",
+            applies_to=["service"],
+            severity=severity,
+            weight=weight,
+            then=action,
+        )
+        plan = compile_constraint(binding)
+        for _ in range(2):  # second call hits the per-date caches
+            result = plan(ctx)
+            assert (result.satisfied, result.penalty, result.reason) == expected
+        assert evaluate_constraint(binding, ctx) == plan(ctx)
@@ -0,0 +1,107 @@
+"""RFC 5545 line writer: escaping, folding and VEVENT layout."""
+
+from datetime import datetime, timedelta, timezone
+
+from api.core.ics_writer import (
+    CALENDAR_FOOTER,
+    calendar_header,
+    content_line,
+    escape_text,
+    format_datetime,
+    vevent,
+    write_calendar_ics,
+)
+from api.core.models import Assignment, Event, Person, SolutionBundle
+
+
+def _unfold(text: str) -> str:
+    return text.replace("\r\n ", "")
+
+
+def test_escape_text():
+    assert escape_text("a\\b;c,d\ne\r\nf") == "a\\\\b\\;c\\,d\\ne\\nf"
+
+
+def test_short_line_is_not_folded():
+    assert content_line("SUMMARY", "Service") == "SUMMARY:Service\r\n"
+
+
+def test_long_ascii_line_folds_at_75_octets():
+    line = content_line("DESCRIPTION", "x" * 200)
+
+    physical = line.split("\r\n")[:-1]
+    assert [len(p) for p in physical] == [75, 75, 64]
+    assert all(p.startswith(" ") for p in physical[1:])
+    assert _unfold(line) == "DESCRIPTION:" + "x" * 200 + "\r\n"
+
+
+def test_fold_never_splits_a_multibyte_character():
+    value = "é" * 50 + "日本" * 20
+    line = content_line("DESCRIPTION", value)
+
+    physical = line.split("\r\n")[:-1]
+    assert len(physical) > 1
+    assert all(len(p.encode()) <= 75 for p in physical)
+    assert _unfold(line) == f"DESCRIPTION:{value}\r\n"
+
+
+def test_format_datetime_converts_to_utc():
+    assert format_datetime(datetime(2026, 6, 7, 9, 30)) == "20260607T093000Z"
+    east = timezone(timedelta(hours=2))
+    assert format_datetime(datetime(2026, 6, 7, 9, 30, tzinfo=east)) == "20260607T073000Z"
+
+
+def test_vevent_layout():
+    start = datetime(2026, 6, 7, 9)
+
+    text = vevent(
+        uid="e1@rostio.app",
+        dtstamp=datetime(2026, 6, 1),
+        start=start,
+        end=start + timedelta(hours=2),
+        summary="Service; main",
+        description="Assigned: A, B",
+    )
+
+    assert text.split("\r\n") == [
+        "BEGIN:VEVENT",
+        "UID:e1@rostio.app",
+        "DTSTAMP:20260601T000000Z",
+        "DTSTART:20260607T090000Z",
+        "DTEND:20260607T110000Z",
+        "SUMMARY:Service\\; main",
+        "DESCRIPTION:Assigned: A\\, B",
+        "STATUS:CONFIRMED",
+        "END:VEVENT",
+        "",
+    ]
+
+
+def test_calendar_header_and_footer():
+    text = calendar_header("Team, A") + CALENDAR_FOOTER
+
+    assert text.startswith("BEGIN:VCALENDAR\r\nPRODID:-//Rostio//Calendar Export//EN\r\n")
+    assert "X-WR-CALNAME:Team\\, A\r\n" in text
+    assert text.endswith("END:VCALENDAR\r\n")
+
+
+def test_write_calendar_ics_filters_by_person(tmp_path):
+    start = datetime(2026, 6, 7, 9)
+    events = [
+        Event(id=f"e{i}", type="service", start=start, end=start + timedelta(hours=1))
+        for i in range(2)
+    ]
+    people = [Person(id="p1", name="Ann", roles=["usher"])]
+    solution = SolutionBundle.model_construct(
+        assignments=[
+            Assignment(event_id="e0", assignees=["p1"]),
+            Assignment(event_id="e1", assignees=["p2"]),
+        ]
+    )
+    out = tmp_path / "cal" / "calendar.ics"
+
+    write_calendar_ics(solution, events, people, out, scope="person", scope_id="p1")
+
+    text = out.read_bytes().decode()
+    assert text.count("BEGIN:VEVENT") == 1
+    assert "DESCRIPTION:Assigned: Ann\r\n" in text
@@ -0,0 +1,177 @@
+"""Unit tests: ``PersonTimeline`` answers the period/gap/recency predicates.
+
+``count_assignments_in_period``, ``min_gap_hours_satisfied`` and
+``last_assignment_days_ago`` used to scan (or sort) the person's whole
+assignment list per call. When ``EvalContext.person_timelines`` is set they
+query a sorted timeline instead — bisect for period counts, running
+aggregates for the min gap and the last end. Results must match the list
+scan exactly.
+
+The slow-marked micro-benchmark times both paths at 500 assignments per person.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from api.core.constraints.dsl import EvalContext
+from api.core.constraints.predicates import (
+    count_assignments_in_period,
+    last_assignment_days_ago,
+    min_gap_hours_satisfied,
+)
+from api.core.constraints.timeline import PersonTimeline
+from api.core.models import Event
+
+
+def _event(eid: str, start: datetime, hours: float = 1.0) -> Event:
+    return Event(id=eid, type="service", start=start, end=start + timedelta(hours=hours))
+
+
+def _random_events(rng: random.Random, n: int, base: datetime) -> list[Event]:
+    return [
+        _event(
+            f"e{i}",
+            base + timedelta(hours=rng.randint(0, 24 * 365)),
+            hours=rng.choice([0.5, 1, 2, 6]),
+        )
+        for i in range(n)
+    ]
+
+
+def _contexts(events: list[Event]) -> tuple[EvalContext, EvalContext]:
+    scan = EvalContext(person_assignments={"p1": events})
+    indexed = EvalContext(person_timelines={"p1": PersonTimeline(events)})
+    return scan, indexed
+
+
+def test_events_kept_in_start_order_with_stable_ties():
+    """Out-of-order inserts come back sorted; equal starts keep insertion order."""
+    base = datetime(2026, 6, 1, 10)
+    timeline = PersonTimeline()
+    for event in [
+        _event("late", base + timedelta(days=2)),
+        _event("tie_a", base),
+        _event("early", base - timedelta(days=1)),
+        _event("tie_b", base, hours=3),
+    ]:
+        timeline.add(event)
+
+    assert [e.id for e in timeline.events] == ["early", "tie_a", "tie_b", "late"]
+    assert len(timeline) == 4
+
+
+def test_predicates_match_list_scan():
+    """Random timelines give identical counts, gap checks and recency as the scan."""
+    rng = random.Random(11)
+    base = datetime(2026, 1, 1)
+    for _ in range(25):
+        events = _random_events(rng, rng.randint(0, 60), base)
+        scan, indexed = _contexts(events)
+        for _ in range(20):
+            lo = base.date() + timedelta(days=rng.randint(-10, 365))
+            hi = lo + timedelta(days=rng.randint(0, 60))
+            assert count_assignments_in_period(indexed, "p1", lo, hi) == (
+                count_assignments_in_period(scan, "p1", lo, hi)
+            )
+        for min_hours in (-5, 0, 1, 12, 48):
+            assert min_gap_hours_satisfied(indexed, "p1", min_hours) == (
+                min_gap_hours_satisfied(scan, "p1", min_hours)
+            )
+        on = base.date() + timedelta(days=400)
+        assert last_assignment_days_ago(indexed, "p1", on) == (
+            last_assignment_days_ago(scan, "p1", on)
+        )
+
+
+def test_unknown_person_defaults():
+    """A person without a timeline has no assignments, no gaps and no recency."""
+    ctx = EvalContext(person_timelines={})
+    today = date(2026, 6, 1)
+
+    assert count_assignments_in_period(ctx, "ghost", today, today) == 0
+    assert min_gap_hours_satisfied(ctx, "ghost", 24) is True
+    assert last_assignment_days_ago(ctx, "ghost", today) is None
+
+
+def test_min_gap_tracks_overlaps_and_inserts_between_neighbours():
+    """Inserting between two assignments can only shrink the tracked minimum gap."""
+    base = datetime(2026, 6, 1, 9)
+    timeline = PersonTimeline([_event("a", base), _event("c", base + timedelta(hours=24))])
+    assert timeline.min_gap == timedelta(hours=23)
+
+    timeline.add(_event("b", base + timedelta(hours=4)))
+    assert timeline.min_gap == timedelta(hours=3)
+
+    timeline.add(_event("overlap", base + timedelta(minutes=30)))
+    assert timeline.min_gap < timedelta(0)
+
+
+def test_remove_rebuilds_aggregates():
+    """Removing an assignment widens the min gap and rolls back the last end."""
+    base = datetime(2026, 6, 1, 9)
+    timeline = PersonTimeline(
+        [
+            _event("a", base),
+            _event("b", base + timedelta(hours=2)),
+            _event("c", base + timedelta(days=3)),
+        ]
+    )
+    assert timeline.min_gap == timedelta(hours=1)
+
+    assert timeline.remove("b") is True
+    assert timeline.remove("missing") is False
+    assert [e.id for e in timeline.events] == ["a", "c"]
+    assert timeline.min_gap == timedelta(days=3, hours=-1)
+    assert timeline.count_in_period(base.date(), base.date()) == 1
+
+    timeline.remove("c")
+    assert timeline.last_end == base + timedelta(hours=1)
+    assert timeline.min_gap is None
+
+
+@pytest.mark.slow
+def test_timeline_predicate_speedup_500_assignments(capsys):
+    """Bench the three predicates: list scan vs timeline at 500 assignments per person."""
+    rng = random.Random(3)
+    base = datetime(2026, 1, 1)
+    people = [f"p{i}" for i in range(50)]
+    per_person = {pid: _random_events(rng, 500, base) for pid in people}
+    scan = EvalContext(person_assignments=per_person)
+    indexed = EvalContext(
+        person_timelines={pid: PersonTimeline(e) for pid, e in per_person.items()}
+    )
+
+    queries = []
+    for _ in range(2_000):
+        lo = base.date() + timedelta(days=rng.randint(0, 365))
+        queries.append((rng.choice(people), lo, lo + timedelta(days=30)))
+
+    def run(ctx: EvalContext) -> tuple[float, list]:
+        t0 = time.perf_counter()
+        out = [
+            (
+                count_assignments_in_period(ctx, pid, lo, hi),
+                min_gap_hours_satisfied(ctx, pid, 12),
+                last_assignment_days_ago(ctx, pid, hi),
+            )
+            for pid, lo, hi in queries
+        ]
+        return time.perf_counter() - t0, out
+
+    scan_s, scan_out = run(scan)
+    indexed_s, indexed_out = run(indexed)
+
+    with capsys.disabled():
+        print(
+            f"\n[person-timeline] assignments/person=500 queries={len(queries)} "
+            f"scan={scan_s * 1000:.0f}ms timeline={indexed_s * 1000:.1f}ms "
+            f"speedup~{scan_s / indexed_s:.0f}x"
+        )
+
+    assert indexed_out == scan_out
+    assert indexed_s * 10 < scan_s
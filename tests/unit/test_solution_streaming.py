@@ -0,0 +1,93 @@
+"""Unit tests: streaming solution bundle writers and the NDJSON loader.
+
+``write_solution_json`` / ``write_solution_ndjson`` serialize assignments
+one at a time instead of dumping the whole bundle; ``load_solution`` and
+``iter_solution_assignments`` read the NDJSON form back.
+"""
+
+import json
+from datetime import date, datetime
+
+from api.core.json_writer import write_solution_json, write_solution_ndjson
+from api.core.loader import iter_solution_assignments, load_solution, load_solution_header
+from api.core.models import (
+    Assignment,
+    FairnessMetrics,
+    Metrics,
+    SolutionBundle,
+    SolutionMeta,
+    SolverMeta,
+    StabilityMetrics,
+    Violation,
+    Violations,
+)
+
+
+def _bundle(n: int) -> SolutionBundle:
+    return SolutionBundle(
+        meta=SolutionMeta(
+            generated_at=datetime(2026, 6, 1, 9, 0),
+            range_start=date(2026, 6, 1),
+            range_end=date(2026, 6, 30),
+            mode="strict",
+            change_min=False,
+            solver=SolverMeta(name="greedy", version="1.0", strategy="greedy"),
+        ),
+        assignments=[
+            Assignment(event_id=f"e{i}", assignees=[f"p{i}", f"p{i + 1}"], team_ids=["t1"])
+            for i in range(n)
+        ],
+        metrics=Metrics(
+            solve_ms=1.5,
+            hard_violations=1,
+            soft_score=0.0,
+            fairness=FairnessMetrics(stdev=0.5, per_person_counts={"p0": 1}),
+            stability=StabilityMetrics(),
+            health_score=90.0,
+        ),
+        violations=Violations(
+            hard=[Violation(constraint_key="cap", severity="hard", message="over cap")]
+        ),
+    )
+
+
+def test_json_stream_round_trips_through_load_solution(tmp_path):
+    """The streamed JSON document is the same bundle ``model_dump`` would give."""
+    bundle = _bundle(3)
+    path = tmp_path / "solution.json"
+
+    assert write_solution_json(bundle, path) == 3
+
+    assert json.loads(path.read_text()) == bundle.model_dump(mode="json")
+    assert load_solution(path) == bundle
+
+
+def test_json_stream_with_no_assignments_is_valid(tmp_path):
+    path = tmp_path / "solution.json"
+    write_solution_json(_bundle(0), path)
+
+    assert json.loads(path.read_text())["assignments"] == []
+
+
+def test_ndjson_has_one_line_per_assignment(tmp_path):
+    """Header line first, then assignments, which load back lazily."""
+    bundle = _bundle(4)
+    path = tmp_path / "solution.ndjson"
+
+    assert write_solution_ndjson(bundle, path) == 4
+
+    assert len(path.read_text().splitlines()) == 5
+    assert load_solution_header(path)["metrics"]["health_score"] == 90.0
+    assert list(iter_solution_assignments(path)) == bundle.assignments
+    assert load_solution(path) == bundle
+
+
+def test_writers_accept_assignments_as_they_are_produced(tmp_path):
+    """A generator of assignments is consumed once, without a list in between."""
+    header = _bundle(0)
+    produced = (Assignment(event_id=f"e{i}", assignees=["p1"]) for i in range(1000))
+    path = tmp_path / "solution.ndjson"
+
+    assert write_solution_ndjson(header, path, assignments=produced) == 1000
+
+    assert sum(1 for _ in iter_solution_assignments(path)) == 1000
@@ -0,0 +1,159 @@
+"""Unit tests: the versioned solve-context cache and greedy model reuse.
+
+``SolveContextCache`` is an LRU bounded by entries and rows that drops an
+org's older data versions when a newer one is stored.
+``GreedyHeuristicSolver.use_model`` adopts another solver's indexes and must
+solve exactly like a fresh ``build_model``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+
+from api.core.models import (
+    Availability,
+    ConstraintAction,
+    ConstraintBinding,
+    Event,
+    Org,
+    OrgDefaults,
+    Person,
+    RequiredRole,
+    VacationPeriod,
+)
+from api.core.solver.adapter import SolveContext
+from api.core.solver.heuristics import GreedyHeuristicSolver
+from api.services.solve_context_cache import SolveContextCache
+
+START = date(2026, 6, 1)
+CREATED = datetime(2026, 1, 1)
+
+
+def _ctx(people: int = 4, events: int = 3) -> SolveContext:
+    evts = []
+    for day in range(events):
+        start = datetime.combine(START + timedelta(days=day), datetime.min.time())
+        evts.append(
+            Event(
+                id=f"e{day}",
+                type="service",
+                start=start,
+                end=start + timedelta(hours=2),
+                required_roles=[RequiredRole(role="usher", count=2)],
+            )
+        )
+    return SolveContext(
+        org=Org(org_id="t-org", region="US", defaults=OrgDefaults()),
+        people=[Person(id=f"p{i}", name=f"P{i}", roles=["usher"]) for i in range(people)],
+        teams=[],
+        resources=[],
+        events=evts,
+        constraints=[],
+        availability=[
+            Availability(person_id="p0", vacations=[VacationPeriod(start=START, end=START)])
+        ],
+        holidays=[],
+        from_date=START,
+        to_date=START + timedelta(days=events),
+        mode="strict",
+        change_min=False,
+    )
+
+
+def _key(org: str, version: int, day: int = 0):
+    return (org, CREATED, version, START + timedelta(days=day), START + timedelta(days=30))
+
+
+def test_hit_miss_and_lru_eviction():
+    """The least recently used snapshot goes first once ``max_entries`` is exceeded."""
+    cache = SolveContextCache(max_entries=2)
+    cache.put(_key("a", 0), _ctx())
+    cache.put(_key("b", 0), _ctx())
+    assert cache.get(_key("a", 0)) is not None  # a is now most recent
+    cache.put(_key("c", 0), _ctx())
+
+    assert cache.get(_key("b", 0)) is None
+    assert cache.get(_key("a", 0)) is not None
+    assert cache.get(_key("c", 0)) is not None
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_row_cap_bounds_memory():
+    """Snapshots are evicted to stay under ``max_rows``; oversized ones aren't kept."""
+    rows = 4 + 3 + 1  # people + events + availability
+    cache = SolveContextCache(max_entries=10, max_rows=2 * rows)
+    for org in "abc":
+        cache.put(_key(org, 0), _ctx())
+
+    assert len(cache) == 2
+    assert cache.rows == 2 * rows
+    assert cache.get(_key("a", 0)) is None
+
+    big = cache.put(_key("d", 0), _ctx(people=100))
+    assert big.context.people  # still returned for this request
+    assert cache.get(_key("d", 0)) is None
+    assert len(cache) == 2
+
+
+def test_newer_version_drops_older_snapshots_of_the_org():
+    """Storing version 2 removes every window cached at version 1 for that org only."""
+    cache = SolveContextCache()
+    cache.put(_key("a", 1, day=0), _ctx())
+    cache.put(_key("a", 1, day=7), _ctx())
+    cache.put(_key("b", 1), _ctx())
+    cache.put(_key("a", 2), _ctx())
+
+    assert len(cache) == 2
+    assert cache.get(_key("a", 1, day=7)) is None
+    assert cache.get(_key("b", 1)) is not None
+
+
+def test_disabled_cache_keeps_nothing():
+    """``max_entries=0`` turns caching off."""
+    cache = SolveContextCache(max_entries=0)
+    cache.put(_key("a", 0), _ctx())
+
+    assert len(cache) == 0
+
+
+def test_use_model_solves_like_build_model():
+    """A solver adopting cached indexes gives the same roster, for any mode."""
+    ctx = _ctx(people=6, events=5)
+    built = GreedyHeuristicSolver()
+    built.build_model(ctx)
+    expected = built.solve()
+
+    reused = GreedyHeuristicSolver()
+    reused.use_model(replace(ctx, mode="relaxed"), built.model_snapshot())
+    result = reused.solve()
+
+    assert [a.model_dump() for a in result.assignments] == [
+        a.model_dump() for a in expected.assignments
+    ]
+    assert result.meta.mode == "relaxed"
+    assert reused._blocked_days is built._blocked_days  # shared, not rebuilt
+
+
+def test_use_model_compiles_its_own_plans():
+    """Plans carry memos and call counters, so solvers sharing a snapshot don't share them."""
+    cap = ConstraintBinding(
+        key="weekly_cap",
+        scope="person",
+        applies_to=["service"],
+        severity="hard",
+        then=ConstraintAction(enforce_cap={"period": "P7D", "max_count": 2}),
+    )
+    ctx = replace(_ctx(people=6, events=5), constraints=[cap])
+    built = GreedyHeuristicSolver()
+    built.build_model(ctx)
+    snapshot = built.model_snapshot()
+    first, second = GreedyHeuristicSolver(), GreedyHeuristicSolver()
+    first.use_model(replace(ctx), snapshot)
+    second.use_model(replace(ctx), snapshot)
+
+    assert first._plans[0] is not second._plans[0]
+    first_counters = first.solve().meta.profile.counters
+    second_counters = second.solve().meta.profile.counters
+    assert first_counters["constraint_evals"] > 0
+    assert second_counters == first_counters
@@ -0,0 +1,163 @@
+"""Unit tests: background solve jobs (``api/services/solve_jobs.py``).
+
+Jobs run on the in-process worker pool, report progress through the
+greedy solver's progress callback and stop cooperatively when cancelled.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from api.core.models import Event, Org, OrgDefaults, Person, RequiredRole
+from api.core.solver.adapter import SolveContext, SolveProgress
+from api.core.solver.heuristics import GreedyHeuristicSolver
+from api.services import solve_jobs
+
+START = date(2026, 6, 1)
+
+
+def _ctx(events: int) -> SolveContext:
+    people = [Person(id=f"p{i}", name=f"P{i}", roles=["usher"]) for i in range(4)]
+    evts = []
+    for day in range(events):
+        start = datetime.combine(START + timedelta(days=day), datetime.min.time())
+        evts.append(
+            Event(
+                id=f"e{day}",
+                type="service",
+                start=start,
+                end=start + timedelta(hours=2),
+                required_roles=[RequiredRole(role="usher", count=2)],
+            )
+        )
+    return SolveContext(
+        org=Org(org_id="t-org", region="US", defaults=OrgDefaults()),
+        people=people,
+        teams=[],
+        resources=[],
+        events=evts,
+        constraints=[],
+        availability=[],
+        holidays=[],
+        from_date=START,
+        to_date=START + timedelta(days=events),
+        mode="strict",
+        change_min=False,
+    )
+
+
+def _wait(job: solve_jobs.SolveJob) -> solve_jobs.SolveJob:
+    job._future.result(timeout=30)
+    return job
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    yield
+    solve_jobs.shutdown()
+
+
+def test_greedy_reports_progress_per_event():
+    """The callback sees every event, with running assignment counts."""
+    reports: list[SolveProgress] = []
+    solver = GreedyHeuristicSolver()
+    solver.build_model(_ctx(3))
+    solver.set_progress_callback(reports.append)
+    solver.solve()
+
+    assert [(r.events_done, r.events_total) for r in reports] == [(1, 3), (2, 3), (3, 3)]
+    assert [r.assignments for r in reports] == [1, 2, 3]
+    assert all(r.hard_violations == 0 for r in reports)
+
+
+def test_completed_job_records_progress_and_solution():
+    """``work``'s return value becomes ``solution_id``; progress is the last report."""
+
+    def work(job: solve_jobs.SolveJob) -> int:
+        solver = GreedyHeuristicSolver()
+        solver.build_model(_ctx(5))
+        solver.set_progress_callback(job.report)
+        solver.solve()
+        return 42
+
+    job = _wait(solve_jobs.submit("t-org", work))
+
+    assert job.status == solve_jobs.COMPLETED
+    assert (job.events_done, job.events_total, job.assignments) == (5, 5, 5)
+    assert job.solution_id == 42
+    assert job.finished_at is not None
+    assert solve_jobs.get(job.id) is job
+
+
+def test_cancel_stops_a_running_job_at_the_next_report():
+    """A running solve raises out of its progress callback and nothing is returned."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def work(job: solve_jobs.SolveJob) -> int:
+        started.set()
+        release.wait(timeout=10)
+        solver = GreedyHeuristicSolver()
+        solver.build_model(_ctx(5))
+        solver.set_progress_callback(job.report)
+        solver.solve()
+        return 1
+
+    job = solve_jobs.submit("t-org", work)
+    assert started.wait(timeout=10)
+    solve_jobs.cancel(job.id)
+    release.set()
+    _wait(job)
+
+    assert job.status == solve_jobs.CANCELLED
+    assert job.events_done == 1
+    assert job.solution_id is None
+
+
+def test_cancel_queued_job_never_runs_it():
+    """With the single worker busy, a queued job is cancelled before it starts."""
+    release = threading.Event()
+    ran: list[str] = []
+
+    def blocker(job: solve_jobs.SolveJob) -> int:
+        release.wait(timeout=10)
+        return 1
+
+    def work(job: solve_jobs.SolveJob) -> int:
+        ran.append(job.id)
+        return 2
+
+    first = solve_jobs.submit("t-org", blocker)
+    queued = solve_jobs.submit("t-org", work)
+    solve_jobs.cancel(queued.id)
+    release.set()
+    _wait(first)
+
+    assert queued.status == solve_jobs.CANCELLED
+    assert ran == []
+
+
+def test_failed_job_keeps_the_error():
+    """Exceptions from ``work`` mark the job failed with the message."""
+
+    def work(job: solve_jobs.SolveJob) -> int:
+        raise ValueError("no events in range")
+
+    job = _wait(solve_jobs.submit("t-org", work))
+
+    assert job.status == solve_jobs.FAILED
+    assert job.error == "no events in range"
+
+
+def test_only_recent_finished_jobs_are_kept(monkeypatch):
+    """Finished jobs beyond ``MAX_FINISHED_JOBS`` are pruned oldest first."""
+    monkeypatch.setattr(solve_jobs, "MAX_FINISHED_JOBS", 2)
+    jobs = [_wait(solve_jobs.submit("t-org", lambda job: 1)) for _ in range(3)]
+    latest = solve_jobs.submit("t-org", lambda job: 1)
+    _wait(latest)
+
+    assert solve_jobs.get(jobs[0].id) is None
+    assert all(solve_jobs.get(job.id) is job for job in jobs[1:] + [latest])
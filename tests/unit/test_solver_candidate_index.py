@@ -0,0 +1,199 @@
+"""Unit tests: ``GreedyHeuristicSolver.build_model`` precomputes candidate indexes.
+
+``_assign_event`` used to rebuild ``[p for p in people if role in p.roles]``
+and a ``people_map`` for every required role of every event, making a solve
+O(events × roles × people). ``build_model`` now builds, once per solve:
+
+- a person-id → dense-int mapping,
+- a role → ascending candidate-int index,
+- a per-person availability bitset over the solve window.
+
+The slow-marked benchmark times ``build_model`` and ``solve`` at 10k people
+× 5k events.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from api.core.models import (
+    Availability,
+    Event,
+    Org,
+    OrgDefaults,
+    Person,
+    RequiredRole,
+    VacationPeriod,
+)
+from api.core.solver.adapter import SolveContext
+from api.core.solver.heuristics import GreedyHeuristicSolver
+
+
+def _ctx(
+    *,
+    people: list[Person],
+    events: list[Event],
+    availability: list[Availability] | None = None,
+    from_date: date,
+    to_date: date,
+) -> SolveContext:
+    return SolveContext(
+        org=Org(org_id="t-org", region="US", defaults=OrgDefaults()),
+        people=people,
+        teams=[],
+        resources=[],
+        events=events,
+        constraints=[],
+        availability=availability or [],
+        holidays=[],
+        from_date=from_date,
+        to_date=to_date,
+        mode="strict",
+        change_min=False,
+    )
+
+
+def _event(eid: str, on: date, role: str = "volunteer", count: int = 1) -> Event:
+    return Event(
+        id=eid,
+        type="service",
+        start=datetime.combine(on, datetime.min.time().replace(hour=10)),
+        end=datetime.combine(on, datetime.min.time().replace(hour=11)),
+        required_roles=[RequiredRole(role=role, count=count)],
+    )
+
+
+def test_role_index_lists_people_in_roster_order():
+    """Each role maps to the dense ints of its holders, in ``context.people`` order."""
+    today = date(2026, 6, 1)
+    people = [
+        Person(id="a", name="A", roles=["usher", "greeter"]),
+        Person(id="b", name="B", roles=["greeter"]),
+        Person(id="c", name="C", roles=["usher", "usher"]),  # duplicate role listed once
+    ]
+    solver = GreedyHeuristicSolver()
+    solver.build_model(_ctx(people=people, events=[], from_date=today, to_date=today))
+
+    assert solver._person_index == {"a": 0, "b": 1, "c": 2}
+    assert solver._candidates_by_role["usher"] == [0, 2]
+    assert solver._candidates_by_role["greeter"] == [0, 1]
+
+
+def test_blocked_day_bitset_covers_vacations_and_exceptions():
+    """Vacation ranges (inclusive, clipped to the window) and exception dates set bits."""
+    start = date(2026, 6, 1)
+    people = [Person(id="p1", name="P1", roles=["volunteer"])]
+    avail = Availability(
+        person_id="p1",
+        vacations=[VacationPeriod(start=start - timedelta(days=3), end=start + timedelta(days=1))],
+        exceptions=[start + timedelta(days=5), start + timedelta(days=90)],  # second is outside
+    )
+    solver = GreedyHeuristicSolver()
+    solver.build_model(
+        _ctx(
+            people=people,
+            events=[],
+            availability=[avail],
+            from_date=start,
+            to_date=start + timedelta(days=10),
+        )
+    )
+
+    bits = solver._blocked_days[0]
+    blocked = {d for d in range(11) if (bits >> d) & 1}
+    assert blocked == {0, 1, 5}
+
+
+def test_availability_for_unknown_person_is_ignored():
+    """Availability rows for people outside the roster don't break the build."""
+    today = date(2026, 6, 1)
+    people = [Person(id="p1", name="P1", roles=["volunteer"])]
+    avail = Availability(person_id="ghost", exceptions=[today])
+    solver = GreedyHeuristicSolver()
+    solver.build_model(
+        _ctx(people=people, events=[], availability=[avail], from_date=today, to_date=today)
+    )
+
+    assert solver._blocked_days == [0]
+
+
+def test_solve_uses_index_for_role_and_availability():
+    """Only role holders who aren't blocked on the event date are assigned."""
+    start = date(2026, 6, 1)
+    people = [
+        Person(id="blocked", name="Blocked", roles=["sound_tech"]),
+        Person(id="other_role", name="Other", roles=["usher"]),
+        Person(id="free", name="Free", roles=["sound_tech"]),
+    ]
+    avail = Availability(
+        person_id="blocked", vacations=[VacationPeriod(start=start, end=start + timedelta(days=2))]
+    )
+    events = [
+        _event("e1", start + timedelta(days=1), role="sound_tech", count=2),
+        _event("e2", start + timedelta(days=3), role="sound_tech", count=1),
+    ]
+    solver = GreedyHeuristicSolver()
+    solver.build_model(
+        _ctx(
+            people=people,
+            events=events,
+            availability=[avail],
+            from_date=start,
+            to_date=start + timedelta(days=7),
+        )
+    )
+    result = solver.solve()
+
+    by_event = {a.event_id: a.assignees for a in result.assignments}
+    assert by_event["e1"] == ["free"]
+    # e1 is one short -> a single coverage violation
+    assert [v.entities for v in result.violations.hard] == [["e1"]]
+    # vacation over: "blocked" has fewer assignments so fairness prefers them
+    assert by_event["e2"] == ["blocked"]
+
+
+@pytest.mark.slow
+def test_candidate_index_speedup_10k_people_5k_events(capsys):
+    """Bench a full greedy solve at 10k people × 5k events."""
+    rng = random.Random(7)
+    role_pool = [f"role{i}" for i in range(12)]
+    people = [
+        Person(id=f"p{i}", name=f"Person {i}", roles=rng.sample(role_pool, rng.randint(1, 3)))
+        for i in range(10_000)
+    ]
+    start = date(2026, 1, 1)
+    events = []
+    for i in range(5_000):
+        on = start + timedelta(days=rng.randint(0, 364))
+        events.append(
+            Event(
+                id=f"e{i}",
+                type="service",
+                start=datetime.combine(on, datetime.min.time()),
+                end=datetime.combine(on, datetime.min.time()) + timedelta(hours=1),
+                required_roles=[RequiredRole(role=r, count=1) for r in rng.sample(role_pool, 3)],
+            )
+        )
+    ctx = _ctx(people=people, events=events, from_date=start, to_date=start + timedelta(days=364))
+
+    solver = GreedyHeuristicSolver()
+    t0 = time.perf_counter()
+    solver.build_model(ctx)
+    build_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    result = solver.solve()
+    solve_s = time.perf_counter() - t0
+
+    with capsys.disabled():
+        print(
+            f"\n[solver-index] people=10000 events=5000 "
+            f"build_model={build_s * 1000:.0f}ms solve={solve_s * 1000:.0f}ms"
+        )
+
+    assert len(result.assignments) == 5_000
+    assert result.violations.hard == []
+    assert all(len(a.assignees) == 3 for a in result.assignments)
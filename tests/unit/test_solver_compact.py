@@ -0,0 +1,151 @@
+"""Unit tests: the solver's compact event table.
+
+``build_model`` pulls each event's epoch day, start order and id into an
+``EventTable`` (``api/core/solver/compact.py``); solves window and offset
+events with integer compares instead of re-reading ``start.date()`` and
+re-sorting the ``Event`` models, and fairness counts live in a per-person
+int list.
+
+The slow-marked benchmark times ``GreedyHeuristicSolver.build_model`` and
+``solve`` on a fixed synthetic org of 50k events, with peak memory, next to
+the footprint of the ``Event`` models and of the table built from them.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from api.core.models import Assignment, Event, Org, OrgDefaults, Person, RequiredRole
+from api.core.solver.adapter import SolveContext
+from api.core.solver.compact import EventTable
+from api.core.solver.heuristics import GreedyHeuristicSolver
+
+START = date(2026, 1, 1)
+
+
+def _event(eid: str, on: date, hour: int = 9, roles: list[RequiredRole] | None = None) -> Event:
+    start = datetime.combine(on, datetime.min.time()) + timedelta(hours=hour)
+    return Event(
+        id=eid,
+        type="service",
+        start=start,
+        end=start + timedelta(hours=1),
+        required_roles=roles or [],
+    )
+
+
+def _ctx(people: list[Person], events: list[Event], days: int) -> SolveContext:
+    return SolveContext(
+        org=Org(org_id="t-org", region="US", defaults=OrgDefaults()),
+        people=people,
+        teams=[],
+        resources=[],
+        events=events,
+        constraints=[],
+        availability=[],
+        holidays=[],
+        from_date=START,
+        to_date=START + timedelta(days=days),
+        mode="strict",
+        change_min=False,
+    )
+
+
+def test_table_holds_epoch_days_and_start_order():
+    events = [
+        _event("late", START + timedelta(days=2)),
+        _event("early", START, hour=8),
+        _event("tied-a", START + timedelta(days=1)),
+        _event("tied-b", START + timedelta(days=1)),
+    ]
+    table = EventTable(events)
+
+    assert list(table.days) == [(START + timedelta(days=d)).toordinal() for d in (2, 0, 1, 1)]
+    assert [events[pos].id for pos in table.order] == ["early", "tied-a", "tied-b", "late"]
+    assert table.day(events[0]) == (START + timedelta(days=2)).toordinal()
+
+
+def test_window_filters_inclusively_in_start_order():
+    events = [_event(f"e{d}", START + timedelta(days=d)) for d in (4, 0, 3, 1, 2)]
+    table = EventTable(events)
+
+    window = table.window(START + timedelta(days=1), START + timedelta(days=3))
+
+    assert [e.id for e in window] == ["e1", "e2", "e3"]
+
+
+def test_day_falls_back_for_events_outside_the_table():
+    """A model the table wasn't built from still gets its own day."""
+    table = EventTable([_event("e1", START)])
+    other = _event("e1", START + timedelta(days=5))
+
+    assert table.day(other) == (START + timedelta(days=5)).toordinal()
+
+
+def test_fairness_counts_spread_assignments():
+    """Per-person int counts drive fairness the way per-person event lists did."""
+    people = [Person(id=f"p{i}", name=f"P{i}", roles=["usher"]) for i in range(3)]
+    events = [
+        _event(f"e{d}", START + timedelta(days=d), roles=[RequiredRole(role="usher", count=1)])
+        for d in range(6)
+    ]
+    solver = GreedyHeuristicSolver()
+    solver.build_model(_ctx(people, events, days=6))
+    result = solver.solve()
+
+    assert [a.assignees for a in result.assignments] == [["p0"], ["p1"], ["p2"]] * 2
+    assert solver._assignment_counts == [2, 2, 2]
+    expected = Assignment(event_id="e0", assignees=["p0"])
+    assert result.assignments[0].model_dump() == expected.model_dump()
+
+
+def _measure(fn):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    value = fn()
+    elapsed_ms = (time.perf_counter() - t0) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, elapsed_ms, peak / 2**20
+
+
+@pytest.mark.slow
+def test_compact_model_50k_events(capsys):
+    """Bench the greedy solver's build and solve at 50k events, time and memory."""
+    rng = random.Random(11)
+    role_pool = [f"role{i}" for i in range(12)]
+    people = [Person(id=f"p{i}", name=f"P{i}", roles=[role_pool[i % 12]]) for i in range(600)]
+    days = 730
+
+    def make_events():
+        return [
+            _event(
+                f"e{i}",
+                START + timedelta(days=rng.randint(0, days)),
+                hour=rng.randint(6, 20),
+                roles=[RequiredRole(role=rng.choice(role_pool), count=1)],
+            )
+            for i in range(50_000)
+        ]
+
+    events, _, models_mb = _measure(make_events)
+    ctx = _ctx(people, events, days=days)
+    _, table_ms, table_mb = _measure(lambda: EventTable(events))
+
+    solver = GreedyHeuristicSolver()
+    _, build_ms, build_mb = _measure(lambda: solver.build_model(ctx))
+    result, solve_ms, solve_mb = _measure(solver.solve)
+    assert len(result.assignments) == 50_000
+    assert sum(solver._assignment_counts) == 50_000
+
+    with capsys.disabled():
+        print(
+            f"\n[compact] 50k events, 600 people: build_model={build_ms:.0f}ms "
+            f"peak {build_mb:.1f}MB, solve={solve_ms:.0f}ms peak {solve_mb:.1f}MB; "
+            f"EventTable {table_ms:.0f}ms/{table_mb:.1f}MB vs Event models {models_mb:.1f}MB"
+        )
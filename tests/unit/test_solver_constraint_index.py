@@ -0,0 +1,191 @@
+"""Unit tests: ``build_model`` indexes compiled constraints by event type.
+
+``_assign_event`` used to split ``context.constraints`` into hard/soft lists
+for every event and then test ``scope`` and ``event.type in applies_to`` for
+every binding, per candidate. ``build_model`` now builds an
+``(event type, scope, severity)`` → plans index once, with ``applies_to`` held
+as a frozenset on each plan.
+
+The slow-marked benchmark compares the old per-candidate filtering against
+index lookups with 60 bindings, the size our larger orgs configure.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from api.core.models import (
+    ConstraintAction,
+    ConstraintBinding,
+    Event,
+    Org,
+    OrgDefaults,
+    Person,
+    RequiredRole,
+)
+from api.core.solver.adapter import SolveContext
+from api.core.solver.heuristics import GreedyHeuristicSolver
+
+START = date(2026, 6, 1)
+
+
+def _binding(key: str, scope: str, applies_to: list[str], severity: str) -> ConstraintBinding:
+    return ConstraintBinding(
+        key=key,
+        scope=scope,
+        applies_to=applies_to,
+        severity=severity,
+        weight=10,
+        then=ConstraintAction(penalize_if={"type": "cooldown", "cooldown_days": 7}),
+    )
+
+
+def _ctx(people, events, constraints) -> SolveContext:
+    return SolveContext(
+        org=Org(org_id="t-org", region="US", defaults=OrgDefaults()),
+        people=people,
+        teams=[],
+        resources=[],
+        events=events,
+        constraints=constraints,
+        availability=[],
+        holidays=[],
+        from_date=START,
+        to_date=START + timedelta(days=90),
+        mode="strict",
+        change_min=False,
+    )
+
+
+def _event(eid: str, event_type: str, on: date) -> Event:
+    start = datetime.combine(on, datetime.min.time().replace(hour=10))
+    return Event(
+        id=eid,
+        type=event_type,
+        start=start,
+        end=start + timedelta(hours=1),
+        required_roles=[RequiredRole(role="volunteer", count=1)],
+    )
+
+
+def test_index_groups_plans_by_type_scope_severity_in_binding_order():
+    """Each (type, scope, severity) key lists its plans in ``context.constraints`` order."""
+    constraints = [
+        _binding("a", "person", ["service", "rehearsal"], "soft"),
+        _binding("b", "person", ["service"], "hard"),
+        _binding("c", "event", ["service"], "hard"),
+        _binding("d", "person", ["service", "service"], "soft"),  # duplicate type listed once
+    ]
+    solver = GreedyHeuristicSolver()
+    solver.build_model(_ctx([], [], constraints))
+
+    keys = {k: [p.key for p in plans] for k, plans in solver._constraint_index.items()}
+    assert keys == {
+        ("service", "person", "soft"): ["a", "d"],
+        ("rehearsal", "person", "soft"): ["a"],
+        ("service", "person", "hard"): ["b"],
+        ("service", "event", "hard"): ["c"],
+    }
+    assert all(isinstance(p.applies_to, frozenset) for p in solver._plans)
+
+
+def test_constraints_only_apply_to_listed_event_types():
+    """A weekly cap bound to ``rehearsal`` doesn't block ``service`` assignments."""
+    people = [Person(id=f"p{i}", name=f"P{i}", roles=["volunteer"]) for i in range(2)]
+    events = [
+        _event("s1", "service", START),
+        _event("s2", "service", START + timedelta(days=1)),
+        _event("s3", "service", START + timedelta(days=2)),
+        _event("r1", "rehearsal", START + timedelta(days=3)),
+    ]
+    cap = ConstraintBinding(
+        key="rehearsal_cap",
+        scope="person",
+        applies_to=["rehearsal"],
+        severity="hard",
+        then=ConstraintAction(enforce_cap={"period": "P7D", "max_count": 1}),
+    )
+    solver = GreedyHeuristicSolver()
+    solver.build_model(_ctx(people, events, [cap]))
+    result = solver.solve()
+    by_event = {a.event_id: a.assignees for a in result.assignments}
+
+    assert by_event == {"s1": ["p0"], "s2": ["p1"], "s3": ["p0"], "r1": []}
+    assert [v.entities for v in result.violations.hard] == [["r1"]]
+
+
+def test_wildcard_applies_to_every_event_type_present():
+    """``applies_to: ["*"]`` files the plan under each event type in the window."""
+    events = [_event("s1", "service", START), _event("r1", "rehearsal", START)]
+    solver = GreedyHeuristicSolver()
+    solver.build_model(_ctx([], events, [_binding("any", "person", ["*"], "soft")]))
+
+    assert sorted(solver._constraint_index) == [
+        ("rehearsal", "person", "soft"),
+        ("service", "person", "soft"),
+    ]
+
+
+@pytest.mark.slow
+def test_constraint_index_speedup_60_bindings(capsys):
+    """Bench per-candidate constraint filtering vs index lookup with 60 bindings."""
+    rng = random.Random(5)
+    event_types = [f"type{i}" for i in range(12)]
+    constraints = [
+        _binding(
+            f"c{i}",
+            rng.choice(["person", "person", "event"]),
+            rng.sample(event_types, rng.randint(1, 3)),
+            rng.choice(["hard", "soft"]),
+        )
+        for i in range(60)
+    ]
+    solver = GreedyHeuristicSolver()
+    solver.build_model(_ctx([], [], constraints))
+    plans = solver._plans
+    events = [rng.choice(event_types) for _ in range(2_000)]
+    candidates_per_event = 50
+
+    # Old shape: split by severity per event, then filter scope/type per candidate.
+    t0 = time.perf_counter()
+    old_hits = 0
+    for event_type in events:
+        hard = [c for c in plans if c.severity == "hard"]
+        soft = [c for c in plans if c.severity == "soft"]
+        for _ in range(candidates_per_event):
+            for c in hard:
+                if c.scope == "person" and event_type in c.binding.applies_to:
+                    old_hits += 1
+            for c in soft:
+                if c.scope == "person" and event_type in c.binding.applies_to:
+                    old_hits += 1
+    old_s = time.perf_counter() - t0
+
+    # New shape: one lookup per (event, scope, severity).
+    t0 = time.perf_counter()
+    new_hits = 0
+    index = solver._constraint_index
+    for event_type in events:
+        hard = index.get((event_type, "person", "hard"), ())
+        soft = index.get((event_type, "person", "soft"), ())
+        for _ in range(candidates_per_event):
+            for _c in hard:
+                new_hits += 1
+            for _c in soft:
+                new_hits += 1
+    new_s = time.perf_counter() - t0
+
+    with capsys.disabled():
+        print(
+            f"\n[constraint-index] bindings=60 events={len(events)} "
+            f"candidates/event={candidates_per_event} "
+            f"filtered={old_s * 1000:.0f}ms indexed={new_s * 1000:.0f}ms "
+            f"speedup~{old_s / new_s:.1f}x"
+        )
+
+    assert new_hits == old_hits
+    assert new_s * 3 < old_s
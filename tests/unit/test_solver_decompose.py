@@ -0,0 +1,219 @@
+"""Unit tests: decomposed solving (``solver="parallel"``).
+
+``partition_context`` splits a solve into connected components of people,
+roles and team events (optionally also by calendar month) and
+``DecomposingSolver`` greedy-solves each on a process pool. These tests check
+the partitioning, that component-only merging reproduces a single greedy
+solve exactly, and that month mode reconciles hard constraints across month
+boundaries.
+
+The slow-marked benchmark solves a 4-campus, 26-week org serially and on the
+pool and reports both timings alongside the core count.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from api.core.models import (
+    ConstraintAction,
+    ConstraintBinding,
+    Event,
+    Org,
+    OrgDefaults,
+    Person,
+    RequiredRole,
+    Team,
+)
+from api.core.solver.adapter import SolveContext
+from api.core.solver.decompose import DecomposingSolver, partition_context
+from api.core.solver.factory import create_solver
+from api.core.solver.heuristics import GreedyHeuristicSolver
+
+START = date(2026, 6, 1)
+
+COOLDOWN = ConstraintBinding(
+    key="cooldown",
+    scope="person",
+    applies_to=["service"],
+    severity="soft",
+    weight=20,
+    then=ConstraintAction(penalize_if={"type": "cooldown", "cooldown_days": 14}),
+)
+WEEKLY_CAP = ConstraintBinding(
+    key="weekly_cap",
+    scope="person",
+    applies_to=["service"],
+    severity="hard",
+    then=ConstraintAction(enforce_cap={"period": "P7D", "max_count": 1}),
+)
+
+
+def _event(eid: str, day: int, team_ids=(), **roles: int) -> Event:
+    start = datetime.combine(START + timedelta(days=day), datetime.min.time().replace(hour=10))
+    return Event(
+        id=eid,
+        type="service",
+        start=start,
+        end=start + timedelta(hours=2),
+        team_ids=list(team_ids),
+        required_roles=[RequiredRole(role=r, count=c) for r, c in roles.items()],
+    )
+
+
+def _ctx(people, events, constraints=None, teams=None, days=28) -> SolveContext:
+    return SolveContext(
+        org=Org(org_id="t-org", region="US", defaults=OrgDefaults()),
+        people=people,
+        teams=teams or [],
+        resources=[],
+        events=events,
+        constraints=constraints or [],
+        availability=[],
+        holidays=[],
+        from_date=START,
+        to_date=START + timedelta(days=days),
+        mode="strict",
+        change_min=False,
+    )
+
+
+def _campuses(n_campuses: int, people_each: int, weeks: int, seed: int = 3) -> SolveContext:
+    """``n_campuses`` groups with campus-prefixed roles, so no roles are shared."""
+    rng = random.Random(seed)
+    people, events = [], []
+    for c in range(n_campuses):
+        roles = [f"c{c}-{r}" for r in ("usher", "sound", "greeter", "kids")]
+        people += [
+            Person(id=f"c{c}p{i}", name=f"C{c} P{i}", roles=rng.sample(roles, rng.randint(1, 2)))
+            for i in range(people_each)
+        ]
+        for d in range(weeks * 7):
+            if d % 7 in (0, 3):
+                events.append(_event(f"c{c}e{d}", d, **{r: rng.randint(1, 3) for r in roles}))
+    return _ctx(people, events, [COOLDOWN], days=weeks * 7)
+
+
+def _greedy(ctx: SolveContext):
+    solver = GreedyHeuristicSolver()
+    solver.build_model(ctx)
+    return solver.solve()
+
+
+def _by_event(result) -> dict[str, list[str]]:
+    return {a.event_id: a.assignees for a in result.assignments}
+
+
+def test_partitions_follow_shared_roles_and_teams():
+    """Events sharing a role or team member land together; the rest split off."""
+    people = [
+        Person(id="a", name="A", roles=["usher", "sound"]),
+        Person(id="b", name="B", roles=["sound"]),
+        Person(id="c", name="C", roles=["kids"]),
+        Person(id="d", name="D", roles=[]),
+    ]
+    teams = [Team(id="t1", name="T1", members=["d"])]
+    events = [
+        _event("usher", 0, usher=1),
+        _event("sound", 1, sound=1),
+        _event("kids", 2, kids=1),
+        _event("team", 3, team_ids=["t1"]),
+        _event("next-month", 40, kids=1),
+    ]
+    ctx = _ctx(people, events, teams=teams, days=60)
+
+    by_component = partition_context(ctx)
+    by_month = partition_context(ctx, by_month=True)
+
+    assert [[e.id for e in p.events] for p in by_component] == [
+        ["usher", "sound"],
+        ["kids", "next-month"],
+        ["team"],
+    ]
+    assert [[p.id for p in part.people] for part in by_component] == [["a", "b"], ["c"], ["d"]]
+    assert [[e.id for e in p.events] for p in by_month] == [
+        ["usher", "sound"],
+        ["kids"],
+        ["team"],
+        ["next-month"],
+    ]
+    assert (by_month[3].from_date, by_month[3].to_date) == (date(2026, 7, 1), START + timedelta(60))
+
+
+def test_components_reproduce_the_greedy_solve():
+    """Merged component solutions equal one greedy solve, in the same order."""
+    ctx = _campuses(n_campuses=3, people_each=12, weeks=8)
+    greedy = _greedy(ctx)
+    solver = DecomposingSolver(max_workers=1)
+    solver.build_model(ctx)
+    merged = solver.solve()
+
+    assert len(solver._partitions) == 3
+    assert merged.meta.solver.name == "greedy_parallel"
+    assert merged.meta.solver.strategy == "components"
+    assert merged.assignments == greedy.assignments
+    assert merged.violations == greedy.violations
+    assert merged.metrics.fairness == greedy.metrics.fairness
+
+
+def test_process_pool_matches_in_process():
+    """Two worker processes give the same roster as solving in-process."""
+    ctx = _campuses(n_campuses=2, people_each=8, weeks=4)
+    solver = create_solver("parallel")
+    solver.max_workers = 2
+    solver.build_model(ctx)
+
+    assert _by_event(solver.solve()) == _by_event(_greedy(ctx))
+
+
+def test_month_split_reconciles_boundary_caps():
+    """Month partitions can't see each other; the reconcile pass restores the cap."""
+    people = [Person(id=f"p{i}", name=f"P{i}", roles=["usher"]) for i in range(4)]
+    # P7D is a centered window (day-3 .. day+3): Jun 29 and Jul 1 share one
+    # but fall in different month partitions.
+    events = [_event(f"e{d}", d, usher=2) for d in range(0, 45, 2)]
+    ctx = _ctx(people, events, [WEEKLY_CAP], days=45)
+    solver = DecomposingSolver(max_workers=1, by_month=True, merge_s=0.1)
+    solver.build_model(ctx)
+    result = solver.solve()
+
+    assert len(solver._partitions) == 2
+    assert result.meta.solver.strategy == "components+month"
+    assert result.metrics.hard_violations == _greedy(ctx).metrics.hard_violations
+    for person in people:
+        days = sorted(
+            event.start.date()
+            for event in events
+            if person.id in _by_event(result).get(event.id, [])
+        )
+        assert all((later - earlier).days > 3 for earlier, later in zip(days, days[1:]))
+
+
+@pytest.mark.slow
+def test_parallel_vs_serial_timing(capsys):
+    """Bench a 4-campus, 26-week org: one greedy solve vs components on the pool."""
+    ctx = _campuses(n_campuses=4, people_each=150, weeks=26)
+
+    t0 = time.perf_counter()
+    greedy = _greedy(ctx)
+    serial_s = time.perf_counter() - t0
+
+    solver = DecomposingSolver(max_workers=4)
+    t0 = time.perf_counter()
+    solver.build_model(ctx)
+    merged = solver.solve()
+    parallel_s = time.perf_counter() - t0
+
+    with capsys.disabled():
+        print(
+            f"\n[parallel] cores={os.cpu_count()} partitions={len(solver._partitions)} "
+            f"events={len(ctx.events)} serial={serial_s * 1000:.0f}ms "
+            f"pool={parallel_s * 1000:.0f}ms"
+        )
+
+    assert merged.assignments == greedy.assignments
@@ -0,0 +1,263 @@
+"""Unit tests: greedy variants and portfolio solving (``solver="portfolio"``).
+
+``GreedyHeuristicSolver`` takes an event ``ordering`` and a
+``tie_break_seed``, and reads its fairness penalty from
+``weights["fairness"]``; ``PortfolioSolver`` runs several such variants in
+worker processes and keeps the best roster. These tests check each knob, that
+the portfolio picks the variant with the fewest hard violations and records
+every variant in ``SolutionMeta.portfolio``.
+
+The slow-marked benchmark races the default portfolio on a 12-week roster
+with a scarce role and reports each variant's hard violations and fairness.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import random
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from api.core.models import (
+    ConstraintAction,
+    ConstraintBinding,
+    Event,
+    Org,
+    OrgDefaults,
+    Person,
+    RequiredRole,
+)
+from api.core.solver import portfolio
+from api.core.solver.adapter import SolveContext
+from api.core.solver.factory import create_solver
+from api.core.solver.heuristics import GreedyHeuristicSolver
+from api.core.solver.portfolio import PortfolioSolver, PortfolioVariant, default_variants
+
+START = date(2026, 6, 1)
+
+WEEKLY_CAP = ConstraintBinding(
+    key="weekly_cap",
+    scope="person",
+    applies_to=["service"],
+    severity="hard",
+    then=ConstraintAction(enforce_cap={"period": "P7D", "max_count": 1}),
+)
+
+
+def _event(eid: str, day: int, **roles: int) -> Event:
+    start = datetime.combine(START + timedelta(days=day), datetime.min.time().replace(hour=10))
+    return Event(
+        id=eid,
+        type="service",
+        start=start,
+        end=start + timedelta(hours=2),
+        required_roles=[RequiredRole(role=r, count=c) for r, c in roles.items()],
+    )
+
+
+def _ctx(people, events, constraints=None, days=28) -> SolveContext:
+    return SolveContext(
+        org=Org(org_id="t-org", region="US", defaults=OrgDefaults()),
+        people=people,
+        teams=[],
+        resources=[],
+        events=events,
+        constraints=constraints or [],
+        availability=[],
+        holidays=[],
+        from_date=START,
+        to_date=START + timedelta(days=days),
+        mode="strict",
+        change_min=False,
+    )
+
+
+def _scarce_sound() -> SolveContext:
+    """The only sound tech also ushers; the usher event comes first."""
+    people = [
+        Person(id="sound", name="Sound", roles=["sound", "usher"]),
+        Person(id="usher", name="Usher", roles=["usher"]),
+    ]
+    events = [_event("ushers", 0, usher=1), _event("mix", 1, sound=1)]
+    return _ctx(people, events, [WEEKLY_CAP])
+
+
+def _solve(ctx: SolveContext, **kwargs):
+    solver = GreedyHeuristicSolver(**kwargs)
+    solver.build_model(ctx)
+    return solver.solve()
+
+
+def _by_event(result) -> dict[str, list[str]]:
+    return {a.event_id: a.assignees for a in result.assignments}
+
+
+def test_most_constrained_ordering_saves_the_scarce_role():
+    """Start order spends the sound tech on ushering; most-constrained-first doesn't."""
+    by_start = _solve(_scarce_sound())
+    by_slack = _solve(_scarce_sound(), ordering="most_constrained")
+
+    assert [v.message for v in by_start.violations.hard] == ["Role sound needs 1, got 0"]
+    assert by_slack.metrics.hard_violations == 0
+    assert _by_event(by_slack) == {"ushers": ["usher"], "mix": ["sound"]}
+    assert [a.event_id for a in by_slack.assignments] == ["ushers", "mix"]  # start order
+    assert by_slack.meta.solver.strategy == "feasible_first+most_constrained"
+
+
+def test_unknown_ordering_rejected():
+    """Orderings are validated up front."""
+    with pytest.raises(ValueError, match="Unknown event ordering"):
+        GreedyHeuristicSolver(ordering="alphabetical")
+
+
+def test_tie_break_seed_is_reproducible():
+    """Seeded tie-breaks vary the roster but the same seed repeats it."""
+    people = [Person(id=f"p{i}", name=f"P{i}", roles=["usher"]) for i in range(8)]
+    ctx = _ctx(people, [_event(f"e{d}", d, usher=2) for d in range(0, 28, 7)])
+
+    plain = _by_event(_solve(ctx))
+    seeded = {seed: _by_event(_solve(ctx, tie_break_seed=seed)) for seed in range(5)}
+
+    assert seeded[3] == _by_event(_solve(ctx, tie_break_seed=3))
+    assert plain["e0"] == ["p0", "p1"]
+    assert any(roster != plain for roster in seeded.values())
+
+
+def test_fairness_weight_comes_from_objective():
+    """With fairness weighted to 0 the soft penalty alone decides (here: no spread)."""
+    people = [Person(id=f"p{i}", name=f"P{i}", roles=["usher"]) for i in range(3)]
+    ctx = _ctx(people, [_event(f"e{d}", d, usher=1) for d in range(3)])
+    solver = GreedyHeuristicSolver()
+    solver.set_objective({"fairness": 0})
+    solver.build_model(ctx)
+
+    assert _by_event(solver.solve()) == {"e0": ["p0"], "e1": ["p0"], "e2": ["p0"]}
+    assert _by_event(_solve(ctx)) == {"e0": ["p0"], "e1": ["p1"], "e2": ["p2"]}
+
+
+def test_default_variants():
+    """Defaults start with the plain greedy solve and vary one knob at a time after."""
+    variants = default_variants(6)
+
+    assert variants[0] == PortfolioVariant("start")
+    assert variants[1].ordering == "most_constrained"
+    assert len({v.name for v in variants}) == 6
+    assert {v.tie_break_seed for v in variants[2:]} == {1, 2, 3, 4}
+
+
+def test_portfolio_keeps_the_best_variant_in_process():
+    """The most-constrained variant wins; every variant's metrics are recorded."""
+    solver = PortfolioSolver(max_workers=1)
+    solver.build_model(_scarce_sound())
+    result = solver.solve(timeout_s=30)
+
+    assert result.metrics.hard_violations == 0
+    assert result.meta.solver.name == "greedy_portfolio"
+    assert result.meta.solver.strategy == "portfolio:most_constrained"
+    portfolio = result.meta.portfolio
+    assert [v.name for v in portfolio] == [v.name for v in default_variants()]
+    assert all(v.completed for v in portfolio)
+    assert portfolio[0].hard_violations == 1
+    assert portfolio[1].hard_violations == 0
+
+
+def test_portfolio_on_worker_processes():
+    """The process pool gives the same winner as the in-process run."""
+    solver = create_solver("portfolio")
+    solver.max_workers = 2
+    solver.variants = default_variants(2)
+    solver.build_model(_scarce_sound())
+    result = solver.solve(timeout_s=30)
+
+    assert result.meta.solver.strategy == "portfolio:most_constrained"
+    assert [v.completed for v in result.meta.portfolio] == [True, True]
+
+
+def _stuck_or_solve(context, variant, settings):
+    if variant.name == "stuck":
+        time.sleep(600)
+    return _solve_variant(context, variant, settings)
+
+
+def _crash_or_solve(context, variant, settings):
+    if variant.name.startswith("crash"):
+        raise ValueError(f"{variant.name} failed")
+    return _solve_variant(context, variant, settings)
+
+
+_solve_variant = portfolio._solve_variant
+
+
+def test_portfolio_kills_variants_past_the_budget(monkeypatch):
+    """A variant still running at the deadline is terminated, not left busy."""
+    monkeypatch.setattr(portfolio, "_solve_variant", _stuck_or_solve)
+    solver = PortfolioSolver(
+        variants=[PortfolioVariant("start"), PortfolioVariant("stuck")], max_workers=2
+    )
+    solver.build_model(_scarce_sound())
+    started = time.time()
+    result = solver.solve(timeout_s=2)
+
+    assert time.time() - started < 30
+    assert [v.completed for v in result.meta.portfolio] == [True, False]
+    assert multiprocessing.active_children() == []
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_portfolio_survives_a_crashing_variant(monkeypatch, max_workers):
+    """A variant that raises is reported as not completed; the others still count."""
+    monkeypatch.setattr(portfolio, "_solve_variant", _crash_or_solve)
+    solver = PortfolioSolver(
+        variants=[PortfolioVariant("crash"), PortfolioVariant("start")], max_workers=max_workers
+    )
+    solver.build_model(_scarce_sound())
+    result = solver.solve(timeout_s=10)
+
+    assert [v.completed for v in result.meta.portfolio] == [False, True]
+    assert result.meta.solver.strategy == "portfolio:start"
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_portfolio_raises_when_every_variant_fails(monkeypatch, max_workers):
+    monkeypatch.setattr(portfolio, "_solve_variant", _crash_or_solve)
+    solver = PortfolioSolver(
+        variants=[PortfolioVariant("crash-a"), PortfolioVariant("crash-b")],
+        max_workers=max_workers,
+    )
+    solver.build_model(_scarce_sound())
+
+    with pytest.raises(ValueError, match="crash-a failed"):
+        solver.solve(timeout_s=10)
+
+
+@pytest.mark.slow
+def test_portfolio_scarce_role_benchmark(capsys):
+    """Race the default portfolio on 12 weeks with a 4-person sound pool."""
+    rng = random.Random(5)
+    people = [
+        Person(id=f"p{i}", name=f"P{i}", roles=["sound", "usher"] if i < 4 else ["usher"])
+        for i in range(24)
+    ]
+    events = []
+    for week in range(12):
+        events.append(_event(f"u{week}", 7 * week, usher=rng.randint(4, 8)))
+        events.append(_event(f"s{week}", 7 * week + 2, sound=2, usher=2))
+        events.append(_event(f"m{week}", 7 * week + 4, sound=2))
+    ctx = _ctx(people, events, [WEEKLY_CAP], days=84)
+    solver = PortfolioSolver(variants=default_variants(6))
+    solver.build_model(ctx)
+    result = solver.solve(timeout_s=60)
+
+    with capsys.disabled():
+        print(f"\n[portfolio] events={len(events)} winner={result.meta.solver.strategy}")
+        for v in result.meta.portfolio:
+            print(
+                f"  {v.name:<32} hard={v.hard_violations} "
+                f"stdev={v.fairness_stdev:.3f} solve={v.solve_ms:.0f}ms"
+            )
+
+    assert all(v.completed for v in result.meta.portfolio)
+    assert result.metrics.hard_violations == min(v.hard_violations for v in result.meta.portfolio)
+    assert result.metrics.hard_violations < result.meta.portfolio[0].hard_violations
@@ -0,0 +1,144 @@
+"""Unit tests: per-phase timing, counters and profiler capture for solves.
+
+``GreedyHeuristicSolver.solve`` reports ``meta.profile`` with wall time per
+phase and counters from the candidate loop and the compiled plans;
+``capture_profile`` wraps a block in cProfile (or pyinstrument) and keeps
+the text report.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from api.core.models import (
+    ConstraintAction,
+    ConstraintBinding,
+    Event,
+    Org,
+    OrgDefaults,
+    Person,
+    RequiredRole,
+)
+from api.core.solver import profiling
+from api.core.solver.adapter import SolveContext
+from api.core.solver.heuristics import GreedyHeuristicSolver
+from api.core.solver.profiling import PhaseTimer, capture_profile
+
+START = date(2026, 6, 1)
+
+
+def _ctx(constraints=()) -> SolveContext:
+    events = []
+    for d in range(4):
+        start = datetime.combine(START + timedelta(days=d), datetime.min.time())
+        events.append(
+            Event(
+                id=f"e{d}",
+                type="service",
+                start=start,
+                end=start + timedelta(hours=2),
+                required_roles=[RequiredRole(role="usher", count=2)],
+            )
+        )
+    return SolveContext(
+        org=Org(org_id="o", region="US", defaults=OrgDefaults()),
+        people=[Person(id=f"p{i}", name=f"P{i}", roles=["usher"]) for i in range(5)],
+        teams=[],
+        resources=[],
+        events=events,
+        constraints=list(constraints),
+        availability=[],
+        holidays=[],
+        from_date=START,
+        to_date=START + timedelta(days=7),
+        mode="strict",
+        change_min=False,
+    )
+
+
+def _cap(max_count: int) -> ConstraintBinding:
+    return ConstraintBinding(
+        key="cap",
+        scope="person",
+        applies_to=["service"],
+        then=ConstraintAction(enforce_cap={"period": "P1M", "max_count": max_count}),
+        severity="hard",
+    )
+
+
+def test_solve_reports_phases_and_counters():
+    solver = GreedyHeuristicSolver()
+    solver.build_model(_ctx([_cap(10)]))
+    profile = solver.solve().meta.profile
+
+    assert set(profile.phases_ms) == {"build", "filter", "score", "select", "metrics"}
+    assert all(ms >= 0 for ms in profile.phases_ms.values())
+    assert profile.counters["events"] == 4
+    # Nobody is blocked and the cap never bites: all 5 ushers scored for each event.
+    assert profile.counters["candidates_scored"] == 20
+    assert profile.counters["constraint_evals"] == 20
+    assert profile.counters["predicates_called"] == 20
+    assert profile.capture is None
+
+
+def test_counters_cover_one_solve_only():
+    """Plan counters only grow; each solve reports its own change."""
+    solver = GreedyHeuristicSolver()
+    solver.build_model(_ctx([_cap(10)]))
+    first = solver.solve().meta.profile
+    second = solver.solve().meta.profile
+
+    assert second.counters == first.counters
+    assert second.phases_ms["build"] == 0.0  # nothing rebuilt for the second solve
+
+
+def test_reused_model_reports_no_build_time():
+    built = GreedyHeuristicSolver()
+    ctx = _ctx()
+    built.build_model(ctx)
+    reused = GreedyHeuristicSolver()
+    reused.use_model(replace(ctx), built.model_snapshot())
+
+    assert reused.solve().meta.profile.phases_ms["build"] == 0.0
+
+
+def test_phase_timer_accumulates():
+    timer = PhaseTimer()
+    t = timer.add("filter", 0.0)
+    timer.add("filter", t)
+
+    assert list(timer.phases_ms) == ["filter"]
+    assert timer.phases_ms["filter"] > 0
+
+
+def test_cprofile_capture_reports_the_block():
+    with capture_profile("cprofile") as captured:
+        GreedyHeuristicSolver().build_model(_ctx())
+
+    assert captured.tool == "cprofile"
+    assert "build_model" in captured.text
+
+
+def test_no_profiler_captures_nothing():
+    with capture_profile(None) as captured:
+        pass
+
+    assert (captured.tool, captured.text) == (None, None)
+
+
+def test_pyinstrument_falls_back_to_cprofile(monkeypatch):
+    monkeypatch.setattr(profiling, "PYINSTRUMENT_AVAILABLE", False)
+    with capture_profile("pyinstrument") as captured:
+        sum(range(10))
+
+    assert captured.tool == "cprofile"
+    assert captured.text
+
+
+def test_unknown_profiler_rejected():
+    with pytest.raises(ValueError, match="Unknown profiler"):
+        with capture_profile("perf"):
+            pass
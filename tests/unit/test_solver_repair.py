@@ -0,0 +1,245 @@
+"""Unit tests: ``GreedyHeuristicSolver.incremental_update`` repair.
+
+After ``incremental_update(patch)`` the next ``solve`` keeps the baseline
+roster (``context.published_solution`` or the last solution) and only
+re-picks slots the patch invalidates — removed people, new time off — plus
+events the patch adds or replaces. These tests check which events are
+touched and that everything else is kept verbatim.
+
+The slow-marked benchmark compares a full re-solve against a repair after
+one volunteer's vacation on a 300-person, 26-week roster.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from api.core.models import (
+    Availability,
+    ConstraintAction,
+    ConstraintBinding,
+    Event,
+    Org,
+    OrgDefaults,
+    Patch,
+    Person,
+    RequiredRole,
+    VacationPeriod,
+)
+from api.core.solver.adapter import SolveContext
+from api.core.solver.heuristics import GreedyHeuristicSolver
+
+START = date(2026, 6, 1)
+
+
+def _event(eid: str, day: int, **roles: int) -> Event:
+    start = datetime.combine(START + timedelta(days=day), datetime.min.time().replace(hour=10))
+    return Event(
+        id=eid,
+        type="service",
+        start=start,
+        end=start + timedelta(hours=2),
+        required_roles=[RequiredRole(role=r, count=c) for r, c in roles.items()],
+    )
+
+
+def _ctx(people, events, constraints=None, days=28) -> SolveContext:
+    return SolveContext(
+        org=Org(org_id="t-org", region="US", defaults=OrgDefaults()),
+        people=people,
+        teams=[],
+        resources=[],
+        events=events,
+        constraints=constraints or [],
+        availability=[],
+        holidays=[],
+        from_date=START,
+        to_date=START + timedelta(days=days),
+        mode="strict",
+        change_min=False,
+    )
+
+
+def _roster() -> SolveContext:
+    people = [Person(id=f"p{i}", name=f"P{i}", roles=["usher"]) for i in range(6)]
+    people.append(Person(id="sound", name="Sound", roles=["sound", "usher"]))
+    events = [_event(f"e{w}", 7 * w, usher=2, sound=1) for w in range(4)]
+    return _ctx(people, events)
+
+
+def _by_event(result) -> dict[str, list[str]]:
+    return {a.event_id: a.assignees for a in result.assignments}
+
+
+def _time_off(person_id: str, day: int) -> Patch:
+    on = START + timedelta(days=day)
+    return Patch(
+        update_availability=[
+            Availability(person_id=person_id, vacations=[VacationPeriod(start=on, end=on)])
+        ]
+    )
+
+
+def test_time_off_refills_only_that_persons_slot():
+    """A vacation re-picks the one slot it affects; every other assignment is kept."""
+    solver = GreedyHeuristicSolver()
+    solver.build_model(_roster())
+    baseline = _by_event(solver.solve())
+    leaving = baseline["e1"][0]
+
+    solver.incremental_update(_time_off(leaving, 7))
+    result = solver.solve()
+    repaired = _by_event(result)
+
+    assert solver.repaired_events == ["e1"]
+    assert result.meta.solver.strategy == "repair"
+    assert {k: v for k, v in repaired.items() if k != "e1"} == {
+        k: v for k, v in baseline.items() if k != "e1"
+    }
+    assert leaving not in repaired["e1"]
+    assert [p for p in baseline["e1"] if p != leaving] == repaired["e1"][:2]
+    assert len(repaired["e1"]) == 3
+    assert result.metrics.hard_violations == 0
+
+
+def test_removed_person_slots_refilled_with_a_role_holder():
+    """Removing the only sound tech leaves each event short one sound slot."""
+    solver = GreedyHeuristicSolver()
+    solver.build_model(_roster())
+    solver.solve()
+
+    solver.incremental_update(Patch(remove_people=["sound"]))
+    result = solver.solve()
+
+    assert solver.repaired_events == ["e0", "e1", "e2", "e3"]
+    assert all("sound" not in people for people in _by_event(result).values())
+    assert [v.message for v in result.violations.hard] == ["Role sound needs 1, got 0"] * 4
+
+
+def test_added_and_removed_events():
+    """New or replaced events are assigned from scratch; removed ones drop out."""
+    solver = GreedyHeuristicSolver()
+    solver.build_model(_roster())
+    baseline = _by_event(solver.solve())
+
+    moved = _event("e2", 15, usher=2, sound=1)  # rescheduled from day 14
+    added = _event("e9", 25, usher=1)
+    solver.incremental_update(Patch(add_events=[moved, added], remove_events=["e3"]))
+    repaired = _by_event(solver.solve())
+
+    assert sorted(solver.repaired_events) == ["e2", "e9"]
+    assert set(repaired) == {"e0", "e1", "e2", "e9"}
+    assert repaired["e0"] == baseline["e0"]
+    assert repaired["e1"] == baseline["e1"]
+
+
+def test_published_solution_is_the_baseline():
+    """With ``context.published_solution`` set, repair keeps it rather than re-solving."""
+    ctx = _roster()
+    solver = GreedyHeuristicSolver()
+    solver.build_model(ctx)
+    published = solver.solve()
+    # Hand-edit the published roster so it differs from what greedy would pick.
+    published.assignments[0].assignees = ["p5", "p4", "sound"]
+    ctx.published_solution = published
+
+    fresh = GreedyHeuristicSolver()
+    fresh.build_model(ctx)
+    fresh.incremental_update(Patch())
+    result = fresh.solve()
+
+    assert fresh.repaired_events == []
+    assert _by_event(result)["e0"] == ["p5", "p4", "sound"]
+
+
+def test_no_baseline_means_full_solve():
+    """Without a baseline the update only patches the model; the next solve is full."""
+    solver = GreedyHeuristicSolver()
+    solver.build_model(_roster())
+    solver.incremental_update(Patch(remove_people=["p0"]))
+    result = solver.solve()
+
+    assert result.meta.solver.strategy == "feasible_first"
+    assert all("p0" not in people for people in _by_event(result).values())
+
+
+def test_updates_accumulate_until_the_next_solve():
+    """Two updates before one solve repair against the same baseline."""
+    solver = GreedyHeuristicSolver()
+    solver.build_model(_roster())
+    baseline = _by_event(solver.solve())
+
+    solver.incremental_update(_time_off(baseline["e0"][0], 0))
+    solver.incremental_update(_time_off(baseline["e2"][0], 14))
+    solver.solve()
+
+    assert solver.repaired_events == ["e0", "e2"]
+    solver.solve()
+    assert solver.repaired_events == []  # repair state is consumed by one solve
+
+
+@pytest.mark.slow
+def test_repair_vs_full_resolve_timing(capsys):
+    """Bench a full re-solve vs repair after one vacation (300 people, 26 weeks)."""
+    rng = random.Random(11)
+    roles = ["usher", "sound", "greeter", "kids", "music"]
+    people = [
+        Person(id=f"p{i}", name=f"P{i}", roles=rng.sample(roles, rng.randint(1, 3)))
+        for i in range(300)
+    ]
+    events = [
+        _event(f"e{d}", d, **{r: rng.randint(1, 4) for r in roles})
+        for d in range(182)
+        if d % 7 in (0, 3, 6)
+    ]
+    constraints = [
+        ConstraintBinding(
+            key="cooldown",
+            scope="person",
+            applies_to=["service"],
+            severity="soft",
+            weight=20,
+            then=ConstraintAction(penalize_if={"type": "cooldown", "cooldown_days": 14}),
+        ),
+        ConstraintBinding(
+            key="monthly_cap",
+            scope="person",
+            applies_to=["service"],
+            severity="hard",
+            then=ConstraintAction(enforce_cap={"period": "P1M", "max_count": 4}),
+        ),
+    ]
+    ctx = _ctx(people, events, constraints, days=182)
+    solver = GreedyHeuristicSolver()
+    solver.build_model(ctx)
+    baseline = solver.solve()
+    target = baseline.assignments[40]
+    leaving = target.assignees[0]
+    patch = _time_off(leaving, int(target.event_id[1:]))
+
+    t0 = time.perf_counter()
+    full = GreedyHeuristicSolver()
+    full.build_model(ctx)
+    full.incremental_update(patch)  # no baseline: full solve on the patched context
+    full.solve()
+    full_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    solver.incremental_update(patch)
+    repaired = solver.solve()
+    repair_s = time.perf_counter() - t0
+
+    with capsys.disabled():
+        print(
+            f"\n[repair] people=300 events={len(events)} repaired={solver.repaired_events} "
+            f"full={full_s * 1000:.0f}ms repair={repair_s * 1000:.0f}ms "
+            f"speedup~{full_s / repair_s:.1f}x"
+        )
+
+    assert len(solver.repaired_events) == 1
+    assert leaving not in _by_event(repaired)[target.event_id]
+    assert repair_s * 3 < full_s
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import re
 from datetime import datetime
 
 from api.models import Event, Solution
+from api.services import solve_jobs
 from tests.web.conftest import seed_person
 from web.deps import SESSION_COOKIE
 
@@ -109,3 +111,68 @@ def test_solver_requires_auth(client):
         ).status_code
         == 303
     )
+
+
+def _seed_event(db, org):
+    seed_person(db, person_id=f"{org}_vol", org_id=org, email=f"{org}_vol@web.test")
+    db.add(
+        Event(
+            id=f"{org}_ev",
+            org_id=org,
+            type="Sunday Service",
+            start_time=datetime(2099, 6, 7, 10, 0),
+            end_time=datetime(2099, 6, 7, 11, 30),
+        )
+    )
+    db.commit()
+
+
+def _run_background(client, token):
+    return client.post(
+        "/a/solver/run",
+        data={
+            "from_date": "2099-06-01",
+            "to_date": "2099-06-30",
+            "mode": "strict",
+            "background": "true",
+        },
+        cookies={SESSION_COOKIE: token},
+    )
+
+
+def test_solver_form_offers_background_mode(client, db):
+    token = _admin(client, db, org="s_org4", email="sadmin4@web.test")
+    resp = client.get("/a/solver", cookies={SESSION_COOKIE: token})
+    assert 'name="background"' in resp.text
+
+
+def test_solver_background_run_polls_to_result(client, db):
+    token = _admin(client, db, org="s_org5", email="sadmin5@web.test")
+    _seed_event(db, "s_org5")
+
+    resp = _run_background(client, token)
+    assert resp.status_code == 200
+    job_id = re.search(r"/a/solver/jobs/([0-9a-f]+)", resp.text).group(1)
+    assert 'hx-trigger="every 1s"' in resp.text
+    solve_jobs.get(job_id)._future.result(timeout=30)
+
+    poll = client.get(f"/a/solver/jobs/{job_id}", cookies={SESSION_COOKIE: token})
+    assert poll.status_code == 200
+    assert "Solution #" in poll.text
+    assert "every 1s" not in poll.text
+    assert db.query(Solution).filter(Solution.org_id == "s_org5").count() == 1
+
+
+def test_solver_job_of_other_org_not_found(client, db):
+    token = _admin(client, db, org="s_org6", email="sadmin6@web.test")
+    _seed_event(db, "s_org6")
+    job_id = re.search(r"/a/solver/jobs/([0-9a-f]+)", _run_background(client, token).text)[1]
+    solve_jobs.get(job_id)._future.result(timeout=30)
+    seed_person(db, person_id="s_admin7", org_id="s_org7", email="sa7@web.test", roles=["admin"])
+    other = client.post("/auth/login", data={"email": "sa7@web.test", "password": "WebPass123!"})
+
+    resp = client.get(
+        f"/a/solver/jobs/{job_id}", cookies={SESSION_COOKIE: other.cookies[SESSION_COOKIE]}
+    )
+    assert resp.status_code == 404
+    assert "form-error" in resp.text
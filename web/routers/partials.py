@@ -51,7 +51,12 @@ from api.routers.solutions import (
     rollback_solution,
     unpublish_solution,
 )
-from api.routers.solver import solve_schedule
+from api.routers.solver import (
+    cancel_solve_job,
+    get_solve_job,
+    solve_schedule,
+    submit_solve_job,
+)
 from api.routers.teams import (
     add_team_members,
     create_team,
@@ -1424,11 +1429,14 @@ def solver_run(
     to_date: str = Form(...),
     mode: str = Form("strict"),
     change_min: str | None = Form(None),
+    background: str | None = Form(None),
     person: Person = Depends(get_session_admin),
     db: Session = Depends(get_db),
 ):
     """Run the scheduler for the admin's org and render a result summary
-    with a link to review the new solution (11.18)."""
+    with a link to review the new solution (11.18). With ``background``
+    the solve is queued as a job and a self-polling progress card is
+    rendered instead."""
     from web.app import templates
 
     def _err(msg: str, code: int = 400):
@@ -1447,6 +1455,12 @@ def solver_run(
         )
     except ValueError:
         return _err("Enter a valid date range.")
+    if background == "true":
+        try:
+            job = submit_solve_job(req, person, db)
+        except HTTPException as exc:
+            return _err(str(exc.detail), exc.status_code or 400)
+        return templates.TemplateResponse(request, "partials/solver_job.html", {"job": job})
     try:
         resp = solve_schedule(req, person, db)
     except HTTPException as exc:
@@ -1468,6 +1482,82 @@ def solver_run(
     )
 
 
+def _solver_job_view(request: Request, job, person: Person, db: Session):
+    """Progress card while the job runs; the usual result card once it's saved."""
+    from api.models import Solution
+    from web.app import templates
+
+    if job.status == "completed":
+        sol = (
+            db.query(Solution)
+            .filter(Solution.id == job.solution_id, Solution.org_id == person.org_id)
+            .first()
+        )
+        if sol is not None:
+            return templates.TemplateResponse(
+                request,
+                "partials/solver_result.html",
+                {
+                    "r": {
+                        "solution_id": sol.id,
+                        "assignment_count": job.assignment_count,
+                        "health_score": round(sol.health_score),
+                        "hard_violations": sol.hard_violations,
+                        "solve_ms": round(sol.solve_ms or 0),
+                    }
+                },
+            )
+    if job.status == "failed":
+        return templates.TemplateResponse(
+            request, "partials/solver_result.html", {"error": job.error or "Solve failed."}
+        )
+    return templates.TemplateResponse(request, "partials/solver_job.html", {"job": job})
+
+
+@router.get("/a/solver/jobs/{job_id}", response_class=HTMLResponse)
+def solver_job_status(
+    request: Request,
+    job_id: str,
+    person: Person = Depends(get_session_admin),
+    db: Session = Depends(get_db),
+):
+    """Polled by the progress card until the background solve finishes."""
+    from web.app import templates
+
+    try:
+        job = get_solve_job(job_id, person)
+    except HTTPException as exc:
+        return templates.TemplateResponse(
+            request,
+            "partials/solver_result.html",
+            {"error": str(exc.detail)},
+            status_code=exc.status_code,
+        )
+    return _solver_job_view(request, job, person, db)
+
+
+@router.post("/a/solver/jobs/{job_id}/cancel", response_class=HTMLResponse)
+def solver_job_cancel(
+    request: Request,
+    job_id: str,
+    person: Person = Depends(get_session_admin),
+    db: Session = Depends(get_db),
+):
+    """Cancel the background solve from its progress card and re-render the card."""
+    from web.app import templates
+
+    try:
+        job = cancel_solve_job(job_id, person)
+    except HTTPException as exc:
+        return templates.TemplateResponse(
+            request,
+            "partials/solver_result.html",
+            {"error": str(exc.detail)},
+            status_code=exc.status_code,
+        )
+    return _solver_job_view(request, job, person, db)
+
+
 # ── Admin: publish solution + compare ────────────────────────────────
 
 